@@ -65,50 +65,48 @@ class DownloadThread(QThread):
             dm = DataManager()
             
             total = len(self.symbols)
+            done = []
             
-            for i, symbol in enumerate(self.symbols):
-                if not self._running:
-                    logger.info("[Download] 중지됨")
-                    break
-                
+            # 지표 생성기 로드
+            from indicator_generator import IndicatorGenerator
+            
+            # 진행률 콜백 (심볼 완료 수 기준)
+            def on_progress(symbol, candle_count):
                 self._current_symbol = symbol
-                self._current_count = 0
-                
-                # 초기 진행률
-                base_progress = int((i / total) * 100)
-                self.progress.emit(base_progress, f"📥 {symbol} 다운로드 중...")
-                logger.info(f"[Download] {i+1}/{total}: {symbol}")
-                
-                try:
-                    # 진행률 콜백
-                    def on_progress(candle_count):
-                        self._current_count = candle_count
-                        msg = f"📥 {symbol}: {int(candle_count):,}개 캔들..."
-                        # 같은 심볼 내에서의 세부 진행률
-                        sub_progress = min(base_progress + int(10 / total), 99)
-                        self.progress.emit(sub_progress, msg)
-                    
-                    # 지표 생성기 로드
-                    from indicator_generator import IndicatorGenerator
-                    
-                    df = dm.download(
-                        symbol=symbol,
-                        timeframe=self.timeframe,
-                        start_date=self.start_date,
-                        end_date=self.end_date,
-                        exchange=self.exchange,
-                        limit=500000,
-                        progress_callback=on_progress,
-                        processor=IndicatorGenerator.add_all_indicators  # 지표 추가 콜백 전달
-                    )
-                    
-                    count = len(df) if df is not None else 0
-                    self.finished.emit(symbol, count)
-                    logger.info(f"[Download] ✅ {symbol}: {count:,}개")
-                    
-                except Exception as e:
-                    self.error.emit(symbol, str(e))
-                    logger.info(f"[Download] ❌ {symbol}: {e}")
+                self._current_count = candle_count
+                base_progress = int((len(done) / total) * 100)
+                sub_progress = min(base_progress + int(10 / total), 99)
+                self.progress.emit(sub_progress, f"📥 {symbol}: {int(candle_count):,}개 캔들...")
+            
+            def on_symbol_done(symbol, df):
+                done.append(symbol)
+                count = len(df) if df is not None else 0
+                self.finished.emit(symbol, count)
+                self.progress.emit(min(int((len(done) / total) * 100), 99), f"✅ {symbol} 저장 완료")
+                logger.info(f"[Download] ✅ {symbol}: {count:,}개 ({len(done)}/{total})")
+            
+            def on_error(symbol, message):
+                done.append(symbol)
+                self.error.emit(symbol, message)
+                logger.info(f"[Download] ❌ {symbol}: {message}")
+            
+            self.progress.emit(0, f"📥 {total}개 심볼 동시 다운로드 중...")
+            
+            # [PERF] 심볼/기간 구간 동시 수집 (거래소 Rate Limit 내), 완료 순서대로 저장
+            dm.download_many(
+                self.symbols,
+                timeframe=self.timeframe,
+                start_date=self.start_date,
+                exchange=self.exchange,
+                limit=500000,
+                processor=IndicatorGenerator.add_all_indicators,  # 지표 추가 콜백 전달
+                on_symbol_done=on_symbol_done,
+                on_progress=on_progress,
+                on_error=on_error,
+                should_stop=lambda: not self._running
+            )
+            if not self._running:
+                logger.info("[Download] 중지됨")
             
             self.progress.emit(100, "✅ 다운로드 완료!")
             logger.info("[Download] 완료!")
@@ -192,7 +192,100 @@ class DataManager:
             processor: 데이터프레임 처리 함수 (예: 지표 추가)
         """
         cache_path = self._get_cache_path(exchange, symbol, timeframe)
+        existing_df, start_ts = self._resume_point(cache_path, start_date)
         
+        # 3. 새 데이터 다운로드
+        new_data = self._fetch_ohlcv(
+            symbol, timeframe, exchange, 
+            since=start_ts, limit=limit,
+            progress_callback=progress_callback
+        )
+        
+        return self._merge_and_save(symbol, timeframe, exchange, existing_df, new_data, processor)
+    
+    def download_many(self, symbols: List[str], timeframe: str, start_date: str = None,
+                      exchange: str = "bybit", limit: int = None, processor=None,
+                      on_symbol_done=None, on_progress=None, on_error=None,
+                      should_stop=None, max_workers: int = 8) -> Dict[str, int]:
+        """
+        여러 심볼 동시 다운로드 및 캐시 저장 (도착 순서대로 저장)
+        
+        [PERF] 심볼/기간 구간을 거래소별 Rate Limit 안에서 동시에 요청
+        
+        Args:
+            symbols: 심볼 목록
+            on_symbol_done: (symbol, DataFrame) - 심볼 저장 직후
+            on_progress: (symbol, 누적 캔들 수)
+            on_error: (symbol, 에러 메시지)
+            should_stop: True 반환 시 중단
+            (나머지는 download와 동일)
+        
+        Returns:
+            {symbol: 저장된 캔들 수}
+        """
+        from utils.concurrent_downloader import DownloadJob, timeframe_to_ms
+        
+        counts: Dict[str, int] = {}
+        jobs, sequential, resume = [], [], {}
+        now_ms = int(time.time() * 1000)
+        
+        for symbol in symbols:
+            exchange_id, source_symbol = self._resolve_source(symbol, exchange.lower())
+            if exchange_id == 'upbit':
+                # Upbit는 pyupbit 역방향 페이지네이션 (기존 경로)
+                sequential.append(symbol)
+                continue
+            cache_path = self._get_cache_path(exchange, symbol, timeframe)
+            existing_df, start_ts = self._resume_point(cache_path, start_date)
+            since = self._resolve_since(symbol, exchange_id, start_ts)
+            until = now_ms if limit is None else min(now_ms, since + limit * timeframe_to_ms(timeframe))
+            resume[symbol] = existing_df
+            jobs.append(DownloadJob(exchange_id, self._to_ccxt_symbol(source_symbol, exchange_id),
+                                    timeframe, since, until, key=symbol))
+        
+        def on_result(job, rows):
+            df = self._merge_and_save(job.key, timeframe, exchange, resume.pop(job.key), rows, processor)
+            counts[job.key] = len(df)
+            if on_symbol_done:
+                on_symbol_done(job.key, df)
+        
+        if jobs:
+            logger.info(f"📥 {exchange} 동시 수집 시작: {len(jobs)}개 심볼 ({timeframe})")
+            self._get_downloader(max_workers).download(
+                jobs,
+                on_result=on_result,
+                on_progress=(lambda job, n: on_progress(job.key, n)) if on_progress else None,
+                on_error=(lambda job, e: on_error(job.key, str(e))) if on_error else None,
+                should_stop=should_stop
+            )
+        
+        for symbol in sequential:
+            if should_stop and should_stop():
+                break
+            try:
+                df = self.download(symbol, timeframe, start_date=start_date, exchange=exchange, limit=limit,
+                                   progress_callback=(lambda n, s=symbol: on_progress(s, n)) if on_progress else None,
+                                   processor=processor)
+                counts[symbol] = len(df) if df is not None else 0
+                if on_symbol_done:
+                    on_symbol_done(symbol, df)
+            except Exception as e:
+                if on_error:
+                    on_error(symbol, str(e))
+        
+        return counts
+    
+    def _get_downloader(self, max_workers: int = 8):
+        """동시 다운로더 (거래소 클라이언트 풀 공유)"""
+        from utils.concurrent_downloader import ConcurrentDownloader
+        downloader = getattr(self, '_downloader', None)
+        if downloader is None or downloader.max_workers != max_workers:
+            downloader = ConcurrentDownloader(max_workers=max_workers, batch_sizes=self.EXCHANGE_LIMITS)
+            self._downloader = downloader
+        return downloader
+    
+    def _resume_point(self, cache_path: Path, start_date: str = None):
+        """기존 캐시와 다운로드 시작 시점 (ms, None이면 상장일부터)"""
         # 1. 기존 캐시 확인
         existing_df = self._load_cache(cache_path)
         
@@ -219,14 +312,12 @@ class DataManager:
         else:
             start_ts = req_start_ts
             existing_df = pd.DataFrame()
-        
-        # 3. 새 데이터 다운로드
-        new_data = self._fetch_ohlcv(
-            symbol, timeframe, exchange, 
-            since=start_ts, limit=limit,
-            progress_callback=progress_callback
-        )
-        
+        return existing_df, start_ts
+    
+    def _merge_and_save(self, symbol: str, timeframe: str, exchange: str,
+                        existing_df: pd.DataFrame, new_data: List, processor=None) -> pd.DataFrame:
+        """새 캔들 병합 → 가공 → 캐시 저장"""
+        cache_path = self._get_cache_path(exchange, symbol, timeframe)
         if new_data is None or len(new_data) == 0:
             logger.info("📭 새 데이터 없음")
             return existing_df
@@ -425,168 +516,92 @@ class DataManager:
             logger.info(f"❌ [Upbit-Pyupbit] Error: {e}")
             return []
 
+    def _resolve_source(self, symbol: str, exchange_id: str):
+        """실제 데이터 소스 (거래소, 심볼) - 빗썸 공통 코인은 업비트로 리다이렉트"""
+        # [NEW] 빗썸-업비트 하이브리드 리다이렉션
+        # 빗썸의 경우 데이터가 부족하므로, 업비트 공통 코인은 업비트에서 데이터를 가져옴
+        if exchange_id == 'bithumb':
+            try:
+                try:
+                    from GUI.constants import COMMON_KRW_SYMBOLS
+                except ImportError:
+                    from constants import COMMON_KRW_SYMBOLS
+                # 심볼에서 코인 이름 추출 (예: BTC/KRW -> BTC, BTC -> BTC)
+                coin = symbol.split('/')[0].replace('KRW', '').replace('-', '').upper()
+                if coin in COMMON_KRW_SYMBOLS:
+                    logger.info(f"🔄 [HYBRID] Bithumb {coin} -> Switching to Upbit Data Source")
+                    exchange_id = 'upbit'
+                    # 업비트 형식으로 심볼 변환
+                    symbol = f"{coin}/KRW"
+            except Exception as e:
+                logger.info(f"⚠️ [HYBRID] Redirection failed: {e}")
+        return exchange_id, symbol
+    
+    @staticmethod
+    def _to_ccxt_symbol(symbol: str, exchange_id: str) -> str:
+        """심볼 → ccxt 형식 (BTCUSDT → BTC/USDT:USDT, KRW-BTC → BTC/KRW)"""
+        if '/' in symbol:
+            return symbol
+        if exchange_id in ['bithumb', 'upbit']:
+            # [FIX] KRW-BTC → BTC/KRW (빗썸/업비트)
+            if symbol.startswith('KRW-'):
+                return f"{symbol.replace('KRW-', '')}/KRW"
+            # BTCKRW → BTC/KRW
+            if symbol.endswith('KRW'):
+                return f"{symbol[:-3]}/KRW"
+            # 기본적으로 BTC/KRW 형식으로 시도
+            return f"{symbol}/KRW"
+        # BTCUSDT → BTC/USDT:USDT
+        return f"{symbol[:-4]}/{symbol[-4:]}:{symbol[-4:]}"
+    
+    def _resolve_since(self, symbol: str, exchange_id: str, since: int = None) -> int:
+        """수집 시작 시점 (상장일 이전이면 상장일로 보정)"""
+        listing_date = self._get_listing_date(symbol, exchange_id)
+        listing_ts = None
+        if listing_date:
+            try:
+                listing_ts = int(pd.Timestamp(listing_date).timestamp() * 1000)
+            except: pass
+        
+        if since is None:
+            if listing_ts:
+                return listing_ts
+            # [FIX] 상장일 불명확 시 2017.01.01부터 전체 수집 (기존 2년 제한 해제)
+            return int(pd.Timestamp("2017-01-01").timestamp() * 1000)
+        if listing_ts and since < listing_ts:
+            return listing_ts
+        return since
+    
     def _fetch_ohlcv(self, symbol: str, timeframe: str, exchange: str,
                      since: int = None, limit: int = 1000,
                      progress_callback=None) -> List:
         """OHLCV 데이터 가져오기 (ccxt 사용)"""
         try:
-            import ccxt
+            from utils.concurrent_downloader import timeframe_to_ms
             
-            exchange_id = exchange.lower()
+            original_symbol = symbol
+            exchange_id, symbol = self._resolve_source(symbol, exchange.lower())
             
-            # [NEW] 빗썸-업비트 하이브리드 리다이렉션
-            # 빗썸의 경우 데이터가 부족하므로, 업비트 공통 코인은 업비트에서 데이터를 가져옴
-            if exchange_id == 'bithumb':
-                try:
-                    try:
-                        from GUI.constants import COMMON_KRW_SYMBOLS
-                    except ImportError:
-                        from constants import COMMON_KRW_SYMBOLS
-                    # 심볼에서 코인 이름 추출 (예: BTC/KRW -> BTC, BTC -> BTC)
-                    coin = symbol.split('/')[0].replace('KRW', '').replace('-', '').upper()
-                    if coin in COMMON_KRW_SYMBOLS:
-                        logger.info(f"🔄 [HYBRID] Bithumb {coin} -> Switching to Upbit Data Source")
-                        exchange_id = 'upbit'
-                        # 업비트 형식으로 심볼 변환
-                        symbol = f"{coin}/KRW"
-                except Exception as e:
-                    logger.info(f"⚠️ [HYBRID] Redirection failed: {e}")
-
-                except Exception as e:
-                    logger.info(f"⚠️ [HYBRID] Redirection failed: {e}")
-
             # [NEW] Upbit 전용 처리 (Pyupbit + Pagination)
             if exchange_id == 'upbit':
                 return self._fetch_upbit_pyupbit(symbol, timeframe, since, limit, progress_callback)
             
-            # [FIX] KRW 거래소 체크
-            is_krw_exchange = exchange_id in ['bithumb', 'upbit']
-            
-            # 거래소 인스턴스
-            exchange_class = getattr(ccxt, exchange_id)
-            ex = exchange_class({
-                'enableRateLimit': True,
-                'options': {'defaultType': 'spot' if is_krw_exchange else 'swap', 'adjustForTimeDifference': True},
-                'timeout': 30000
-            })
-            ex.load_markets()
-            
-            # 심볼 변환
-            original_symbol = symbol
-            if '/' not in symbol:
-                if is_krw_exchange:
-                    # [FIX] KRW-BTC → BTC/KRW (빗썸/업비트)
-                    if symbol.startswith('KRW-'):
-                        base = symbol.replace('KRW-', '')
-                        symbol = f"{base}/KRW"
-                    else:
-                        # BTCKRW → BTC/KRW
-                        if symbol.endswith('KRW'):
-                            symbol = f"{symbol[:-3]}/KRW"
-                        else:
-                            # 기본적으로 BTC/KRW 형식으로 시도
-                            symbol = f"{symbol}/KRW"
-                else:
-                    # BTCUSDT → BTC/USDT:USDT
-                    symbol = f"{symbol[:-4]}/{symbol[-4:]}:{symbol[-4:]}"
-            
-            # 상장일 체크
-            listing_date = self._get_listing_date(original_symbol, exchange_id)
-            listing_ts = None
-            if listing_date:
-                try:
-                    listing_ts = int(pd.Timestamp(listing_date).timestamp() * 1000)
-                except: pass
-            
-            # since 설정
-            if since is None:
-                if listing_ts:
-                    since = listing_ts
-                else:
-                    # [FIX] 상장일 불명확 시 2017.01.01부터 전체 수집 (기존 2년 제한 해제)
-                    since = int(pd.Timestamp("2017-01-01").timestamp() * 1000)
-            elif listing_ts and since < listing_ts:
-                since = listing_ts
-            
-            all_data = []
-            fetched = 0
+            symbol = self._to_ccxt_symbol(symbol, exchange_id)
+            since = self._resolve_since(original_symbol, exchange_id, since)
             
             # [FIX] limit이 None일 경우 무한 수집을 위해 매우 큰 값으로 설정
             if limit is None:
                 limit = 1000000 
+            until = min(int(time.time() * 1000), since + limit * timeframe_to_ms(timeframe))
             
-            # [FIX] 거래소별 맞춤형 배치 사이즈
-            batch_size = self.EXCHANGE_LIMITS.get(exchange_id, 1000)
-            # 요청한 limit보다 batch_size가 크면 조절
-            batch_size = min(batch_size, limit)
-            
-            logger.info(f"📥 {exchange_id} 데이터 수집 시작: {symbol} ({timeframe}), Target: {limit}, Batch: {batch_size}")
+            logger.info(f"📥 {exchange_id} 데이터 수집 시작: {symbol} ({timeframe}), Target: {limit}")
             
-            retry_count = 0
-            max_retries = 3
+            # [PERF] 거래소 클라이언트 재사용 + 기간 구간 동시 요청 (거래소별 Rate Limit 준수)
+            all_data = self._get_downloader().fetch_range(
+                exchange_id, symbol, timeframe, since, until,
+                on_progress=(lambda job, n: progress_callback(n)) if progress_callback else None
+            )[:limit]
             
-            while fetched < limit:
-                try:
-                    # 남은 개수가 batch_size보다 작으면 조절
-                    current_batch = min(batch_size, limit - fetched)
-                    
-                    # [DEBUG] Readable timestamp
-                    readable_since = datetime.fromtimestamp(since/1000).strftime('%Y-%m-%d %H:%M')
-                    logger.info(f"[DataManager] Batch {fetched//batch_size + 1}: {fetched:,}/{limit:,} candles (since={readable_since})")
-                    data = ex.fetch_ohlcv(symbol, timeframe, since=since, limit=current_batch)
-                    retry_count = 0
-                except Exception as e:
-                    retry_count += 1
-                    if retry_count >= max_retries:
-                        logger.info(f"❌ {exchange_id} 재시도 실패: {e}")
-                        break
-                    logger.info(f"⚠️ 재시도 {retry_count}/{max_retries}...")
-                    time.sleep(2)
-                    continue
-                
-                if not data:
-                    # [FIX] 데이터가 없는데 처음(fetched=0)인 경우에만 1회성 폴백 시도
-                    if fetched == 0 and since is not None:
-                        # [CAUTION] 'since=None'은 거래소에 따라 최신 1000개만 반환하고 끝날 수 있음
-                        # 여기서는 log만 남기고 루프를 종료하거나, 다른 전략을 취해야 함
-                        logger.info(f"ℹ️ {exchange_id}: {datetime.fromtimestamp(since/1000)} 이후 데이터 없음 (상장 전 또는 서버 제한)")
-                    break
-                
-                # [FIX] CCXT 페이지네이션의 고질적인 중복 체크 개선
-                # 중복 데이터가 들어왔을 때 무한 루프 방지 & 실제 데이터만 추가
-                new_candles = []
-                for d in data:
-                    if not all_data or d[0] > all_data[-1][0]:
-                        new_candles.append(d)
-                
-                if not new_candles:
-                    logger.info("ℹ️ 더 이상 새로운 데이터가 없습니다. (수집 종료)")
-                    break
-                    
-                all_data.extend(new_candles)
-                fetched += len(new_candles)
-                
-                if progress_callback:
-                    progress_callback(fetched)
-                
-                # 다음 배치를 위한 since 업데이트
-                last_ts = all_data[-1][0]
-                
-                # 현재 시간에 도달했는지 체크 (10초 전까지 수집)
-                now_ts = int(time.time() * 1000)
-                if last_ts >= now_ts - 20000: # 20초 이내
-                    logger.info("✅ 현재 시점에 도달했습니다.")
-                    break
-                    
-                since = last_ts + 1
-                time.sleep(0.1) # 속도 개선 (기존 0.3 -> 0.1)
-            
-            # 중복 제거 (혹시 모를 상황 대비)
-            if all_data:
-                df_temp = pd.DataFrame(all_data, columns=['ts', 'o', 'h', 'l', 'c', 'v'])
-                df_temp = df_temp.drop_duplicates(subset=['ts']).sort_values('ts')
-                all_data = df_temp.values.tolist()
-                
             logger.info(f"✅ {exchange_id} 수집 완료: 총 {len(all_data)}개 캔들")
             return all_data
             
@@ -27,6 +27,7 @@ HISTORY_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__fi
 # 새 Storage 경로
 try:
     from paths import Paths
+    from storage.trade_journal import JOURNAL_SUFFIX, read_records
     USE_NEW_STORAGE = True
 except ImportError:
     USE_NEW_STORAGE = False
@@ -671,21 +672,23 @@ class HistoryWidget(QWidget):
             if USE_NEW_STORAGE:
                 exchanges_dir = Paths.EXCHANGES
                 if os.path.exists(exchanges_dir):
-                    # user/exchanges/*/*/history.json 패턴 검색
+                    # user/exchanges/*/*/history.json (+ 아직 압축 전인 history.json.wal) 검색
                     pattern = os.path.join(exchanges_dir, '*', '*', 'history.json')
-                    for history_file in glob.glob(pattern):
+                    history_files = set(glob.glob(pattern))
+                    history_files.update(p[:-len(JOURNAL_SUFFIX)] for p in glob.glob(pattern + JOURNAL_SUFFIX))
+                    for history_file in sorted(history_files):
                         try:
-                            with open(history_file, 'r', encoding='utf-8') as f:
-                                trades = json.load(f)
-                                # 경로에서 거래소/심볼 추출
-                                parts = history_file.replace('\\\\', '/').split('/')
-                                if len(parts) >= 3:
-                                    exchange = parts[-3]
-                                    symbol = parts[-2]
-                                    for t in trades:
-                                        t.setdefault('exchange', exchange)
-                                        t.setdefault('symbol', symbol)
-                                all_trades.extend(trades)
+                            # [FIX] 스냅샷 + 저널 (진행 중 세션 거래는 저널에만 있음)
+                            trades = read_records(history_file)
+                            # 경로에서 거래소/심볼 추출
+                            parts = history_file.replace('\\\\', '/').split('/')
+                            if len(parts) >= 3:
+                                exchange = parts[-3]
+                                symbol = parts[-2]
+                                for t in trades:
+                                    t.setdefault('exchange', exchange)
+                                    t.setdefault('symbol', symbol)
+                            all_trades.extend(trades)
                         except Exception as e:
                             logging.error(f"Error loading {history_file}: {e}")
             
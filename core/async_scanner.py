@@ -1,29 +1,169 @@
 """
 TwinStar Quantum - Async Scanner
 aiohttp를 이용한 대량 심볼 동시 데이터 수집 및 스캔
+
+파이프라인 (심볼별로 이어서 진행, 결과는 심볼 순서):
+- 수집: 세마포어로 동시 요청 수 제한 + 거래소별 토큰 버킷으로 요청률 제한
+        (429/5xx/타임아웃/거래소 rate limit 코드는 지수 백오프 재시도)
+- 파싱: 응답 JSON → timestamp 오름차순 NumPy 배열 (timestamp/open/high/low/close/volume)
+- 점수: 지표/패턴 계산은 워커 풀(ProcessPool)에서 실행 → 이벤트 루프는 수집만 담당
 """
 import asyncio
 import aiohttp
 import pandas as pd
+import numpy as np
+import threading
 import time
 import logging
-from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, List, Dict, Optional
 from datetime import datetime
 
+from core.parallel_signals import default_workers
+from utils.api_utils import TokenBucket
+from utils.concurrent_downloader import DEFAULT_RATE_LIMITS
+from utils.indicators import calculate_rsi
+
 logger = logging.getLogger(__name__)
 
+# 재시도할 HTTP 상태 (418: Binance IP 차단 → 재시도하지 않음)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Bybit 응답 retCode 중 재시도할 코드 (10006: rate limit, 10016: 서버 오류)
+BYBIT_RETRY_CODES = {10006, 10016}
+
+CANDLE_FIELDS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+
+class _RetryableResponse(Exception):
+    """재시도 대상 응답 (retry_after: 거래소가 알려준 대기 시간)"""
+
+    def __init__(self, message: str, retry_after: float = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+# ========== 거래소별 요청률 ==========
+
+_rate_buckets: Dict[str, TokenBucket] = {}
+_rate_buckets_lock = threading.Lock()
+
+
+def get_rate_bucket(exchange: str) -> TokenBucket:
+    """거래소별 공유 토큰 버킷 (스캐너 인스턴스가 여러 개여도 합산 요청률 제한)"""
+    exchange = exchange.lower()
+    with _rate_buckets_lock:
+        bucket = _rate_buckets.get(exchange)
+        if bucket is None:
+            rate = DEFAULT_RATE_LIMITS.get(exchange, 5.0)
+            bucket = TokenBucket(rate, capacity=max(1.0, rate))
+            _rate_buckets[exchange] = bucket
+        return bucket
+
+
+# ========== 파싱 / 점수 ==========
+
+def parse_klines(exchange: str, data) -> Optional[Dict[str, np.ndarray]]:
+    """
+    캔들 응답 JSON → NumPy 배열 dict (timestamp 오름차순)
+
+    Returns:
+        {'timestamp': int64 ms, 'open'/'high'/'low'/'close'/'volume': float64}
+        형식이 맞지 않거나 비어 있으면 None
+    """
+    if exchange == 'bybit':
+        # {"retCode": 0, "result": {"list": [[start, open, high, low, close, volume, turnover], ...]}} (최신순)
+        if not isinstance(data, dict) or data.get('retCode', 0) != 0:
+            return None
+        result = data.get('result')
+        rows = result.get('list') if isinstance(result, dict) else None
+    elif exchange == 'binance':
+        # [[openTime, open, high, low, close, volume, closeTime, ...], ...] (오래된 순)
+        rows = data
+    else:
+        return None
+
+    if not isinstance(rows, list) or not rows:
+        return None
+    try:
+        values = np.array([row[:6] for row in rows], dtype=np.float64)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if values.ndim != 2 or values.shape[1] != 6:
+        return None
+
+    values = values[np.argsort(values[:, 0], kind='stable')]
+    candles = {name: values[:, i] for i, name in enumerate(CANDLE_FIELDS)}
+    candles['timestamp'] = values[:, 0].astype(np.int64)
+    return candles
+
+
+def score_candles(symbol: str, candles: Dict[str, np.ndarray], period: int = 14) -> Dict:
+    """
+    기본 점수 함수 (워커 풀에서 실행 → 모듈 최상위 함수)
+
+    Returns:
+        rsi / atr_pct (ATR/종가 %) / change_pct (구간 등락 %) / volume_ratio (마지막/평균 거래량)
+    """
+    close = candles['close']
+    high = candles['high']
+    low = candles['low']
+    volume = candles['volume']
+    last = float(close[-1])
+
+    prev_close = np.r_[close[0], close[:-1]]
+    true_range = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+    atr = float(np.mean(true_range[-period:]))
+    mean_volume = float(np.mean(volume))
+
+    return {
+        'symbol': symbol,
+        'price': last,
+        'rsi': float(calculate_rsi(close, period)),
+        'atr_pct': atr / last * 100 if last else 0.0,
+        'change_pct': (last / float(close[0]) - 1) * 100 if close[0] else 0.0,
+        'volume_ratio': float(volume[-1]) / mean_volume if mean_volume else 0.0,
+    }
+
+
 class AsyncScanner:
     """
     비동기 마켓 스캐너
     - Bybit/Binance API 비동기 호출
-    - 50개 이상의 심볼 동시 데이터 수집
-    - 병렬 지표 계산
+    - 50개 이상의 심볼 동시 데이터 수집 (동시 요청 수 / 요청률 제한)
+    - 병렬 지표 계산 (워커 풀)
     """
-    
-    def __init__(self, exchange: str = 'bybit'):
+
+    MAX_CONCURRENCY = 16
+    MAX_RETRIES = 3
+    RETRY_DELAY = 0.5   # 초 (attempt마다 2배)
+    MAX_RETRY_DELAY = 10.0
+    TIMEOUT = 10
+
+    def __init__(self, exchange: str = 'bybit', max_concurrency: int = None,
+                 rate: float = None, max_retries: int = None, retry_delay: float = None,
+                 workers: int = None, scorer: Optional[Callable] = score_candles,
+                 session_factory: Callable = None):
+        """
+        Args:
+            max_concurrency: 동시 요청 수 (재시도 대기 포함)
+            rate: 초당 요청 수 (None이면 거래소별 공유 버킷 사용)
+            workers: 점수 계산 워커 수 (None: CPU 코어 수 - 1, 1 이하면 현재 프로세스에서 계산)
+            scorer: (symbol, candles) → 점수 dict (pickle 가능한 모듈 최상위 함수, None이면 점수 생략)
+            session_factory: aiohttp.ClientSession 대체 (테스트용)
+        """
         self.exchange = exchange.lower()
         self.base_url = self._get_base_url()
-        
+        self.max_concurrency = max(1, int(max_concurrency or self.MAX_CONCURRENCY))
+        self.max_retries = max(1, int(max_retries or self.MAX_RETRIES))
+        self.retry_delay = self.RETRY_DELAY if retry_delay is None else retry_delay
+        self.bucket = TokenBucket(rate, capacity=max(1.0, rate)) if rate else get_rate_bucket(self.exchange)
+        self.workers = default_workers() if workers is None else int(workers)
+        self.scorer = scorer
+        self._session_factory = session_factory or aiohttp.ClientSession
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._stats = {'requests': 0, 'retries': 0, 'failed': 0, 'elapsed': 0.0}
+
     def _get_base_url(self) -> str:
         if self.exchange == 'bybit':
             return "https://api.bybit.com/v5/market/kline"
@@ -31,20 +171,61 @@ class AsyncScanner:
             return "https://fapi.binance.com/fapi/v1/klines"
         return ""
 
+    # ========== 수집 ==========
+
+    async def _acquire_token(self):
+        """토큰 버킷 대기 (이벤트 루프를 막지 않도록 asyncio.sleep)"""
+        while True:
+            wait = self.bucket.try_acquire()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    async def _request(self, session, symbol: str, params: Dict):
+        """요청 1회 → JSON (재시도 대상이면 _RetryableResponse, 그 외 실패는 None)"""
+        await self._acquire_token()
+        self._stats['requests'] += 1
+        async with session.get(self.base_url, params=params, timeout=self.TIMEOUT) as response:
+            if response.status in RETRY_STATUSES:
+                retry_after = None
+                headers = getattr(response, 'headers', None) or {}
+                try:
+                    retry_after = float(headers.get('Retry-After'))
+                except (TypeError, ValueError):
+                    pass
+                raise _RetryableResponse(f"status {response.status}", retry_after)
+            if response.status != 200:
+                logger.debug(f"[ASYNC] Failed {symbol}: Status {response.status}")
+                return None
+            data = await response.json()
+        if isinstance(data, dict) and data.get('retCode') in BYBIT_RETRY_CODES:
+            raise _RetryableResponse(f"retCode {data.get('retCode')}")
+        return data
+
     async def fetch_kline(self, session: aiohttp.ClientSession, symbol: str, timeframe: str, limit: int = 200) -> Optional[Dict]:
-        """단일 심볼 캔들 데이터 비동기 수집"""
+        """단일 심볼 캔들 데이터 비동기 수집 (실패 시 지수 백오프 재시도)"""
         params = self._get_params(symbol, timeframe, limit)
-        try:
-            async with session.get(self.base_url, params=params, timeout=10) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {'symbol': symbol, 'data': data}
-                else:
-                    logger.debug(f"[ASYNC] Failed {symbol}: Status {response.status}")
-                    return None
-        except Exception as e:
-            logger.debug(f"[ASYNC] Error {symbol}: {e}")
-            return None
+        for attempt in range(self.max_retries):
+            try:
+                data = await self._request(session, symbol, params)
+                if data is None:
+                    break
+                return {'symbol': symbol, 'data': data}
+            except (_RetryableResponse, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt + 1 >= self.max_retries:
+                    logger.debug(f"[ASYNC] Error {symbol}: {e} (after {self.max_retries} attempts)")
+                    break
+                delay = getattr(e, 'retry_after', None)
+                if delay is None:
+                    delay = min(self.retry_delay * (2 ** attempt), self.MAX_RETRY_DELAY)
+                self._stats['retries'] += 1
+                logger.debug(f"[ASYNC] {symbol} retry {attempt + 1}/{self.max_retries} in {delay:.2f}s: {e}")
+                await asyncio.sleep(delay)
+            except Exception as e:
+                logger.debug(f"[ASYNC] Error {symbol}: {e}")
+                break
+        self._stats['failed'] += 1
+        return None
 
     def _get_params(self, symbol: str, timeframe: str, limit: int) -> Dict:
         if self.exchange == 'bybit':
@@ -64,25 +245,89 @@ class AsyncScanner:
             }
         return {}
 
-    async def scan_symbols(self, symbols: List[str], timeframe: str) -> List[Dict]:
-        """여러 심볼 동시 스캔"""
+    # ========== 점수 ==========
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        if self.workers <= 1:
+            return None
+        if self._pool is None:
+            try:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            except (OSError, ValueError, NotImplementedError) as e:
+                logger.warning(f"[ASYNC] ProcessPool unavailable, scoring in-process: {e}")
+                self.workers = 1
+        return self._pool
+
+    async def _score(self, symbol: str, candles: Dict[str, np.ndarray]) -> Optional[Dict]:
+        """워커 풀에서 점수 계산 (풀이 없거나 깨지면 현재 프로세스에서)"""
+        try:
+            pool = self._get_pool()
+            if pool is not None:
+                try:
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(pool, self.scorer, symbol, candles)
+                except BrokenProcessPool as e:
+                    logger.warning(f"[ASYNC] Worker pool broken, scoring in-process: {e}")
+                    self.close()
+                    self.workers = 1
+            return self.scorer(symbol, candles)
+        except Exception as e:
+            logger.debug(f"[ASYNC] Score failed {symbol}: {e}")
+            return None
+
+    # ========== 스캔 ==========
+
+    async def _scan_one(self, session, semaphore: asyncio.Semaphore, symbol: str,
+                        timeframe: str, limit: int) -> Optional[Dict]:
+        async with semaphore:
+            result = await self.fetch_kline(session, symbol, timeframe, limit)
+        if result is None:
+            return None
+        candles = parse_klines(self.exchange, result['data'])
+        result['candles'] = candles
+        result['score'] = None
+        if candles is not None and self.scorer is not None:
+            result['score'] = await self._score(symbol, candles)
+        return result
+
+    async def scan_symbols(self, symbols: List[str], timeframe: str, limit: int = 200) -> List[Dict]:
+        """
+        여러 심볼 동시 스캔
+
+        Returns:
+            심볼 순서의 {'symbol', 'data' (원본 JSON), 'candles' (NumPy dict 또는 None), 'score'}
+            (수집 실패 심볼 제외)
+        """
         start_time = time.time()
         logger.info(f"[ASYNC] Scanning {len(symbols)} symbols on {timeframe}...")
-        
-        async with aiohttp.ClientSession() as session:
-            tasks = [self.fetch_kline(session, symbol, timeframe) for symbol in symbols]
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._session_factory() as session:
+            tasks = [self._scan_one(session, semaphore, symbol, timeframe, limit) for symbol in symbols]
             results = await asyncio.gather(*tasks)
-            
+
         valid_results = [r for r in results if r is not None]
-        
+
         elapsed = time.time() - start_time
+        self._stats['elapsed'] = elapsed
         logger.info(f"[ASYNC] Scan completed in {elapsed:.2f}s (Success: {len(valid_results)}/{len(symbols)})")
-        
+
         return valid_results
 
-    def run_sync_scan(self, symbols: List[str], timeframe: str) -> List[Dict]:
+    def run_sync_scan(self, symbols: List[str], timeframe: str, limit: int = 200) -> List[Dict]:
         """동기 인터페이스 (GUI 라이브러리 등에서 호출용)"""
-        return asyncio.run(self.scan_symbols(symbols, timeframe))
+        return asyncio.run(self.scan_symbols(symbols, timeframe, limit))
+
+    def close(self):
+        """점수 워커 풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    @property
+    def stats(self) -> Dict:
+        """요청/재시도/실패 횟수, 마지막 스캔 소요 시간"""
+        return dict(self._stats)
 
 if __name__ == "__main__":
     # 테스트
@@ -90,12 +335,12 @@ if __name__ == "__main__":
 
 
     test_symbols = ['BTCUSDT', 'ETHUSDT', 'SOLUSDT', 'XRPUSDT', 'ADAUSDT'] * 10 # 50개 테스트
-    
+
     # Windows 에러 방지
     import sys
     if sys.platform == 'win32':
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-        
+
     results = scanner.run_sync_scan(test_symbols, '15m')
+    scanner.close()
     logger.info(f"Total results: {len(results)}")
-
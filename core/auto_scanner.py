@@ -52,7 +52,7 @@ class AutoScanner(QObject):
         
         self.preset_manager = get_preset_manager()
         self.verified_symbols = []
-        self.monitoring_candidates = {} # {symbol: {params, ws_handler, detected_at}}
+        self.monitoring_candidates = {} # {symbol: {params, ws (StreamSubscription), detected_at}}
         self.active_positions = {} 
         self.lock = threading.Lock()
         
@@ -242,28 +242,20 @@ class AutoScanner(QObject):
             
         self.log(f"👀 Candidate Found: {item['symbol']} -> Starting WS Monitor")
         
-        from exchanges.ws_handler import WebSocketHandler
-        
-        # Init WS
-        ws = WebSocketHandler(item['exchange'], item['symbol'], interval='15m')
+        from exchanges.ws_stream_manager import get_stream_manager
         
         # Callback Closure
         def on_price(price):
             self._check_trigger(item, price)
-            
-        ws.on_price_update = on_price
-        
-        # Start WS in thread (asyncio loop managed inside ws_handler or we need to wrap it?)
-        # ws_handler.py `connect` is async. We need a thread to run `asyncio.run(ws.connect())`.
         
-        t = threading.Thread(target=ws.run_sync, daemon=True)
-        t.start()
+        # [PERF] 공유 멀티플렉싱 스트림에 구독만 추가 (심볼당 연결/스레드/이벤트 루프 X)
+        sub = get_stream_manager().subscribe(item['exchange'], item['symbol'], interval='15m',
+                                             on_price_update=on_price)
         
         with self.lock:
             self.monitoring_candidates[sys_id] = {
                 'params': item['params'],
-                'ws': ws,
-                'thread': t,
+                'ws': sub,
                 'detected_at': datetime.now()
             }
 
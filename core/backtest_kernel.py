@@ -0,0 +1,338 @@
+"""
+core/backtest_kernel.py
+AlphaX7Core.run_backtest 배열 기반 실행 커널
+
+- run_backtest 루프와 동일한 진입 / 트레일링 SL / 풀백 추가 진입 규칙
+- 타임스탬프는 int64 (ns), OHLC는 float64 배열로만 처리 (pd.Timestamp 변환 없음)
+- 포지션이 없고 대기 시그널도 없는 구간은 다음 시그널 시점으로 점프
+- 포지션 보유 구간은 윈도우 단위 누적 max/min 으로 트레일링 SL 및 청산봉 탐색
+- 거래 결과는 미리 할당된 structured 버퍼(TRADE_DTYPE)에 기록
+"""
+import logging
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+# 방향 코드
+DIR_LONG = 1
+DIR_SHORT = -1
+
+# 거래 버퍼 레코드 형식
+TRADE_DTYPE = np.dtype([
+    ('entry_idx', np.int64),
+    ('exit_idx', np.int64),
+    ('direction', np.int8),
+    ('entry', np.float64),
+    ('exit', np.float64),
+    ('pnl', np.float64),
+    ('is_addon', np.bool_),
+])
+
+# 포지션 보유 구간 스캔 시작 윈도우 크기 (청산봉이 없으면 2배씩 확장)
+_INITIAL_WINDOW = 64
+
+
+class TradeBuffer:
+    """미리 할당된 거래 결과 버퍼 (용량 부족 시 2배 확장)"""
+
+    def __init__(self, capacity: int = 256):
+        self._buf = np.empty(max(int(capacity), 1), dtype=TRADE_DTYPE)
+        self.size = 0
+
+    def _reserve(self, extra: int):
+        need = self.size + extra
+        if need > len(self._buf):
+            new_buf = np.empty(max(need, len(self._buf) * 2), dtype=TRADE_DTYPE)
+            new_buf[:self.size] = self._buf[:self.size]
+            self._buf = new_buf
+
+    def close_positions(
+        self,
+        entry_idx: List[int],
+        entries: List[float],
+        exit_idx: int,
+        direction: int,
+        exit_price: float,
+        fee_pct: float,
+    ):
+        """보유 포지션(메인 + 추가 진입) 일괄 청산 기록"""
+        k = len(entry_idx)
+        self._reserve(k)
+        buf = self._buf
+        for n, (idx, ep) in enumerate(zip(entry_idx, entries)):
+            if direction == DIR_LONG:
+                pnl = (exit_price - ep) / ep * 100 - fee_pct
+            else:
+                pnl = (ep - exit_price) / ep * 100 - fee_pct
+            buf[self.size] = (idx, exit_idx, direction, ep, exit_price, pnl, n > 0)
+            self.size += 1
+
+    def view(self) -> np.ndarray:
+        """기록된 거래 레코드 (복사 없음)"""
+        return self._buf[:self.size]
+
+
+def _next_true_index(mask: np.ndarray) -> np.ndarray:
+    """각 위치 k 이후(포함) 첫 True 인덱스 (없으면 len(mask)), 길이 len+1"""
+    m = len(mask)
+    idx = np.where(mask, np.arange(m), m)
+    nxt = np.minimum.accumulate(idx[::-1])[::-1] if m else idx
+    return np.append(nxt, m).astype(np.int64)
+
+
+def to_ns(values) -> np.ndarray:
+    """datetime 배열 → int64 나노초"""
+    arr = np.asarray(values)
+    if arr.dtype.kind == 'M':
+        return arr.astype('datetime64[ns]').view(np.int64)
+    return np.array([pd.Timestamp(v).value for v in arr], dtype=np.int64)
+
+
+def is_supported(highs: np.ndarray, lows: np.ndarray, opens: np.ndarray) -> bool:
+    """커널 사용 가능 여부 (NaN 캔들이 있으면 루프 방식 사용)"""
+    return bool(np.isfinite(highs).all() and np.isfinite(lows).all() and np.isfinite(opens).all())
+
+
+def run_trade_kernel(
+    times_ns: np.ndarray,
+    opens: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    rsis: np.ndarray,
+    atrs: np.ndarray,
+    trend: Optional[np.ndarray],
+    sig_ns: np.ndarray,
+    sig_dir: np.ndarray,
+    sig_allowed: np.ndarray,
+    validity_ns: int,
+    slippage: float,
+    atr_mult: float,
+    trail_start_r: float,
+    trail_dist_r: float,
+    pullback_rsi_long: float,
+    pullback_rsi_short: float,
+    max_adds: int,
+    enable_pullback: bool,
+) -> Tuple[np.ndarray, Dict]:
+    """
+    run_backtest 진입/청산 루프의 배열 구현
+
+    Args:
+        times_ns: 진입 TF 캔들 시간 (int64 ns, 오름차순)
+        opens/highs/lows: 진입 TF OHLC (float64)
+        rsis/atrs: 캔들별 RSI / ATR
+        trend: 캔들별 MTF 추세 코드 (1=up, -1=down), None이면 필터 없음
+        sig_ns: 시그널 시간 (int64 ns, 오름차순)
+        sig_dir: 시그널 방향 코드 (1=Long, -1=Short)
+        sig_allowed: allowed_direction 통과 여부
+        validity_ns: 시그널 유효시간 (ns)
+
+    Returns:
+        (거래 레코드 배열(TRADE_DTYPE), 최종 상태 dict)
+    """
+    n = len(times_ns)
+    m = len(sig_ns)
+    fee_pct = slippage * 2 * 100
+    buf = TradeBuffer(capacity=max(64, m * 2))
+
+    exp_ns = sig_ns + validity_ns
+    next_long = _next_true_index((sig_dir == DIR_LONG) & sig_allowed)
+    next_short = _next_true_index((sig_dir == DIR_SHORT) & sig_allowed)
+    next_any = np.minimum(next_long, next_short)
+
+    # 캔들별 진입 가능 여부 / SL (시그널 무관하게 한 번만 계산)
+    sl_long_all = opens - atrs * atr_mult
+    sl_short_all = opens + atrs * atr_mult
+    long_ok_all = (atrs > 0) & (opens > sl_long_all)
+    short_ok_all = (atrs > 0) & (opens < sl_short_all)
+    if trend is not None:
+        long_ok_all &= trend != -1
+        short_ok_all &= trend != 1
+
+    # 트레일링 배수 / 풀백 조건
+    mult_long = np.where(rsis > pullback_rsi_short, 2.0, np.where(rsis < 50, 0.8, 1.0))
+    mult_short = np.where(rsis < pullback_rsi_long, 2.0, np.where(rsis > 50, 0.8, 1.0))
+    add_long = rsis < pullback_rsi_long
+    add_short = rsis > pullback_rsi_short
+
+    # 상태 (run_backtest 루프 변수와 1:1 대응)
+    direction = 0
+    pos_idx: List[int] = []
+    pos_entry: List[float] = []
+    add_count = 0
+    shared_sl = None
+    shared_trail_start = None
+    shared_trail_dist = None
+    extreme_price = None
+    p_clear = 0  # 진입 시 pending.clear() 지점
+
+    i = 0
+    while i < n:
+        # ---- 포지션 없음: 대기 시그널로 진입 시도 ----
+        t = times_ns[i]
+        hi = int(sig_ns.searchsorted(t, side='right'))
+        lo = max(p_clear, int(exp_ns.searchsorted(t, side='right')))
+
+        if lo >= hi or next_any[lo] >= hi:
+            # 진입 가능한 대기 시그널 없음 → 다음 허용 시그널 도착 캔들로 점프
+            k = next_any[hi] if hi < m else m
+            if k >= m:
+                break
+            i = max(i + 1, int(times_ns.searchsorted(sig_ns[k], side='left')))
+            continue
+
+        # 대기 시그널 구성이 바뀌는 시점(다음 시그널 도착 / 선두 시그널 만료) 전까지 진입 가능 캔들 탐색
+        t_next = exp_ns[lo] if hi >= m else min(exp_ns[lo], sig_ns[hi])
+        seg_end = max(i + 1, int(times_ns.searchsorted(t_next, side='left')))
+        has_long = next_long[lo] < hi
+        has_short = next_short[lo] < hi
+        if has_long and has_short:
+            entry_ok = long_ok_all[i:seg_end] | short_ok_all[i:seg_end]
+        else:
+            entry_ok = long_ok_all[i:seg_end] if has_long else short_ok_all[i:seg_end]
+        if not entry_ok.any():
+            i = seg_end
+            continue
+
+        i += int(entry_ok.argmax())
+        k = m
+        if has_long and long_ok_all[i]:
+            k = next_long[lo]
+        if has_short and short_ok_all[i]:
+            k = min(k, next_short[lo])
+
+        # ---- 진입 ----
+        direction = int(sig_dir[k])
+        ep = opens[i]
+        sl = sl_long_all[i] if direction == DIR_LONG else sl_short_all[i]
+        risk = abs(ep - sl)
+        extreme_price = ep
+        shared_sl = sl
+        add_count = 0
+        shared_trail_start = ep + risk * trail_start_r if direction == DIR_LONG else ep - risk * trail_start_r
+        shared_trail_dist = risk * trail_dist_r
+        pos_idx = [i]
+        pos_entry = [ep]
+        p_clear = hi
+
+        # ---- 포지션 보유: 윈도우 단위로 트레일링 SL / 청산봉 탐색 ----
+        j = i + 1
+        window = _INITIAL_WINDOW
+        exit_bar = -1
+        while j < n:
+            b = min(n, j + window)
+            if direction == DIR_LONG:
+                h = highs[j:b]
+                cur = np.maximum(np.maximum.accumulate(h), extreme_price)
+                new_ext = h > np.concatenate(([extreme_price], cur[:-1]))
+                cand = np.where(new_ext & (cur >= shared_trail_start),
+                                cur - shared_trail_dist * mult_long[j:b], -np.inf)
+                sl_run = np.maximum(np.maximum.accumulate(cand), shared_sl)
+                hit = lows[j:b] <= sl_run
+                add_mask = add_long[j:b]
+            else:
+                lw = lows[j:b]
+                cur = np.minimum(np.minimum.accumulate(lw), extreme_price)
+                new_ext = lw < np.concatenate(([extreme_price], cur[:-1]))
+                cand = np.where(new_ext & (cur <= shared_trail_start),
+                                cur + shared_trail_dist * mult_short[j:b], np.inf)
+                sl_run = np.minimum(np.minimum.accumulate(cand), shared_sl)
+                hit = highs[j:b] >= sl_run
+                add_mask = add_short[j:b]
+
+            span = b - j
+            if hit.any():
+                span = int(hit.argmax())
+                exit_bar = j + span
+
+            # 풀백 추가 진입 (청산봉 이전 캔들에서만)
+            if enable_pullback and add_count < max_adds and span > 0:
+                for off in np.flatnonzero(add_mask[:span]):
+                    if add_count >= max_adds:
+                        break
+                    pos_idx.append(j + int(off))
+                    pos_entry.append(opens[j + int(off)])
+                    add_count += 1
+
+            last = span if exit_bar >= 0 else span - 1
+            extreme_price = cur[last]
+            shared_sl = sl_run[last]
+            if exit_bar >= 0:
+                break
+            j = b
+            window *= 2
+
+        if exit_bar < 0:
+            # 데이터 끝까지 보유
+            break
+
+        buf.close_positions(pos_idx, pos_entry, exit_bar, direction, shared_sl, fee_pct)
+        direction = 0
+        pos_idx, pos_entry = [], []
+        add_count = 0
+        # 청산봉에서 즉시 재진입 가능 (원본 루프와 동일)
+        i = exit_bar
+
+    # 최종 대기 시그널 구간
+    if n > 0:
+        t_last = times_ns[-1]
+        hi = int(sig_ns.searchsorted(t_last, side='right'))
+        lo = max(p_clear, int(exp_ns.searchsorted(t_last, side='right')))
+    else:
+        hi = lo = 0
+
+    state = {
+        'direction': direction,
+        'pos_idx': pos_idx,
+        'pos_entry': pos_entry,
+        'add_count': add_count,
+        'current_sl': shared_sl,
+        'extreme_price': extreme_price,
+        'trail_start': shared_trail_start,
+        'trail_dist': shared_trail_dist,
+        'pending_range': (lo, max(lo, hi)),
+    }
+    return buf.view(), state
+
+
+def build_trade_dicts(records: np.ndarray, times: np.ndarray) -> List[Dict]:
+    """거래 레코드 → run_backtest 거래 dict 목록 (원본 루프와 동일한 키/타입)"""
+    trades = []
+    for rec in records:
+        entry_idx = int(rec['entry_idx'])
+        exit_idx = int(rec['exit_idx'])
+        trades.append({
+            'entry_time': times[entry_idx], 'exit_time': times[exit_idx],
+            'type': 'Long' if rec['direction'] == DIR_LONG else 'Short',
+            'entry': rec['entry'], 'exit': rec['exit'], 'pnl': rec['pnl'],
+            'is_addon': bool(rec['is_addon']), 'entry_idx': entry_idx, 'exit_idx': exit_idx,
+        })
+    return trades
+
+
+def build_final_state(state: Dict, signals: List[Dict], times: np.ndarray, entry_validity_hours: float) -> Dict:
+    """커널 상태 → run_backtest(return_state=True) 최종 상태 dict"""
+    lo, hi = state['pending_range']
+    pending = []
+    for sig in signals[lo:hi]:
+        order = sig.copy()
+        order['expire_time'] = pd.Timestamp(sig['time']) + timedelta(hours=entry_validity_hours)
+        pending.append(order)
+
+    positions = [
+        {'entry_time': times[idx], 'entry': ep, 'is_addon': k > 0, 'entry_idx': idx}
+        for k, (idx, ep) in enumerate(zip(state['pos_idx'], state['pos_entry']))
+    ]
+    direction = state['direction']
+    return {
+        'position': ('Long' if direction == DIR_LONG else 'Short') if direction else None,
+        'positions': positions, 'current_sl': state['current_sl'],
+        'extreme_price': state['extreme_price'], 'trail_start': state['trail_start'],
+        'trail_dist': state['trail_dist'], 'pending': pending, 'add_count': state['add_count'],
+        'last_idx': len(times) - 1, 'last_time': times[-1] if len(times) > 0 else None,
+    }
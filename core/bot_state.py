@@ -8,7 +8,10 @@ core/bot_state.py
 """
 
 import os
+import copy
 import tempfile
+import threading
+import time
 
 import json
 import logging
@@ -16,6 +19,15 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, List
 from pathlib import Path
 
+from storage.trade_journal import TradeJournal
+
+
+def _apply_state_delta(state: Dict, delta: Dict):
+    """WAL 델타 반영 (최상위 키 교체/삭제 - 전체 재생해도 결과 동일)"""
+    state.update(delta.get('set', {}))
+    for key in delta.get('del', ()):
+        state.pop(key, None)
+
 
 class BotStateManager:
     """
@@ -24,8 +36,15 @@ class BotStateManager:
     - 인스턴스별 상태 파일 분리 (exchange_symbol 조합)
     - 새 Storage 시스템과 레거시 파일 모두 지원
     - 캐시 관리 (1시간 유효)
+    - [PERF] use_wal=True: 저장 시 변경된 최상위 키만 WAL에 추가 (group commit),
+      주기적으로 기존 JSON 스냅샷(state/bot_state/새 Storage)에 체크포인트
     """
     
+    WAL_SYNC_EVERY = 8          # 이만큼 쌓이면 fsync (group commit)
+    WAL_SYNC_INTERVAL = 1.0     # 마지막 fsync 후 이 시간(초) 지나면 fsync
+    CHECKPOINT_EVERY = 200      # WAL 델타가 이만큼 쌓이면 체크포인트
+    CHECKPOINT_INTERVAL = 60    # 마지막 체크포인트 후 이 시간(초) 지나면 체크포인트
+    
     def __init__(
         self, 
         exchange_name: str, 
@@ -33,7 +52,8 @@ class BotStateManager:
         storage_dir: str = None,
         use_new_storage: bool = False,
         state_storage = None,
-        trade_storage = None
+        trade_storage = None,
+        use_wal: bool = False
     ):
         """
         Args:
@@ -43,6 +63,7 @@ class BotStateManager:
             use_new_storage: 새 Storage 시스템 사용 여부
             state_storage: StateStorage 인스턴스 (use_new_storage=True일 때)
             trade_storage: TradeStorage 인스턴스 (use_new_storage=True일 때)
+            use_wal: 상태를 WAL 델타로 저장 (스냅샷은 체크포인트 시에만 재작성)
         """
         self.exchange_name = exchange_name.lower()
         self.symbol = symbol.replace('/', '').replace('-', '').upper()
@@ -73,6 +94,24 @@ class BotStateManager:
         self.state_storage = state_storage
         self.trade_storage = trade_storage
         
+        # [PERF] 상태 WAL ({instance_id}_state.json.wal)
+        self.use_wal = use_wal
+        self._wal_lock = threading.Lock()
+        self._wal: Optional[TradeJournal] = None
+        self._wal_encoded: Optional[Dict[str, str]] = None  # 최상위 키별 직렬화 (변경 감지)
+        self._last_checkpoint = time.monotonic()
+        if use_wal:
+            self._wal = TradeJournal(
+                str(self.state_file),
+                empty=dict,
+                apply=_apply_state_delta,
+                size=lambda state: 0,
+                on_compact=self._write_checkpoint_copies,
+                sync_every=self.WAL_SYNC_EVERY,
+                sync_interval=self.WAL_SYNC_INTERVAL,
+                compact_every=self.CHECKPOINT_EVERY,
+            )
+        
         logging.debug(f"[STATE] Initialized: {instance_id} → {self.state_file}")
 
         # Managed Positions (Phase 8.1.1)
@@ -89,6 +128,13 @@ class BotStateManager:
             상태 딕셔너리 또는 None
         """
         try:
+            # 0. WAL 모드: 스냅샷 + WAL 재생 상태가 가장 최신
+            if self._wal is not None:
+                with self._wal_lock:
+                    state = self._wal.state
+                    if state:
+                        return copy.deepcopy(state)
+            
             # 1. 새 Storage 우선
             if self.use_new_storage and self.state_storage:
                 state = self.state_storage.load()
@@ -116,12 +162,13 @@ class BotStateManager:
             logging.error(f"[STATE] Load error: {e}")
             return None
     
-    def save_state(self, state: Dict) -> bool:
+    def save_state(self, state: Dict, sync: bool = False) -> bool:
         """
         상태 저장 (Atomic Write 적용)
         
         Args:
             state: 저장할 상태 딕셔너리
+            sync: WAL 모드에서 group commit을 기다리지 않고 즉시 fsync
             
         Returns:
             성공 여부
@@ -132,23 +179,19 @@ class BotStateManager:
             state['exchange'] = self.exchange_name
             state['symbol'] = self.symbol
             
+            # [PERF] WAL 모드: 변경 키만 추가 기록, 스냅샷은 체크포인트 시
+            if self._wal is not None:
+                self._append_state_delta(state, sync)
+                logging.debug(f"[STATE] Logged to WAL: {self.state_file.name}")
+                return True
+            
             # 1. 새 Storage 저장
             if self.use_new_storage and self.state_storage:
                 self.state_storage.save(state)
             
             # 2. 인스턴스 전용 파일 저장 (Atomic Write)
-            self.storage_dir.mkdir(parents=True, exist_ok=True)
-            
-            # 임시 파일 사용하여 원자적 쓰기 보장
-            dir_name = str(self.storage_dir)
             try:
-                with tempfile.NamedTemporaryFile('w', dir=dir_name, delete=False, encoding='utf-8') as tmp_file:
-                    json.dump(state, tmp_file, indent=2, ensure_ascii=False, default=str)
-                    tmp_file.flush()
-                    os.fsync(tmp_file.fileno())
-                    tmp_name = tmp_file.name
-                
-                os.replace(tmp_name, self.state_file)
+                self._write_json_atomic(self.state_file, state)
             except Exception as e:
                 logging.error(f"[STATE] Atomic write failed: {e}")
                 # Fallback to direct write if temp file fails (e.g. permission)
@@ -156,26 +199,7 @@ class BotStateManager:
                     json.dump(state, f, indent=2, ensure_ascii=False, default=str)
 
             # 3. 레거시 파일도 저장 (UI 동기화용)
-            try:
-                legacy_dir = os.path.dirname(self.default_state_file)
-                if not os.path.exists(legacy_dir):
-                     os.makedirs(legacy_dir, exist_ok=True)
-
-                with tempfile.NamedTemporaryFile('w', dir=legacy_dir, delete=False, encoding='utf-8') as tmp_file_legacy:
-                    json.dump(state, tmp_file_legacy, indent=2, ensure_ascii=False, default=str)
-                    tmp_file_legacy.flush()
-                    os.fsync(tmp_file_legacy.fileno())
-                    tmp_name_legacy = tmp_file_legacy.name
-                
-                os.replace(tmp_name_legacy, self.default_state_file)
-            except Exception as e:
-                logging.debug(f"[STATE] Legacy save failed: {e}")
-                # Try simple write fallback
-                try:
-                    with open(self.default_state_file, 'w', encoding='utf-8') as f:
-                         json.dump(state, f, indent=2, ensure_ascii=False, default=str)
-                except:
-                     pass
+            self._write_legacy_state(state)
             
             logging.debug(f"[STATE] Saved: {self.state_file.name}")
             return True
@@ -184,6 +208,89 @@ class BotStateManager:
             logging.error(f"[STATE] Save error: {e}")
             return False
     
+    @staticmethod
+    def _write_json_atomic(path: Path, state: Dict):
+        """임시 파일 + fsync + os.replace 원자적 쓰기"""
+        dir_name = os.path.dirname(str(path))
+        os.makedirs(dir_name, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', dir=dir_name, delete=False, encoding='utf-8') as tmp_file:
+            json.dump(state, tmp_file, indent=2, ensure_ascii=False, default=str)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+            tmp_name = tmp_file.name
+        os.replace(tmp_name, path)
+    
+    def _write_legacy_state(self, state: Dict):
+        """레거시 bot_state.json 저장 (실패해도 무시)"""
+        try:
+            self._write_json_atomic(self.default_state_file, state)
+        except Exception as e:
+            logging.debug(f"[STATE] Legacy save failed: {e}")
+            # Try simple write fallback
+            try:
+                with open(self.default_state_file, 'w', encoding='utf-8') as f:
+                     json.dump(state, f, indent=2, ensure_ascii=False, default=str)
+            except:
+                 pass
+    
+    # ========== 상태 WAL ==========
+    
+    def _append_state_delta(self, state: Dict, sync: bool = False):
+        """이전 저장 대비 바뀐 최상위 키만 WAL에 추가"""
+        with self._wal_lock:
+            current = self._wal.state
+            if self._wal_encoded is None:
+                self._wal_encoded = {
+                    k: json.dumps(v, ensure_ascii=False, default=str) for k, v in current.items()
+                }
+            
+            encoded = {k: json.dumps(v, ensure_ascii=False, default=str) for k, v in state.items()}
+            changed = {k: json.loads(text) for k, text in encoded.items() if self._wal_encoded.get(k) != text}
+            removed = [k for k in self._wal_encoded if k not in encoded]
+            
+            if changed or removed:
+                delta = {'set': changed}
+                if removed:
+                    delta['del'] = removed
+                self._wal.append(delta, sync=sync)
+                self._wal_encoded = encoded
+            elif sync:
+                self._wal.sync()
+            
+            if time.monotonic() - self._last_checkpoint >= self.CHECKPOINT_INTERVAL:
+                self._wal.compact()
+    
+    def _write_checkpoint_copies(self, state: Dict):
+        """체크포인트: 인스턴스 스냅샷 교체 직후 새 Storage / 레거시 파일도 갱신"""
+        self._last_checkpoint = time.monotonic()
+        if self.use_new_storage and self.state_storage:
+            try:
+                self.state_storage.save(copy.deepcopy(state))
+            except Exception as e:
+                logging.error(f"[STATE] Checkpoint to new storage failed: {e}")
+        self._write_legacy_state(state)
+        logging.debug(f"[STATE] Checkpoint: {self.state_file.name}")
+    
+    def checkpoint(self) -> bool:
+        """WAL을 JSON 스냅샷으로 체크포인트 (WAL 모드가 아니면 아무것도 안 함)"""
+        if self._wal is None:
+            return False
+        try:
+            with self._wal_lock:
+                self._wal.sync()
+                return self._wal.compact()
+        except Exception as e:
+            logging.error(f"[STATE] Checkpoint error: {e}")
+            return False
+    
+    def close(self):
+        """종료 시 호출: 체크포인트 후 WAL 파일 닫기"""
+        if self._wal is None:
+            return
+        self.checkpoint()
+        with self._wal_lock:
+            self._wal.close()
+    
     # ========== 캐시 관리 ==========
     
     def load_cache(self, max_age_hours: float = 1.0) -> Optional[Dict]:
@@ -326,10 +433,10 @@ class BotStateManager:
             logging.debug(f"[POS] Loaded {len(self.managed_positions)} managed positions")
 
     def _save_managed_positions(self):
-        """managed_positions를 상태에 저장"""
+        """managed_positions를 상태에 저장 (포지션 등록/해제는 즉시 fsync)"""
         state = self.load_state() or {}
         state['managed_positions'] = self.managed_positions
-        self.save_state(state)
+        self.save_state(state, sync=True)
 
     def add_managed_position(
         self, 
@@ -16,6 +16,10 @@ from datetime import datetime
 from typing import Optional, Dict, Callable
 import threading
 
+from storage.candle_store import get_candle_store
+from storage.resample_cache import ResamplePyramid
+from utils.indicators import IndicatorStreams
+
 
 # TF 리샘플링 규칙 (pandas 호환)
 TF_RESAMPLE_FIX = {
@@ -65,6 +69,9 @@ class BotDataManager:
         
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
+        # [PERF] 캔들 저장소 (캔들당 델타 추가, entry 파일은 압축 시 미러로 갱신)
+        self.candle_store = get_candle_store(self.cache_dir)
+        
         # 데이터 저장소
         self.df_entry_full: Optional[pd.DataFrame] = None       # 15m 원본
         self.df_entry_resampled: Optional[pd.DataFrame] = None  # Entry TF 리샘플링
@@ -81,6 +88,12 @@ class BotDataManager:
         # 스레드 안전
         self._data_lock = threading.RLock()
         
+        # [PERF] 15m Entry 지표 스트리밍 상태 (캔들 마감마다 O(1) 갱신)
+        self._entry_streams = IndicatorStreams()
+        
+        # [PERF] 상위 TF 리샘플 상태 (새 캔들이 속한 마지막 구간만 다시 계산)
+        self._tf_pyramid: Optional[ResamplePyramid] = None
+        
         logging.debug(f"[DATA] Manager initialized: {self.exchange_name}_{self.symbol_clean}")
     
     # ========== Parquet 파일 경로 ==========
@@ -112,9 +125,10 @@ class BotDataManager:
         try:
             entry_file = self.get_entry_file_path()
             
-            if entry_file.exists():
-                df = pd.read_parquet(entry_file)
-                
+            # 저장소 최근 1000개 조회 (기존 entry 파일과 같은 구간, 최초 접근 시 entry 파일을 가져옴)
+            df = self.candle_store.tail(self.exchange_name, self.symbol_clean, '15m', 1000)
+            
+            if not df.empty:
                 # Timestamp 변환/정규화
                 if 'timestamp' in df.columns:
                     if pd.api.types.is_numeric_dtype(df['timestamp']):
@@ -181,43 +195,32 @@ class BotDataManager:
             
             # 1. Entry TF 리샘플링
             entry_tf = self.strategy_params.get('entry_tf', '15m')
-            if entry_tf in ['15m', '15min']:
-                self.df_entry_resampled = self.df_entry_full.copy()
+            pattern_tf = self.strategy_params.get('pattern_tf', '1h')
+            pattern_rule = self._resample_rule(pattern_tf)
+            is_base_tf = entry_tf in ['15m', '15min']
+            resample_rule = pattern_rule if is_base_tf else self._resample_rule(entry_tf)
+            # [PERF] Entry/Pattern TF를 한 번에 증분 리샘플
+            frames = self._resample_entry(resample_rule, pattern_rule)
+            if entry_tf in ['15m', '15min'] and self._extend_entry_indicators():
+                # [PERF] 새 캔들만 스트리밍 지표로 추가 (전체 재계산 X)
+                pass
+            elif entry_tf in ['15m', '15min']:
+                self.df_entry_resampled = add_all_indicators(self.df_entry_full.copy())
+                self._entry_streams.reset()
+                self._entry_streams.sync(self.df_entry_resampled)
             else:
-                resample_rule = TF_RESAMPLE_FIX.get(entry_tf, entry_tf)
-                if resample_rule.endswith('m') and not resample_rule.endswith('min'):
-                    resample_rule = resample_rule.replace('m', 'min')
-                
                 logging.info(f"[DATA] Resampling: 15m -> {entry_tf}")
                 
-                df_temp = self.df_entry_full.copy()
-                if 'timestamp' in df_temp.columns:
-                    df_temp = df_temp.set_index('timestamp')
+                self.df_entry_resampled = frames[resample_rule]
                 
-                self.df_entry_resampled = df_temp.resample(resample_rule).agg({
-                    'open': 'first', 'high': 'max', 'low': 'min', 
-                    'close': 'last', 'volume': 'sum'
-                }).dropna().reset_index()
+                # Entry 지표 추가
+                self.df_entry_resampled = add_all_indicators(self.df_entry_resampled)
             
-            # Entry 지표 추가
-            self.df_entry_resampled = add_all_indicators(self.df_entry_resampled)
             logging.info(f"[DATA] Entry processed ({entry_tf}): {len(self.df_entry_resampled)} candles")
             
             # 2. Pattern Data 생성 (기본 1h, 파라미터로 변경 가능)
-            pattern_tf = self.strategy_params.get('pattern_tf', '1h')
-            resample_rule_pattern = TF_RESAMPLE_FIX.get(pattern_tf, pattern_tf)
-            if resample_rule_pattern.endswith('m') and not resample_rule_pattern.endswith('min'):
-                resample_rule_pattern = resample_rule_pattern.replace('m', 'min')
-                
-            df_temp = self.df_entry_full.copy()
-            if 'timestamp' in df_temp.columns:
-                df_temp = df_temp.set_index('timestamp')
-            
             logging.info(f"[DATA] Resampling Pattern: 15m -> {pattern_tf}")
-            self.df_pattern_full = df_temp.resample(resample_rule_pattern).agg({
-                'open': 'first', 'high': 'max', 'low': 'min', 
-                'close': 'last', 'volume': 'sum'
-            }).dropna().reset_index()
+            self.df_pattern_full = frames[pattern_rule]
             
             # Pattern 지표 추가
             self.df_pattern_full = add_all_indicators(self.df_pattern_full)
@@ -239,6 +242,57 @@ class BotDataManager:
             import traceback
             traceback.print_exc()
     
+    @staticmethod
+    def _resample_rule(tf: str) -> str:
+        """TF 문자열 → pandas 리샘플 규칙"""
+        rule = TF_RESAMPLE_FIX.get(tf, tf)
+        if rule.endswith('m') and not rule.endswith('min'):
+            rule = rule.replace('m', 'min')
+        return rule
+    
+    def _resample_entry(self, *rules: str) -> Dict[str, pd.DataFrame]:
+        """
+        15m 원본 → 상위 TF OHLCV {rule: DataFrame} (timestamp = 구간 시작)
+        
+        직전 호출과 같은 TF 조합이면 새 캔들이 속한 구간만 다시 계산
+        """
+        rules = tuple(dict.fromkeys(rules))
+        if self._tf_pyramid is None or tuple(self._tf_pyramid.rules) != rules:
+            self._tf_pyramid = ResamplePyramid(rules, time_column='timestamp')
+        result = {}
+        for rule, frame in self._tf_pyramid.update(self.df_entry_full).items():
+            columns = ['datetime'] + [c for c in ('open', 'high', 'low', 'close', 'volume') if c in frame.columns]
+            result[rule] = frame[columns].rename(columns={'datetime': 'timestamp'})
+        return result
+    
+    def _extend_entry_indicators(self) -> bool:
+        """
+        15m Entry: 지난 처리 이후 추가된 캔들만 스트리밍 지표로 계산해 붙이기
+        
+        Returns:
+            True면 처리 완료, False면 전체 재계산 필요 (최초/과거 캔들 보충/수정)
+        """
+        prev = self.df_entry_resampled
+        full = self.df_entry_full
+        streams = self._entry_streams
+        if prev is None or prev.empty or 'timestamp' not in full.columns or 'timestamp' not in prev.columns:
+            return False
+        if not streams.ready or prev['timestamp'].iloc[-1] != streams.last_timestamp:
+            return False
+        start = streams.new_rows_start(full)
+        if start is None:
+            return False
+        
+        new_rows = full.iloc[start:].copy()
+        if not new_rows.empty:
+            values = streams.sync(full)
+            for col in streams.COLUMNS:
+                new_rows[col] = [v[col] for v in values]
+            prev = pd.concat([prev, new_rows], ignore_index=True)
+        # df_entry_full과 같은 구간 유지 (최대 1000개)
+        self.df_entry_resampled = prev.tail(len(full)).reset_index(drop=True)
+        return True
+    
     # ========== 데이터 저장 ==========
     
     def save_parquet(self):
@@ -248,17 +302,12 @@ class BotDataManager:
         try:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
             
-            # 15m 데이터 저장
+            # 15m 데이터 저장 (저장소에 추가 후 압축 → entry 파일 미러 갱신)
             if self.df_entry_full is not None and len(self.df_entry_full) > 0:
                 entry_file = self.get_entry_file_path()
-                save_df = self.df_entry_full.tail(1000).copy()
-                
-                # Timestamp 처리 (ms 정수로)
-                if 'timestamp' in save_df.columns:
-                    if pd.api.types.is_datetime64_any_dtype(save_df['timestamp']):
-                        save_df['timestamp'] = save_df['timestamp'].astype(np.int64) // 10**6
-                
-                save_df.to_parquet(entry_file, index=False)
+                self.candle_store.append(self.exchange_name, self.symbol_clean, '15m', self.df_entry_full.tail(1000))
+                # 아래에서 entry 파일을 바로 복제하므로 미러 간격과 관계없이 기록
+                self.candle_store.compact(self.exchange_name, self.symbol_clean, '15m', force_mirror=True)
                 logging.debug(f"[DATA] Saved 15m: {entry_file.name}")
                 
                 # Bithumb -> Upbit 복제 (하이브리드 모드)
@@ -306,17 +355,29 @@ class BotDataManager:
             if 'timestamp' in new_row.columns:
                 new_row['timestamp'] = pd.to_datetime(new_row['timestamp'])
             
-            # 추가 및 중복 제거
-            self.df_entry_full = pd.concat([self.df_entry_full, new_row], ignore_index=True)
-            self.df_entry_full = self.df_entry_full.drop_duplicates(subset='timestamp', keep='last')
-            self.df_entry_full = self.df_entry_full.sort_values('timestamp').reset_index(drop=True)
+            # [PERF] 최신 캔들은 끝에 붙이기만 함 (중복 제거/정렬은 과거 캔들일 때만)
+            last_ts = self.df_entry_full['timestamp'].iloc[-1] if len(self.df_entry_full) else None
+            new_ts = new_row['timestamp'].iloc[0] if 'timestamp' in new_row.columns else None
+            if last_ts is not None and new_ts is not None and new_ts > last_ts:
+                self.df_entry_full = pd.concat([self.df_entry_full, new_row], ignore_index=True)
+            elif last_ts is not None and new_ts is not None and new_ts == last_ts:
+                self.df_entry_full = pd.concat([self.df_entry_full.iloc[:-1], new_row], ignore_index=True)
+            else:
+                # 추가 및 중복 제거
+                self.df_entry_full = pd.concat([self.df_entry_full, new_row], ignore_index=True)
+                self.df_entry_full = self.df_entry_full.drop_duplicates(subset='timestamp', keep='last')
+                self.df_entry_full = self.df_entry_full.sort_values('timestamp').reset_index(drop=True)
             
             # 최대 1000개 유지
             if len(self.df_entry_full) > 1000:
                 self.df_entry_full = self.df_entry_full.tail(1000).reset_index(drop=True)
             
             if save:
-                self.save_parquet()
+                # [PERF] 캔들 1개만 델타로 기록 (1000행 파일 재작성 X)
+                try:
+                    self.candle_store.append(self.exchange_name, self.symbol_clean, '15m', new_row)
+                except Exception as e:
+                    logging.error(f"[DATA] Candle append failed: {e}")
     
     def backfill(self, fetch_callback: Callable) -> int:
         """
@@ -399,6 +460,7 @@ class BotDataManager:
         self.df_entry_full = None
         self.df_entry_resampled = None
         self.df_pattern_full = None
+        self._tf_pyramid = None
         self.indicator_cache = {
             'df_pattern': None,
             'df_entry': None,
@@ -0,0 +1,158 @@
+"""
+core/incremental_patterns.py
+실시간 W/M 패턴 증분 감지기
+
+- AlphaX7Core._extract_all_signals / extract_hl_points와 동일한 시그널 (같은 이력 기준)
+- MACD 히스토그램 진행 중 구간과 최근 H/L 포인트만 상태로 유지
+- 새로 마감된 봉만 검사 → 캔들당 지연이 이력 길이와 무관 (O(1))
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.indicators import StreamingMACD
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalPatternDetector:
+    """
+    W/M 패턴 증분 감지기
+
+    update(df)는 마지막으로 반영한 봉 이후의 새 봉만 처리하고,
+    이력이 어긋나면(과거 봉 보충/수정) 처음부터 재시드한다.
+
+    Usage:
+        detector = IncrementalPatternDetector(tolerance=0.05)
+        new_signals = detector.update(df_1h_closed)   # 마감된 봉만 전달
+    """
+
+    def __init__(self, tolerance: float, macd_fast: int = 12, macd_slow: int = 26, macd_signal: int = 9):
+        self.tolerance = tolerance
+        self._macd_periods = (macd_fast, macd_slow, macd_signal)
+        self.reset()
+
+    def reset(self):
+        """상태 초기화 (다음 update에서 재시드)"""
+        self._macd = StreamingMACD(*self._macd_periods)
+        # 진행 중 히스토그램 구간: 부호, 극값, 극값 시각, 구간 마지막 봉 시각
+        self._seg_sign: Optional[int] = None
+        self._seg_price = np.nan
+        self._seg_time = None
+        self._seg_last_time = None
+        self._points: List[Dict] = []  # 최근 확정 H/L 포인트 (최대 2개)
+        self._cast = None
+        self.signals: List[Dict] = []  # 지금까지 감지한 전체 시그널 (시간순)
+        self.last_timestamp = None
+        self._last_close = None
+
+    def _new_rows_start(self, df: pd.DataFrame) -> Optional[int]:
+        """df에서 아직 반영하지 않은 첫 행 위치 (이력이 어긋나면 None)"""
+        if self.last_timestamp is None:
+            return None
+        timestamps = df['timestamp']
+        if not timestamps.is_monotonic_increasing:
+            return None
+        pos = int(timestamps.searchsorted(self.last_timestamp))
+        if pos >= len(df) or timestamps.iloc[pos] != self.last_timestamp:
+            return None
+        if float(df['close'].iloc[pos]) != self._last_close:
+            return None
+        return pos + 1
+
+    def _close_segment(self) -> Optional[Dict]:
+        """진행 중 구간 확정 → H/L 포인트 추가, W/M 성립 시 시그널 반환"""
+        if not self._seg_sign or self._seg_price != self._seg_price:
+            return None
+        conf = self._seg_last_time
+        point = {
+            'type': 'H' if self._seg_sign > 0 else 'L',
+            'price': self._seg_price,
+            'time': self._seg_time,
+            'confirmed_time': self._cast(conf) if self._cast else conf,
+        }
+        self._points.append(point)
+        if len(self._points) > 3:
+            del self._points[0]
+        if len(self._points) < 3:
+            return None
+
+        first, middle, last = self._points
+        if first['type'] == 'L' and middle['type'] == 'H' and last['type'] == 'L':
+            if abs(last['price'] - first['price']) / first['price'] < self.tolerance:
+                return {'time': last['confirmed_time'], 'type': 'Long', 'pattern': 'W'}
+        if first['type'] == 'H' and middle['type'] == 'L' and last['type'] == 'H':
+            if abs(last['price'] - first['price']) / first['price'] < self.tolerance:
+                return {'time': last['confirmed_time'], 'type': 'Short', 'pattern': 'M'}
+        return None
+
+    def _step(self, ts, high: float, low: float, close: float) -> Optional[Dict]:
+        """마감 봉 1개 처리"""
+        _, _, hist = self._macd.update(close)
+        sign = 1 if hist > 0 else (-1 if hist < 0 else 0)
+
+        signal = None
+        if sign != self._seg_sign:
+            if self._seg_sign is not None:
+                signal = self._close_segment()
+            self._seg_sign = sign
+            self._seg_price = np.nan
+            self._seg_time = None
+
+        # 구간 극값 (NaN 무시, 동률 시 앞쪽 유지)
+        if sign > 0 and (high > self._seg_price or (self._seg_price != self._seg_price and high == high)):
+            self._seg_price, self._seg_time = high, ts
+        elif sign < 0 and (low < self._seg_price or (self._seg_price != self._seg_price and low == low)):
+            self._seg_price, self._seg_time = low, ts
+        self._seg_last_time = ts
+        return signal
+
+    def update(self, df: pd.DataFrame) -> List[Dict]:
+        """
+        마감된 봉 DataFrame과 상태 동기화
+
+        Args:
+            df: 패턴 TF 데이터 (timestamp, high, low, close) - 마감된 봉만
+
+        Returns:
+            새로 감지한 시그널 목록 (재시드한 경우 전체 이력의 시그널)
+        """
+        if df is None or df.empty:
+            return []
+        start = self._new_rows_start(df)
+        if start is None:
+            self.reset()
+            start = 0
+            # extract_hl_points와 같은 행 단위 타입 변환 (timestamp가 숫자면 float 등)
+            row_dtype = df.iloc[0].dtype
+            ts_dtype = df['timestamp'].dtype
+            self._cast = None if row_dtype == object or row_dtype == ts_dtype else row_dtype.type
+        rows = df.iloc[start:]
+        if rows.empty:
+            return []
+
+        new_signals = []
+        timestamps = rows['timestamp']
+        highs = rows['high'].to_numpy(np.float64)
+        lows = rows['low'].to_numpy(np.float64)
+        closes = rows['close'].to_numpy(np.float64)
+        for i in range(len(rows)):
+            signal = self._step(timestamps.iat[i], highs[i], lows[i], closes[i])
+            if signal is not None:
+                new_signals.append(signal)
+
+        self.last_timestamp = timestamps.iat[-1]
+        self._last_close = float(closes[-1])
+        self.signals.extend(new_signals)
+        return new_signals
+
+    def signals_since(self, since) -> List[Dict]:
+        """since 이후 시그널 (시간순, 최근 것부터 역방향 탐색)"""
+        since = pd.Timestamp(since)
+        start = len(self.signals)
+        while start > 0 and pd.Timestamp(self.signals[start - 1]['time']) > since:
+            start -= 1
+        return self.signals[start:]
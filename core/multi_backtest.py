@@ -24,6 +24,21 @@ except ImportError:
     CACHE_DIR = 'data/cache'
 
 from core.strategy_core import AlphaX7Core
+from core.parallel_signals import (
+    default_workers, estimate_task_memory, merge_by_time, pack_rows, run_parallel, unpack_rows,
+)
+
+
+def _collect_preset_trades(exchange: str, cache_dir: str, preset: Dict):
+    """[워커] 프리셋 1개 데이터 로드 + 백테스트 → 컬럼 배열 (키가 다른 행이 섞이면 dict 목록)"""
+    bt = MultiBacktester(exchange=exchange)
+    bt.cache_dir = Path(cache_dir)
+    trades = bt._collect_preset_signals(preset)
+    keys = list(trades[0]) if trades else []
+    if all(list(t) == keys for t in trades):
+        return pack_rows(trades, keys)
+    return trades
+
 
 class MultiBacktester:
     """통합 시계열 백테스터"""
@@ -96,62 +111,101 @@ class MultiBacktester:
             logging.error(f"[MULTI-BT] Data error {symbol}: {e}")
             return None, None
 
-    def collect_all_signals(self, presets: List[Dict]) -> List[Dict]:
-        """모든 프리셋의 개별 신호 수집 및 정렬"""
-        all_signals = []
+    def collect_all_signals(self, presets: List[Dict], max_workers: int = None,
+                            memory_budget: int = None) -> List[Dict]:
+        """
+        모든 프리셋의 개별 신호 수집 및 정렬
         
+        Args:
+            max_workers: 병렬 워커 수 (None=코어 수-1, 1=순차)
+            memory_budget: 워커 동시 실행 메모리 예산 (bytes, None=가용 메모리의 절반)
+        """
+        # [PERF] 프리셋(심볼)별 데이터 로드/백테스트를 프로세스 풀에 분산
+        if len(presets) > 1 and (max_workers or default_workers()) > 1:
+            return self._collect_signals_parallel(presets, max_workers, memory_budget)
+        
+        all_signals = []
         for preset in presets:
-            symbol = preset['_meta']['symbol']
-            tf = preset['_meta']['timeframe']
-            
-            logging.info(f"[MULTI-BT] Processing signals for {symbol}...")
-            
-            df_pattern, df_entry = self._get_data(symbol, tf)
-            if df_pattern is None: continue
-            
-            # 파라미터 추출 (평탄화 및 필터링)
-            params = {}
-            # 1. 최상위 키 중 '_'로 시작하지 않는 것들
-            for k, v in preset.items():
-                if not k.startswith('_') and k != 'params':
-                    params[k] = v
-            # 2. 'params' 키 내부에 있는 것들 (우선순위 높음)
-            if 'params' in preset:
-                params.update(preset['params'])
-            
-            # 3. run_backtest가 받는 필드만 남기기
-            allowed_keys = [
-                'slippage', 'atr_mult', 'trail_start_r', 'trail_dist_r',
-                'pattern_tolerance', 'entry_validity_hours', 'pullback_rsi_long',
-                'pullback_rsi_short', 'max_adds', 'filter_tf', 'rsi_period',
-                'atr_period', 'enable_pullback'
-            ]
-            params = {k: v for k, v in params.items() if k in allowed_keys and k != 'filter_tf'}
-            
-            # 개별 백테스트 실행
-            trades = self.core.run_backtest(
-                df_pattern=df_pattern,
-                df_entry=df_entry,
-                **params,
-                filter_tf=tf
-            )
-            
-            for t in trades:
-                t['symbol'] = symbol
-                # 간단 판별: BTCUSDT 이거나, BTC가 포함되고 USDT 페어인 경우 (ETHBTC 등 제외)
-                # 정확하진 않지만 대부분의 경우 작동. 더 정확히는 is_btc 파라미터를 프리셋에 넣는게 좋음.
-                sym_upper = symbol.upper()
-                is_btc_pair = (sym_upper == 'BTCUSDT' or 
-                              ('BTC' in sym_upper and 'USDT' in sym_upper and '/' not in sym_upper))
-                
-                t['is_btc'] = is_btc_pair
-                
-                all_signals.append(t)
+            all_signals.extend(self._collect_preset_signals(preset))
         
         # 시간순 정렬 (entry_time 기준)
         all_signals.sort(key=lambda x: x['entry_time'])
         return all_signals
 
+    def _collect_signals_parallel(self, presets: List[Dict], max_workers: int = None,
+                                  memory_budget: int = None) -> List[Dict]:
+        """프리셋별 병렬 수집 → 프리셋 순서로 합친 뒤 entry_time 안정 정렬 (순차 수집과 같은 순서)"""
+        tasks = [(self.exchange, str(self.cache_dir), preset) for preset in presets]
+        costs = [estimate_task_memory([self.cache_dir / f"{self.exchange}_{p['_meta']['symbol'].lower()}_15m.parquet"])
+                 for p in presets]
+        results = run_parallel(_collect_preset_trades, tasks, costs=costs, max_workers=max_workers,
+                               memory_budget=memory_budget)
+        
+        parts = [r for r in results if r]
+        if all(isinstance(r, dict) for r in parts) and len({tuple(r) for r in parts}) <= 1:
+            return unpack_rows(merge_by_time(parts, 'entry_time'))
+        
+        all_signals = []
+        for r in parts:
+            if isinstance(r, dict):
+                all_signals.extend(unpack_rows(r))
+            else:
+                all_signals.extend(r)
+        all_signals.sort(key=lambda x: x['entry_time'])
+        return all_signals
+
+    def _collect_preset_signals(self, preset: Dict) -> List[Dict]:
+        """프리셋 1개의 개별 거래 신호 (심볼 / BTC 트랙 여부 포함)"""
+        signals = []
+        symbol = preset['_meta']['symbol']
+        tf = preset['_meta']['timeframe']
+        
+        logging.info(f"[MULTI-BT] Processing signals for {symbol}...")
+        
+        df_pattern, df_entry = self._get_data(symbol, tf)
+        if df_pattern is None: return []
+        
+        # 파라미터 추출 (평탄화 및 필터링)
+        params = {}
+        # 1. 최상위 키 중 '_'로 시작하지 않는 것들
+        for k, v in preset.items():
+            if not k.startswith('_') and k != 'params':
+                params[k] = v
+        # 2. 'params' 키 내부에 있는 것들 (우선순위 높음)
+        if 'params' in preset:
+            params.update(preset['params'])
+        
+        # 3. run_backtest가 받는 필드만 남기기
+        allowed_keys = [
+            'slippage', 'atr_mult', 'trail_start_r', 'trail_dist_r',
+            'pattern_tolerance', 'entry_validity_hours', 'pullback_rsi_long',
+            'pullback_rsi_short', 'max_adds', 'filter_tf', 'rsi_period',
+            'atr_period', 'enable_pullback'
+        ]
+        params = {k: v for k, v in params.items() if k in allowed_keys and k != 'filter_tf'}
+        
+        # 개별 백테스트 실행
+        trades = self.core.run_backtest(
+            df_pattern=df_pattern,
+            df_entry=df_entry,
+            **params,
+            filter_tf=tf
+        )
+        
+        for t in trades:
+            t['symbol'] = symbol
+            # 간단 판별: BTCUSDT 이거나, BTC가 포함되고 USDT 페어인 경우 (ETHBTC 등 제외)
+            # 정확하진 않지만 대부분의 경우 작동. 더 정확히는 is_btc 파라미터를 프리셋에 넣는게 좋음.
+            sym_upper = symbol.upper()
+            is_btc_pair = (sym_upper == 'BTCUSDT' or 
+                          ('BTC' in sym_upper and 'USDT' in sym_upper and '/' not in sym_upper))
+            
+            t['is_btc'] = is_btc_pair
+            
+            signals.append(t)
+        
+        return signals
+
     def run_simulation(self, signals: List[Dict]) -> Dict:
         """통합 시계열 시뮬레이션 루프"""
         alt_capital = self.initial_alt_capital
@@ -19,6 +19,9 @@ from pathlib import Path
 from utils.logger import get_module_logger
 logger = get_module_logger(__name__)
 
+from storage.result_store import get_result_store
+from utils.data_utils import data_fingerprint
+
 # DataManager import
 try:
     from GUI.data_manager import DataManager
@@ -207,6 +210,41 @@ class MultiOptimizer:
             logging.error(f"[OPTIMIZER] Data load error: {symbol} - {e}")
             return None, None
     
+    def _evaluate_combo(self, core, df_pattern, df_entry, params: Dict, timeframe: str) -> Optional[Dict]:
+        """조합 1개 백테스트 → 지표 dict (최소 거래수 미달 시 None)"""
+        result = core.run_backtest(
+            df_pattern=df_pattern,
+            df_entry=df_entry,
+            **params,
+            filter_tf=timeframe,
+            return_state=False
+        )
+        
+        if not result or len(result) < self.MIN_TRADES:
+            return None
+        
+        wins = len([t for t in result if t.get('pnl', 0) > 0])
+        win_rate = wins / len(result)
+        total_pnl = sum(t.get('pnl', 0) for t in result)
+        
+        # MDD 계산
+        cumsum = 0
+        peak = 0
+        mdd = 0
+        for t in result:
+            cumsum += t.get('pnl', 0)
+            peak = max(peak, cumsum)
+            mdd = max(mdd, peak - cumsum)
+        
+        pf = total_pnl / max(abs(sum(t.get('pnl_pct', 0) for t in result if t.get('pnl_pct', 0) < 0)), 1)
+        return {
+            'trades': len(result),
+            'win_rate': win_rate,
+            'total_pnl': total_pnl,
+            'mdd': mdd,
+            'pf': pf,
+        }
+    
     def _optimize_single(self, symbol: str, timeframe: str) -> Optional[Dict]:
         """단일 심볼/TF 최적화"""
         try:
@@ -242,59 +280,45 @@ class MultiOptimizer:
             keys = list(param_grid.keys())
             values = list(param_grid.values())
             
-            for combo in product(*values):
-                params = dict(zip(keys, combo))
+            # [PERF] 결과 저장소: 같은 데이터로 평가한 조합은 백테스트 생략
+            store = get_result_store()
+            store_ns = f"multi_optimizer:{timeframe}"
+            data_fp = f"{data_fingerprint(df_pattern)}:{data_fingerprint(df_entry)}"
+            combos = [dict(zip(keys, combo)) for combo in product(*values)]
+            cached = store.get_many(store_ns, data_fp, combos)
+            to_store = []
+            
+            for params in combos:
+                key = store.key(params)
                 
                 try:
-                    result = core.run_backtest(
-                        df_pattern=df_pattern,
-                        df_entry=df_entry,
-                        **params,
-                        filter_tf=timeframe,
-                        return_state=False
-                    )
+                    if key in cached:
+                        metrics = cached[key]
+                    else:
+                        metrics = self._evaluate_combo(core, df_pattern, df_entry, params, timeframe)
+                        to_store.append((params, metrics))
                     
-                    if not result or len(result) < self.MIN_TRADES:
+                    if metrics is None:
                         continue
                     
-                    wins = len([t for t in result if t.get('pnl', 0) > 0])
-                    win_rate = wins / len(result)
-                    total_pnl = sum(t.get('pnl', 0) for t in result)
-                    
-                    # MDD 계산
-                    cumsum = 0
-                    peak = 0
-                    mdd = 0
-                    for t in result:
-                        cumsum += t.get('pnl', 0)
-                        peak = max(peak, cumsum)
-                        mdd = max(mdd, peak - cumsum)
-                    
                     # 기준 충족 확인
-                    if win_rate < self.MIN_WIN_RATE:
+                    if metrics['win_rate'] < self.MIN_WIN_RATE:
                         continue
-                    if mdd / 100 > self.MAX_MDD:
+                    if metrics['mdd'] / 100 > self.MAX_MDD:
                         continue
                     
                     # 점수 계산 (승률 + PF)
-                    pf = total_pnl / max(abs(sum(t.get('pnl_pct', 0) for t in result if t.get('pnl_pct', 0) < 0)), 1)
-                    score = win_rate * 0.6 + min(pf / 3, 1) * 0.4
+                    pf = metrics['pf']
+                    score = metrics['win_rate'] * 0.6 + min(pf / 3, 1) * 0.4
                     
                     if score > best_score:
                         best_score = score
-                        best_result = {
-                            'params': params,
-                            'trades': len(result),
-                            'win_rate': win_rate,
-                            'total_pnl': total_pnl,
-                            'mdd': mdd,
-                            'pf': pf,
-                            'score': score
-                        }
+                        best_result = {'params': params, **metrics, 'score': score}
                         
                 except Exception as e:
                     continue
             
+            store.put_many(store_ns, data_fp, to_store)
             return best_result
             
         except Exception as e:
@@ -7,13 +7,97 @@ import logging
 import threading
 import os
 import json
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
 from core.trade_common import CoinStatus, CoinState, CapitalMode, WS_LIMITS
 from core.capital_manager import CapitalManager
+from core.parallel_signals import default_workers
+from storage.candle_store import get_candle_store
+from storage.trade_journal import JOURNAL_SUFFIX, TradeJournal
+
+
+def _apply_history_event(history: dict, event: dict):
+    """저널 이벤트(거래 1건) → 코인별 히스토리에 누적 반영"""
+    symbol = event["symbol"]
+    trade = event["trade"]
+    entry = history.get(symbol)
+    if entry is None:
+        entry = history[symbol] = {
+            "initial_seed": event.get("initial_seed", 0),
+            "current_seed": event.get("current_seed") or 0,
+            "total_pnl": 0,
+            "trade_count": 0,
+            "win_count": 0,
+            "trades": []
+        }
+    
+    entry["trades"].append(trade)
+    if event.get("current_seed") is not None:
+        entry["current_seed"] = event["current_seed"]
+    entry["total_pnl"] = entry.get("total_pnl", 0) + trade["closed_pnl"]
+    entry["trade_count"] = len(entry["trades"])
+    entry["win_count"] = entry.get("win_count", 0) + (1 if trade["closed_pnl"] > 0 else 0)
+    entry["last_update"] = event.get("last_update", "")
+
+
+def _history_trade_count(history: dict) -> int:
+    """스냅샷에 포함된 거래 수 (저널 seq 기준)"""
+    return sum(len(data.get("trades", [])) for data in history.values())
+
+
+# 프리셋에서 run_backtest로 넘기는 파라미터 (나머지는 ACTIVE_PARAMS 기본값)
+_BACKTEST_PARAM_KEYS = (
+    'atr_mult', 'trail_start_r', 'trail_dist_r', 'pattern_tolerance', 'entry_validity_hours',
+    'pullback_rsi_long', 'pullback_rsi_short', 'rsi_period', 'atr_period',
+)
+
+
+def _backtest_winrate(symbol: str, df, params: dict) -> float:
+    """
+    빠른 백테스트 계산부 (프로세스 풀 워커에서도 실행되므로 모듈 최상위 함수)
+    캔들 수 기반 TF 리샘플 → AlphaX7Core 백테스트 → 거래 목록 승률 % (거래 없으면 75.0)
+    """
+    import pandas as pd
+    from core.strategy_core import AlphaX7Core
+    
+    logger = logging.getLogger("MultiSniper")
+    try:
+        # [NEW] 캔들 수 기반 TF 자동 결정
+        optimal_tf = MultiCoinSniper._select_optimal_tf(len(df))
+        logger.info(f"[{symbol}] 캔들 {len(df)}개 → TF: {optimal_tf}")
+        
+        # TF에 맞게 리샘플링 (호출 측 df는 수정하지 않음)
+        df = df.assign(timestamp=pd.to_datetime(df['timestamp']))
+        df_resampled = df.set_index('timestamp').resample(optimal_tf).agg({
+            'open': 'first', 'high': 'max', 'low': 'min',
+            'close': 'last', 'volume': 'sum'
+        }).dropna().reset_index()
+        
+        if len(df_resampled) < 50:
+            logger.debug(f"{symbol} 리샘플링 후 데이터 부족")
+            return 75.0
+        
+        # 전략 실행 (run_backtest는 거래 목록 반환)
+        core = AlphaX7Core()
+        trades = core.run_backtest(
+            df_pattern=df_resampled,
+            df_entry=df_resampled,
+            **{k: params[k] for k in _BACKTEST_PARAM_KEYS if params and params.get(k) is not None}
+        )
+        
+        if not trades:
+            return 75.0
+        wins = sum(1 for t in trades if t.get('pnl', 0) > 0)
+        return wins / len(trades) * 100
+    
+    except Exception as e:
+        logger.debug(f"{symbol} 백테스트 실패: {e}")
+        return 75.0
 
 
 class MultiCoinSniper:
@@ -25,6 +109,8 @@ class MultiCoinSniper:
         'bybit': 0.5, 'binance': 0.5, 'okx': 1.0,
         'bitget': 1.0, 'bingx': 1.0, 'upbit': 1.0, 'bithumb': 1.0
     }
+    INIT_FETCH_WORKERS = 6       # [PERF] 초기화 시 동시 데이터 수집 수 (거래소 요청 제한)
+    HISTORY_COMPACT_EVERY = 200  # [PERF] 저널이 이만큼 쌓이면 sniper_history.json 압축
     
     def __init__(self, license_guard, exchange_client, total_seed: float, 
                  timeframe: str = "4h", exchange: str = "bybit"):
@@ -59,6 +145,12 @@ class MultiCoinSniper:
         self.last_refresh = 0  # [NEW] 마지막 갱신 시간
         self.known_coins = set()  # [NEW] 이미 백테스트한 코인
         
+        # [PERF] 캔들 저장소 (캔들당 델타 1개 기록, 백그라운드 압축)
+        self.candle_store = get_candle_store()
+        
+        # [PERF] 거래 히스토리 저널 (첫 기록/조회 시 생성)
+        self._history_journal: Optional[TradeJournal] = None
+        
         self.running = False
         self._lock = threading.Lock()
     
@@ -72,7 +164,8 @@ class MultiCoinSniper:
             return False
         return True
     
-    def _select_optimal_tf(self, df_len: int) -> str:
+    @staticmethod
+    def _select_optimal_tf(df_len: int) -> str:
         """캔들 수에 따른 최적 TF 자동 결정
         
         Args:
@@ -90,8 +183,15 @@ class MultiCoinSniper:
     
     # === 초기화 ===
     
-    def initialize(self, exchange: str) -> bool:
-        """초기화 - Top 50 로드 + 백테스트 검증"""
+    def initialize(self, exchange: str, max_workers: int = None,
+                   on_coin_ready: Callable[[str, CoinState, int, int], None] = None) -> bool:
+        """
+        초기화 - Top 50 로드 + 백테스트 검증
+        
+        Args:
+            max_workers: 백테스트 프로세스 수 (기본 CPU-1, 1이면 순차 초기화)
+            on_coin_ready: (심볼, CoinState, 완료 수, 전체 수) - 코인별 완료 시 호출
+        """
         if not self.check_premium():
             return False
         
@@ -102,9 +202,8 @@ class MultiCoinSniper:
             top_coins = self._get_top_by_volume(exchange)
             self.logger.info(f"Top {len(top_coins)}개 조회 완료")
             
-            # 2. 각 코인 초기화
-            for symbol in top_coins:
-                self._init_coin(exchange, symbol)
+            # 2. 각 코인 초기화 (데이터 수집 스레드 풀 + 백테스트 프로세스 풀)
+            self._init_coins(exchange, top_coins, max_workers, on_coin_ready)
             
             # 3. 승률 미달 제외
             self._filter_by_winrate()
@@ -168,24 +267,93 @@ class MultiCoinSniper:
         else:
             raise ValueError(f"지원하지 않는 거래소: {exchange}")
     
-    def _init_coin(self, exchange: str, symbol: str):
+    def _init_coins(self, exchange: str, symbols: List[str], max_workers: int = None,
+                    on_coin_ready: Callable[[str, CoinState, int, int], None] = None):
+        """
+        [PERF] 코인 초기화 파이프라인
+        - 코인별 수집 → 파라미터 → 백테스트를 스레드 풀에서 동시 진행 (거래소 요청은 INIT_FETCH_WORKERS개로 제한)
+        - 백테스트 계산(리샘플 + AlphaX7Core)은 프로세스 풀로 분산
+        - 완료되는 순서대로 on_coin_ready 호출, self.coins는 거래량 순서 유지
+        """
+        total = len(symbols)
+        workers = min(max_workers or default_workers(), total)
+        
+        def report(symbol: str, state: CoinState, done: int):
+            self.logger.info(f"[INIT] {symbol} 준비 완료 ({done}/{total}) 승률 {state.backtest_winrate:.1f}%")
+            if on_coin_ready:
+                try:
+                    on_coin_ready(symbol, state, done, total)
+                except Exception as e:
+                    self.logger.debug(f"on_coin_ready 오류 무시: {e}")
+        
+        if total <= 1 or workers <= 1:
+            for done, symbol in enumerate(symbols, 1):
+                report(symbol, self._init_coin(exchange, symbol), done)
+            return
+        
+        try:
+            backtest_pool = ProcessPoolExecutor(max_workers=workers)
+        except (OSError, ValueError, NotImplementedError) as e:
+            self.logger.warning(f"[INIT] 프로세스 풀 사용 불가, 스레드에서 백테스트: {e}")
+            backtest_pool = None
+        fetch_slots = threading.BoundedSemaphore(self.INIT_FETCH_WORKERS)
+        
+        errors = []
+        try:
+            with ThreadPoolExecutor(max_workers=min(total, self.INIT_FETCH_WORKERS + workers),
+                                    thread_name_prefix="sniper-init") as threads:
+                futures = {
+                    threads.submit(self._init_coin, exchange, symbol, backtest_pool, fetch_slots): symbol
+                    for symbol in symbols
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    symbol = futures[future]
+                    try:
+                        state = future.result()
+                    except Exception as e:
+                        self.logger.error(f"[INIT] {symbol} 초기화 실패: {e}")
+                        errors.append(e)
+                        continue
+                    report(symbol, state, done)
+        finally:
+            if backtest_pool is not None:
+                backtest_pool.shutdown(cancel_futures=True)
+        
+        # 거래량 순서로 정렬 (순차 초기화와 같은 순서)
+        with self._lock:
+            self.coins = {
+                **{s: self.coins[s] for s in symbols if s in self.coins},
+                **{s: c for s, c in self.coins.items() if s not in symbols},
+            }
+        if errors:
+            raise errors[0]
+    
+    def _init_coin(self, exchange: str, symbol: str, backtest_pool: Executor = None,
+                   fetch_slots: threading.Semaphore = None) -> CoinState:
         """개별 코인 초기화"""
         # [NEW] 최신 데이터 수집
-        self._fetch_latest_data(exchange, symbol)
+        if fetch_slots is not None:
+            with fetch_slots:
+                self._fetch_latest_data(exchange, symbol)
+        else:
+            self._fetch_latest_data(exchange, symbol)
         
         # 최적화값 로드 (없으면 기본값)
         params = self._load_params(exchange, symbol)
         
         # 백테스트 (간단 버전)
-        winrate = self._quick_backtest(exchange, symbol, params)
+        winrate = self._quick_backtest(exchange, symbol, params, pool=backtest_pool)
         
-        self.coins[symbol] = CoinState(
+        state = CoinState(
             symbol=symbol,
             initial_seed=0,
             seed=0,
             params=params,
             backtest_winrate=winrate
         )
+        with self._lock:
+            self.coins[symbol] = state
+        return state
     
     def _fetch_latest_data(self, exchange: str, symbol: str) -> bool:
         """REST API로 최신 15분봉 수집 + Parquet 저장"""
@@ -239,61 +407,31 @@ class MultiCoinSniper:
             "trail_dist": 0.2
         }
     
-    def _quick_backtest(self, exchange: str, symbol: str, params: dict) -> float:
-        """빠른 백테스트 - 승률 반환 (strategy_core 연동)"""
+    def _quick_backtest(self, exchange: str, symbol: str, params: dict, pool: Executor = None) -> float:
+        """
+        빠른 백테스트 - 승률 반환 (strategy_core 연동)
+        
+        Args:
+            pool: 지정 시 리샘플 + 전략 실행을 이 풀(프로세스 풀)에서 수행
+        """
         try:
-            import pandas as pd
-            from core.strategy_core import AlphaX7Core
-            
-            # 캐시된 데이터 로드 (15분 기본)
-            cache_path_15m = os.path.join(
-                Paths.CACHE,
-                f"{exchange}_{symbol.lower()}_15m.parquet"
-            )
-            cache_path_1h = os.path.join(
-                Paths.CACHE,
-                f"{exchange}_{symbol.lower()}_1h.parquet"
-            )
-            
-            # 15분 데이터 우선, 없으면 1시간
-            if os.path.exists(cache_path_15m):
-                df = pd.read_parquet(cache_path_15m)
-            elif os.path.exists(cache_path_1h):
-                df = pd.read_parquet(cache_path_1h)
-            else:
+            # 캐시된 데이터 로드 (15분 우선, 없으면 1시간)
+            df = self.candle_store.read(exchange, symbol, '15m')
+            if df.empty:
+                df = self.candle_store.read(exchange, symbol, '1h')
+            if df.empty:
                 self.logger.debug(f"{symbol} 데이터 없음 - 기본값 사용")
                 return 75.0
             
             if len(df) < 100:
                 return 75.0
             
-            # [NEW] 캔들 수 기반 TF 자동 결정
-            optimal_tf = self._select_optimal_tf(len(df))
-            self.logger.info(f"[{symbol}] 캔들 {len(df)}개 → TF: {optimal_tf}")
-            
-            # TF에 맞게 리샘플링
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df_resampled = df.set_index('timestamp').resample(optimal_tf).agg({
-                'open': 'first', 'high': 'max', 'low': 'min',
-                'close': 'last', 'volume': 'sum'
-            }).dropna().reset_index()
-            
-            if len(df_resampled) < 50:
-                self.logger.debug(f"{symbol} 리샘플링 후 데이터 부족")
-                return 75.0
-            
-            # 전략 실행
-            core = AlphaX7Core(params)
-            result = core.run_backtest(
-                df_pattern=df_resampled,
-                df_entry=df_resampled,
-                initial_balance=1000,
-                risk_pct=1.0
-            )
-            
-            if result.get('total_trades', 0) > 0:
-                return result.get('win_rate', 75.0)
-            return 75.0
+            if pool is not None:
+                try:
+                    return pool.submit(_backtest_winrate, symbol, df, params).result()
+                except BrokenProcessPool as e:
+                    self.logger.debug(f"{symbol} 프로세스 풀 중단 - 현재 프로세스에서 실행: {e}")
+            return _backtest_winrate(symbol, df, params)
             
         except Exception as e:
             self.logger.debug(f"{symbol} 백테스트 실패: {e}")
@@ -344,40 +482,9 @@ class MultiCoinSniper:
     # === [NEW] 데이터 지속성 ===
     
     def _save_candle_to_parquet(self, symbol: str, candle: dict):
-        """WS 수신 캔들 → Parquet 저장"""
+        """WS 수신 캔들 → Parquet 저장 (델타 추가, 기존 파일 재작성 없음)"""
         try:
-            import pandas as pd
-            
-            cache_dir = Paths.CACHE
-            os.makedirs(cache_dir, exist_ok=True)
-            
-            symbol_clean = symbol.lower().replace('/', '').replace('-', '')
-            filename = f"{self.exchange}_{symbol_clean}_15m.parquet"
-            filepath = os.path.join(cache_dir, filename)
-            
-            # 새 캔들 DataFrame
-            ts = candle.get('start') or candle.get('timestamp') or candle.get('t')
-            new_row = pd.DataFrame([{
-                'timestamp': pd.to_datetime(ts, unit='ms'),
-                'open': float(candle.get('open', candle.get('o', 0))),
-                'high': float(candle.get('high', candle.get('h', 0))),
-                'low': float(candle.get('low', candle.get('l', 0))),
-                'close': float(candle.get('close', candle.get('c', 0))),
-                'volume': float(candle.get('volume', candle.get('v', 0)))
-            }])
-            
-            # 기존 파일 있으면 병합
-            if os.path.exists(filepath):
-                df_existing = pd.read_parquet(filepath)
-                df = pd.concat([df_existing, new_row])
-                df = df.drop_duplicates(subset='timestamp')
-                df = df.sort_values('timestamp')
-                # [FIX] Preserve full historical data. Do not use tail()
-                # df = df.tail(10000)  
-            else:
-                df = new_row
-            
-            df.to_parquet(filepath, index=False)
+            self.candle_store.append(self.exchange, symbol, '15m', candle)
             self.logger.debug(f"[{symbol}] Parquet 저장 완료")
             
         except Exception as e:
@@ -389,20 +496,10 @@ class MultiCoinSniper:
             import pandas as pd
             import requests
             
-            cache_dir = Paths.CACHE
-            symbol_clean = symbol.lower().replace('/', '').replace('-', '')
-            filename = f"{self.exchange}_{symbol_clean}_15m.parquet"
-            filepath = os.path.join(cache_dir, filename)
-            
-            # 현재 데이터 로드
-            now = pd.Timestamp.utcnow()
-            if os.path.exists(filepath):
-                df = pd.read_parquet(filepath)
-                if len(df) > 0:
-                    last_time = pd.to_datetime(df['timestamp'].max())
-                else:
-                    last_time = now - pd.Timedelta(days=7)
-            else:
+            # 마지막 캔들 시각 (최신 파티션만 읽음)
+            now = pd.Timestamp.utcnow().tz_localize(None)
+            last_time = self.candle_store.last_timestamp(self.exchange, symbol, '15m')
+            if last_time is None:
                 last_time = now - pd.Timedelta(days=7)
             
             # 갭 계산
@@ -428,14 +525,7 @@ class MultiCoinSniper:
                                 'low': float(c[3]), 'close': float(c[4]), 'volume': float(c[5])
                             } for c in candles])
                             
-                            if os.path.exists(filepath):
-                                df_existing = pd.read_parquet(filepath)
-                                df = pd.concat([df_existing, df_new])
-                            else:
-                                df = df_new
-                            
-                            df = df.drop_duplicates(subset='timestamp').sort_values('timestamp')
-                            df.to_parquet(filepath, index=False)
+                            self.candle_store.append(self.exchange, symbol, '15m', df_new)
                             self.logger.info(f"[{symbol}] 갭 채우기 완료: {len(df_new)}개")
                 
                 elif self.exchange.lower() == 'binance':
@@ -450,14 +540,7 @@ class MultiCoinSniper:
                             'low': float(c[3]), 'close': float(c[4]), 'volume': float(c[5])
                         } for c in candles])
                         
-                        if os.path.exists(filepath):
-                            df_existing = pd.read_parquet(filepath)
-                            df = pd.concat([df_existing, df_new])
-                        else:
-                            df = df_new
-                        
-                        df = df.drop_duplicates(subset='timestamp').sort_values('timestamp')
-                        df.to_parquet(filepath, index=False)
+                        self.candle_store.append(self.exchange, symbol, '15m', df_new)
                         self.logger.info(f"[{symbol}] 갭 채우기 완료: {len(df_new)}개")
             
             return True
@@ -641,23 +724,14 @@ class MultiCoinSniper:
             if not state:
                 return 0
             
-            # 캐시된 데이터 로드
+            # 캐시된 데이터 로드 (최근 50개 캔들만)
             exchange = getattr(self, 'exchange', 'bybit')
-            cache_path = os.path.join(
-                Paths.CACHE,
-                f"{exchange}_{symbol.lower()}_1h.parquet"
-            )
-            
-            if not os.path.exists(cache_path):
-                return 0
-            
-            df = pd.read_parquet(cache_path)
-            if len(df) < 50:
+            df_recent = self.candle_store.tail(exchange, symbol, '1h', 50)
+            if len(df_recent) < 50:
                 return 0
             
             # 최근 50개 캔들로 패턴 분석
             core = AlphaX7Core(state.params)
-            df_recent = df.tail(50).copy()
             pattern = core.detect_pattern(df_recent)
             
             if pattern and pattern.get('detected'):
@@ -814,20 +888,11 @@ class MultiCoinSniper:
             from core.strategy_core import AlphaX7Core
             
             exchange = getattr(self, 'exchange', 'bybit')
-            cache_path = os.path.join(
-                Paths.CACHE,
-                f"{exchange}_{symbol.lower()}_1h.parquet"
-            )
-            
-            if not os.path.exists(cache_path):
-                return None
-            
-            df = pd.read_parquet(cache_path)
-            if len(df) < 50:
+            df_recent = self.candle_store.tail(exchange, symbol, '1h', 50)
+            if len(df_recent) < 50:
                 return None
             
             core = AlphaX7Core(params)
-            df_recent = df.tail(50).copy()
             
             # 패턴 감지
             pattern = core.detect_pattern(df_recent)
@@ -942,12 +1007,10 @@ class MultiCoinSniper:
             # 1. RSI 계산 (15m 데이터 기반)
             current_rsi = 50.0
             try:
-                import pandas as pd
-                cache_path = os.path.join(Paths.CACHE, f"{self.exchange}_{symbol.lower()}_15m.parquet")
-                if os.path.exists(cache_path):
-                    df_15m = pd.read_parquet(cache_path)
-                    if len(df_15m) >= 20:
-                        current_rsi = self.strategy.calculate_rsi(df_15m['close'].values, period=14)
+                # RSI(14)는 최근 구간만으로 충분 (전체 히스토리 로드 X)
+                df_15m = self.candle_store.tail(self.exchange, symbol, '15m', 500)
+                if len(df_15m) >= 20:
+                    current_rsi = self.strategy.calculate_rsi(df_15m['close'].values, period=14)
             except Exception: pass
 
             # 2. Risk 계산 (entry - initial_sl)
@@ -1183,6 +1246,16 @@ class MultiCoinSniper:
             except Exception as e:
                 self.logger.debug(f"WS stop ignored: {e}")
         
+        # 진행 중 캔들 기록 + 압축 완료 대기
+        try:
+            self.candle_store.flush()
+        except Exception as e:
+            self.logger.debug(f"Candle store flush ignored: {e}")
+        
+        # 거래 히스토리 저널 압축
+        if self._history_journal is not None:
+            self.compact_history()
+        
         self.logger.info("[STOP] 종료 완료")
     
     def _main_loop(self):
@@ -1373,42 +1446,14 @@ class MultiCoinSniper:
             self.logger.error(f"Binance WS 처리 오류: {e}")
     
     def _update_cache(self, symbol: str, kline: dict):
-        """캔들 데이터 캐시 업데이트"""
-        import pandas as pd
-        
+        """캔들 데이터 캐시 업데이트 (진행 중 캔들은 메모리 버퍼, 마감 캔들만 델타 기록)"""
         exchange = getattr(self, 'exchange', 'bybit')
-        cache_path = os.path.join(
-            Paths.CACHE,
-            f"{exchange}_{symbol.lower()}_{self.timeframe}.parquet"
-        )
         
         try:
-            timestamp = kline.get("start") or kline.get("timestamp")
-            if timestamp:
-                timestamp = pd.to_datetime(int(timestamp), unit="ms")
-            else:
-                timestamp = datetime.utcnow()
-            
-            new_row = {
-                "timestamp": timestamp,
-                "open": float(kline.get("open", 0)),
-                "high": float(kline.get("high", 0)),
-                "low": float(kline.get("low", 0)),
-                "close": float(kline.get("close", 0)),
-                "volume": float(kline.get("volume", 0))
-            }
-            
-            if os.path.exists(cache_path):
-                df = pd.read_parquet(cache_path)
-                # 중복 제거
-                df = df[df["timestamp"] != new_row["timestamp"]]
-                df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-                df = df.sort_values("timestamp").reset_index(drop=True)
-            else:
-                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-                df = pd.DataFrame([new_row])
-            
-            df.to_parquet(cache_path, index=False)
+            if not (kline.get("start") or kline.get("timestamp")):
+                kline = {**kline, "timestamp": datetime.utcnow()}
+            self.candle_store.append(exchange, symbol, self.timeframe, kline,
+                                     buffer=not kline.get("confirm", False))
             
         except Exception as e:
             self.logger.debug(f"{symbol} 캐시 업데이트 실패: {e}")
@@ -1475,25 +1520,22 @@ class MultiCoinSniper:
         """히스토리 파일 경로"""
         return os.path.join(Paths.CONFIG, "sniper_history.json")
     
+    def _get_history_journal(self) -> TradeJournal:
+        """[PERF] 히스토리 저널 (sniper_history.json 스냅샷 + 거래별 추가 기록)"""
+        if self._history_journal is None:
+            self._history_journal = TradeJournal(
+                self._get_history_path(),
+                empty=dict,
+                apply=_apply_history_event,
+                size=_history_trade_count,
+                compact_every=self.HISTORY_COMPACT_EVERY,
+            )
+        return self._history_journal
+    
     def _save_trade_history(self, symbol: str, pnl_data: dict):
-        """매매 히스토리 저장"""
-        
-        # 기존 데이터 로드
-        history = self._load_history()
-        
-        # 코인 데이터 초기화
-        if symbol not in history:
-            state = self.coins.get(symbol)
-            history[symbol] = {
-                "initial_seed": state.initial_seed if state else 0,
-                "current_seed": state.seed if state else 0,
-                "total_pnl": 0,
-                "trade_count": 0,
-                "win_count": 0,
-                "trades": []
-            }
+        """매매 히스토리 저장 (저널 한 줄 추가, 통계는 누적 반영)"""
         
-        # 거래 기록 추가
+        # 거래 기록
         trade = {
             "order_id": pnl_data.get("orderId", ""),
             "direction": pnl_data.get("side", ""),
@@ -1506,41 +1548,39 @@ class MultiCoinSniper:
             "timestamp": datetime.utcnow().isoformat()
         }
         
-        history[symbol]["trades"].append(trade)
-        
-        # 통계 업데이트
         state = self.coins.get(symbol)
-        if state:
-            history[symbol]["current_seed"] = state.seed
-        
-        history[symbol]["total_pnl"] = sum(t["closed_pnl"] for t in history[symbol]["trades"])
-        history[symbol]["trade_count"] = len(history[symbol]["trades"])
-        history[symbol]["win_count"] = sum(1 for t in history[symbol]["trades"] if t["closed_pnl"] > 0)
-        history[symbol]["last_update"] = datetime.utcnow().isoformat()
+        event = {
+            "symbol": symbol,
+            "trade": trade,
+            "initial_seed": state.initial_seed if state else 0,
+            "current_seed": state.seed if state else None,
+            "last_update": datetime.utcnow().isoformat()
+        }
         
-        # 저장
-        self._save_history(history)
+        try:
+            journal = self._get_history_journal()
+            journal.append(event, sync=True)
+            trade_count = journal.state[symbol]["trade_count"]
+        except Exception as e:
+            self.logger.error(f"히스토리 저장 실패: {e}")
+            return
         
-        self.logger.info(f"📝 {symbol} 거래 기록 저장 (총 {history[symbol]['trade_count']}건)")
+        self.logger.info(f"📝 {symbol} 거래 기록 저장 (총 {trade_count}건)")
     
     def _load_history(self) -> dict:
-        """히스토리 로드"""
-        path = self._get_history_path()
-        if os.path.exists(path):
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception as e:
-                self.logger.error(f"히스토리 로드 실패: {e}")
-        return {}
+        """히스토리 로드 (스냅샷 + 저널, 호출 측 수정이 저널 상태에 영향 없도록 복사)"""
+        try:
+            history = self._get_history_journal().state
+        except Exception as e:
+            self.logger.error(f"히스토리 로드 실패: {e}")
+            return {}
+        return {symbol: dict(data, trades=list(data.get("trades", [])))
+                for symbol, data in history.items()}
     
-    def _save_history(self, history: dict):
-        """히스토리 저장"""
+    def compact_history(self):
+        """저널을 sniper_history.json 으로 압축 (종료 시 호출)"""
         try:
-            path = self._get_history_path()
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(history, f, indent=2, ensure_ascii=False)
+            self._get_history_journal().compact()
         except Exception as e:
             self.logger.error(f"히스토리 저장 실패: {e}")
     
@@ -1620,10 +1660,10 @@ class MultiCoinSniper:
                 reset_count += 1
                 self.logger.info(f"🔄 {symbol} 리셋: ${state.initial_seed:.2f}")
         
-        # 히스토리 삭제
+        # 히스토리 삭제 (스냅샷 + 저널)
         history_path = self._get_history_path()
-        if os.path.exists(history_path):
-            os.remove(history_path)
+        if os.path.exists(history_path) or os.path.exists(history_path + JOURNAL_SUFFIX):
+            self._get_history_journal().reset()
             self.logger.info("📝 히스토리 파일 삭제됨")
         
         self.logger.info(f"✅ 리셋 완료: {reset_count}개 코인")
@@ -6,6 +6,7 @@
 - 복리 적용
 """
 
+import numpy as np
 import pandas as pd
 import requests
 from pathlib import Path
@@ -13,6 +14,9 @@ from datetime import datetime
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 
+from core.parallel_signals import default_workers, estimate_task_memory, run_parallel
+from utils.price_index import PriceIndex, to_ns
+
 # Logging
 import logging
 logger = logging.getLogger(__name__)
@@ -49,6 +53,25 @@ class Trade:
     exit_reason: str = ''  # 'SL', 'TRAILING', 'SIGNAL_EXIT', 'END'
 
 
+def _collect_symbol_signals(exchange: str, symbol: str, timeframe: str,
+                            preset_params: dict, volume_24h: float) -> dict:
+    """[워커] 단일 심볼/TF 시그널 추출 → 컬럼 배열 (캔들은 워커에서만 로드)"""
+    bt = MultiSymbolBacktest(exchange=exchange, preset_params=preset_params)
+    bt._volume_map = {symbol: volume_24h}
+    signals = bt.extract_signals_from_symbol(symbol, timeframe)
+    tz = next((s.timestamp.tz for s in signals if getattr(s.timestamp, 'tz', None) is not None), None)
+    return {
+        'tz': str(tz) if tz is not None else None,
+        'time': np.array([to_ns(s.timestamp) for s in signals], dtype=np.int64),
+        'direction': np.array([s.direction for s in signals], dtype=str),
+        'entry_price': np.array([s.entry_price for s in signals], dtype=np.float64),
+        'sl_price': np.array([s.sl_price for s in signals], dtype=np.float64),
+        'atr': np.array([s.atr for s in signals], dtype=np.float64),
+        'pattern_score': np.array([s.pattern_score for s in signals], dtype=np.float64),
+        'volume_24h': np.array([s.volume_24h for s in signals], dtype=np.float64),
+    }
+
+
 class MultiSymbolBacktest:
     """멀티 심볼 통합 백테스트"""
     
@@ -61,8 +84,14 @@ class MultiSymbolBacktest:
         max_positions: int = 1,
         leverage: int = 5,
         preset_params: dict = None,
-        capital_mode: str = "compound"
+        capital_mode: str = "compound",
+        path_exits: bool = False
     ):
+        """
+        Args:
+            path_exits: True면 시그널 시각 캔들 하나가 아니라 진입 후 지나온 캔들 전체로
+                        SL/트레일링 판정 (청산 시각 = 실제 도달 캔들)
+        """
         self.exchange = exchange.lower()
         self.symbols = symbols or []
         self.timeframes = timeframes
@@ -71,6 +100,7 @@ class MultiSymbolBacktest:
         self.capital_mode = capital_mode.lower() # "compound" or "fixed"
         self.max_positions = max_positions
         self.leverage = leverage
+        self.path_exits = path_exits
         self.preset_params = preset_params or {
             'atr_mult': 1.5,
             'trail_start_r': 0.8,
@@ -82,8 +112,13 @@ class MultiSymbolBacktest:
         self.position: Optional[Trade] = None
         self.all_signals: List[Signal] = []
         self.all_candles: Dict[str, pd.DataFrame] = {}
+        # [PERF] 심볼별 정렬 타임스탬프 인덱스 (cache_key → (원본 df, PriceIndex))
+        self._price_index: Dict[str, tuple] = {}
+        # 병렬 수집 시 워커에서만 로드된 캔들 (가격 조회 시 부모에서 지연 로드)
+        self._deferred_candles: set = set()
         self.trades: List[Trade] = []
         self.equity_curve: List[dict] = []
+        self._exit_pos: Optional[int] = None  # path_exits: 아직 확인하지 않은 첫 캔들 위치
         
         # 진행 상태
         self.is_running = False
@@ -252,12 +287,23 @@ class MultiSymbolBacktest:
         
         return signals
     
-    def collect_all_signals(self):
-        """전체 심볼에서 시그널 수집"""
+    def collect_all_signals(self, max_workers: int = None, memory_budget: int = None):
+        """
+        전체 심볼에서 시그널 수집
+        
+        Args:
+            max_workers: 병렬 워커 수 (None=코어 수-1, 1=순차)
+            memory_budget: 워커 동시 실행 메모리 예산 (bytes, None=가용 메모리의 절반)
+        """
         self.all_signals = []
         total = len(self.symbols) * len(self.timeframes)
         current = 0
         
+        # [PERF] 심볼 × TF 태스크를 프로세스 풀에 분산
+        if total > 1 and (max_workers or default_workers()) > 1:
+            self._collect_signals_parallel(max_workers, memory_budget)
+            return
+        
         for symbol in self.symbols:
             if not self.is_running:
                 return
@@ -278,57 +324,148 @@ class MultiSymbolBacktest:
         self.all_signals.sort(key=lambda x: (x.timestamp, -x.volume_24h))
         self._update_status(f"✅ 총 {len(self.all_signals)}개 시그널 수집 완료", 40)
     
-    def get_price_at_time(self, symbol: str, timeframe: str, target_time: datetime) -> dict:
-        """특정 시점의 OHLC 가격 조회"""
+    def _collect_signals_parallel(self, max_workers: int = None, memory_budget: int = None):
+        """심볼 × TF 병렬 시그널 수집 (결과는 순차 수집과 같은 순서로 병합)"""
+        tasks = [(self.exchange, symbol, tf, self.preset_params, self._volume_map.get(symbol, 0))
+                 for symbol in self.symbols for tf in self.timeframes]
+        total = len(tasks)
+        
+        try:
+            from paths import Paths
+            cache_dir = Path(Paths.CACHE)
+        except ImportError:
+            cache_dir = Path('data/cache')
+        costs = [estimate_task_memory([cache_dir / f"{self.exchange}_{symbol.lower().replace('/', '')}_{tf}.parquet"])
+                 for _, symbol, tf, _, _ in tasks]
+        
+        done = [0]
+        
+        def on_done(i, _result):
+            done[0] += 1
+            _, symbol, tf, _, _ = tasks[i]
+            self.current_symbol = symbol
+            self._update_status(f"📊 [{done[0]}/{total}] {symbol} {tf} 시그널 수집...", (done[0] / total) * 40)
+        
+        def on_error(i, e):
+            logger.info(f"[MultiSymbolBT] {tasks[i][1]} 시그널 수집 오류: {e}")
+        
+        results = run_parallel(
+            _collect_symbol_signals, tasks, costs=costs,
+            max_workers=max_workers, memory_budget=memory_budget,
+            should_stop=lambda: not self.is_running, on_done=on_done, on_error=on_error
+        )
+        if not self.is_running:
+            return
+        
+        for (_, symbol, tf, _, _), cols in zip(tasks, results):
+            self._deferred_candles.add(f"{symbol}_{tf}")
+            if not cols or len(cols['time']) == 0:
+                continue
+            times = pd.to_datetime(cols['time'])
+            if cols['tz']:
+                times = times.tz_localize('UTC').tz_convert(cols['tz'])
+            for k in range(len(times)):
+                self.all_signals.append(Signal(
+                    symbol=symbol,
+                    timestamp=times[k],
+                    direction=str(cols['direction'][k]),
+                    entry_price=float(cols['entry_price'][k]),
+                    sl_price=float(cols['sl_price'][k]),
+                    atr=float(cols['atr'][k]),
+                    pattern_score=float(cols['pattern_score'][k]),
+                    volume_24h=float(cols['volume_24h'][k]),
+                    timeframe=tf
+                ))
+        
+        self.all_signals.sort(key=lambda x: (x.timestamp, -x.volume_24h))
+        self._update_status(f"✅ 총 {len(self.all_signals)}개 시그널 수집 완료", 40)
+    
+    def _get_price_index(self, symbol: str, timeframe: str) -> Optional[PriceIndex]:
+        """심볼/타임프레임 가격 인덱스 (캔들 df가 바뀌면 재생성)"""
         cache_key = f"{symbol}_{timeframe}"
         df = self.all_candles.get(cache_key)
-        
+        if df is None and cache_key in self._deferred_candles:
+            # 병렬 수집 시 워커에서만 로드된 캔들
+            self._deferred_candles.discard(cache_key)
+            df = self.load_candle_data(symbol, timeframe)
         if df is None:
-            return {'open': 0, 'high': 0, 'low': 0, 'close': 0}
+            return None
+        
+        cached = self._price_index.get(cache_key)
+        if cached is not None and cached[0] is df:
+            return cached[1]
         
         try:
-            if 'timestamp' in df.columns:
-                df_filtered = df[df['timestamp'] >= target_time]
-            else:
-                df_filtered = df[df.index >= target_time]
-            
-            if len(df_filtered) == 0:
-                return {'open': 0, 'high': 0, 'low': 0, 'close': 0}
-            
-            row = df_filtered.iloc[0]
-            return {
-                'open': float(row['open']),
-                'high': float(row['high']),
-                'low': float(row['low']),
-                'close': float(row['close'])
-            }
-        except:
-            return {'open': 0, 'high': 0, 'low': 0, 'close': 0}
+            index = PriceIndex.from_frame(df)
+        except Exception as e:
+            logger.info(f"[MultiSymbolBT] {cache_key} 가격 인덱스 생성 실패: {e}")
+            index = None
+        self._price_index[cache_key] = (df, index)
+        return index
+    
+    def get_price_at_time(self, symbol: str, timeframe: str, target_time: datetime) -> dict:
+        """특정 시점의 OHLC 가격 조회 (target_time 이후 첫 캔들, searchsorted)"""
+        index = self._get_price_index(symbol, timeframe)
+        try:
+            price = index.at(target_time) if index is not None else None
+        except Exception:
+            price = None
+        return price or {'open': 0, 'high': 0, 'low': 0, 'close': 0}
+    
+    def get_price_range(self, symbol: str, timeframe: str, start_time: datetime,
+                        end_time: datetime = None) -> dict:
+        """[start_time, end_time) 구간 최고가/최저가 (SL/TP 도달 여부 판정용)"""
+        index = self._get_price_index(symbol, timeframe)
+        try:
+            extrema = index.extrema(start_time, end_time) if index is not None else None
+        except Exception:
+            extrema = None
+        if extrema is None:
+            return {'high': 0, 'low': 0}
+        return {'high': extrema[0], 'low': extrema[1]}
+    
+    def find_first_hit(self, symbol: str, timeframe: str, start_time: datetime,
+                       end_time: Optional[datetime], level: float, side: str) -> Optional[datetime]:
+        """
+        [start_time, end_time) 구간에서 가격이 level에 처음 닿은 캔들 시각
+        
+        Args:
+            side: 'below' (low <= level) 또는 'above' (high >= level)
+        """
+        index = self._get_price_index(symbol, timeframe)
+        if index is None:
+            return None
+        i = index.first_hit(start_time, end_time, level, side)
+        return index.time_at(i) if i is not None else None
     
     def check_exit_conditions(self, signal_time: datetime) -> bool:
         """현재 포지션 청산 조건 체크"""
         if self.position is None:
             return False
+        if self.path_exits:
+            return self._check_exit_path(signal_time)
         
-        trade = self.position
-        price_data = self.get_price_at_time(trade.symbol, '4h', signal_time)
+        price_data = self.get_price_at_time(self.position.symbol, '4h', signal_time)
         
         if price_data['high'] == 0:
             return False
         
-        high = price_data['high']
-        low = price_data['low']
+        return self._check_candle_exit(price_data['high'], price_data['low'], signal_time)
+    
+    def _check_candle_exit(self, high: float, low: float, exit_time: datetime) -> bool:
+        """캔들 1개로 SL/트레일링 판정 (청산 시 True)"""
+        trade = self.position
         
         # SL 체크
         if trade.direction == 'Long':
             if low <= trade.sl_price:
-                self._close_position(trade.sl_price, signal_time, 'SL')
+                self._close_position(trade.sl_price, exit_time, 'SL')
                 return True
             if high > trade.highest_price:
                 trade.highest_price = high
         else:
             if high >= trade.sl_price:
-                self._close_position(trade.sl_price, signal_time, 'SL')
+                self._close_position(trade.sl_price, exit_time, 'SL')
                 return True
             if low < trade.lowest_price or trade.lowest_price == 0:
                 trade.lowest_price = low
@@ -347,7 +484,7 @@ class MultiSymbolBacktest:
                     trade.sl_price = trail_sl
                 
                 if low <= trade.sl_price:
-                    self._close_position(trade.sl_price, signal_time, 'TRAILING')
+                    self._close_position(trade.sl_price, exit_time, 'TRAILING')
                     return True
         else:
             risk = trade.sl_price - trade.entry_price
@@ -359,11 +496,78 @@ class MultiSymbolBacktest:
                     trade.sl_price = trail_sl
                 
                 if high >= trade.sl_price:
-                    self._close_position(trade.sl_price, signal_time, 'TRAILING')
+                    self._close_position(trade.sl_price, exit_time, 'TRAILING')
                     return True
         
         return False
     
+    def _check_exit_path(self, signal_time: datetime) -> bool:
+        """
+        [NEW] 마지막 확인 이후 ~ signal_time 캔들까지 경로 전체로 청산 판정
+        
+        트레일링 시작 전에는 SL/트레일링 시작가 첫 터치 캔들을 find_first_hit으로 찾아 건너뛰고
+        (사이 구간 최고/최저가는 get_price_range), 시작 후에는 캔들별로 판정
+        """
+        trade = self.position
+        index = self._get_price_index(trade.symbol, '4h')
+        if index is None:
+            return False
+        if self._exit_pos is None:
+            # 진입 캔들 다음부터
+            self._exit_pos = int(np.searchsorted(index.times, to_ns(trade.entry_time), side='right'))
+        lo = self._exit_pos
+        hi = min(index.locate(signal_time) + 1, len(index))
+        if lo >= hi:
+            return False
+        self._exit_pos = hi
+        
+        is_long = trade.direction == 'Long'
+        start = index.time_at(lo)
+        end = index.time_at(hi) if hi < len(index) else None
+        trail_start = self.preset_params.get('trail_start_r', 0.8)
+        risk = (trade.entry_price - trade.sl_price) if is_long else (trade.sl_price - trade.entry_price)
+        
+        if risk > 0:
+            trail_level = trade.entry_price + risk * trail_start if is_long else trade.entry_price - risk * trail_start
+            best = trade.highest_price if is_long else trade.lowest_price
+            trailing = best >= trail_level if is_long else (best != 0 and best <= trail_level)
+        else:
+            trail_level, trailing = None, False
+        
+        if not trailing:
+            sl_time = self.find_first_hit(trade.symbol, '4h', start, end, trade.sl_price,
+                                          'below' if is_long else 'above')
+            trail_time = None
+            if trail_level is not None:
+                trail_time = self.find_first_hit(trade.symbol, '4h', start, end, trail_level,
+                                                 'above' if is_long else 'below')
+            # 같은 캔들이면 SL 우선 (캔들 단위 판정과 동일)
+            if sl_time is not None and (trail_time is None or sl_time <= trail_time):
+                self._track_extremes(start, sl_time)
+                self._close_position(trade.sl_price, sl_time, 'SL')
+                return True
+            if trail_time is None:
+                self._track_extremes(start, end)
+                return False
+            self._track_extremes(start, trail_time)
+            lo = index.locate(trail_time)
+        
+        for i in range(lo, hi):
+            if self._check_candle_exit(float(index.high[i]), float(index.low[i]), index.time_at(i)):
+                return True
+        return False
+    
+    def _track_extremes(self, start: datetime, end: Optional[datetime]):
+        """[start, end) 구간 최고/최저가를 포지션 트레일링 기준가에 반영"""
+        trade = self.position
+        price_range = self.get_price_range(trade.symbol, '4h', start, end)
+        if price_range['high'] == 0:
+            return
+        if trade.direction == 'Long':
+            trade.highest_price = max(trade.highest_price, price_range['high'])
+        elif trade.lowest_price == 0 or price_range['low'] < trade.lowest_price:
+            trade.lowest_price = price_range['low']
+    
     def enter_position(self, signal: Signal) -> bool:
         """포지션 진입"""
         if self.position is not None:
@@ -380,6 +584,7 @@ class MultiSymbolBacktest:
         )
         
         self.position = trade
+        self._exit_pos = None
         return True
     
     def _close_position(self, exit_price: float, exit_time: datetime, reason: str):
@@ -425,6 +630,9 @@ class MultiSymbolBacktest:
         self.trades = []
         self.equity_curve = [{'time': None, 'capital': self.initial_capital}]
         self.all_candles = {}
+        self._price_index = {}
+        self._deferred_candles = set()
+        self._exit_pos = None
         
         if not self.symbols:
             self._update_status("🔍 거래소 심볼 조회 중...", 0)
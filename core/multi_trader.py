@@ -18,6 +18,7 @@ from core.strategy_core import AlphaX7Core
 from core.capital_manager import CapitalManager
 from core.order_executor import OrderExecutor
 from exchanges.exchange_manager import ExchangeManager
+from utils.kline_poller import KlinePoller
 
 logger = logging.getLogger("MultiTrader")
 
@@ -25,6 +26,8 @@ logger = logging.getLogger("MultiTrader")
 class MultiTrader:
     """멀티 매매 시스템"""
     
+    SCAN_WORKERS = 8  # [PERF] 시그널 스캔 동시 요청/평가 수 (요청률은 거래소 토큰 버킷이 제한)
+    
     def __init__(self, config: dict = None):
         self.config = config or {}
         self.exchange_name = self.config.get('exchange', 'bybit')
@@ -48,6 +51,7 @@ class MultiTrader:
         
         self.adapter = None
         self.executor = None
+        self.poller: Optional[KlinePoller] = None
         
         self.stats = {'watching': 0, 'pending': [], 'active': None}
 
@@ -116,6 +120,7 @@ class MultiTrader:
             return False
         
         self.executor = OrderExecutor(self.adapter, dry_run=False)
+        self.poller = None  # 거래소/어댑터가 바뀔 수 있으므로 새로 생성
         self.cm.switch_mode(self.capital_mode)
         
         self.watching_symbols = self._get_target_symbols()
@@ -169,29 +174,40 @@ class MultiTrader:
         
         return ["BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT", "DOGEUSDT"]
     
-    def _scan_signals(self):
-        """시그널 스캔"""
-        signals = []
+    def _get_poller(self) -> KlinePoller:
+        """[PERF] 감시 심볼 일괄 폴러 (증분 요청 + 동시 평가)"""
+        if self.poller is None:
+            self.poller = KlinePoller(
+                lambda symbol, interval, limit: self.adapter.get_klines(symbol=symbol, interval=interval, limit=limit),
+                interval='15m',
+                limit=100,
+                exchange=self.exchange_name,
+                max_workers=self.SCAN_WORKERS,
+            )
+        return self.poller
+    
+    def _evaluate_symbol(self, symbol: str, df) -> Optional[dict]:
+        """심볼 캔들 → 시그널 (패턴 미감지 시 None)"""
+        if len(df) < 50:
+            return None
         
-        for symbol in self.watching_symbols:
-            if not self.running:
-                break
-            
-            try:
-                df = self.adapter.get_klines(symbol=symbol, interval='15m', limit=100)
-                if df is None or len(df) < 50:
-                    continue
-                
-                result = self.core.detect_pattern(df)
-                if result and result.get('detected'):
-                    signals.append({
-                        'symbol': symbol,
-                        'direction': result['direction'],
-                        'strength': result.get('strength', 0),
-                        'price': float(df['close'].iloc[-1])
-                    })
-            except:
-                continue
+        result = self.core.detect_pattern(df)
+        if result and result.get('detected'):
+            return {
+                'symbol': symbol,
+                'direction': result['direction'],
+                'strength': result.get('strength', 0),
+                'price': float(df['close'].iloc[-1])
+            }
+        return None
+    
+    def _scan_signals(self):
+        """시그널 스캔 (전체 심볼 동시 폴링, 결과는 감시 순서)"""
+        signals = self._get_poller().scan(
+            self.watching_symbols,
+            self._evaluate_symbol,
+            should_stop=lambda: not self.running
+        )
         
         self.pending_signals = signals
         self.stats['watching'] = len(self.watching_symbols)
@@ -1,5 +1,5 @@
 from typing import Dict, List, Optional, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 import logging
 from concurrent.futures import ProcessPoolExecutor, as_completed
 
@@ -15,6 +15,10 @@ try:
 except ImportError:
     AlphaX7Core = None
 
+from core.shared_frames import SharedFrames
+from storage.result_store import EvaluationFailed, ResultStore, get_result_store
+from utils.data_utils import data_fingerprint
+
 logger = logging.getLogger(__name__)
 
 
@@ -159,77 +163,161 @@ def calculate_optimal_leverage(mdd: float, target_mdd: float = 20.0) -> int:
 
 # ============ 멀티프로세스 워커 함수 (모듈 레벨) ============
 
+# 시그널 세트를 결정하는 파라미터 (나머지 축은 시그널 재사용)
+_SIGNAL_PARAM_KEYS = ['pattern_tolerance', 'entry_validity_hours', 'macd_fast', 'macd_slow', 'macd_signal']
+
+
+def _resolve_signal_params(params: Dict) -> Dict:
+    """시그널 파라미터 확정 (run_backtest와 동일하게 ACTIVE_PARAMS 기본값 사용)"""
+    from core.strategy_core import ACTIVE_PARAMS
+
+    def _get(key, fallback=None):
+        value = params.get(key)
+        return ACTIVE_PARAMS.get(key, fallback) if value is None else value
+
+    return {
+        'tolerance': _get('pattern_tolerance'),
+        'validity_hours': _get('entry_validity_hours'),
+        'macd_fast': _get('macd_fast', 12),
+        'macd_slow': _get('macd_slow', 26),
+        'macd_signal': _get('macd_signal', 9),
+    }
+
+
+def _prepare_source_frame(df):
+    """원본 DF timestamp 정규화 후 DatetimeIndex로 설정"""
+    import pandas as pd
+    
+    # timestamp 처리 (다양한 형식 지원)
+    if 'timestamp' in df.columns:
+        ts = df['timestamp']
+        # int/float (ms) → datetime
+        if pd.api.types.is_numeric_dtype(ts):
+            df['timestamp'] = pd.to_datetime(ts, unit='ms')
+        # string → datetime
+        elif pd.api.types.is_string_dtype(ts):
+            df['timestamp'] = pd.to_datetime(ts)
+        # 이미 datetime이면 그대로
+        
+        df = df.set_index('timestamp')
+    else:
+        # timestamp 컬럼 없으면 인덱스가 datetime인지 확인
+        if not isinstance(df.index, pd.DatetimeIndex):
+            logging.getLogger(__name__).warning("No valid timestamp - using default 1h resampling")
+    return df
+
+
+# 패턴 TF 리샘플링 맵
+_PATTERN_RESAMPLE_MAP = {'1h': '1h', '2h': '2h', '4h': '4h', '6h': '6h', '1H': '1h', '4H': '4h'}
+
+
+def _resample_pattern(df, resample_rule_p: str):
+    """패턴용 리샘플링 (W/M 패턴은 보통 1H에서 탐지)"""
+    df_pattern_opt = df.resample(resample_rule_p).agg({
+        'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'
+    }).dropna().reset_index()
+    
+    if 'timestamp' not in df_pattern_opt.columns:
+        df_pattern_opt = df_pattern_opt.reset_index()
+    return df_pattern_opt
+
+
+# 공유 메모리 워커 컨텍스트 (풀 initializer에서 설정)
+_WORKER_CONTEXT: Dict = {}
+
+
+def _init_shared_worker(handle, data_fp=None):
+    """ProcessPool initializer: 공유 메모리 원본 DF attach (워커당 1회)"""
+    from core.shared_frames import attach_frames
+    frames = attach_frames(handle)
+    _WORKER_CONTEXT['df'] = _prepare_source_frame(frames['source'])
+    _WORKER_CONTEXT['data_fp'] = data_fp
+    _WORKER_CONTEXT['patterns'] = {}
+
+
+def _worker_run_shared(params):
+    """공유 메모리 워커: 태스크에는 파라미터 dict만 전달, 패턴 리샘플은 워커에서 TF당 1회"""
+    df = _WORKER_CONTEXT['df']
+    resample_rule_p = _PATTERN_RESAMPLE_MAP.get(params.get('pattern_tf', '1h'), '1h')
+    patterns = _WORKER_CONTEXT['patterns']
+    if resample_rule_p not in patterns:
+        patterns[resample_rule_p] = _resample_pattern(df, resample_rule_p)
+    return _run_backtest_task(params, df, patterns[resample_rule_p], resample_rule_p, _WORKER_CONTEXT.get('data_fp'))
+
+
 def _worker_run_backtest(args):
     """
     멀티프로세스용 워커 함수 (pickle 호환)
     
     Args:
-        args: (params, df_dict, columns) 튜플
+        args: (params, df_dict, columns[, data_fp]) 튜플
+              data_fp: 원본 데이터 지문 (시그널 캐시 키, 없으면 워커에서 계산)
     
     Returns:
-        OptimizationResult or None
+        OptimizationResult, 필터 탈락 시 None, 예외 시 EvaluationFailed
     """
     import pandas as pd
-    import math
-    import numpy as np
     
-    params, df_dict, columns = args
+    params, df_dict, columns = args[:3]
+    data_fp = args[3] if len(args) > 3 else None
     
     try:
         # DataFrame 재구성
         df = pd.DataFrame(df_dict)
         df.columns = columns
-        
-        # filter_tf에 따른 동적 리샘플링 (15분봉 → 1H/2H/4H/6H)
-        filter_tf = params.get('filter_tf', '1h')
-        
-        # timestamp 처리 (다양한 형식 지원)
-        if 'timestamp' in df.columns:
-            ts = df['timestamp']
-            # int/float (ms) → datetime
-            if pd.api.types.is_numeric_dtype(ts):
-                df['timestamp'] = pd.to_datetime(ts, unit='ms')
-            # string → datetime
-            elif pd.api.types.is_string_dtype(ts):
-                df['timestamp'] = pd.to_datetime(ts)
-            # 이미 datetime이면 그대로
-            
-            df = df.set_index('timestamp')
-        else:
-            # timestamp 컬럼 없으면 인덱스가 datetime인지 확인
-            if not isinstance(df.index, pd.DatetimeIndex):
-                logging.getLogger(__name__).warning("No valid timestamp - using default 1h resampling")
+        df = _prepare_source_frame(df)
         
         # [FIX] 패턴 데이터와 필터 데이터 분리 (Live/Backtest와 정규화)
-        pattern_tf = params.get('pattern_tf', '1h')
-        filter_tf = params.get('filter_tf', '4h') # 트렌드 필터용
-        
-        # 리샘플링 맵
-        resample_map = {'1h': '1h', '2h': '2h', '4h': '4h', '6h': '6h', '1H': '1h', '4H': '4h'}
+        resample_rule_p = _PATTERN_RESAMPLE_MAP.get(params.get('pattern_tf', '1h'), '1h')
+        df_pattern_opt = _resample_pattern(df, resample_rule_p)
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Worker backtest error: {e}")
+        return EvaluationFailed(e, params)
+    
+    return _run_backtest_task(params, df, df_pattern_opt, resample_rule_p, data_fp)
 
-        # 패턴용 리샘플링 (W/M 패턴은 보통 1H에서 탐지)
-        resample_rule_p = resample_map.get(pattern_tf, '1h')
-        df_pattern_opt = df.resample(resample_rule_p).agg({
-            'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'
-        }).dropna().reset_index()
-        
-        if 'timestamp' not in df_pattern_opt.columns:
-            df_pattern_opt = df_pattern_opt.reset_index()
+
+def _run_backtest_task(params, df, df_pattern_opt, resample_rule_p, data_fp=None):
+    """단일 파라미터 백테스트 + 메트릭 (df: DatetimeIndex 원본, df_pattern_opt: 패턴 TF)
+    
+    필터 탈락은 None (저장소에 '결과 없음'으로 기록), 예외는 EvaluationFailed (기록하지 않음)
+    """
+    import math
+    import numpy as np
+    
+    try:
+        filter_tf = params.get('filter_tf', '4h') # 트렌드 필터용
 
         # Strategy import inside worker (프로세스 격리)
         from core.strategy_core import AlphaX7Core
+        from core.signal_cache import get_signal_cache
         strategy = AlphaX7Core(use_mtf=True)  # MTF 필터 활성화 (추세 정렬)
 
         # 비용 합산 (백테스트 UI와 동일)
         combined_cost = params.get('slippage', 0.0006) + params.get('fee', 0.00055)
         
+        # 시그널 세트 (패턴 파라미터가 같은 조합끼리 공유)
+        signal_params = _resolve_signal_params(params)
+        signals = get_signal_cache().get_signals(
+            strategy, df_pattern_opt, pattern_tf=resample_rule_p,
+            fingerprint=f"{data_fp}:{resample_rule_p}" if data_fp else None,
+            **signal_params
+        )
+        
         # 백테스트 실행
-        bt_params = {k: v for k, v in params.items() if k not in ['slippage', 'fee', 'filter_tf']}
+        bt_params = {k: v for k, v in params.items() if k not in _SIGNAL_PARAM_KEYS + ['slippage', 'fee', 'filter_tf']}
         trades = strategy.run_backtest(
             df_pattern=df_pattern_opt, 
             df_entry=df.reset_index(), 
             slippage=combined_cost, 
             filter_tf=filter_tf, # MTF 필터용 TF만 따로 전달
+            use_kernel=True,     # [PERF] 배열 커널 (루프와 동일 결과)
+            pattern_tolerance=signal_params['tolerance'],
+            entry_validity_hours=signal_params['validity_hours'],
+            macd_fast=signal_params['macd_fast'],
+            macd_slow=signal_params['macd_slow'],
+            macd_signal=signal_params['macd_signal'],
+            signals=signals,
             **bt_params
         )
         
@@ -312,7 +400,20 @@ def _worker_run_backtest(args):
         )
     except Exception as e:
         logging.getLogger(__name__).error(f"Worker backtest error: {e}")
+        return EvaluationFailed(e, params)
+
+# 결과 저장소 네임스페이스 (워커 메트릭 계산 방식별로 분리)
+RESULT_NAMESPACE = 'optimization_engine'
+
+
+def _result_metrics(result: Optional[OptimizationResult]) -> Optional[Dict]:
+    """결과 저장소용 메트릭 (params 제외), 결과 없음은 None"""
+    if result is None:
         return None
+    metrics = asdict(result)
+    metrics.pop('params', None)
+    return metrics
+
 
 class OptimizationEngine:
     """최적화 엔진 (UI 독립)"""
@@ -327,6 +428,7 @@ class OptimizationEngine:
         self.param_ranges = param_ranges or PARAM_RANGES
         self.progress_callback = progress_callback
         self._stop_requested = False
+        self.result_store: Optional[ResultStore] = None  # None이면 기본 저장소 사용
     
     def generate_param_grid(self, selected_params: List[str] = None) -> List[Dict]:
         """파라미터 그리드 생성"""
@@ -388,9 +490,15 @@ class OptimizationEngine:
         try:
             # AlphaX7Core.run_backtest returns List[Dict] (trades)
             # Optimization expects a summary dict
+            from core.signal_cache import get_signal_cache
+            signal_params = _resolve_signal_params(params)
+            signals = get_signal_cache().get_signals(
+                self.strategy, df, pattern_tf=params.get('pattern_tf'), **signal_params
+            )
             trades = self.strategy.run_backtest(
                 df_pattern=df, 
                 df_entry=df, 
+                signals=signals,
                 **params
             )
             
@@ -478,9 +586,16 @@ class OptimizationEngine:
         param_grid: List[Dict],
         max_workers: int = 4,
         task_callback: Callable[[OptimizationResult], None] = None,
-        capital_mode: str = 'COMPOUND'
+        capital_mode: str = 'COMPOUND',
+        use_shared_memory: bool = True,
+        use_result_store: bool = True
     ) -> List[OptimizationResult]:
-        """전체 최적화 실행"""
+        """전체 최적화 실행
+        
+        use_shared_memory: True면 원본 DF를 공유 메모리로 1회 배포하고 태스크에는 파라미터만 전달
+                           (배포 실패 시 태스크별 df_dict 전달로 진행)
+        use_result_store: True면 결과 저장소(storage.result_store)에서 이미 평가한 조합은 건너뜀
+        """
         results = []
         total = len(param_grid)
         completed = 0
@@ -489,18 +604,67 @@ class OptimizationEngine:
         self._executor = None
         self._futures = {}
         
+        data_fp = data_fingerprint(df)  # 워커 시그널 캐시 키 / 결과 저장소 키 (1회 계산)
+        
+        def deliver(result):
+            results.append(result)
+            if task_callback:
+                task_callback(result)
+        
+        # [PERF] 이미 평가한 조합은 저장소에서 복원, 나머지만 실행
+        store = (self.result_store or get_result_store()) if use_result_store else None
+        pending = param_grid
+        if store is not None:
+            cached = store.get_many(RESULT_NAMESPACE, data_fp, param_grid)
+            pending = []
+            for params in param_grid:
+                key = store.key(params)
+                if key not in cached:
+                    pending.append(params)
+                    continue
+                if cached[key] is not None:
+                    deliver(OptimizationResult(params=params, **cached[key]))
+                completed += 1
+            if cached:
+                logger.info(f"Result store: {completed}/{total} combinations reused")
+                if self.progress_callback:
+                    self.progress_callback(completed, total)
+        to_store = []
+        failed = 0
+        
+        shared = None
         try:
-            self._executor = ProcessPoolExecutor(max_workers=max_workers)
-            
-            # DataFrame을 pickle 가능한 형태로 변환
-            df_dict = df.to_dict('list')
-            columns = list(df.columns)
-            args_list = [(params, df_dict, columns) for params in param_grid]
+            # [PERF] 원본 DF 공유 메모리 배포 → 태스크에는 파라미터 dict만 전달
+            if use_shared_memory and pending:
+                try:
+                    shared = SharedFrames({'source': df})
+                except (ValueError, OSError) as e:
+                    logger.warning(f"Shared memory unavailable, falling back to pickled data: {e}")
             
-            self._futures = {
-                self._executor.submit(_worker_run_backtest, args): args[0]
-                for args in args_list
-            }
+            if not pending:
+                pass
+            elif shared is not None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_shared_worker,
+                    initargs=(shared.handle, data_fp)
+                )
+                self._futures = {
+                    self._executor.submit(_worker_run_shared, params): params
+                    for params in pending
+                }
+            else:
+                self._executor = ProcessPoolExecutor(max_workers=max_workers)
+                
+                # DataFrame을 pickle 가능한 형태로 변환
+                df_dict = df.to_dict('list')
+                columns = list(df.columns)
+                args_list = [(params, df_dict, columns, data_fp) for params in pending]
+                
+                self._futures = {
+                    self._executor.submit(_worker_run_backtest, args): args[0]
+                    for args in args_list
+                }
             
             for future in as_completed(self._futures):
                 if self._stop_requested:
@@ -508,10 +672,13 @@ class OptimizationEngine:
                 
                 try:
                     result = future.result(timeout=1)
-                    if result:
-                        results.append(result)
-                        if task_callback:
-                            task_callback(result)
+                    if isinstance(result, EvaluationFailed):
+                        # 일시적 실패일 수 있음: 저장하지 않고 다음 실행에서 재평가
+                        failed += 1
+                    else:
+                        to_store.append((self._futures[future], _result_metrics(result)))
+                        if result:
+                            deliver(result)
                 except Exception as e:
                     logger.error(f"Optimization task error: {e}")
                 
@@ -519,9 +686,15 @@ class OptimizationEngine:
                 if self.progress_callback:
                     self.progress_callback(completed, total)
         finally:
-            # 항상 정리
+            # 항상 정리 (워커 종료 후 공유 블록 해제)
             self._cleanup_executor()
+            if shared is not None:
+                shared.close()
+            if store is not None:
+                store.put_many(RESULT_NAMESPACE, data_fp, to_store)
         
+        if failed:
+            logger.warning(f"{failed} optimization tasks failed (not stored, will be re-evaluated)")
         return results
     
     def _cleanup_executor(self):
@@ -10,10 +10,11 @@ logger = logging.getLogger(__name__)
 
 
 import itertools
+from contextlib import nullcontext
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Callable
-from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Callable
+from dataclasses import dataclass, asdict
 from concurrent.futures import ProcessPoolExecutor, as_completed
 
 import sys
@@ -23,6 +24,12 @@ import os
 from utils.logger import get_module_logger
 logger = get_module_logger(__name__)
 
+from core.shared_frames import SharedFrames, attach_frames
+from core.signal_cache import get_signal_cache
+from core.task_batching import AdaptiveChunker, run_chunked, run_timed_chunk
+from storage.result_store import EvaluationFailed, ResultStore, get_result_store
+from utils.data_utils import data_fingerprint
+
 # TF_MAPPING, TF_RESAMPLE_MAP import
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'GUI'))
 try:
@@ -69,6 +76,9 @@ LEVERAGE_RANGE = [1, 2, 3, 5, 7, 10, 15, 20]
 # 방향 범위
 DIRECTION_RANGE = ['Both', 'Long', 'Short']
 
+# 사후 확장 축 (백테스트 1회 거래 목록에서 파생, 조합별 재실행 불필요)
+POSTHOC_AXES = ('leverage', 'direction')
+
 # 지표 범위 (TODO 5 반영)
 INDICATOR_RANGE = {
     'macd_fast': [6, 8, 10, 12],
@@ -261,91 +271,217 @@ def calculate_grade(win_rate: float, profit_factor: float, max_drawdown: float)
         return "🥉C"
 
 
-def _worker_run_single(strategy_class, params, df_pattern, df_entry, slippage, fee):
-    """멀티프로세싱 지원을 위한 독립형 워커 함수"""
-    try:
-        # 방향 처리
-        leverage = params.get('leverage', 3)
-        if isinstance(leverage, list): leverage = leverage[0]
-        leverage = int(leverage)
+def _signal_params(params: Dict) -> Dict:
+    """시그널 세트를 결정하는 파라미터 (SignalCache 키)"""
+    return {
+        'tolerance': params.get('pattern_tolerance', DEFAULT_PARAMS.get('pattern_tolerance', 0.03)),
+        'validity_hours': params.get('entry_validity_hours', DEFAULT_PARAMS.get('entry_validity_hours', 12.0)),
+        'macd_fast': params.get('macd_fast', DEFAULT_PARAMS.get('macd_fast', 12)),
+        'macd_slow': params.get('macd_slow', DEFAULT_PARAMS.get('macd_slow', 26)),
+        'macd_signal': params.get('macd_signal', DEFAULT_PARAMS.get('macd_signal', 9)),
+    }
+
+
+def _worker_backtest(strategy_class, params, df_pattern, df_entry, slippage, fee, data_fp=None) -> List[Dict]:
+    """단일 파라미터 조합 백테스트 (레버리지/방향 적용 전 거래 목록 반환)"""
+    filter_tf = params.get('filter_tf', '4h')
+    if isinstance(filter_tf, list): filter_tf = filter_tf[0]
+    
+    # 전략 인스턴스 생성
+    strategy = strategy_class()
+    
+    # 총 비용
+    total_cost = slippage + fee
+    
+    # 시그널 세트 (패턴 파라미터가 같은 조합끼리 공유)
+    signal_params = _signal_params(params)
+    signals = get_signal_cache().get_signals(
+        strategy, df_pattern, pattern_tf=params.get('trend_interval'), fingerprint=data_fp, **signal_params
+    )
+    
+    # 백테스트 실행 (파라미터화 완료)
+    return strategy.run_backtest(
+        df_pattern=df_pattern,
+        df_entry=df_entry,
+        slippage=total_cost,
+        atr_mult=params.get('atr_mult', DEFAULT_PARAMS.get('atr_mult', 1.5)),
+        trail_start_r=params.get('trail_start_r', DEFAULT_PARAMS.get('trail_start_r', 0.8)),
+        trail_dist_r=params.get('trail_dist_r', DEFAULT_PARAMS.get('trail_dist_r', 0.5)),
+        pattern_tolerance=signal_params['tolerance'],
+        entry_validity_hours=signal_params['validity_hours'],
+        pullback_rsi_long=params.get('pullback_rsi_long', DEFAULT_PARAMS.get('pullback_rsi_long', 35)),
+        pullback_rsi_short=params.get('pullback_rsi_short', DEFAULT_PARAMS.get('pullback_rsi_short', 65)),
+        max_adds=params.get('max_adds', DEFAULT_PARAMS.get('max_adds', 1)),
+        filter_tf=filter_tf,
+        rsi_period=params.get('rsi_period', DEFAULT_PARAMS.get('rsi_period', 14)),
+        atr_period=params.get('atr_period', DEFAULT_PARAMS.get('atr_period', 14)),
+        macd_fast=signal_params['macd_fast'],
+        macd_slow=signal_params['macd_slow'],
+        macd_signal=signal_params['macd_signal'],
+        ema_period=params.get('ema_period', DEFAULT_PARAMS.get('ema_period', 20)),
+        enable_pullback=params.get('enable_pullback', False),
+        use_kernel=True,  # [PERF] 배열 커널 (루프와 동일 결과)
+        signals=signals
+    )
+
+
+def _evaluate_trades(params: Dict, trades: List[Dict]) -> Optional[OptimizationResult]:
+    """거래 목록에 방향 필터/레버리지 적용 후 결과 생성 (원본 거래 목록은 수정하지 않음)"""
+    # 방향 처리
+    leverage = params.get('leverage', 3)
+    if isinstance(leverage, list): leverage = leverage[0]
+    leverage = int(leverage)
+    
+    direction = params.get('direction', 'Both')
+    if isinstance(direction, list): direction = direction[0]
+    
+    if not trades:
+        return None
         
-        direction = params.get('direction', 'Both')
-        if isinstance(direction, list): direction = direction[0]
+    min_trades = params.get('min_trades', 1)
+    if len(trades) < min_trades:
+        return None
         
-        filter_tf = params.get('filter_tf', '4h')
-        if isinstance(filter_tf, list): filter_tf = filter_tf[0]
+    # 방향 필터링
+    if direction != 'Both':
+        trades = [t for t in trades if t['type'] == direction]
+        if len(trades) < min_trades: return None
         
-        # 전략 인스턴스 생성
-        strategy = strategy_class()
+    # 레버리지 적용
+    trades = [{**t, 'pnl': t['pnl'] * leverage} for t in trades]
         
-        # 총 비용
-        total_cost = slippage + fee
+    # 메트릭 계산 (공용 정적 메서드 호출)
+    metrics = BacktestOptimizer.calculate_metrics(trades)
+    
+    # MDD 필터
+    max_mdd_limit = params.get('max_mdd', 100.0)
+    if max_mdd_limit < 100.0 and abs(metrics['max_drawdown']) > max_mdd_limit:
+        return None
         
-        # 백테스트 실행 (파라미터화 완료)
-        trades = strategy.run_backtest(
-            df_pattern=df_pattern,
-            df_entry=df_entry,
-            slippage=total_cost,
-            atr_mult=params.get('atr_mult', DEFAULT_PARAMS.get('atr_mult', 1.5)),
-            trail_start_r=params.get('trail_start_r', DEFAULT_PARAMS.get('trail_start_r', 0.8)),
-            trail_dist_r=params.get('trail_dist_r', DEFAULT_PARAMS.get('trail_dist_r', 0.5)),
-            pattern_tolerance=params.get('pattern_tolerance', DEFAULT_PARAMS.get('pattern_tolerance', 0.03)),
-            entry_validity_hours=params.get('entry_validity_hours', DEFAULT_PARAMS.get('entry_validity_hours', 12.0)),
-            pullback_rsi_long=params.get('pullback_rsi_long', DEFAULT_PARAMS.get('pullback_rsi_long', 35)),
-            pullback_rsi_short=params.get('pullback_rsi_short', DEFAULT_PARAMS.get('pullback_rsi_short', 65)),
-            max_adds=params.get('max_adds', DEFAULT_PARAMS.get('max_adds', 1)),
-            filter_tf=filter_tf,
-            rsi_period=params.get('rsi_period', DEFAULT_PARAMS.get('rsi_period', 14)),
-            atr_period=params.get('atr_period', DEFAULT_PARAMS.get('atr_period', 14)),
-            macd_fast=params.get('macd_fast', DEFAULT_PARAMS.get('macd_fast', 12)),
-            macd_slow=params.get('macd_slow', DEFAULT_PARAMS.get('macd_slow', 26)),
-            macd_signal=params.get('macd_signal', DEFAULT_PARAMS.get('macd_signal', 9)),
-            ema_period=params.get('ema_period', DEFAULT_PARAMS.get('ema_period', 20)),
-            enable_pullback=params.get('enable_pullback', False)
-        )
+    return OptimizationResult(
+        params=params,
+        trades=len(trades),
+        win_rate=metrics['win_rate'],
+        total_return=metrics['total_return'],
+        simple_return=metrics['simple_return'],
+        compound_return=metrics['compound_return'],
+        max_drawdown=metrics['max_drawdown'],
+        sharpe_ratio=metrics['sharpe_ratio'],
+        profit_factor=metrics['profit_factor'],
+        avg_trades_per_day=metrics.get('avg_trades_per_day', 0.0),
+        stability=metrics.get('stability', "⚠️"),
+        grade=calculate_grade(metrics['win_rate'], metrics['profit_factor'], metrics['max_drawdown'])
+    )
+
+
+def _worker_run_single(strategy_class, params, df_pattern, df_entry, slippage, fee, data_fp=None):
+    """멀티프로세싱 지원을 위한 독립형 워커 함수
+    
+    data_fp: df_pattern 데이터 지문 (시그널 캐시 키, 없으면 워커에서 계산)
+    
+    Returns:
+        OptimizationResult, 필터 탈락 시 None, 예외 시 EvaluationFailed (저장소에 기록하지 않음)
+    """
+    try:
+        trades = _worker_backtest(strategy_class, params, df_pattern, df_entry, slippage, fee, data_fp)
+        return _evaluate_trades(params, trades)
+    except Exception as e:
+        return EvaluationFailed(e, params)
 
-        
-        if not trades:
-            return None
-            
-        min_trades = params.get('min_trades', 1)
-        if len(trades) < min_trades:
-            return None
-            
-        # 방향 필터링
-        if direction != 'Both':
-            trades = [t for t in trades if t['type'] == direction]
-            if len(trades) < min_trades: return None
-            
-        # 레버리지 적용
-        for t in trades:
-            t['pnl'] = t['pnl'] * leverage
-            
-        # 메트릭 계산 (공용 정적 메서드 호출)
-        metrics = BacktestOptimizer.calculate_metrics(trades)
-        
-        # MDD 필터
-        max_mdd_limit = params.get('max_mdd', 100.0)
-        if max_mdd_limit < 100.0 and abs(metrics['max_drawdown']) > max_mdd_limit:
-            return None
-            
-        return OptimizationResult(
-            params=params,
-            trades=len(trades),
-            win_rate=metrics['win_rate'],
-            total_return=metrics['total_return'],
-            simple_return=metrics['simple_return'],
-            compound_return=metrics['compound_return'],
-            max_drawdown=metrics['max_drawdown'],
-            sharpe_ratio=metrics['sharpe_ratio'],
-            profit_factor=metrics['profit_factor'],
-            avg_trades_per_day=metrics.get('avg_trades_per_day', 0.0),
-            stability=metrics.get('stability', "⚠️"),
-            grade=calculate_grade(metrics['win_rate'], metrics['profit_factor'], metrics['max_drawdown'])
-        )
-    except Exception:
+
+def _worker_run_expanded(strategy_class, params, variants, df_pattern, df_entry, slippage, fee, data_fp=None):
+    """사후 확장 워커: 백테스트 1회 → 레버리지/방향 조합별 결과 목록
+    
+    variants: params에 덮어쓸 사후 확장 값 목록 (예: [{'leverage': 3, 'direction': 'Long'}, ...])
+    
+    Returns:
+        필터 통과 결과 목록 (평가 중 예외가 난 조합은 EvaluationFailed로 포함),
+        백테스트 자체가 실패하면 EvaluationFailed
+    """
+    try:
+        trades = _worker_backtest(strategy_class, params, df_pattern, df_entry, slippage, fee, data_fp)
+    except Exception as e:
+        return EvaluationFailed(e, params)
+    
+    results = []
+    for variant in variants:
+        variant_params = {**params, **variant}
+        try:
+            result = _evaluate_trades(variant_params, trades)
+        except Exception as e:
+            result = EvaluationFailed(e, variant_params)
+        if result is not None:
+            results.append(result)
+    return results
+
+
+def _result_metrics(result: Optional[OptimizationResult]) -> Optional[Dict]:
+    """결과 저장소용 지표 dict (params 제외, 결과 없음은 None)"""
+    if not result:
         return None
+    metrics = asdict(result)
+    metrics.pop('params', None)
+    return metrics
+
+
+# 공유 메모리 워커 컨텍스트 (풀 initializer에서 설정)
+_WORKER_CONTEXT: Dict = {}
+
 
+def _init_shared_worker(strategy_class, handle):
+    """ProcessPool initializer: 공유 메모리 DF attach (워커당 1회)"""
+    _WORKER_CONTEXT['strategy_class'] = strategy_class
+    _WORKER_CONTEXT['frames'] = attach_frames(handle)
+
+
+def _worker_run_task(params, pattern_key, entry_key, data_fp, variants, slippage, fee,
+                     frames=None, strategy_class=None):
+    """청크 태스크 1개 실행 (frames가 없으면 공유 메모리 워커 컨텍스트 사용)
+    
+    Returns:
+        variants가 있으면 결과 목록, 없으면 OptimizationResult 또는 None (예외 시 EvaluationFailed)
+    """
+    if frames is None:
+        frames = _WORKER_CONTEXT.get('frames', {})
+        strategy_class = _WORKER_CONTEXT.get('strategy_class')
+    df_pattern = frames.get(pattern_key)
+    df_entry = frames.get(entry_key)
+    if variants is not None:
+        return _worker_run_expanded(strategy_class, params, variants, df_pattern, df_entry, slippage, fee, data_fp)
+    return _worker_run_single(strategy_class, params, df_pattern, df_entry, slippage, fee, data_fp)
+
+
+def iter_base_combos(grid: Dict, exclude=()) -> Iterator[Dict]:
+    """
+    그리드 조합을 지연 생성 (exclude 축은 첫 값으로 자리만 잡음, 키 순서는 grid와 동일)
+    """
+    keys = list(grid.keys())
+    base_keys = [k for k in keys if k not in exclude]
+    placeholder = {k: grid[k][0] for k in keys if k in exclude and grid[k]}
+    for combo in itertools.product(*[grid[k] for k in base_keys]):
+        values = dict(zip(base_keys, combo))
+        yield {k: values[k] if k in values else placeholder.get(k) for k in keys}
+
+
+def posthoc_variants(grid: Dict) -> List[Dict]:
+    """사후 확장 축(leverage/direction) 값 조합 목록"""
+    posthoc_keys = [k for k in grid if k in POSTHOC_AXES]
+    return [dict(zip(posthoc_keys, combo)) for combo in itertools.product(*[grid[k] for k in posthoc_keys])]
+
+
+def expand_posthoc_grid(grid: Dict) -> tuple:
+    """
+    그리드를 백테스트 조합과 사후 확장 조합으로 분리
+    
+    leverage는 PnL 배율, direction은 'Both' 결과의 부분집합이므로
+    백테스트 없이 같은 거래 목록에서 파생 가능
+    
+    Returns:
+        (base_combos, variants)
+        - base_combos: 백테스트가 필요한 params 목록 (키 순서는 grid와 동일)
+        - variants: 각 base에 덮어쓸 사후 확장 값 목록
+    """
+    return list(iter_base_combos(grid, exclude=POSTHOC_AXES)), posthoc_variants(grid)
 
 
     # _calculate_metrics_standalone removed and unified inside BacktestOptimizer
@@ -368,6 +504,8 @@ class BacktestOptimizer:
         self.results: List[OptimizationResult] = []
         self.progress_callback: Optional[Callable] = None
         self.cancelled = False
+        self.result_store: Optional[ResultStore] = None  # None이면 전역 저장소 사용
+        self.failed_count = 0  # 마지막 실행에서 평가하지 못한 조합 수 (워커/청크 실패)
     
     def set_data(self, df: pd.DataFrame):
         """데이터 설정"""
@@ -414,11 +552,21 @@ class BacktestOptimizer:
     
     def run_optimization(self, df: pd.DataFrame, grid: Dict, max_workers: int = 4, 
                          metric: str = 'WinRate', task_callback: Callable = None, 
-                         capital_mode: str = 'compound') -> List[OptimizationResult]:
-        """그리드 서치 최적화 실행"""
+                         capital_mode: str = 'compound',
+                         expand_posthoc: bool = True,
+                         use_shared_memory: bool = True,
+                         use_result_store: bool = True) -> List[OptimizationResult]:
+        """그리드 서치 최적화 실행
+        
+        expand_posthoc: True면 leverage/direction 축은 백테스트 1회 결과에서 파생
+                        (백테스트 수 = 전체 조합 / (레버리지 수 × 방향 수), 결과 동일)
+        use_shared_memory: True면 DF를 공유 메모리로 1회 배포하고 태스크에는 파라미터만 전달
+        use_result_store: True면 같은 데이터로 이미 평가한 조합은 저장소 결과 재사용
+        """
         self.df = df
         self.results = []
         self.cancelled = False
+        self.failed_count = 0
         self.capital_mode = capital_mode.lower()
         if self.df is None or self.df.empty:
             raise ValueError("데이터가 설정되지 않았습니다")
@@ -439,20 +587,30 @@ class BacktestOptimizer:
         # 리샘플링 캐시 초기화
         self._resample_cache = {}
         
-        # 모든 파라미터 조합 생성
-        keys = list(param_grid.keys())
-        values = list(param_grid.values())
-        combinations = list(itertools.product(*values))
-        total = len(combinations)
+        # 파라미터 조합 (지연 생성 - 전체 리스트를 만들지 않음)
+        if expand_posthoc:
+            # [PERF] 레버리지/방향은 백테스트 후 파생
+            variants = posthoc_variants(grid)
+            combos = iter_base_combos(grid, exclude=POSTHOC_AXES)
+            total = int(np.prod([len(v) for k, v in grid.items() if k not in POSTHOC_AXES]))
+        else:
+            variants = None
+            combos = iter_base_combos(grid)
+            total = int(np.prod([len(v) for v in grid.values()]))
         
         # [NEW] n_cores 처리
+        n_cores = max_workers
         if n_cores is None:
             import multiprocessing
             n_cores = multiprocessing.cpu_count()
         
+        # 비용 (슬리피지 + 수수료)
+        slippage = DEFAULT_PARAMS.get('slippage', 0.0005)
+        fee = DEFAULT_PARAMS.get('fee', 0.00055)
+        
         # [NEW] 지표 선행 계산 (ThreadPool 경합 방지)
-        all_trend_tfs = set(param_grid.get('trend_interval', []))
-        all_entry_tfs = set(param_grid.get('entry_tf', []))
+        all_trend_tfs = set(grid.get('trend_interval', []))
+        all_entry_tfs = set(grid.get('entry_tf', []))
         
         for tf in all_trend_tfs:
             key = f"p_{tf}"
@@ -467,89 +625,167 @@ class BacktestOptimizer:
                 else:
                     self._resample_cache[key] = df.copy()
         
-        logger.info(f"🔬 최적화 시작: {total}개 조합, {n_cores}코어 (ProcessPool) 사용")
+        # [PERF] 패턴 TF별 데이터 지문 (워커 시그널 캐시 키, 조합마다 재계산 방지)
+        pattern_fps = {tf: data_fingerprint(self._resample_cache.get(f"p_{tf}")) for tf in all_trend_tfs}
+        
+        # [PERF] 결과 저장소: 같은 데이터/비용/전략으로 평가한 조합은 재실행하지 않음
+        store = (self.result_store or get_result_store()) if use_result_store else None
+        store_ns = f"backtest_optimizer:{self.strategy_class.__name__}:{slippage}:{fee}"
+        data_fp = data_fingerprint(df) if store is not None else None
+        cached_results: List[OptimizationResult] = []  # 저장소 적중 결과 (메인 루프에서 배출)
+        cached_count = 0
+        to_store = []
+        failures: List[EvaluationFailed] = []  # 워커 예외 (저장하지 않음 → 다음 실행에서 재평가)
+        failed_combos = 0                      # 평가하지 못한 조합 수 (파생 조합 포함, 청크 실패 포함)
+        
+        def expand(base):
+            return [{**base, **v} for v in variants] if variants is not None else [base]
+        
+        def uncached(bases):
+            """저장소에 모든 파생 조합이 있는 base 조합은 건너뛰고 나머지만 반환 (256개 단위 조회)"""
+            nonlocal cached_count
+            bases = iter(bases)
+            while True:
+                batch = list(itertools.islice(bases, 256))
+                if not batch:
+                    return
+                found = store.get_many(store_ns, data_fp, (p for base in batch for p in expand(base)))
+                for base in batch:
+                    full = [(p, store.key(p)) for p in expand(base)]
+                    if all(key in found for _, key in full):
+                        cached_results.extend(OptimizationResult(params=p, **found[key])
+                                              for p, key in full if found[key] is not None)
+                        cached_count += 1
+                    else:
+                        yield base
+        
+        if store is not None:
+            combos = uncached(combos)
+        
+        if variants is not None:
+            logger.info(f"🔬 최적화 시작: {total * len(variants)}개 조합 → 백테스트 {total}회, {n_cores}코어 (ProcessPool) 사용")
+        else:
+            logger.info(f"🔬 최적화 시작: {total}개 조합, {n_cores}코어 (ProcessPool) 사용")
         
         # 병렬 처리 (ProcessPoolExecutor)
-        from concurrent.futures import ProcessPoolExecutor, as_completed
+        from concurrent.futures import ProcessPoolExecutor
+        
+        # [PERF] 리샘플링/지표 DF를 공유 메모리로 1회 배포 (실패 시 태스크별 pickle 전달)
+        shared = None
+        pool_kwargs = {}
+        if use_shared_memory:
+            try:
+                shared = SharedFrames(self._resample_cache)
+                pool_kwargs = {'initializer': _init_shared_worker, 'initargs': (self.strategy_class, shared.handle)}
+            except (ValueError, OSError) as e:
+                logger.warning(f"⚠️ 공유 메모리 배포 실패, pickle 전달로 진행: {e}")
+        
+        try:
+            from GUI.constants import TF_MAPPING as entry_tf_map
+        except ImportError:
+            # Fallback if GUI package not found or structure differs
+            entry_tf_map = {'1h': '15m', '4h': '1h', '1d': '4h'}
+        
+        def to_task(params):
+            # 해당 조합에 맞는 cached df 키
+            trend_tf = params.get('trend_interval', '4h')
+            if isinstance(trend_tf, list): trend_tf = trend_tf[0]
+            entry_tf = params.get('entry_tf')
+            if isinstance(entry_tf, list): entry_tf = entry_tf[0]
+            if not entry_tf:
+                entry_tf = entry_tf_map.get(trend_tf, '15min')
+            return (params, f"p_{trend_tf}", f"e_{entry_tf}", pattern_fps.get(trend_tf))
         
-        with ProcessPoolExecutor(max_workers=n_cores) as executor:
-            # TF별 미리 리샘플링된 DF들을 맵으로 준비
-            # (멀티프로세싱 시 파라미터로 매번 DF를 통째로 전달하면 오버헤드가 크지만, 
-            #  여기서는 pickle로 전달됨)
+        with (shared or nullcontext()), ProcessPoolExecutor(max_workers=n_cores, **pool_kwargs) as executor:
+            def submit_chunk(chunk):
+                if shared is not None:
+                    # [PERF] 데이터는 워커가 공유 메모리에서 attach, 청크에는 파라미터만 전달
+                    return executor.submit(run_timed_chunk, _worker_run_task, chunk, variants, slippage, fee)
+                # 공유 메모리 미사용: 청크에서 쓰는 DF만 청크당 1회 pickle 전달
+                frames = {key: self._resample_cache.get(key) for task in chunk for key in task[1:3]}
+                return executor.submit(run_timed_chunk, _worker_run_task, chunk, variants, slippage, fee,
+                                       frames, self.strategy_class)
             
-            futures = []
-            for combo in combinations:
-                params = dict(zip(keys, combo))
-                
-                # 해당 조합에 맞는 cached df 추출
-                trend_tf = params.get('trend_interval', '4h')
-                if isinstance(trend_tf, list): trend_tf = trend_tf[0]
-                entry_tf = params.get('entry_tf')
-                if isinstance(entry_tf, list): entry_tf = entry_tf[0]
-                if not entry_tf:
-                    try:
-                        from GUI.constants import TF_MAPPING
-                    except ImportError:
-                        # Fallback if GUI package not found or structure differs
-                        TF_MAPPING = {'1h': '15m', '4h': '1h', '1d': '4h'}
-                    entry_tf = TF_MAPPING.get(trend_tf, '15min')
-                
-                df_pattern = self._resample_cache.get(f"p_{trend_tf}")
-                df_entry = self._resample_cache.get(f"e_{entry_tf}")
-                
-                # Backtest 실행
-                # [NEW] MultiSymbolBacktest를 사용하여 정밀 테스트
-                from core.multi_symbol_backtest import MultiSymbolBacktest
-                msb = MultiSymbolBacktest(
-                    exchange=params.get('exchange', 'bybit'),
-                    symbols=[symbol],
-                    initial_capital=1000.0,
-                    leverage=leverage,
-                    preset_params=params,
-                    capital_mode=self.capital_mode # [NEW]
+            def collect(result):
+                # === 필터링 조건 ===
+                # 1. MDD ≤ 25% (레버리지 적용 전 기준)
+                # 2. PF ≥ 1.0 (수익 > 손실)
+                # 3. 최소 거래수 ≥ 10
+                passes_filter = (
+                    abs(result.max_drawdown) <= 25.0 and
+                    result.profit_factor >= 1.0 and
+                    result.trades >= 10
                 )
                 
-                futures.append(executor.submit(
-                    _worker_run_single,
-                    self.strategy_class,
-                    params,
-                    df_pattern,
-                    df_entry,
-                    slippage,
-                    fee
-                ))
+                if passes_filter:
+                    self.results.append(result)
+                    if task_callback:
+                        task_callback(result)
             
-            for i, future in enumerate(as_completed(futures)):
-                if self.cancelled:
-                    logger.info("❌ 최적화 취소됨")
-                    executor.shutdown(wait=False, cancel_futures=True)
-                    break
-                
-                try:
-                    result = future.result()
-                    if result:
-                        # === 필터링 조건 ===
-                        # 1. MDD ≤ 25% (레버리지 적용 전 기준)
-                        # 2. PF ≥ 1.0 (수익 > 손실)
-                        # 3. 최소 거래수 ≥ 10
-                        passes_filter = (
-                            abs(result.max_drawdown) <= 25.0 and
-                            result.profit_factor >= 1.0 and
-                            result.trades >= 10
-                        )
-                        
-                        if passes_filter:
-                            self.results.append(result)
-                            if task_callback:
-                                task_callback(result)
-                except Exception as e:
-                    # 프로세스 오류 로그
-                    pass
-                
-                # 진행률 업데이트
-                if self.progress_callback:
-                    progress = int((i + 1) / total * 100)
-                    self.progress_callback(progress)
+            def drain_cached():
+                while cached_results:
+                    collect(cached_results.pop())
+            
+            # [PERF] 청크 단위 제출 + 진행 중 청크 수 제한 (부모 메모리 일정, future 오버헤드 상각)
+            done_count = 0
+            try:
+                for chunk, chunk_results in run_chunked(
+                    submit_chunk,
+                    (to_task(params) for params in combos),
+                    max_in_flight=max(2, n_cores * 2),
+                    chunker=AdaptiveChunker(target_seconds=0.5, max_size=256),
+                    should_stop=lambda: self.cancelled
+                ):
+                    drain_cached()
+                    if chunk_results is None:
+                        # 실패한 청크: 저장하지 않음 (다음 실행에서 재평가)
+                        failed_combos += sum(len(expand(task[0])) for task in chunk)
+                        chunk_results = []
+                    
+                    for task, result in zip(chunk, chunk_results):
+                        if isinstance(result, EvaluationFailed):
+                            # 태스크 실패: 파생 조합 모두 저장하지 않음
+                            failures.append(result)
+                            failed_combos += len(expand(task[0]))
+                            continue
+                        items = result if isinstance(result, list) else [result]
+                        failed = [r for r in items if isinstance(r, EvaluationFailed)]
+                        failures.extend(failed)
+                        failed_combos += len(failed)
+                        if store is not None:
+                            failed_keys = {store.key(r.params) for r in failed}
+                            by_key = {store.key(r.params): r for r in items if r}
+                            for p in expand(task[0]):
+                                key = store.key(p)
+                                if key not in failed_keys:
+                                    to_store.append((p, _result_metrics(by_key.get(key))))
+                        for r in items:
+                            if r:
+                                collect(r)
+                    
+                    # 진행률 업데이트
+                    done_count += len(chunk)
+                    if self.progress_callback:
+                        progress = int((done_count + cached_count) / total * 100)
+                        self.progress_callback(progress)
+                drain_cached()
+            finally:
+                if store is not None:
+                    store.put_many(store_ns, data_fp, to_store)
+            
+            self.failed_count = failed_combos
+            if failed_combos:
+                error = f": {failures[0].error}" if failures else ""
+                logger.warning(f"⚠️ 평가 실패 {failed_combos}개 조합 (저장하지 않음, 다음 실행에서 재평가){error}")
+            
+            if cached_count:
+                logger.info(f"💾 결과 저장소: {cached_count}/{total}개 조합 재사용")
+                if self.progress_callback and not self.cancelled:
+                    self.progress_callback(int((done_count + cached_count) / total * 100))
+            
+            if self.cancelled:
+                logger.info("❌ 최적화 취소됨")
+                executor.shutdown(wait=False, cancel_futures=True)
         
         # 결과 정렬 및 상세 분류 (v2)
         if self.results:
@@ -666,7 +902,9 @@ class BacktestOptimizer:
             
             # 백테스트 실행 (Core Interface)
             if hasattr(strategy, 'run_backtest') and not hasattr(strategy, 'run_backtest_plus'):
-                # AlphaX7Core
+                # AlphaX7Core - 시그널 세트는 패턴 파라미터가 같은 조합끼리 공유
+                signal_params = _signal_params(params)
+                signals = get_signal_cache().get_signals(strategy, df_pattern, pattern_tf=trend_tf, **signal_params)
                 trades = strategy.run_backtest(
                     df_pattern=df_pattern,
                     df_entry=df_entry,  # [FIX] 원본 15min 데이터 사용
@@ -686,7 +924,9 @@ class BacktestOptimizer:
                     macd_slow=params.get('macd_slow', DEFAULT_PARAMS.get('macd_slow', 26)),
                     macd_signal=params.get('macd_signal', DEFAULT_PARAMS.get('macd_signal', 9)),
                     ema_period=params.get('ema_period', DEFAULT_PARAMS.get('ema_period', 20)),
-                    enable_pullback=params.get('enable_pullback', False)  # [NEW] 불타기 옵션
+                    enable_pullback=params.get('enable_pullback', False),  # [NEW] 불타기 옵션
+                    use_kernel=True,  # [PERF] 배열 커널 (루프와 동일 결과)
+                    signals=signals
                 )
 
             else:
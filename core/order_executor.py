@@ -80,6 +80,24 @@ class OrderExecutor:
         clean_symbol = symbol.replace('/', '').replace('-', '').upper()
         return f"TWIN_{clean_symbol}_{side}_{timestamp}"
     
+    def _min_order_qty(self, default: float = 0.001) -> float:
+        """거래소별 최소 주문 수량 (로컬 마켓 캐시, 주문 경로에서 요청 없음 / 없으면 기본값)"""
+        name = getattr(self.exchange, 'name', None)
+        symbol = getattr(self.exchange, 'symbol', None)
+        if not isinstance(name, str) or not isinstance(symbol, str):
+            return default
+        try:
+            from storage.market_cache import get_market_cache
+            exchange_info = getattr(self.exchange, 'exchange_info', None)
+            market_type = exchange_info.get('type') if isinstance(exchange_info, dict) else None
+            info = get_market_cache().instrument(
+                name, symbol, market_type, bool(getattr(self.exchange, 'testnet', False)))
+        except Exception as e:
+            logging.debug(f"[ENTRY] Market cache lookup failed: {e}")
+            return default
+        min_qty = info.get('min_qty') if info else None
+        return float(min_qty) if min_qty else default
+    
     # ========== PnL 계산 ==========
     
     def calculate_pnl(
@@ -359,9 +377,10 @@ class OrderExecutor:
             amount = balance * (invest_ratio / 100) * leverage
             size = amount / current_price
             
-            # 최소 주문 수량 체크 (거래소별 상이)
-            if size < 0.001: # TODO: 거래소별 최소 주문 수량 동적으로 가져오기
-                logging.warning(f"[ENTRY] Size too small: {size}")
+            # 최소 주문 수량 체크 (거래소별 상이 → 로컬 마켓 캐시)
+            min_qty = self._min_order_qty()
+            if size < min_qty:
+                logging.warning(f"[ENTRY] Size too small: {size} (min {min_qty})")
                 return None
             
             # [Phase 8.1.2] Client Order ID 생성
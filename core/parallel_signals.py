@@ -0,0 +1,206 @@
+"""
+core/parallel_signals.py
+포트폴리오 백테스트용 심볼별 시그널 병렬 수집
+
+- 심볼(프리셋) 단위 태스크를 ProcessPool에 분산 (parquet 로드 / 리샘플 / AlphaX7Core 실행은 워커에서)
+- 메모리 예산: 실행 중 태스크의 예상 메모리(캐시 파일 크기 × 배수) 합이 예산을 넘지 않도록 제출 제한
+- 워커 결과는 컬럼 배열(dict[str, ndarray])로 반환 → 행 dict 목록보다 pickle 크기가 작음
+- 결과는 태스크 순서대로 이어 붙인 뒤 시간 기준 안정 정렬 (순차 수집과 같은 순서)
+- 태스크가 1개 이하 / max_workers=1 / 풀 생성 실패 시 현재 프로세스에서 순차 실행
+"""
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# parquet 파일 크기 대비 워커 메모리 배수 (압축 해제 + 리샘플 + 지표 컬럼)
+_MEMORY_MULTIPLIER = 12
+# 파일 크기를 모를 때 태스크당 예상 메모리
+_DEFAULT_TASK_BYTES = 256 * 1024 * 1024
+# psutil이 없을 때 기본 예산
+_DEFAULT_BUDGET_BYTES = 2 * 1024 ** 3
+
+
+def estimate_task_memory(paths: Sequence, multiplier: float = _MEMORY_MULTIPLIER) -> int:
+    """태스크 입력 파일 크기 합 × 배수 (파일이 없으면 기본값)"""
+    total = 0
+    for path in paths:
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            continue
+    return int(total * multiplier) if total else _DEFAULT_TASK_BYTES
+
+
+def default_memory_budget() -> int:
+    """사용 가능 메모리의 절반 (psutil 없으면 2GB)"""
+    try:
+        import psutil
+        return int(psutil.virtual_memory().available * 0.5)
+    except Exception:
+        return _DEFAULT_BUDGET_BYTES
+
+
+def default_workers() -> int:
+    """CPU 코어 수 - 1 (최소 1)"""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+# ========== 컬럼 배열 ==========
+
+def pack_rows(rows: List[Dict], columns: Sequence[str] = None) -> Dict[str, np.ndarray]:
+    """행 dict 목록 → 컬럼 배열 dict"""
+    if columns is None:
+        columns = list(rows[0].keys()) if rows else []
+    packed = {}
+    for col in columns:
+        values = [row.get(col) for row in rows]
+        arr = np.asarray(values)
+        if arr.ndim != 1:
+            arr = np.empty(len(values), dtype=object)
+            arr[:] = values
+        packed[col] = arr
+    return packed
+
+
+def unpack_rows(columns: Dict[str, np.ndarray]) -> List[Dict]:
+    """컬럼 배열 dict → 행 dict 목록 (bool/int는 파이썬 기본형, 그 외는 배열 원소)"""
+    if not columns:
+        return []
+    names = list(columns)
+    values = []
+    for name in names:
+        arr = columns[name]
+        values.append(arr.tolist() if arr.dtype.kind in 'biuU' else list(arr))
+    return [dict(zip(names, row)) for row in zip(*values)]
+
+
+def column_length(columns: Dict[str, np.ndarray]) -> int:
+    return len(next(iter(columns.values()))) if columns else 0
+
+
+def merge_by_time(parts: Sequence[Dict[str, np.ndarray]], key: str) -> Dict[str, np.ndarray]:
+    """태스크별 컬럼 배열을 순서대로 이어 붙이고 key 기준 안정 정렬 (같은 시각은 태스크 순서 유지)"""
+    parts = [p for p in parts if p and column_length(p)]
+    if not parts:
+        return {}
+    names = list(parts[0])
+    merged = {}
+    for name in names:
+        arrays = [p[name] for p in parts]
+        if len({a.dtype for a in arrays}) > 1 and any(a.dtype == object for a in arrays):
+            arrays = [a.astype(object) for a in arrays]
+        merged[name] = np.concatenate(arrays)
+    order = np.argsort(merged[key], kind='stable')
+    return {name: arr[order] for name, arr in merged.items()}
+
+
+# ========== 실행 ==========
+
+def run_parallel(
+    fn: Callable,
+    tasks: Sequence[tuple],
+    costs: Sequence[int] = None,
+    max_workers: int = None,
+    memory_budget: int = None,
+    should_stop: Callable[[], bool] = None,
+    on_done: Callable[[int, Any], None] = None,
+    on_error: Callable[[int, BaseException], None] = None,
+) -> List[Any]:
+    """
+    fn(*task)를 태스크별로 실행 (ProcessPool, 메모리 예산 내에서만 동시 제출)
+
+    Args:
+        fn: 모듈 최상위 함수 (pickle 가능)
+        costs: 태스크별 예상 메모리 (bytes), None이면 제한 없음
+        should_stop: True 반환 시 새 태스크 제출 중단
+        on_done: (태스크 번호, 결과) - 완료 순서대로 호출
+        on_error: (태스크 번호, 예외) - 없으면 예외를 그대로 전파
+
+    Returns:
+        태스크 순서의 결과 목록 (실패/미실행은 None)
+    """
+    n = len(tasks)
+    results: List[Any] = [None] * n
+    workers = min(max_workers or default_workers(), n)
+
+    def finish(i, result=None, error=None):
+        if error is not None:
+            if on_error is None:
+                raise error
+            on_error(i, error)
+            return
+        results[i] = result
+        if on_done:
+            on_done(i, result)
+
+    def run_sequential(indices):
+        for i in indices:
+            if should_stop and should_stop():
+                break
+            try:
+                result = fn(*tasks[i])
+            except Exception as e:
+                finish(i, error=e)
+                continue
+            finish(i, result)
+
+    if workers <= 1:
+        run_sequential(range(n))
+        return results
+
+    budget = memory_budget if memory_budget is not None else default_memory_budget()
+    costs = list(costs) if costs is not None else [0] * n
+
+    try:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    except (OSError, ValueError, NotImplementedError) as e:
+        logger.warning(f"[PARALLEL] ProcessPool unavailable, running sequentially: {e}")
+        run_sequential(range(n))
+        return results
+
+    pending = {}
+    next_task = 0
+    in_flight_cost = 0
+    try:
+        with executor:
+            while next_task < n or pending:
+                # 예산 안에서 제출 (실행 중인 태스크가 없으면 예산을 넘어도 1개는 제출)
+                while (next_task < n and len(pending) < workers
+                       and (not pending or in_flight_cost + costs[next_task] <= budget)):
+                    if should_stop and should_stop():
+                        next_task = n
+                        break
+                    future = executor.submit(fn, *tasks[next_task])
+                    pending[future] = next_task
+                    in_flight_cost += costs[next_task]
+                    next_task += 1
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = pending[future]
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool:
+                        # pending에 남겨 두어 아래에서 순차 재실행
+                        raise
+                    except Exception as e:
+                        result, error = None, e
+                    else:
+                        error = None
+                    del pending[future]
+                    in_flight_cost -= costs[i]
+                    finish(i, result, error)
+    except BrokenProcessPool as e:
+        # 워커 비정상 종료: 완료되지 않은 태스크는 현재 프로세스에서 이어서 실행
+        logger.warning(f"[PARALLEL] Worker pool broken, finishing sequentially: {e}")
+        remaining = sorted(set(pending.values()) | set(range(next_task, n)))
+        run_sequential(remaining)
+    return results
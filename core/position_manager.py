@@ -49,6 +49,7 @@ class PositionManager:
         self._strategy_core = strategy_core
         self.dry_run = dry_run or getattr(exchange, 'dry_run', False)
         self.state_manager = state_manager
+        self._rsi_stream = None  # Entry RSI 스트리밍 상태 (_calculate_rsi)
         
         # 콜백 함수
         self.on_sl_hit: Callable = None
@@ -83,6 +84,14 @@ class PositionManager:
             return 50.0
         
         try:
+            # [PERF] 새 캔들만 스트리밍 상태에 반영 (틱마다 전체 이력 재계산 X)
+            if 'timestamp' in df_entry.columns:
+                from utils.indicators import IndicatorStreams
+                if self._rsi_stream is None or self._rsi_stream.rsi.period != period:
+                    self._rsi_stream = IndicatorStreams(rsi_period=period)
+                self._rsi_stream.sync(df_entry)
+                return self._rsi_stream.rsi.value
+            
             from utils.indicators import calculate_rsi
             return calculate_rsi(df_entry['close'].values, period=period)
         except Exception:
@@ -0,0 +1,175 @@
+"""
+core/shared_frames.py
+최적화 워커 풀용 공유 메모리 DataFrame 배포
+
+- 부모 프로세스가 OHLCV/지표 배열을 공유 메모리 블록 하나에 1회 기록
+- 워커는 풀 initializer에서 attach → 태스크에는 파라미터 dict만 전달
+- 지원 컬럼: 숫자형 / bool / datetime64 (tz 없음), 그 외는 ValueError
+"""
+import logging
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 컬럼 시작 오프셋 정렬 (바이트)
+_ALIGN = 64
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """공유 블록 내 배열 위치"""
+    name: object
+    dtype: str
+    offset: int
+    length: int
+
+
+@dataclass(frozen=True)
+class FrameSpec:
+    """공유 블록 내 DataFrame 레이아웃"""
+    columns: Tuple[ColumnSpec, ...]
+    index: Optional[ColumnSpec] = None   # None이면 RangeIndex
+    index_name: object = None
+
+
+@dataclass(frozen=True)
+class SharedFramesHandle:
+    """워커에 전달하는 핸들 (pickle 크기: 수 KB)"""
+    shm_name: str
+    frames: Dict[str, FrameSpec] = field(default_factory=dict)
+
+
+def _column_array(values) -> np.ndarray:
+    """공유 가능한 연속 배열로 변환 (datetime64/timedelta64는 단위 유지)"""
+    arr = np.asarray(values)
+    if arr.dtype.kind not in 'biufMm':
+        raise ValueError(f"unsupported dtype for shared memory: {arr.dtype}")
+    return np.ascontiguousarray(arr)
+
+
+def _aligned(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _frame_arrays(df: pd.DataFrame) -> Tuple[List[Tuple[object, np.ndarray]], Optional[np.ndarray]]:
+    """DataFrame → (컬럼 배열 목록, 인덱스 배열 또는 None)"""
+    if df.columns.duplicated().any():
+        raise ValueError("duplicate column names are not supported")
+    arrays = [(col, _column_array(df[col].to_numpy())) for col in df.columns]
+    index = df.index
+    if isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1:
+        return arrays, None
+    return arrays, _column_array(index.to_numpy())
+
+
+class SharedFrames:
+    """
+    여러 DataFrame을 공유 메모리 블록 하나로 배포 (부모 프로세스 소유)
+
+    Usage:
+        with SharedFrames({'p_1h': df_1h, 'e_15m': df_15m}) as shared:
+            with ProcessPoolExecutor(initializer=init, initargs=(shared.handle,)) as ex:
+                ...
+
+        # 워커 (initializer)
+        frames = attach_frames(handle)
+    """
+
+    def __init__(self, frames: Dict[str, pd.DataFrame]):
+        layout = {}
+        pending = []
+        offset = 0
+
+        def place(name, arr):
+            nonlocal offset
+            offset = _aligned(offset)
+            spec = ColumnSpec(name=name, dtype=arr.dtype.str, offset=offset, length=len(arr))
+            pending.append((spec, arr))
+            offset += arr.nbytes
+            return spec
+
+        for key, df in frames.items():
+            if df is None:
+                continue
+            arrays, index = _frame_arrays(df)
+            columns = tuple(place(col, arr) for col, arr in arrays)
+            index_spec = place(df.index.name, index) if index is not None else None
+            layout[key] = FrameSpec(columns=columns, index=index_spec, index_name=df.index.name)
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        try:
+            for spec, arr in pending:
+                if spec.length == 0:
+                    continue
+                view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=self._shm.buf, offset=spec.offset)
+                view[:] = arr
+                del view
+        except Exception:
+            self.close()
+            raise
+
+        self.handle = SharedFramesHandle(shm_name=self._shm.name, frames=layout)
+        self.nbytes = offset
+        logger.debug(f"[SHM] Published {len(layout)} frames ({offset / 1e6:.1f} MB) as {self._shm.name}")
+
+    def close(self):
+        """공유 블록 해제 (워커 풀 종료 후 호출)"""
+        if self._shm is None:
+            return
+        try:
+            self._shm.close()
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _read_array(buf, spec: ColumnSpec, copy: bool) -> np.ndarray:
+    if spec.length == 0:
+        return np.empty(0, dtype=np.dtype(spec.dtype))
+    arr = np.ndarray((spec.length,), dtype=np.dtype(spec.dtype), buffer=buf, offset=spec.offset)
+    if copy:
+        return arr.copy()
+    arr.flags.writeable = False
+    return arr
+
+
+def attach_frames(handle: SharedFramesHandle, copy: bool = True) -> Dict[str, pd.DataFrame]:
+    """
+    공유 블록에서 DataFrame 복원 (워커 프로세스)
+
+    Args:
+        copy: True면 워커 로컬 사본 생성 후 블록을 바로 닫음 (워커당 1회 복사).
+              False면 읽기 전용 뷰 - 블록은 프로세스 종료까지 열어둠.
+    """
+    shm = shared_memory.SharedMemory(name=handle.shm_name)
+    frames = {}
+    try:
+        for key, spec in handle.frames.items():
+            data = {col.name: _read_array(shm.buf, col, copy) for col in spec.columns}
+            index = None
+            if spec.index is not None:
+                index = pd.Index(_read_array(shm.buf, spec.index, copy), name=spec.index_name)
+            frames[key] = pd.DataFrame(data, index=index, copy=False)
+    finally:
+        if copy:
+            shm.close()
+        else:
+            # 뷰가 버퍼를 참조하므로 프로세스 수명 동안 유지
+            _ATTACHED.append(shm)
+    return frames
+
+
+# copy=False로 attach한 블록 (GC로 버퍼가 해제되지 않도록 보관)
+_ATTACHED: List[shared_memory.SharedMemory] = []
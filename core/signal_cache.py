@@ -0,0 +1,148 @@
+"""
+core/signal_cache.py
+W/M 시그널 세트 캐시 (최적화용)
+
+- 시그널 목록은 (데이터 지문, 패턴 TF, MACD 파라미터, 톨러런스, 유효시간)에만 의존
+- atr_mult / trail_* / leverage / direction 등 나머지 그리드 축은 시그널에 영향 없음
+- 같은 키를 공유하는 조합은 한 번 계산한 시그널 목록을 재사용
+- 프로세스 단위 캐시 (ProcessPool 워커는 워커별로 키당 1회 계산)
+"""
+import logging
+import weakref
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from utils.data_utils import data_fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+class SignalCache:
+    """
+    패턴 파라미터 기준 시그널 목록 LRU 캐시
+
+    Usage:
+        cache = get_signal_cache()
+        signals = cache.get_signals(core, df_pattern, tolerance=0.05, validity_hours=12,
+                                    macd_fast=6, macd_slow=18, macd_signal=7, pattern_tf='1h')
+
+    Note:
+        반환된 시그널 목록은 여러 백테스트가 공유하므로 수정하지 말 것
+        (run_backtest는 주문 생성 시 dict를 복사해서 사용)
+    """
+
+    def __init__(self, max_items: int = 256):
+        self._cache: 'OrderedDict[Tuple, List[Dict]]' = OrderedDict()
+        self._fingerprints: Dict[int, Tuple[weakref.ref, str]] = {}
+        self._lock = Lock()
+        self.max_items = max_items
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(
+        fingerprint: str,
+        pattern_tf: Optional[str],
+        macd_fast: int,
+        macd_slow: int,
+        macd_signal: int,
+        tolerance: float,
+        validity_hours: float,
+    ) -> Tuple:
+        """캐시 키 생성 (숫자형은 float 정규화: 5 == 5.0)"""
+        return (
+            fingerprint, str(pattern_tf or ''),
+            int(macd_fast), int(macd_slow), int(macd_signal),
+            round(float(tolerance), 10), round(float(validity_hours), 10),
+        )
+
+    def fingerprint(self, df: pd.DataFrame) -> str:
+        """DataFrame 지문 (같은 객체는 재계산하지 않음)"""
+        key = id(df)
+        with self._lock:
+            entry = self._fingerprints.get(key)
+            if entry is not None and entry[0]() is df:
+                return entry[1]
+
+        fp = data_fingerprint(df)
+        with self._lock:
+            try:
+                self._fingerprints[key] = (weakref.ref(df), fp)
+            except TypeError:
+                pass
+            # 사라진 객체 정리
+            if len(self._fingerprints) > self.max_items:
+                self._fingerprints = {k: v for k, v in self._fingerprints.items() if v[0]() is not None}
+        return fp
+
+    def get_signals(
+        self,
+        core,
+        df_pattern: pd.DataFrame,
+        tolerance: float,
+        validity_hours: float,
+        macd_fast: int,
+        macd_slow: int,
+        macd_signal: int,
+        pattern_tf: str = None,
+        fingerprint: str = None,
+    ) -> List[Dict]:
+        """
+        캐시에서 시그널 목록 조회, 없으면 core._extract_all_signals로 계산 후 저장
+
+        Args:
+            core: AlphaX7Core 인스턴스
+            df_pattern: 패턴 TF 데이터
+            fingerprint: 미리 계산한 데이터 지문 (없으면 df_pattern에서 계산)
+        """
+        fp = fingerprint or self.fingerprint(df_pattern)
+        key = self.make_key(fp, pattern_tf, macd_fast, macd_slow, macd_signal, tolerance, validity_hours)
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return self._cache[key]
+            self._misses += 1
+
+        signals = core._extract_all_signals(df_pattern, tolerance, validity_hours, macd_fast, macd_slow, macd_signal)
+
+        with self._lock:
+            self._cache[key] = signals
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_items:
+                self._cache.popitem(last=False)
+        logger.debug(f"[SIGNAL-CACHE] Store: {key[1:]} ({len(signals)} signals)")
+        return signals
+
+    def clear(self):
+        """캐시 초기화"""
+        with self._lock:
+            self._cache.clear()
+            self._fingerprints.clear()
+            self._hits = 0
+            self._misses = 0
+
+    @property
+    def stats(self) -> Dict:
+        """캐시 통계"""
+        total = self._hits + self._misses
+        hit_rate = (self._hits / total * 100) if total > 0 else 0
+        return {
+            'size': len(self._cache),
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_rate': f"{hit_rate:.1f}%"
+        }
+
+
+# 싱글톤 인스턴스 (프로세스 단위)
+_signal_cache = SignalCache()
+
+
+def get_signal_cache() -> SignalCache:
+    """시그널 캐시 인스턴스"""
+    return _signal_cache
@@ -50,6 +50,7 @@ class SignalProcessor:
         # 시그널 큐
         self.pending_signals = deque(maxlen=maxlen)
         self.last_pattern_check_time = None
+        self._pattern_detector = None  # 증분 W/M 감지기 (add_patterns_from_df)
         
         # 전략 코어 (지연 로드)
         self._strategy_core = None
@@ -200,19 +201,21 @@ class SignalProcessor:
             if len(df_for_detection) < 50:
                 return 0
             
-            # 모든 시그널 추출 (파라미터 반영)
-            all_signals = self.strategy._extract_all_signals(
-                df_for_detection, 
-                self._pattern_tolerance, 
-                self._validity_hours,
-                macd_fast=self.strategy_params.get('macd_fast', 12),
-                macd_slow=self.strategy_params.get('macd_slow', 26),
-                macd_signal=self.strategy_params.get('macd_signal', 9)
-            )
+            # [PERF] 새로 마감된 봉만 검사하는 증분 감지기 (파라미터 반영)
+            if self._pattern_detector is None:
+                from .incremental_patterns import IncrementalPatternDetector
+                self._pattern_detector = IncrementalPatternDetector(
+                    self._pattern_tolerance,
+                    macd_fast=self.strategy_params.get('macd_fast', 12),
+                    macd_slow=self.strategy_params.get('macd_slow', 26),
+                    macd_signal=self.strategy_params.get('macd_signal', 9)
+                )
+            detected = self._pattern_detector.update(df_for_detection)
             
             # 새 시그널만 추가
             new_count = 0
-            for s in all_signals:
+            existing_keys = {f"{p.get('time', '')}_{p.get('type', '')}" for p in self.pending_signals}
+            for s in detected:
                 signal_time = pd.Timestamp(s['time'])
                 
                 # [FIX] Allow signals >= last_check_time (handle retroactive confirmation)
@@ -220,14 +223,12 @@ class SignalProcessor:
                     expire_time = signal_time + timedelta(hours=self._validity_hours)
                     
                     if expire_time > current_time:
-                        s['expire_time'] = expire_time
-                        
                         # 중복 체크 후 추가
                         sig_key = f"{s.get('time', '')}_{s.get('type', '')}"
-                        existing_keys = {f"{p.get('time', '')}_{p.get('type', '')}" for p in self.pending_signals}
                         
                         if sig_key not in existing_keys:
-                            self.pending_signals.append(s)
+                            self.pending_signals.append(dict(s, expire_time=expire_time))
+                            existing_keys.add(sig_key)
                             new_count += 1
             
             # 마지막 체크 시간 갱신
@@ -259,6 +260,8 @@ class SignalProcessor:
         """시그널 큐 초기화"""
         self.pending_signals.clear()
         self.last_pattern_check_time = None
+        if self._pattern_detector is not None:
+            self._pattern_detector.reset()
     
     # ========== 진입 조건 판단 ==========
     
@@ -15,6 +15,7 @@ from dataclasses import dataclass
 
 # 통합 지표 모듈
 from utils.indicators import calculate_rsi as _calc_rsi, calculate_atr as _calc_atr
+from core import backtest_kernel
 
 # Logging
 from utils.logger import get_module_logger
@@ -119,6 +120,63 @@ def calculate_backtest_metrics(trades: List[Dict], leverage: int = 1) -> Dict:
     }
 
 
+def extract_hl_points(df_1h: pd.DataFrame, hist: Union[pd.Series, np.ndarray]) -> List[Dict]:
+    """
+    MACD 히스토그램 부호 구간별 H/L 포인트 추출 (배열 연산)
+    
+    - 양수 구간 → 구간 내 최고가 'H', 음수 구간 → 최저가 'L'
+    - 0/NaN 값은 구간을 끊음, 마지막(미확정) 구간은 제외
+    - 구간 라벨링(run-length) + reduceat 으로 극값 계산 (기존 while 루프와 동일 결과)
+    
+    Args:
+        df_1h: 패턴 TF 데이터 (timestamp, high, low)
+        hist: MACD 히스토그램 (df_1h와 같은 길이)
+    
+    Returns:
+        [{'type', 'price', 'time', 'confirmed_time'}, ...] 시간순
+    """
+    h = np.asarray(hist, dtype=np.float64)
+    n = len(h)
+    if n == 0:
+        return []
+    
+    sign = np.where(h > 0, 1, np.where(h < 0, -1, 0)).astype(np.int8)
+    starts = np.flatnonzero(np.r_[True, sign[1:] != sign[:-1]])
+    ends = np.r_[starts[1:], n]
+    run_id = np.repeat(np.arange(len(starts)), ends - starts)
+    
+    # 구간별 극값 및 첫 번째 극값 위치 (idxmax/idxmin과 동일: NaN 무시, 동률 시 앞쪽)
+    highs = df_1h['high'].to_numpy(dtype=np.float64)
+    lows = df_1h['low'].to_numpy(dtype=np.float64)
+    is_high = sign[starts] > 0
+    extreme = np.where(is_high, np.fmax.reduceat(highs, starts), np.fmin.reduceat(lows, starts))
+    values = np.where(sign > 0, highs, lows)
+    first_pos = np.minimum.reduceat(np.where(values == extreme[run_id], np.arange(n), n), starts)
+    
+    # 부호가 있고 다음 캔들에서 종료된(확정) 구간만 사용
+    keep = (sign[starts] != 0) & (ends < n) & (first_pos < n)
+    ends, is_high, first_pos = ends[keep], is_high[keep], first_pos[keep]
+    
+    # 원본 루프의 df.iloc[i-1]['timestamp'] 행 단위 타입 변환과 동일하게 맞춤
+    ts = df_1h['timestamp']
+    row_dtype = df_1h.iloc[0].dtype
+    cast = None if row_dtype == object or row_dtype == ts.dtype else row_dtype.type
+    
+    price_h = df_1h['high']
+    price_l = df_1h['low']
+    points = []
+    for k in range(len(ends)):
+        pos = int(first_pos[k])
+        conf = ts.iat[int(ends[k]) - 1]
+        if is_high[k]:
+            points.append({'type': 'H', 'price': price_h.iat[pos], 'time': ts.iat[pos],
+                           'confirmed_time': cast(conf) if cast else conf})
+        else:
+            points.append({'type': 'L', 'price': price_l.iat[pos], 'time': ts.iat[pos],
+                           'confirmed_time': cast(conf) if cast else conf})
+    return points
+
+
 @dataclass
 class TradeSignal:
     """거래 시그널"""
@@ -159,6 +217,7 @@ class AlphaX7Core:
     def __init__(self, use_mtf: bool = True):
         self.USE_MTF_FILTER = use_mtf
         self.adaptive_params = None
+        self._live_detectors = {}  # _extract_new_signals 증분 감지기 (파라미터별)
     
     def calculate_adaptive_params(self, df_15m: pd.DataFrame, rsi_period: int = None) -> Optional[Dict]:
         """코인 데이터에서 적응형 파라미터 자동 계산"""
@@ -274,17 +333,22 @@ class AlphaX7Core:
         }
         mtf = offset_map.get(mtf, mtf)
         
-        df = df_base.copy()
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df = df.set_index('timestamp', drop=False)
-        
-        # MTF로 리샘플
-        df_mtf = df.resample(mtf).agg({
-            'open': 'first',
-            'high': 'max',
-            'low': 'min',
-            'close': 'last'
-        }).dropna()
+        if pd.api.types.is_datetime64_any_dtype(df_base['timestamp']):
+            # [PERF] 같은 기준 데이터는 MTF당 한 번만 리샘플 (리샘플 캐시)
+            from storage.resample_cache import get_resample_cache
+            df_mtf = get_resample_cache().resample(df_base, mtf, time_column='timestamp')
+        else:
+            df = df_base.copy()
+            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            df = df.set_index('timestamp', drop=False)
+            
+            # MTF로 리샘플
+            df_mtf = df.resample(mtf).agg({
+                'open': 'first',
+                'high': 'max',
+                'low': 'min',
+                'close': 'last'
+            }).dropna()
         
         if len(df_mtf) < ema_period:
             return None
@@ -362,42 +426,8 @@ class AlphaX7Core:
         signal_line = macd.ewm(span=macd_signal, adjust=False).mean()
         hist = macd - signal_line
         
-        # H/L 포인트 추출
-        points = []
-        n = len(hist)
-        i = 0
-        
-        while i < n:
-            if hist.iloc[i] > 0:
-                start = i
-                while i < n and hist.iloc[i] > 0:
-                    i += 1
-                if i < n:
-                    seg = df_1h.iloc[start:i]
-                    if len(seg) > 0:
-                        max_idx = seg['high'].idxmax()
-                        points.append({
-                            'type': 'H',
-                            'price': df_1h.loc[max_idx, 'high'],
-                            'time': df_1h.loc[max_idx, 'timestamp'],
-                            'confirmed_time': df_1h.iloc[i-1]['timestamp']
-                        })
-            elif hist.iloc[i] < 0:
-                start = i
-                while i < n and hist.iloc[i] < 0:
-                    i += 1
-                if i < n:
-                    seg = df_1h.iloc[start:i]
-                    if len(seg) > 0:
-                        min_idx = seg['low'].idxmin()
-                        points.append({
-                            'type': 'L',
-                            'price': df_1h.loc[min_idx, 'low'],
-                            'time': df_1h.loc[min_idx, 'timestamp'],
-                            'confirmed_time': df_1h.iloc[i-1]['timestamp']
-                        })
-            else:
-                i += 1
+        # H/L 포인트 추출 (배열 연산)
+        points = extract_hl_points(df_1h, hist)
         
         # W/M 패턴 탐지 (최신 것부터)
         for i in range(len(points) - 3, -1, -1):
@@ -616,6 +646,8 @@ class AlphaX7Core:
         macd_slow: int = None,
         macd_signal: int = None,
         ema_period: int = None,
+        use_kernel: bool = False,
+        signals: List[Dict] = None,
         **kwargs
     ) -> Union[List[Dict], Tuple[List[Dict], Dict], Tuple[List[Dict], List[Dict]]]:
 
@@ -624,6 +656,8 @@ class AlphaX7Core:
         - detect_signal과 동일한 W/M 패턴 감지
         - RSI 적응형 트레일링
         - 풀백 추가 진입
+        - use_kernel=True: 배열 커널(core.backtest_kernel)로 실행 (결과 동일, collect_audit 시 루프 사용)
+        - signals: 미리 추출한 시그널 목록 (core.signal_cache), 없으면 df_pattern에서 추출
         """
         # 파라미터 기본값 설정 (ACTIVE_PARAMS 연동)
         if atr_mult is None: atr_mult = ACTIVE_PARAMS.get('atr_mult')
@@ -644,8 +678,9 @@ class AlphaX7Core:
         # 적응형 파라미터 계산
         self.calculate_adaptive_params(df_entry, rsi_period=rsi_period)
         
-        # 모든 W/M 시그널 추출
-        signals = self._extract_all_signals(df_pattern, pattern_tolerance, entry_validity_hours, macd_fast, macd_slow, macd_signal)
+        # 모든 W/M 시그널 추출 (캐시된 시그널이 있으면 재사용)
+        if signals is None:
+            signals = self._extract_all_signals(df_pattern, pattern_tolerance, entry_validity_hours, macd_fast, macd_slow, macd_signal)
 
         # MTF 필터용 trend map 생성
         trend_map = None
@@ -703,6 +738,16 @@ class AlphaX7Core:
         tr = np.maximum(np.maximum(highs - lows, np.abs(highs - prev_closes)), np.abs(lows - prev_closes))
         atrs = pd.Series(tr).rolling(atr_period).mean().fillna(0).values
         
+        # [PERF] 배열 커널 모드
+        if use_kernel and not collect_audit and backtest_kernel.is_supported(highs, lows, opens):
+            return self._run_backtest_kernel(
+                signals, times, opens, highs, lows, rsis, atrs, trend_map,
+                slippage=slippage, atr_mult=atr_mult, trail_start_r=trail_start_r, trail_dist_r=trail_dist_r,
+                entry_validity_hours=entry_validity_hours, pullback_rsi_long=pullback_rsi_long,
+                pullback_rsi_short=pullback_rsi_short, max_adds=max_adds, enable_pullback=enable_pullback,
+                allowed_direction=allowed_direction, return_state=return_state,
+            )
+        
         from collections import deque
         pending = deque()
         sig_idx = 0
@@ -832,6 +877,67 @@ class AlphaX7Core:
             return trades, audit_logs, final_state
         return trades, final_state
 
+    def _run_backtest_kernel(
+        self,
+        signals: List[Dict],
+        times: np.ndarray,
+        opens: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        rsis: np.ndarray,
+        atrs: np.ndarray,
+        trend_map: Optional[pd.Series],
+        slippage: float,
+        atr_mult: float,
+        trail_start_r: float,
+        trail_dist_r: float,
+        entry_validity_hours: float,
+        pullback_rsi_long: float,
+        pullback_rsi_short: float,
+        max_adds: int,
+        enable_pullback: bool,
+        allowed_direction: str,
+        return_state: bool,
+    ) -> Union[List[Dict], Tuple[List[Dict], Dict]]:
+        """run_backtest 배열 커널 실행 (루프 방식과 동일한 거래 목록 반환)"""
+        allowed = allowed_direction.lower() if allowed_direction else 'both'
+        sig_dir = np.array([backtest_kernel.DIR_LONG if s['type'] == 'Long' else backtest_kernel.DIR_SHORT
+                            for s in signals], dtype=np.int8)
+        if allowed not in ['both', 'long/short (both)', '']:
+            sig_allowed = np.array([s['type'].lower() == allowed for s in signals], dtype=bool)
+        else:
+            sig_allowed = np.ones(len(signals), dtype=bool)
+        
+        trend = None
+        if trend_map is not None:
+            trend = np.where(trend_map.values == 'up', 1, -1).astype(np.int8)
+        
+        records, state = backtest_kernel.run_trade_kernel(
+            times_ns=backtest_kernel.to_ns(times),
+            opens=np.asarray(opens, dtype=np.float64),
+            highs=np.asarray(highs, dtype=np.float64),
+            lows=np.asarray(lows, dtype=np.float64),
+            rsis=np.asarray(rsis, dtype=np.float64),
+            atrs=np.asarray(atrs, dtype=np.float64),
+            trend=trend,
+            sig_ns=backtest_kernel.to_ns([s['time'] for s in signals]),
+            sig_dir=sig_dir,
+            sig_allowed=sig_allowed,
+            validity_ns=pd.Timedelta(timedelta(hours=entry_validity_hours)).value,
+            slippage=slippage,
+            atr_mult=atr_mult,
+            trail_start_r=trail_start_r,
+            trail_dist_r=trail_dist_r,
+            pullback_rsi_long=pullback_rsi_long,
+            pullback_rsi_short=pullback_rsi_short,
+            max_adds=max_adds,
+            enable_pullback=enable_pullback,
+        )
+        trades = backtest_kernel.build_trade_dicts(records, times)
+        if not return_state:
+            return trades
+        return trades, backtest_kernel.build_final_state(state, signals, times, entry_validity_hours)
+
     def _extract_all_signals(
         self,
         df_1h: pd.DataFrame,
@@ -848,27 +954,7 @@ class AlphaX7Core:
         signal_line = macd.ewm(span=macd_signal, adjust=False).mean()
         hist = macd - signal_line
         
-        points = []
-        n = len(hist)
-        i = 0
-        while i < n:
-            if hist.iloc[i] > 0:
-                start = i
-                while i < n and hist.iloc[i] > 0: i += 1
-                if i < n:
-                    seg = df_1h.iloc[start:i]
-                    if len(seg) > 0:
-                        max_idx = seg['high'].idxmax()
-                        points.append({'type': 'H', 'price': df_1h.loc[max_idx, 'high'], 'time': df_1h.loc[max_idx, 'timestamp'], 'confirmed_time': df_1h.iloc[i-1]['timestamp']})
-            elif hist.iloc[i] < 0:
-                start = i
-                while i < n and hist.iloc[i] < 0: i += 1
-                if i < n:
-                    seg = df_1h.iloc[start:i]
-                    if len(seg) > 0:
-                        min_idx = seg['low'].idxmin()
-                        points.append({'type': 'L', 'price': df_1h.loc[min_idx, 'low'], 'time': df_1h.loc[min_idx, 'timestamp'], 'confirmed_time': df_1h.iloc[i-1]['timestamp']})
-            else: i += 1
+        points = extract_hl_points(df_1h, hist)
         
         signals = []
         for i in range(2, len(points)):
@@ -898,14 +984,19 @@ class AlphaX7Core:
         if macd_slow is None: macd_slow = ACTIVE_PARAMS.get('macd_slow', 26)
         if macd_signal is None: macd_signal = ACTIVE_PARAMS.get('macd_signal', 9)
 
-        all_signals = self._extract_all_signals(df_1h, tolerance, validity_hours, macd_fast, macd_slow, macd_signal)
+        # [PERF] 파라미터별 증분 감지기 재사용 → 새로 추가된 봉만 검사
+        key = (tolerance, macd_fast, macd_slow, macd_signal)
+        detector = self._live_detectors.get(key)
+        if detector is None:
+            from .incremental_patterns import IncrementalPatternDetector
+            detector = self._live_detectors[key] = IncrementalPatternDetector(
+                tolerance, macd_fast, macd_slow, macd_signal
+            )
+        detector.update(df_1h)
         
-        if since is None:
-            return all_signals
-            
         # since 이후의 시그널만 필터링
-        new_signals = [s for s in all_signals if pd.Timestamp(s['time']) > pd.Timestamp(since)]
-        return new_signals
+        signals = detector.signals if since is None else detector.signals_since(since)
+        return [dict(s) for s in signals]
 
     def manage_position_realtime(self, position: dict = None, current_high: float = 0, current_low: float = 0, current_rsi: float = 50, **kwargs) -> dict:
         """실시간 포지션 관리"""
@@ -0,0 +1,116 @@
+"""
+core/task_batching.py
+대규모 그리드용 청크 단위 태스크 스케줄러
+
+- 조합은 이터레이터에서 필요한 만큼만 꺼냄 (전체 리스트 생성 X)
+- 측정된 태스크당 시간으로 청크 크기 자동 조정 (future당 오버헤드 상각)
+- 동시에 떠 있는 future 수 제한 (부모 프로세스 메모리 일정 유지)
+"""
+import itertools
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveChunker:
+    """
+    태스크당 실행 시간 EMA로 다음 청크 크기 결정
+
+    청크 1개 실행 시간이 target_seconds 근처가 되도록 조정
+    """
+
+    def __init__(self, target_seconds: float = 0.5, min_size: int = 1,
+                 max_size: int = 256, initial_size: int = 1, smoothing: float = 0.3):
+        self.target_seconds = target_seconds
+        self.min_size = min_size
+        self.max_size = max_size
+        self.smoothing = smoothing
+        self._size = max(min_size, min(initial_size, max_size))
+        self._per_task: Optional[float] = None
+
+    @property
+    def per_task_seconds(self) -> Optional[float]:
+        """측정된 태스크당 시간 (EMA, 측정 전 None)"""
+        return self._per_task
+
+    def next_size(self) -> int:
+        """다음 청크 크기"""
+        return self._size
+
+    def record(self, n_tasks: int, elapsed: float):
+        """청크 실행 결과 반영"""
+        if n_tasks <= 0 or elapsed is None or elapsed < 0:
+            return
+        sample = elapsed / n_tasks
+        if self._per_task is None:
+            self._per_task = sample
+        else:
+            self._per_task = self.smoothing * sample + (1 - self.smoothing) * self._per_task
+
+        if self._per_task <= 0:
+            size = self.max_size
+        else:
+            size = int(round(self.target_seconds / self._per_task))
+        self._size = max(self.min_size, min(size, self.max_size))
+
+
+def run_timed_chunk(fn: Callable, tasks: List[Tuple], *shared_args) -> Tuple[List, float]:
+    """워커에서 청크 실행: fn(*task, *shared_args)를 순서대로 호출 → (결과 목록, 실행 시간)"""
+    start = time.perf_counter()
+    results = [fn(*task, *shared_args) for task in tasks]
+    return results, time.perf_counter() - start
+
+
+def run_chunked(
+    submit_chunk: Callable[[List], Future],
+    items: Iterable,
+    max_in_flight: int,
+    chunker: AdaptiveChunker = None,
+    should_stop: Callable[[], bool] = None,
+) -> Iterator[Tuple[List, List]]:
+    """
+    청크 단위 제출 + 완료 순서대로 (청크, 결과 목록) 반환
+
+    Args:
+        submit_chunk: 청크(list) → Future. Future 결과는 (결과 목록, 실행 시간)
+        items: 태스크 이터러블 (지연 생성 가능)
+        max_in_flight: 동시에 제출된 청크 최대 수
+        should_stop: True 반환 시 남은 청크 취소 후 종료
+
+    실패한 청크는 결과 목록 대신 None이 반환됨 (경고 로그, 집계는 호출 측에서)
+    """
+    chunker = chunker or AdaptiveChunker()
+    iterator = iter(items)
+    in_flight: Dict[Future, List] = {}
+    exhausted = False
+
+    def fill():
+        nonlocal exhausted
+        while not exhausted and len(in_flight) < max_in_flight:
+            chunk = list(itertools.islice(iterator, chunker.next_size()))
+            if not chunk:
+                exhausted = True
+                break
+            in_flight[submit_chunk(chunk)] = chunk
+
+    fill()
+    while in_flight:
+        if should_stop and should_stop():
+            for future in in_flight:
+                future.cancel()
+            return
+
+        done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+        for future in done:
+            chunk = in_flight.pop(future)
+            try:
+                results, elapsed = future.result()
+                chunker.record(len(chunk), elapsed)
+            except Exception as e:
+                logger.warning(f"[BATCH] Chunk failed ({len(chunk)} tasks): {e}")
+                results = None
+            yield chunk, results
+        fill()
@@ -24,6 +24,8 @@ class CoinState:
     entry_price: float = 0.0 # 진입 가격
     stop_loss: float = 0.0   # 손절 가격
     params: Dict[str, Any] = field(default_factory=dict) # 전략 파라미터
+    initial_seed: float = 0.0      # 초기 할당 시드 (복리 기준)
+    backtest_winrate: float = 0.0  # 초기화 시 빠른 백테스트 승률 (%)
 
 # 거래소별 웹소켓 구독 제한 (공통 상수)
 WS_LIMITS: Dict[str, int] = {
@@ -0,0 +1,108 @@
+"""
+core/trade_outcome.py
+고정 SL/TP 거래 결과 배열 판정 (UnifiedBacktest._calculate_trade_outcome)
+
+- 캔들별 루프 대신 전방 윈도우의 SL/TP 도달 마스크 + argmax 로 첫 청산봉 탐색
+- 같은 봉에서 SL과 TP가 모두 닿으면 SL 우선 (기존 루프와 동일)
+- 여러 시그널을 (시그널 × 윈도우) 2차원 배열로 한 번에 판정
+- 청산봉이 없으면 다음 구간을 2배 윈도우로 이어서 탐색 (메모리는 max_cells로 제한)
+"""
+from typing import Tuple
+
+import numpy as np
+
+# 방향 코드
+DIR_LONG = 1
+DIR_SHORT = -1
+
+# 청산 사유 코드
+EXIT_NONE = 0
+EXIT_SL = 1
+EXIT_TP = 2
+
+# 첫 탐색 윈도우 크기 / 한 번에 만드는 (시그널 × 윈도우) 셀 수 상한
+_INITIAL_WINDOW = 64
+_MAX_CELLS = 1 << 20
+
+
+def resolve_exits(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    starts: np.ndarray,
+    directions: np.ndarray,
+    sl_prices: np.ndarray,
+    tp_prices: np.ndarray,
+    window: int = _INITIAL_WINDOW,
+    max_cells: int = _MAX_CELLS,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    시그널별 첫 SL/TP 도달 캔들 일괄 탐색
+
+    Args:
+        highs/lows: 캔들 고가/저가 (float64, 시간순)
+        starts: 시그널별 탐색 시작 위치 (진입봉 다음 캔들)
+        directions: DIR_LONG / DIR_SHORT
+        sl_prices/tp_prices: 시그널별 SL / TP 가격 (TP 0은 미설정으로 간주)
+
+    Returns:
+        (청산 캔들 위치 (없으면 -1), 청산 사유 코드 EXIT_*)
+    """
+    highs = np.asarray(highs, dtype=np.float64)
+    lows = np.asarray(lows, dtype=np.float64)
+    starts = np.asarray(starts, dtype=np.int64)
+    is_long = np.asarray(directions) == DIR_LONG
+    sl_prices = np.asarray(sl_prices, dtype=np.float64)
+    tp_prices = np.asarray(tp_prices, dtype=np.float64)
+
+    n = len(highs)
+    m = len(starts)
+    exit_idx = np.full(m, -1, dtype=np.int64)
+    reasons = np.full(m, EXIT_NONE, dtype=np.int8)
+    scanned = np.zeros(m, dtype=np.int64)
+
+    pending = np.flatnonzero(starts < n)
+    w = max(1, int(window))
+    while len(pending):
+        rows = max(1, max_cells // w)
+        offsets = np.arange(w, dtype=np.int64)
+        for chunk_start in range(0, len(pending), rows):
+            chunk = pending[chunk_start:chunk_start + rows]
+            base = starts[chunk] + scanned[chunk]
+            idx = base[:, None] + offsets
+            inside = idx < n
+            np.minimum(idx, n - 1, out=idx)
+            h = highs[idx]
+            l = lows[idx]
+
+            long_ = is_long[chunk, None]
+            sl = sl_prices[chunk, None]
+            tp = tp_prices[chunk, None]
+            sl_hit = np.where(long_, l <= sl, h >= sl) & inside
+            tp_hit = np.where(long_, h >= tp, l <= tp) & inside & (tp != 0)
+            hit = sl_hit | tp_hit
+
+            first = hit.argmax(axis=1)
+            r = np.arange(len(chunk))
+            found = hit[r, first]
+            done = chunk[found]
+            exit_idx[done] = base[found] + first[found]
+            reasons[done] = np.where(sl_hit[r, first][found], EXIT_SL, EXIT_TP)
+
+        scanned[pending] += w
+        pending = pending[(exit_idx[pending] < 0) & (starts[pending] + scanned[pending] < n)]
+        w *= 2
+
+    return exit_idx, reasons
+
+
+def resolve_exit(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    start: int,
+    direction: int,
+    sl_price: float,
+    tp_price: float,
+) -> Tuple[int, int]:
+    """단일 시그널 첫 SL/TP 도달 캔들 → (위치 (없으면 -1), 청산 사유 코드)"""
+    exit_idx, reasons = resolve_exits(highs, lows, [start], [direction], [sl_price], [tp_price])
+    return int(exit_idx[0]), int(reasons[0])
@@ -16,12 +16,44 @@ from dataclasses import dataclass
 
 from core.strategy_core import AlphaX7Core
 from core.multi_symbol_backtest import MultiSymbolBacktest, Signal
+from core.trade_outcome import resolve_exits, DIR_LONG, DIR_SHORT, EXIT_SL
+from core.parallel_signals import default_workers, estimate_task_memory, run_parallel
 from utils.preset_manager import get_preset_manager
 
 # Logging
 from utils.logger import get_module_logger
 logger = get_module_logger(__name__)
 
+def _load_preset_signals(exchange, symbol, params, strategy=None):
+    """
+    Load 15m data for one preset, resample to 1H and detect signals.
+    Returns (15m OHLC frame for outcome resolution, signals) or None if data is insufficient.
+    Runs in a worker process when strategy is None (only high/low/close are sent back).
+    """
+    # [FIX] 15m 단일 소스 원칙: 15m 로드 → 1H 리샘플
+    from utils.data_utils import resample_data
+    
+    # Fetch 15m Data
+    msb = MultiSymbolBacktest(exchange=exchange)
+    df_15m = msb.load_candle_data(symbol, '15m')
+    
+    if df_15m is None or len(df_15m) < 100: return None
+    
+    # Resample 15m → 1H for pattern detection
+    df_1h = resample_data(df_15m, '1h', add_indicators=True)
+    if df_1h is None or len(df_1h) < 50: return None
+    
+    # Detect Signals
+    signals = (strategy or AlphaX7Core()).detect_signal(
+        df_1h, df_15m,
+        rsi_period=params.get('rsi_period', 14),
+        atr_period=params.get('atr_period', 14)
+    )
+    
+    if strategy is None:
+        df_15m = df_15m[[c for c in ('high', 'low', 'close') if c in df_15m.columns]]
+    return df_15m, signals
+
 @dataclass
 class UnifiedResult:
     total_trades: int
@@ -51,8 +83,14 @@ class UnifiedBacktest:
         
         self.active_position = None # {symbol, entry_price, size, direction, sl, tp}
     
-    def run(self, progress_callback=None) -> UnifiedResult:
-        """Run unified backtest simulation"""
+    def run(self, progress_callback=None, max_workers=None, memory_budget=None) -> UnifiedResult:
+        """
+        Run unified backtest simulation
+        
+        Args:
+            max_workers: parallel data/signal workers (None = cores - 1, 1 = sequential)
+            memory_budget: in-flight worker memory budget in bytes (None = half of available)
+        """
         try:
             # 1. Load Verified Presets
             presets = self._load_verified_presets()
@@ -71,47 +109,62 @@ class UnifiedBacktest:
             symbol_data_map = {} # Keep 15m DF for price lookup
             
             total_presets = len(presets)
-            for i, p in enumerate(presets):
-                symbol = p['symbol']
-                params = p['params']
-                
-                if progress_callback:
-                    progress_callback(i, total_presets * 2, f"Loading Data: {symbol}")
-                
-                # [FIX] 15m 단일 소스 원칙: 15m 로드 → 1H 리샘플
-                from utils.data_utils import resample_data
-                
-                # Fetch 15m Data
-                msb = MultiSymbolBacktest(exchange=p['exchange'])
-                df_15m = msb.load_candle_data(symbol, '15m')
-                
-                if df_15m is None or len(df_15m) < 100: continue
-                
-                # Resample 15m → 1H for pattern detection
-                df_1h = resample_data(df_15m, '1h', add_indicators=True)
-                if df_1h is None or len(df_1h) < 50: continue
+            
+            # [PERF] Load data + detect signals per preset in a process pool
+            if total_presets > 1 and (max_workers or default_workers()) > 1:
+                try:
+                    from paths import Paths
+                    cache_dir = Paths.CACHE
+                except ImportError:
+                    cache_dir = 'data/cache'
+                tasks = [(p['exchange'], p['symbol'], p['params']) for p in presets]
+                costs = [estimate_task_memory([f"{cache_dir}/{str(p['exchange']).lower()}_{str(p['symbol']).lower().replace('/', '')}_15m.parquet"])
+                         for p in presets]
+                done = [0]
                 
-                # Align dates if provided
-                # (Skipping date filter for speed/simplicity or implementing basic slice)
+                def on_done(i, _result):
+                    done[0] += 1
+                    if progress_callback:
+                        progress_callback(done[0], total_presets * 2, f"Loading Data: {presets[i]['symbol']}")
                 
+                loaded = run_parallel(_load_preset_signals, tasks, costs=costs, max_workers=max_workers,
+                                      memory_budget=memory_budget, on_done=on_done)
+            else:
+                loaded = []
+                for i, p in enumerate(presets):
+                    if progress_callback:
+                        progress_callback(i, total_presets * 2, f"Loading Data: {p['symbol']}")
+                    loaded.append(_load_preset_signals(p['exchange'], p['symbol'], p['params'], self.strategy))
+            
+            # Merge in preset order (same order as the sequential loop)
+            for p, result in zip(presets, loaded):
+                if result is None: continue
+                symbol = p['symbol']
+                df_15m, signals = result
                 symbol_data_map[symbol] = df_15m
                 
-                # Detect Signals
-                signals = self.strategy.detect_signal(
-                    df_1h, df_15m,
-                    rsi_period=params.get('rsi_period', 14),
-                    atr_period=params.get('atr_period', 14)
-                )
-                
                 # Append to global list
                 for sig in signals:
                     all_signals.append({
                         'timestamp': sig.timestamp,
                         'symbol': symbol,
                         'signal': sig,
-                        'params': params
+                        'params': p['params']
                     })
             
+            # [PERF] Resolve SL/TP outcomes per symbol in one batch (array first-hit search)
+            by_symbol = {}
+            for item in all_signals:
+                by_symbol.setdefault(item['symbol'], []).append(item)
+            for symbol, items in by_symbol.items():
+                outcomes = self._resolve_trade_outcomes(
+                    symbol_data_map[symbol],
+                    [(item['timestamp'], item['signal'], item['params']) for item in items],
+                    symbol
+                )
+                for item, outcome in zip(items, outcomes):
+                    item['outcome'] = outcome
+            
             # 3. Sort by Timestamp
             all_signals.sort(key=lambda x: x['timestamp'])
             
@@ -144,9 +197,8 @@ class UnifiedBacktest:
                     continue
                 
                 # Open New Position
-                # Calculate Outcome locally
-                df_15m = symbol_data_map[symbol]
-                outcome = self._calculate_trade_outcome(df_15m, ts, sig, item['params'], symbol)
+                # Outcome already resolved in batch above
+                outcome = item['outcome']
                 
                 if outcome:
                     processed_trades += 1
@@ -204,87 +256,119 @@ class UnifiedBacktest:
         Simulate trade outcome from entry_time using DF.
         Returns {exit_time, pnl_percent, ...} or None if data insufficient.
         """
+        return self._resolve_trade_outcomes(df, [(entry_time, signal, params)], symbol)[0]
+
+    def _resolve_trade_outcomes(self, df, entries, symbol):
+        """
+        Simulate many trades on one symbol's DF at once.
+        
+        - Entry: first candle at/after entry_time (close), exit scan starts at the next candle
+        - First SL/TP breach found via array comparison + argmax (SL wins on the same candle)
+        - No breach until end of data -> Force close at last close
+        
+        Args:
+            entries: [(entry_time, signal, params), ...]
+        Returns:
+            [outcome dict or None, ...] aligned with entries
+        """
+        outcomes = [None] * len(entries)
         try:
-            # Slice DF from entry_time
-            # Find index
-            mask = df.index >= entry_time
-            future = df[mask]
-            
-            if len(future) < 2: return None
-            
-            entry_price = future.iloc[0]['close'] # Or signal price
-            direction = signal.signal_type # 'buy' or 'sell'
-            
-            # SL/TP
-            atr_period = params.get('atr_period', 14)
-            atr_mult = params.get('atr_multiplier', 2.0)
-            
-            # Simple ATR approx (if not in signal)
-            # Signal object usually has sl_price if StrategyCore set it
-            sl_price = signal.stop_loss
-            if not sl_price:
-               # Fallback
-               return None
-            
-            # Calculate Risk %
-            risk_pct = abs(entry_price - sl_price) / entry_price
-            
-            # Target (RR 1.5 default)
-            tp_dist = abs(entry_price - sl_price) * 1.5
-            tp_price = entry_price + tp_dist if direction == 'buy' else entry_price - tp_dist
-            
-            # Iterate Candles for Exit
-            for i in range(1, len(future)):
-                candle = future.iloc[i]
-                c_low = candle['low']
-                c_high = candle['high']
-                c_ts = candle.name # timestamp index
+            index = df.index
+            highs = df['high'].to_numpy(dtype=np.float64)
+            lows = df['low'].to_numpy(dtype=np.float64)
+            closes = df['close'].to_numpy(dtype=np.float64)
+            monotonic = index.is_monotonic_increasing
+        except Exception:
+            return outcomes
+        
+        n = len(index)
+        batch = []  # (k, rows, entry_pos, direction, entry_price, sl_price, tp_price)
+        
+        for k, (entry_time, signal, params) in enumerate(entries):
+            try:
+                # Candles at/after entry_time (contiguous slice when index is sorted)
+                if monotonic:
+                    rows = None
+                    entry_pos = int(index.searchsorted(entry_time, side='left'))
+                    if n - entry_pos < 2:
+                        continue
+                else:
+                    rows = np.flatnonzero(index >= entry_time)
+                    entry_pos = 0
+                    if len(rows) < 2:
+                        continue
                 
-                # Check Hit
-                exit_price = None
-                exit_reason = ''
+                entry_price = closes[entry_pos if rows is None else rows[0]] # Or signal price
+                direction = signal.signal_type # 'buy' or 'sell'
                 
-                if direction == 'buy':
-                    if c_low <= sl_price:
-                        exit_price = sl_price
-                        exit_reason = 'SL'
-                    elif c_high >= tp_price:
-                        exit_price = tp_price
-                        exit_reason = 'TP'
-                else: # sell
-                    if c_high >= sl_price:
-                        exit_price = sl_price
-                        exit_reason = 'SL'
-                    elif c_low <= tp_price:
-                        exit_price = tp_price
-                        exit_reason = 'TP'
-                        
-                if exit_price:
-                    # Calculate PnL
-                    pnl = (exit_price - entry_price) / entry_price
-                    if direction == 'sell': pnl = -pnl
-                    
-                    return {
-                        'symbol': symbol,
-                        'entry_time': entry_time,
-                        'exit_time': c_ts,
-                        'pnl_percent': pnl * 100,
-                        'exit_reason': exit_reason
-                    }
-                    
-            # End of Data (Force Close)
-            last = future.iloc[-1]
-            pnl = (last['close'] - entry_price) / entry_price
-            if direction == 'sell': pnl = -pnl
-            return {
-                'entry_time': entry_time,
-                'exit_time': last.name,
-                'pnl_percent': pnl * 100,
-                'exit_reason': 'Force'
-            }
+                # Signal object usually has sl_price if StrategyCore set it
+                sl_price = signal.stop_loss
+                if not sl_price:
+                    continue
+                
+                # Target (RR 1.5 default)
+                tp_dist = abs(entry_price - sl_price) * 1.5
+                tp_price = entry_price + tp_dist if direction == 'buy' else entry_price - tp_dist
+                batch.append((k, rows, entry_pos, direction, entry_price, sl_price, tp_price))
+            except Exception:
+                continue
+        
+        if not batch:
+            return outcomes
+        
+        sorted_items = [b for b in batch if b[1] is None]
+        exits = {}
+        if sorted_items:
+            exit_idx, reasons = resolve_exits(
+                highs, lows,
+                [b[2] + 1 for b in sorted_items],
+                [DIR_LONG if b[3] == 'buy' else DIR_SHORT for b in sorted_items],
+                [b[5] for b in sorted_items],
+                [b[6] for b in sorted_items],
+            )
+            for b, i, r in zip(sorted_items, exit_idx, reasons):
+                exits[b[0]] = (int(i), int(r), n - 1)
+        
+        for b in batch:
+            if b[1] is None:
+                continue
+            # Unsorted index: resolve on the masked rows
+            rows = b[1]
+            exit_idx, reasons = resolve_exits(
+                highs[rows], lows[rows], [1],
+                [DIR_LONG if b[3] == 'buy' else DIR_SHORT], [b[5]], [b[6]]
+            )
+            i = int(exit_idx[0])
+            exits[b[0]] = (int(rows[i]) if i >= 0 else -1, int(reasons[0]), int(rows[-1]))
+        
+        for k, rows, entry_pos, direction, entry_price, sl_price, tp_price in batch:
+            entry_time = entries[k][0]
+            exit_pos, reason, last_pos = exits[k]
             
-        except Exception:
-            return None
+            if exit_pos >= 0:
+                exit_price = sl_price if reason == EXIT_SL else tp_price
+                pnl = (exit_price - entry_price) / entry_price
+                if direction == 'sell': pnl = -pnl
+                
+                outcomes[k] = {
+                    'symbol': symbol,
+                    'entry_time': entry_time,
+                    'exit_time': index[exit_pos],
+                    'pnl_percent': pnl * 100,
+                    'exit_reason': 'SL' if reason == EXIT_SL else 'TP'
+                }
+            else:
+                # End of Data (Force Close)
+                pnl = (closes[last_pos] - entry_price) / entry_price
+                if direction == 'sell': pnl = -pnl
+                outcomes[k] = {
+                    'entry_time': entry_time,
+                    'exit_time': index[last_pos],
+                    'pnl_percent': pnl * 100,
+                    'exit_reason': 'Force'
+                }
+        
+        return outcomes
 
     def _finalize_results(self):
         if not self.trade_history:
@@ -211,7 +211,8 @@ class UnifiedBot:
                 self.symbol, 
                 use_new_storage=True, 
                 state_storage=s_store, 
-                trade_storage=t_store
+                trade_storage=t_store,
+                use_wal=True
             )
             self.mod_data = BotDataManager(self.exchange.name, self.symbol, self.strategy_params)
             self.mod_signal = SignalProcessor(self.strategy_params, self.direction)
@@ -421,6 +422,9 @@ class UnifiedBot:
             except Exception as e:
                 logging.error(f"[LOOP] Error: {e}"); time.sleep(5)
 
+        # [PERF] 상태 WAL 체크포인트
+        if hasattr(self, 'mod_state'): self.mod_state.close()
+
     def _health_api_check(self) -> bool:
         """헬스체크용 API 상태 확인"""
         if hasattr(self, 'exchange') and self.exchange:
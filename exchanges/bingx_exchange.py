@@ -14,6 +14,7 @@ from datetime import datetime
 from typing import Optional
 
 from .base_exchange import BaseExchange, Position
+from storage.market_cache import get_market_cache
 
 try:
     import ccxt
@@ -62,7 +63,8 @@ class BingXExchange(BaseExchange):
             # 시간 동기화
             self.sync_time()
             
-            self.exchange.load_markets()
+            # [PERF] 마켓 정보는 로컬 캐시 사용
+            get_market_cache().apply_to(self.exchange, 'bingx', 'swap')
             
             logging.info(f"BingX connected. Time offset: {self.time_offset}ms")
             return True
@@ -14,6 +14,7 @@ from datetime import datetime
 from typing import Optional
 
 from .base_exchange import BaseExchange, Position
+from storage.market_cache import get_market_cache
 
 try:
     from utils.helpers import safe_float
@@ -119,7 +120,7 @@ class BithumbExchange(BaseExchange):
                 'enableRateLimit': True,
             })
             self.use_ccxt = True
-            self.bithumb.load_markets()
+            get_market_cache().apply_to(self.bithumb, 'bithumb', 'spot')  # [PERF] 마켓 캐시
             logging.info("Bithumb connected (ccxt)")
             return True
             
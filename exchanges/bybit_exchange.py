@@ -11,6 +11,7 @@ from datetime import datetime
 from typing import Optional
 
 from .base_exchange import BaseExchange, Position
+from storage.market_cache import get_market_cache
 
 try:
     from pybit.unified_trading import HTTP
@@ -484,9 +485,12 @@ class BybitExchange(BaseExchange):
             return None
     
     def _get_tick_size(self) -> dict:
-        """Tick size 조회"""
-        # 기본값 (BTCUSDT)
-        return {'qty_decimals': 3, 'price_decimals': 1}
+        """Tick size 조회 (로컬 마켓 캐시, 요청 없음)"""
+        # [PERF] 캐시에 없으면 백그라운드 로드 예약 후 기본값 (BTCUSDT)
+        info = get_market_cache().instrument('bybit', self.symbol, 'swap', self.testnet)
+        if not info or info['qty_decimals'] is None or info['price_decimals'] is None:
+            return {'qty_decimals': 3, 'price_decimals': 1}
+        return {'qty_decimals': info['qty_decimals'], 'price_decimals': info['price_decimals']}
     
     def set_leverage(self, leverage: int) -> bool:
         """레버리지 설정"""
@@ -12,6 +12,7 @@ from datetime import datetime
 from typing import Optional, Callable
 
 from .base_exchange import BaseExchange, Position
+from storage.market_cache import get_market_cache
 
 # WebSocket 핸들러 import (선택적)
 try:
@@ -228,8 +229,9 @@ class CCXTExchange(BaseExchange):
             if hasattr(self.ccxt_exchange, 'load_time_difference'):
                  self.ccxt_exchange.load_time_difference()
 
-            # 시장 정보 로드
-            self.ccxt_exchange.load_markets()
+            # [PERF] 시장 정보: 로컬 캐시 적용 (TTL 초과 시 백그라운드 갱신, 없을 때만 load_markets)
+            get_market_cache().apply_to(
+                self.ccxt_exchange, exchange_class, self.exchange_info['type'], self.testnet)
             
             # 잔고 확인
             if self.api_key:
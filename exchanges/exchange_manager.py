@@ -244,7 +244,8 @@ class ExchangeManager:
                         'secret': config.api_secret,
                         'enableRateLimit': True,
                     })
-                    exchange.load_markets()
+                    from storage.market_cache import get_market_cache
+                    get_market_cache().apply_to(exchange, 'bithumb', 'spot')  # [PERF] 마켓 캐시
                     self.exchanges[exchange_name] = exchange
                     print(f"✅ 빗썸 연결 성공 (ccxt)")
                     return (True, "")
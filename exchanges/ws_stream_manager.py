@@ -0,0 +1,552 @@
+# exchanges/ws_stream_manager.py
+"""
+멀티플렉싱 웹소켓 스트림 관리자
+- 여러 심볼/인터벌을 거래소별 소수의 연결로 구독 (거래소 배치 구독 메시지 사용)
+- 이벤트 루프 스레드 1개에서 모든 연결 처리 (심볼당 스레드/루프 X)
+- 수신 캔들을 토픽별 구독자 콜백으로 분배
+- 연결별 자동 재연결 + 재구독
+
+콜백은 스트림 스레드에서 호출되므로 무거운 작업은 별도 스레드로 넘길 것
+"""
+
+import asyncio
+import gzip
+import itertools
+import json
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from exchanges.ws_handler import WebSocketHandler
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+logger = logging.getLogger(__name__)
+
+
+# ================= 거래소별 프로토콜 =================
+
+class _Protocol:
+    """거래소 구독/파싱 규칙 (토픽 = 구독 단위 식별자)"""
+
+    exchange = ''
+    max_topics = 100      # 연결당 최대 토픽 수
+    batch_size = 50       # 구독 메시지 1개당 토픽 수
+
+    def topic(self, symbol: str, interval: str) -> str:
+        raise NotImplementedError
+
+    def subscribe_messages(self, topics: List[str], unsubscribe: bool = False) -> List:
+        """토픽 목록 → 전송할 메시지 목록 (batch_size 단위)"""
+        return [self._message(topics[i:i + self.batch_size], unsubscribe)
+                for i in range(0, len(topics), self.batch_size)]
+
+    def _message(self, topics: List[str], unsubscribe: bool):
+        raise NotImplementedError
+
+    def parse(self, data) -> List[Tuple[str, Dict]]:
+        """수신 메시지 → [(토픽, 캔들)] (캔들 confirm=None이면 가격 업데이트만)"""
+        raise NotImplementedError
+
+    @staticmethod
+    def _candle(ts, o, h, l, c, v, confirm) -> Dict:
+        return {
+            'timestamp': int(ts or 0),
+            'open': float(o or 0),
+            'high': float(h or 0),
+            'low': float(l or 0),
+            'close': float(c or 0),
+            'volume': float(v or 0),
+            'confirm': confirm,
+        }
+
+
+class _BybitProtocol(_Protocol):
+    exchange = 'bybit'
+    max_topics = 200
+    batch_size = 10       # Bybit: 요청당 args 최대 10개
+
+    def topic(self, symbol, interval):
+        iv = WebSocketHandler.INTERVAL_MAP['bybit'].get(interval, '15')
+        return f"kline.{iv}.{symbol.upper()}"
+
+    def _message(self, topics, unsubscribe):
+        return {"op": "unsubscribe" if unsubscribe else "subscribe", "args": topics}
+
+    def parse(self, data):
+        topic = data.get('topic', '') if isinstance(data, dict) else ''
+        if not topic.startswith('kline.'):
+            return []
+        return [(topic, self._candle(k.get('start'), k.get('open'), k.get('high'), k.get('low'),
+                                     k.get('close'), k.get('volume'), bool(k.get('confirm', False))))
+                for k in data.get('data', [])]
+
+
+class _BinanceProtocol(_Protocol):
+    exchange = 'binance'
+    max_topics = 200      # Binance: 연결당 스트림 최대 200개
+
+    def __init__(self):
+        self._ids = itertools.count(1)
+
+    def topic(self, symbol, interval):
+        return f"{symbol.lower()}@kline_{interval}"
+
+    def _message(self, topics, unsubscribe):
+        return {"method": "UNSUBSCRIBE" if unsubscribe else "SUBSCRIBE", "params": topics, "id": next(self._ids)}
+
+    def parse(self, data):
+        if isinstance(data, dict) and 'stream' in data:   # combined stream 형식
+            data = data.get('data', {})
+        if not isinstance(data, dict) or data.get('e') != 'kline':
+            return []
+        k = data.get('k', {})
+        topic = f"{data.get('s', k.get('s', '')).lower()}@kline_{k.get('i', '')}"
+        return [(topic, self._candle(k.get('t'), k.get('o'), k.get('h'), k.get('l'),
+                                     k.get('c'), k.get('v'), bool(k.get('x', False))))]
+
+
+class _OkxProtocol(_Protocol):
+    exchange = 'okx'
+
+    def topic(self, symbol, interval):
+        iv = WebSocketHandler.INTERVAL_MAP['okx'].get(interval, '15m')
+        inst_id = symbol.upper().replace('/', '-')
+        if '-' not in inst_id:
+            inst_id = inst_id.replace('USDT', '-USDT-SWAP')
+        if '-' not in inst_id:
+            inst_id = f"{inst_id}-SWAP"
+        return f"candle{iv}:{inst_id}"
+
+    def _message(self, topics, unsubscribe):
+        args = [dict(zip(('channel', 'instId'), t.split(':', 1))) for t in topics]
+        return {"op": "unsubscribe" if unsubscribe else "subscribe", "args": args}
+
+    def parse(self, data):
+        if not isinstance(data, dict) or not isinstance(data.get('data'), list):
+            return []
+        arg = data.get('arg', {})
+        topic = f"{arg.get('channel', '')}:{arg.get('instId', '')}"
+        events = []
+        for k in data['data']:
+            if isinstance(k, list):   # [ts, o, h, l, c, vol, volCcy, volCcyQuote, confirm]
+                confirm = len(k) > 8 and str(k[8]) == '1'
+                events.append((topic, self._candle(k[0], k[1], k[2], k[3], k[4], k[5], confirm)))
+            elif isinstance(k, dict):
+                events.append((topic, self._candle(k.get('ts'), k.get('o'), k.get('h'), k.get('l'),
+                                                   k.get('c'), k.get('vol'), k.get('confirm') == '1')))
+        return events
+
+
+class _BitgetProtocol(_Protocol):
+    exchange = 'bitget'
+
+    def topic(self, symbol, interval):
+        iv = WebSocketHandler.INTERVAL_MAP['bitget'].get(interval, '15m')
+        return f"candle{iv}:{symbol.upper()}"
+
+    def _message(self, topics, unsubscribe):
+        args = [{"instType": "MC", **dict(zip(('channel', 'instId'), t.split(':', 1)))} for t in topics]
+        return {"op": "unsubscribe" if unsubscribe else "subscribe", "args": args}
+
+    def parse(self, data):
+        if not isinstance(data, dict) or not isinstance(data.get('data'), list):
+            return []
+        arg = data.get('arg', {})
+        topic = f"{arg.get('channel', '')}:{arg.get('instId', '')}"
+        events = []
+        for k in data['data']:
+            # 마감 플래그 없음 → 가격 업데이트만
+            if isinstance(k, list) and len(k) >= 6:
+                events.append((topic, self._candle(k[0], k[1], k[2], k[3], k[4], k[5], None)))
+            elif isinstance(k, dict):
+                events.append((topic, self._candle(k.get('ts'), k.get('open'), k.get('high'), k.get('low'),
+                                                   k.get('close'), k.get('volume'), None)))
+        return events
+
+
+class _BingxProtocol(_Protocol):
+    exchange = 'bingx'
+    batch_size = 1        # BingX: 메시지당 dataType 1개
+
+    def topic(self, symbol, interval):
+        return f"{symbol.upper()}@kline_{interval}"
+
+    def _message(self, topics, unsubscribe):
+        return {"id": f"{topics[0]}:{int(time.time() * 1000)}", "reqType": "unsub" if unsubscribe else "sub",
+                "dataType": topics[0]}
+
+    def parse(self, data):
+        if not isinstance(data, dict) or 'data' not in data:
+            return []
+        topic = data.get('dataType', '')
+        items = data['data'] if isinstance(data['data'], list) else [data['data']]
+        return [(topic, self._candle(k.get('T'), k.get('o'), k.get('h'), k.get('l'), k.get('c'), k.get('v'), None))
+                for k in items if isinstance(k, dict)]
+
+
+class _UpbitProtocol(_Protocol):
+    exchange = 'upbit'
+    max_topics = 200
+
+    def topic(self, symbol, interval):
+        return symbol.upper()   # ticker 스트림 (인터벌 무관)
+
+    def subscribe_messages(self, topics, unsubscribe=False):
+        # Upbit: 메시지가 연결의 구독 목록을 대체 → 항상 전체 목록 전송
+        return [[{"ticket": f"twin_{int(time.time())}"}, {"type": "ticker", "codes": topics}]]
+
+    def parse(self, data):
+        if not isinstance(data, dict) or data.get('type') != 'ticker':
+            return []
+        price = data.get('trade_price', 0)
+        return [(data.get('code', ''), self._candle(data.get('timestamp'), price, price, price, price, 0, None))]
+
+
+class _BithumbProtocol(_Protocol):
+    exchange = 'bithumb'
+
+    def topic(self, symbol, interval):
+        return f"{symbol.upper().replace('-', '_').replace('/', '_')}:{interval.upper()}"
+
+    def subscribe_messages(self, topics, unsubscribe=False):
+        # Bithumb: 심볼 목록 × tickType 목록 조합 구독 → tickType별 메시지 1개
+        by_tick: Dict[str, List[str]] = {}
+        for t in topics:
+            sym, tick = t.split(':', 1)
+            by_tick.setdefault(tick, []).append(sym)
+        return [{"type": "ticker", "symbols": syms, "tickTypes": [tick]} for tick, syms in by_tick.items()]
+
+    def parse(self, data):
+        if not isinstance(data, dict) or data.get('type') != 'ticker':
+            return []
+        content = data.get('content', {})
+        price = content.get('closePrice', 0)
+        topic = f"{content.get('symbol', '')}:{content.get('tickType', '')}"
+        return [(topic, self._candle(0, price, price, price, price, 0, None))]
+
+
+PROTOCOLS = {p.exchange: p for p in (_BybitProtocol, _BinanceProtocol, _OkxProtocol, _BitgetProtocol,
+                                      _BingxProtocol, _UpbitProtocol, _BithumbProtocol)}
+
+
+def _decode(message):
+    """원문 → JSON (BingX gzip 바이너리 지원)"""
+    if isinstance(message, (bytes, bytearray)):
+        if message[:2] == b'\x1f\x8b':
+            message = gzip.decompress(message)
+        message = message.decode('utf-8')
+    return json.loads(message)
+
+
+# ================= 구독/연결 =================
+
+class StreamSubscription:
+    """구독 핸들 (WebSocketHandler와 같은 콜백 속성)"""
+
+    def __init__(self, manager: 'StreamManager', exchange: str, symbol: str, interval: str, topic: str):
+        self.manager = manager
+        self.exchange = exchange
+        self.symbol = symbol
+        self.interval = interval
+        self.topic = topic
+        self.on_candle_close: Optional[Callable[[Dict], None]] = None
+        self.on_price_update: Optional[Callable[[float], None]] = None
+        self.last_candle: Optional[Dict] = None
+        self.active = True
+
+    def disconnect(self):
+        """구독 해제 (연결은 다른 구독과 공유되므로 유지)"""
+        self.manager.unsubscribe(self)
+
+    def _deliver(self, candle: Dict):
+        self.last_candle = candle
+        if self.on_price_update:
+            self.on_price_update(candle['close'])
+        if candle.get('confirm') and self.on_candle_close:
+            self.on_candle_close(candle)
+
+
+class _Connection:
+    """거래소 연결 1개 (토픽 최대 protocol.max_topics개)"""
+
+    def __init__(self, manager: 'StreamManager', exchange: str, url: str, protocol: _Protocol, conn_id: int):
+        self.manager = manager
+        self.exchange = exchange
+        self.url = url
+        self.protocol = protocol
+        self.conn_id = conn_id
+        self.topics: List[str] = []
+        self.ws = None
+        self.task: Optional[asyncio.Task] = None
+        self.started = False      # 구독 스레드에서 설정 (task는 루프에서 생성되므로 별도 플래그)
+        self.is_connected = False
+        self.reconnect_attempts = 0
+
+    def _reconnect_delay(self) -> float:
+        # WebSocketHandler와 같은 백오프 (3초 × 1.5^n, 최대 60초)
+        return min(3 * (1.5 ** self.reconnect_attempts), 60)
+
+    async def send_topics(self, topics: List[str], unsubscribe: bool = False):
+        """열린 연결에 추가 구독/해제 전송 (미연결이면 재연결 시 일괄 구독)"""
+        if self.ws is None or not self.is_connected:
+            return
+        if isinstance(self.protocol, (_UpbitProtocol, _BithumbProtocol)):
+            topics = list(self.topics)   # 전체 목록 재전송
+            unsubscribe = False
+            if not topics:
+                return
+        for payload in self.protocol.subscribe_messages(topics, unsubscribe):
+            await self.ws.send(json.dumps(payload))
+
+    async def run(self):
+        while self.manager.running and self.topics:
+            try:
+                async with websockets.connect(self.url, ping_interval=20, ping_timeout=10, close_timeout=5) as ws:
+                    self.ws = ws
+                    self.is_connected = True
+                    self.reconnect_attempts = 0
+                    logger.info(f"[WS-MUX] ✅ {self.exchange}#{self.conn_id} connected ({len(self.topics)} topics)")
+                    await self.send_topics(list(self.topics))
+
+                    async for message in ws:
+                        if message == 'Ping':   # BingX 앱 레벨 keepalive
+                            await ws.send('Pong')
+                            continue
+                        self.manager._dispatch(self.exchange, message)
+                        if not self.topics:
+                            break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.reconnect_attempts += 1
+                logger.warning(f"[WS-MUX] {self.exchange}#{self.conn_id} connection lost: {e}")
+            finally:
+                self.ws = None
+                self.is_connected = False
+            if self.manager.running and self.topics:
+                await asyncio.sleep(self._reconnect_delay())
+
+
+class StreamManager:
+    """
+    멀티플렉싱 스트림 관리자
+
+    Usage:
+        manager = get_stream_manager()
+        sub = manager.subscribe('bybit', 'BTCUSDT', '15m',
+                                on_candle_close=on_close, on_price_update=on_price)
+        ...
+        sub.disconnect()
+    """
+
+    def __init__(self, endpoints: Dict[str, str] = None, max_topics: Dict[str, int] = None):
+        """
+        Args:
+            endpoints: 거래소별 URL 덮어쓰기 (기본: WebSocketHandler.WS_ENDPOINTS)
+            max_topics: 거래소별 연결당 토픽 수 덮어쓰기
+        """
+        self.endpoints = {**WebSocketHandler.WS_ENDPOINTS, **(endpoints or {})}
+        self.protocols: Dict[str, _Protocol] = {}
+        self._max_topics = max_topics or {}
+        self._routes: Dict[Tuple[str, str], List[StreamSubscription]] = {}
+        self._connections: Dict[str, List[_Connection]] = {}
+        self._topic_conn: Dict[Tuple[str, str], _Connection] = {}
+        self._conn_ids = itertools.count(1)
+        self._lock = threading.RLock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self.running = False
+
+    # ========== 루프 스레드 ==========
+
+    def _ensure_loop(self):
+        if self._loop is not None:
+            return
+        if websockets is None:
+            raise ImportError("websockets library not installed")
+        self.running = True
+        self._loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self._loop)
+            self._loop.call_soon(ready.set)
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name='ws-stream-manager', daemon=True)
+        self._thread.start()
+        ready.wait(timeout=5)
+
+    def _call(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def _protocol(self, exchange: str) -> _Protocol:
+        if exchange not in self.protocols:
+            if exchange not in PROTOCOLS:
+                raise ValueError(f"Unsupported exchange: {exchange}")
+            protocol = PROTOCOLS[exchange]()
+            if exchange in self._max_topics:
+                protocol.max_topics = self._max_topics[exchange]
+            self.protocols[exchange] = protocol
+        return self.protocols[exchange]
+
+    # ========== 구독 ==========
+
+    def subscribe(self, exchange: str, symbol: str, interval: str = '15m',
+                  on_candle_close: Callable[[Dict], None] = None,
+                  on_price_update: Callable[[float], None] = None) -> StreamSubscription:
+        """심볼/인터벌 구독 (기존 연결에 여유가 있으면 재사용, 없으면 연결 추가)"""
+        exchange = exchange.lower()
+        protocol = self._protocol(exchange)
+        topic = protocol.topic(symbol, interval)
+        sub = StreamSubscription(self, exchange, symbol, interval, topic)
+        sub.on_candle_close = on_candle_close
+        sub.on_price_update = on_price_update
+
+        with self._lock:
+            self._ensure_loop()
+            subs = self._routes.setdefault((exchange, topic), [])
+            subs.append(sub)
+            if len(subs) > 1:
+                return sub   # 이미 구독 중인 토픽 → 콜백만 추가
+
+            conns = self._connections.setdefault(exchange, [])
+            conn = next((c for c in conns if len(c.topics) < protocol.max_topics), None)
+            if conn is None:
+                conn = _Connection(self, exchange, self.endpoints[exchange], protocol, next(self._conn_ids))
+                conns.append(conn)
+            conn.topics.append(topic)
+            self._topic_conn[(exchange, topic)] = conn
+            start = not conn.started
+            conn.started = True
+        self._call(self._attach(conn, topic, start))
+        return sub
+
+    async def _attach(self, conn: _Connection, topic: str, start: bool):
+        if start:
+            conn.task = asyncio.ensure_future(conn.run())
+        else:
+            await self._safe_send(conn, [topic])
+
+    async def _safe_send(self, conn: _Connection, topics: List[str], unsubscribe: bool = False):
+        try:
+            await conn.send_topics(topics, unsubscribe)
+        except Exception as e:
+            logger.debug(f"[WS-MUX] {conn.exchange}#{conn.conn_id} send failed (resubscribe on reconnect): {e}")
+
+    def unsubscribe(self, sub: StreamSubscription):
+        """구독 해제 (토픽의 마지막 구독자면 거래소 구독도 해제, 빈 연결은 종료)"""
+        with self._lock:
+            if not sub.active:
+                return
+            sub.active = False
+            subs = self._routes.get((sub.exchange, sub.topic), [])
+            if sub in subs:
+                subs.remove(sub)
+            if subs:
+                return
+            self._routes.pop((sub.exchange, sub.topic), None)
+            conn = self._topic_conn.pop((sub.exchange, sub.topic), None)
+            if conn is None:
+                return
+            conn.topics.remove(sub.topic)
+            if not conn.topics:
+                self._connections[sub.exchange].remove(conn)
+        if self._loop is not None:
+            self._call(self._detach(conn, sub.topic))
+
+    async def _detach(self, conn: _Connection, topic: str):
+        if conn.topics:
+            await self._safe_send(conn, [topic], unsubscribe=True)
+        elif conn.task is not None:
+            conn.task.cancel()
+
+    # ========== 분배 ==========
+
+    def _dispatch(self, exchange: str, message):
+        """수신 메시지 파싱 → 토픽 구독자 콜백"""
+        try:
+            data = _decode(message)
+        except (ValueError, UnicodeDecodeError, OSError):
+            return
+        try:
+            events = self.protocols[exchange].parse(data)
+        except Exception as e:
+            logger.debug(f"[WS-MUX] Parse error ({exchange}): {e}")
+            return
+        for topic, candle in events:
+            with self._lock:
+                subs = list(self._routes.get((exchange, topic), ()))
+            for sub in subs:
+                try:
+                    sub._deliver(candle)
+                except Exception as e:
+                    logger.error(f"[WS-MUX] Callback error ({sub.symbol}): {e}")
+
+    # ========== 상태/종료 ==========
+
+    @property
+    def stats(self) -> Dict:
+        """거래소별 연결/토픽/구독 수"""
+        with self._lock:
+            return {
+                exchange: {
+                    'connections': len(conns),
+                    'connected': sum(1 for c in conns if c.is_connected),
+                    'topics': sum(len(c.topics) for c in conns),
+                    'subscriptions': sum(len(s) for (ex, _), s in self._routes.items() if ex == exchange),
+                }
+                for exchange, conns in self._connections.items()
+            }
+
+    def stop(self, timeout: float = 5):
+        """전체 연결 종료 + 루프 스레드 정리"""
+        with self._lock:
+            if self._loop is None:
+                return
+            self.running = False
+            for subs in self._routes.values():
+                for sub in subs:
+                    sub.active = False
+            self._routes.clear()
+            self._topic_conn.clear()
+            conns = [c for cs in self._connections.values() for c in cs]
+            self._connections.clear()
+            loop, self._loop = self._loop, None
+
+        async def shutdown():
+            # 정상 종료 핸드셰이크 후 태스크 정리
+            await asyncio.gather(*(c.ws.close() for c in conns if c.ws is not None), return_exceptions=True)
+            tasks = [c.task for c in conns if c.task is not None]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout)
+        except Exception as e:
+            logger.debug(f"[WS-MUX] Shutdown: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if not loop.is_running():
+            loop.close()
+
+
+_stream_manager: Optional[StreamManager] = None
+_stream_manager_lock = threading.Lock()
+
+
+def get_stream_manager() -> StreamManager:
+    """스트림 관리자 싱글톤"""
+    global _stream_manager
+    with _stream_manager_lock:
+        if _stream_manager is None:
+            _stream_manager = StreamManager()
+        return _stream_manager
@@ -1,5 +1,10 @@
 # Storage modules
 from storage.trade_storage import TradeStorage, get_trade_storage
+from storage.trade_journal import TradeJournal
 from storage.state_storage import StateStorage, get_state_storage
 from storage.secure_storage import SecureKeyStorage, get_secure_storage
 from storage.trade_history import TradeHistory
+from storage.result_store import ResultStore, get_result_store
+from storage.candle_store import CandleStore, get_candle_store
+from storage.resample_cache import ResampleCache, ResamplePyramid, get_resample_cache
+from storage.market_cache import MarketMetadataCache, get_market_cache
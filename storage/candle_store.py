@@ -0,0 +1,571 @@
+"""
+추가 전용(append-only) 캔들 저장소 (Parquet)
+
+- 캔들 수신 시 작은 델타 파일만 기록 (기존 히스토리 재작성 X → 캔들당 O(1))
+- 델타가 쌓이면 백그라운드에서 월별 파티션으로 압축 (해당 월 파티션만 재작성)
+- 조회: 파티션 + 델타 + 메모리 버퍼 병합 (같은 timestamp는 마지막 값 우선)
+- 기존 단일 파일({exchange}_{symbol}_{tf}.parquet)은 최초 접근 시 가져오고,
+  압축 시 미러로 갱신 (단일 파일을 직접 읽는 기존 코드 호환)
+- 단일 파일이 외부(GUI 다운로더 등)에서 다시 쓰이면 (mtime/크기 변경) 다음 조회 시 병합
+- 미러는 전체 히스토리 재작성이므로 키별 mirror_interval 초에 1회만 기록 (미뤄진 미러는 flush 시 기록)
+
+디렉토리 구조:
+    {root}/{exchange}_{symbol}_{tf}/2024-01.parquet     월별 파티션
+    {root}/{exchange}_{symbol}_{tf}/delta/*.parquet     미압축 델타
+"""
+
+import os
+import json
+import time
+import itertools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    from paths import Paths
+    DEFAULT_CACHE_DIR = Path(Paths.CACHE)
+except ImportError:
+    DEFAULT_CACHE_DIR = Path(__file__).parent.parent / 'data' / 'cache'
+
+OHLCV_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+# 캔들 dict 키 별칭 (Bybit/Binance WS 형식)
+_ALIASES = {
+    'timestamp': ('timestamp', 'start', 't'),
+    'open': ('open', 'o'),
+    'high': ('high', 'h'),
+    'low': ('low', 'l'),
+    'close': ('close', 'c'),
+    'volume': ('volume', 'v'),
+}
+
+_LEGACY_STATE = 'legacy.json'
+
+
+def clean_symbol(symbol: str) -> str:
+    """파일명용 심볼 정규화 (BTC/USDT:USDT → btcusdtusdt)"""
+    return symbol.lower().replace('/', '').replace(':', '').replace('-', '')
+
+
+def _candle_row(candle: dict) -> dict:
+    """WS/REST 캔들 dict → OHLCV 행"""
+    row = {}
+    for column, keys in _ALIASES.items():
+        value = next((candle[k] for k in keys if candle.get(k) is not None), None)
+        row[column] = value if column == 'timestamp' else float(value or 0)
+    return row
+
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """timestamp → tz 없는 datetime64[ms] (ms 정수/문자열/datetime 모두 허용)"""
+    if df is None or df.empty or 'timestamp' not in df.columns:
+        return pd.DataFrame(columns=OHLCV_COLUMNS)
+    df = df.copy()
+    ts = df['timestamp']
+    if pd.api.types.is_numeric_dtype(ts):
+        ts = pd.to_datetime(ts, unit='ms')
+    else:
+        ts = pd.to_datetime(ts, utc=True).dt.tz_localize(None)
+    df['timestamp'] = ts.astype('datetime64[ms]')
+    return df
+
+
+def _to_ms(df: pd.DataFrame) -> pd.DataFrame:
+    """timestamp → ms 정수 (기존 단일 파일 형식, 단일 파일을 직접 읽는 코드는 ms 정수를 가정)"""
+    df = df.copy()
+    df['timestamp'] = df['timestamp'].astype('datetime64[ms]').astype('int64')
+    return df
+
+
+def _merge(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """뒤쪽 프레임 우선으로 병합 → timestamp 정렬/중복 제거"""
+    frames = [f for f in frames if f is not None and not f.empty]
+    if not frames:
+        return pd.DataFrame(columns=OHLCV_COLUMNS)
+    df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    df = df.drop_duplicates(subset='timestamp', keep='last')
+    return df.sort_values('timestamp').reset_index(drop=True)
+
+
+def _month_of(df: pd.DataFrame) -> pd.Series:
+    """행별 파티션 이름 (YYYY-MM)"""
+    return df['timestamp'].dt.strftime('%Y-%m')
+
+
+def _by_month(df: Optional[pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """파티션 이름 → 해당 월 행"""
+    if df is None or df.empty:
+        return {}
+    return dict(tuple(df.groupby(_month_of(df))))
+
+
+def _parquet_rows(path: Path) -> int:
+    """Parquet 행 수 (메타데이터만 읽음)"""
+    try:
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(path).metadata.num_rows
+    except ImportError:
+        return len(pd.read_parquet(path, columns=['timestamp']))
+
+
+def _write_atomic(df: pd.DataFrame, path: Path):
+    """임시 파일 기록 후 교체 (읽는 쪽은 항상 완성된 파일만 봄)"""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    df.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+
+
+class CandleStore:
+    """
+    심볼/TF별 추가 전용 캔들 저장소
+
+    Usage:
+        store = get_candle_store()
+        store.append('bybit', 'BTCUSDT', '15m', candle)               # 델타 1개 기록
+        store.append('bybit', 'BTCUSDT', '15m', kline, buffer=True)   # 진행 중 캔들 (메모리)
+        df = store.read('bybit', 'BTCUSDT', '15m', start=since)
+    """
+
+    MIRROR_INTERVAL = 300.0  # 키별 미러 재작성 최소 간격 (초)
+
+    def __init__(self, root: Union[str, Path] = None, legacy_dir: Union[str, Path] = None,
+                 compact_threshold: int = 16, mirror_legacy: bool = True, background: bool = True,
+                 mirror_interval: float = None):
+        """
+        Args:
+            root: 파티션/델타 루트 (기본: {cache}/candles)
+            legacy_dir: 기존 단일 파일 디렉토리 (기본: root의 상위)
+            compact_threshold: 델타 파일이 이 개수 이상이면 압축 예약
+            mirror_legacy: 압축 시 단일 파일 미러 갱신 + 외부 변경 가져오기
+            background: False면 압축을 append 호출 스레드에서 바로 실행
+            mirror_interval: 키별 미러 재작성 최소 간격 (초, 기본 MIRROR_INTERVAL)
+        """
+        self.root = Path(root) if root else DEFAULT_CACHE_DIR / 'candles'
+        self.legacy_dir = Path(legacy_dir) if legacy_dir else self.root.parent
+        self.compact_threshold = max(1, compact_threshold)
+        self.mirror_legacy = mirror_legacy
+        self.background = background
+        self.mirror_interval = self.MIRROR_INTERVAL if mirror_interval is None else mirror_interval
+
+        self._lock = threading.Lock()                     # 키별 락 생성 보호
+        self._locks: Dict[str, threading.Lock] = {}       # 파일 목록 변경 (델타 기록/삭제)
+        self._compact_locks: Dict[str, threading.Lock] = {}
+        self._delta_counts: Dict[str, int] = {}
+        self._buffers: Dict[str, Dict] = {}               # 진행 중 캔들 {timestamp: row}
+        self._scheduled = set()
+        self._legacy_sigs: Dict[str, Optional[tuple]] = {}  # 마지막으로 가져오거나 미러로 쓴 단일 파일 (mtime_ns, size)
+        self._mirror_times: Dict[str, float] = {}
+        self._mirror_dirty: Dict[str, tuple] = {}         # 미러가 미뤄진 키 → (exchange, symbol, timeframe)
+        self._seq = itertools.count(1)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    # ========== 경로 ==========
+
+    @staticmethod
+    def key(exchange: str, symbol: str, timeframe: str) -> str:
+        return f"{exchange.lower()}_{clean_symbol(symbol)}_{timeframe}"
+
+    def legacy_path(self, exchange: str, symbol: str, timeframe: str) -> Path:
+        """기존 단일 Parquet 파일 경로 (미러)"""
+        return self.legacy_dir / f"{self.key(exchange, symbol, timeframe)}.parquet"
+
+    def _key_dir(self, key: str) -> Path:
+        return self.root / key
+
+    def _delta_dir(self, key: str) -> Path:
+        return self.root / key / 'delta'
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        """파일 목록 락 (압축 락과 함께 잡을 때는 압축 락 → 키 락 순서)"""
+        with self._lock:
+            if key not in self._locks:
+                self._locks[key] = threading.Lock()
+                self._compact_locks[key] = threading.Lock()
+            return self._locks[key]
+
+    def _list_deltas(self, key: str) -> List[Path]:
+        delta_dir = self._delta_dir(key)
+        if not delta_dir.exists():
+            return []
+        return sorted(p for p in delta_dir.iterdir() if p.suffix == '.parquet')
+
+    def _list_partitions(self, key: str) -> List[Path]:
+        key_dir = self._key_dir(key)
+        if not key_dir.exists():
+            return []
+        return sorted(p for p in key_dir.iterdir() if p.suffix == '.parquet')
+
+    # ========== 기존 단일 파일 ==========
+
+    @staticmethod
+    def _legacy_signature(legacy: Path) -> Optional[tuple]:
+        """단일 파일 (mtime_ns, size) - 없으면 None"""
+        try:
+            st = legacy.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _legacy_state(self, key: str) -> Optional[tuple]:
+        """마지막으로 가져오거나 미러로 쓴 단일 파일 서명 (메모리 캐시, 없으면 legacy.json)"""
+        with self._lock:
+            if key in self._legacy_sigs:
+                return self._legacy_sigs[key]
+        sig = None
+        try:
+            with open(self._key_dir(key) / _LEGACY_STATE) as f:
+                state = json.load(f)
+            sig = (state['mtime_ns'], state['size'])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        with self._lock:
+            return self._legacy_sigs.setdefault(key, sig)
+
+    def _save_legacy_state(self, key: str, sig: Optional[tuple]):
+        with self._lock:
+            self._legacy_sigs[key] = sig
+        if sig is None:
+            return
+        try:
+            with open(self._key_dir(key) / _LEGACY_STATE, 'w') as f:
+                json.dump({'mtime_ns': sig[0], 'size': sig[1]}, f)
+        except OSError as e:
+            logger.debug(f"[CANDLE-STORE] Legacy state save failed ({key}): {e}")
+
+    def _changed_legacy(self, key: str, legacy: Path) -> Tuple[Optional[pd.DataFrame], Optional[tuple]]:
+        """단일 파일이 마지막 가져오기/미러 이후 외부에서 바뀌었으면 (내용, 읽기 전 서명) 반환"""
+        sig = self._legacy_signature(legacy)
+        if sig is None or sig == self._legacy_state(key):
+            return None, sig
+        try:
+            return _normalize(pd.read_parquet(legacy)), sig
+        except Exception as e:
+            logger.warning(f"[CANDLE-STORE] Legacy read failed ({legacy.name}): {e}")
+            return None, sig
+
+    def _refresh_legacy(self, key: str, exchange: str, symbol: str, timeframe: str):
+        """조회 전 단일 파일 외부 변경 확인 (평소에는 stat 1회) → 바뀌었으면 파티션에 병합"""
+        if not self.mirror_legacy or not self._key_dir(key).exists():
+            return
+        sig = self._legacy_signature(self.legacy_path(exchange, symbol, timeframe))
+        if sig is None or sig == self._legacy_state(key):
+            return
+        self._key_lock(key)
+        with self._compact_locks[key]:
+            self._import_legacy(key, self.legacy_path(exchange, symbol, timeframe))
+
+    def _import_legacy(self, key: str, legacy: Path, delta_parts: Dict[str, pd.DataFrame] = None) -> List[str]:
+        """
+        외부에서 바뀐 단일 파일 (+ 델타) → 월별 파티션 병합 (압축 락 보유 상태에서 호출)
+
+        우선순위: 외부 변경분 < 기존 파티션 < 델타
+
+        Returns:
+            재작성한 파티션 이름 목록
+        """
+        external, sig = self._changed_legacy(key, legacy) if self.mirror_legacy else (None, None)
+        external_parts = _by_month(external)
+        delta_parts = delta_parts or {}
+        months = sorted(set(external_parts) | set(delta_parts))
+
+        key_dir = self._key_dir(key)
+        for month in months:
+            path = key_dir / f"{month}.parquet"
+            existing = _normalize(pd.read_parquet(path)) if path.exists() else None
+            _write_atomic(_merge([external_parts.get(month), existing, delta_parts.get(month)]), path)
+        if external is not None:
+            self._save_legacy_state(key, sig)
+            logger.info(f"[CANDLE-STORE] Merged {len(external)} candles from changed {legacy.name}")
+        return months
+
+    # ========== 기록 ==========
+
+    def append(self, exchange: str, symbol: str, timeframe: str,
+               candles: Union[dict, List[dict], pd.DataFrame], buffer: bool = False):
+        """
+        캔들 추가 (기존 파일은 읽지 않음)
+
+        Args:
+            candles: 캔들 dict, dict 목록 또는 DataFrame
+            buffer: True면 메모리 버퍼에만 반영 (진행 중 캔들 틱용).
+                    더 새로운 timestamp가 들어오면 이전 캔들을 델타로 기록
+        """
+        key = self.key(exchange, symbol, timeframe)
+        if isinstance(candles, dict):
+            candles = [candles]
+        df = candles if isinstance(candles, pd.DataFrame) else pd.DataFrame([_candle_row(c) for c in candles])
+        df = _normalize(df)
+        if df.empty:
+            return
+
+        lock = self._key_lock(key)
+        with lock:
+            self._ensure_imported(key, exchange, symbol, timeframe)
+            pending = self._buffers.setdefault(key, {})
+            if buffer:
+                for row in df.to_dict('records'):
+                    pending[row['timestamp']] = row
+                # 최신 캔들만 버퍼에 남기고 마감된 캔들은 기록
+                latest = max(pending)
+                closed = [pending.pop(ts) for ts in sorted(pending) if ts < latest]
+                if not closed:
+                    return
+                df = pd.DataFrame(closed)
+            elif pending:
+                # 확정 캔들이 버퍼의 진행 중 값을 대체
+                for ts in df['timestamp']:
+                    pending.pop(ts, None)
+            self._write_delta(key, df)
+            count = self._delta_counts[key]
+
+        if count >= self.compact_threshold:
+            self._schedule_compaction(key, exchange, symbol, timeframe)
+
+    def _write_delta(self, key: str, df: pd.DataFrame):
+        """델타 파일 1개 기록 (락 보유 상태에서 호출)"""
+        delta_dir = self._delta_dir(key)
+        delta_dir.mkdir(parents=True, exist_ok=True)
+        name = f"{time.time_ns():020d}-{os.getpid()}-{next(self._seq):06d}.parquet"
+        _write_atomic(df, delta_dir / name)
+        if key not in self._delta_counts:
+            self._delta_counts[key] = len(self._list_deltas(key))
+        else:
+            self._delta_counts[key] += 1
+
+    def _ensure_imported(self, key: str, exchange: str, symbol: str, timeframe: str):
+        """최초 접근 시 기존 단일 파일을 파티션으로 가져오기 (락 보유 상태에서 호출)"""
+        key_dir = self._key_dir(key)
+        if key_dir.exists():
+            return
+        key_dir.mkdir(parents=True, exist_ok=True)
+        legacy = self.legacy_path(exchange, symbol, timeframe)
+        df, sig = self._changed_legacy(key, legacy)
+        if df is None or df.empty:
+            return
+        for month, part in _by_month(df).items():
+            _write_atomic(_merge([part]), key_dir / f"{month}.parquet")
+        self._save_legacy_state(key, sig)
+        logger.info(f"[CANDLE-STORE] Imported {len(df)} candles from {legacy.name}")
+
+    # ========== 압축 ==========
+
+    def _schedule_compaction(self, key: str, exchange: str, symbol: str, timeframe: str):
+        if not self.background:
+            self.compact(exchange, symbol, timeframe)
+            return
+        with self._lock:
+            if key in self._scheduled:
+                return
+            self._scheduled.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='candle-compact')
+            executor = self._executor
+        executor.submit(self._compact_scheduled, key, exchange, symbol, timeframe)
+
+    def _compact_scheduled(self, key: str, exchange: str, symbol: str, timeframe: str):
+        with self._lock:
+            self._scheduled.discard(key)
+        try:
+            self.compact(exchange, symbol, timeframe)
+        except Exception as e:
+            logger.error(f"[CANDLE-STORE] Compaction failed ({key}): {e}")
+
+    def compact(self, exchange: str, symbol: str, timeframe: str, force_mirror: bool = False) -> int:
+        """
+        델타 → 월별 파티션 병합 (영향받는 월만 재작성), 미러 갱신
+
+        Args:
+            force_mirror: True면 mirror_interval과 관계없이 미러 기록 (단일 파일을 바로 읽을 호출 측용)
+
+        Returns:
+            병합한 델타 파일 수
+        """
+        key = self.key(exchange, symbol, timeframe)
+        lock = self._key_lock(key)
+        with self._compact_locks[key]:
+            with lock:
+                self._ensure_imported(key, exchange, symbol, timeframe)
+                deltas = self._list_deltas(key)
+            legacy = self.legacy_path(exchange, symbol, timeframe)
+            delta_parts = _by_month(_merge([_normalize(pd.read_parquet(p)) for p in deltas]))
+            months = self._import_legacy(key, legacy, delta_parts)
+
+            with lock:
+                for p in deltas:
+                    try:
+                        p.unlink()
+                    except FileNotFoundError:
+                        pass
+                self._delta_counts[key] = len(self._list_deltas(key))
+
+            if self.mirror_legacy and (months or (force_mirror and key in self._mirror_dirty)):
+                self._mirror(key, legacy, exchange, symbol, timeframe, force=force_mirror)
+        if deltas:
+            logger.debug(f"[CANDLE-STORE] Compacted {len(deltas)} deltas ({key}, {len(months)} partitions)")
+        return len(deltas)
+
+    def _mirror(self, key: str, legacy: Path, exchange: str, symbol: str, timeframe: str, force: bool = False):
+        """[PERF] 미러 기록은 키별 mirror_interval 초에 1회 - 그 사이 압축은 표시만 하고 다음 기회/flush에 기록"""
+        now = time.monotonic()
+        with self._lock:
+            last = self._mirror_times.get(key)
+            if not force and last is not None and now - last < self.mirror_interval:
+                self._mirror_dirty[key] = (exchange, symbol, timeframe)
+                return
+            self._mirror_dirty.pop(key, None)
+            self._mirror_times[key] = now
+        self._write_mirror(key, legacy, exchange, symbol, timeframe)
+
+    def _write_mirror(self, key: str, legacy: Path, exchange: str, symbol: str, timeframe: str):
+        """기존 단일 파일 갱신 (파티션 + 델타, 버퍼 제외)"""
+        try:
+            df = self._read(key, include_buffer=False)
+            legacy.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomic(_to_ms(df), legacy)
+            self._save_legacy_state(key, self._legacy_signature(legacy))
+        except Exception as e:
+            logger.warning(f"[CANDLE-STORE] Mirror write failed ({legacy.name}): {e}")
+
+    def flush(self, wait: bool = True):
+        """버퍼의 진행 중 캔들 기록 + 예약된 압축 완료 대기 + 미뤄진 미러 기록 (종료 시 호출)"""
+        with self._lock:
+            keys = list(self._buffers)
+        for key in keys:
+            with self._key_lock(key):
+                pending = self._buffers.get(key) or {}
+                if pending:
+                    self._write_delta(key, pd.DataFrame([pending[ts] for ts in sorted(pending)]))
+                    pending.clear()
+        if wait and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if wait:
+            with self._lock:
+                dirty = list(self._mirror_dirty.items())
+            for key, (exchange, symbol, timeframe) in dirty:
+                with self._compact_locks[key]:
+                    if key in self._mirror_dirty:
+                        self._mirror(key, self.legacy_path(exchange, symbol, timeframe),
+                                     exchange, symbol, timeframe, force=True)
+
+    # ========== 조회 ==========
+
+    def read(self, exchange: str, symbol: str, timeframe: str,
+             start=None, end=None, include_buffer: bool = True) -> pd.DataFrame:
+        """
+        병합 조회 (timestamp 오름차순, 중복 없음)
+
+        Args:
+            start/end: 조회 구간 (포함, None이면 전체) - 해당 월 파티션만 읽음
+            include_buffer: 진행 중 캔들(메모리 버퍼) 포함 여부
+        """
+        key = self.key(exchange, symbol, timeframe)
+        with self._key_lock(key):
+            self._ensure_imported(key, exchange, symbol, timeframe)
+        self._refresh_legacy(key, exchange, symbol, timeframe)
+        return self._read(key, start, end, include_buffer)
+
+    def _read(self, key: str, start=None, end=None, include_buffer: bool = True) -> pd.DataFrame:
+        """파티션 + 델타 (+ 버퍼) 병합 조회 (가져오기/외부 변경 확인 없음 - 압축 락 보유 중에도 호출 가능)"""
+        with self._key_lock(key):
+            pending = list(self._buffers.get(key, {}).values()) if include_buffer else []
+
+        start = pd.Timestamp(start).tz_localize(None) if start is not None else None
+        end = pd.Timestamp(end).tz_localize(None) if end is not None else None
+        lo = start.strftime('%Y-%m') if start is not None else None
+        hi = end.strftime('%Y-%m') if end is not None else None
+
+        frames = self._read_files(key, lambda partitions: [
+            p for p in partitions if (lo is None or p.stem >= lo) and (hi is None or p.stem <= hi)])
+        if pending:
+            frames.append(_normalize(pd.DataFrame(pending)))
+
+        df = _merge(frames)
+        if start is not None:
+            df = df[df['timestamp'] >= start]
+        if end is not None:
+            df = df[df['timestamp'] <= end]
+        return df.reset_index(drop=True)
+
+    def tail(self, exchange: str, symbol: str, timeframe: str, n: int) -> pd.DataFrame:
+        """최근 n개 캔들 (최신 월 파티션부터 필요한 만큼만 읽음)"""
+        key = self.key(exchange, symbol, timeframe)
+        with self._key_lock(key):
+            self._ensure_imported(key, exchange, symbol, timeframe)
+        self._refresh_legacy(key, exchange, symbol, timeframe)
+        with self._key_lock(key):
+            pending = list(self._buffers.get(key, {}).values())
+
+        def latest(partitions: List[Path]) -> List[Path]:
+            # 파티션끼리는 월 단위로 겹치지 않으므로 파티션 행 수가 n 이상이면 충분
+            chosen, rows = [], 0
+            for path in reversed(partitions):
+                if rows >= n:
+                    break
+                chosen.insert(0, path)
+                rows += _parquet_rows(path)
+            return chosen
+
+        frames = self._read_files(key, latest)
+        if pending:
+            frames.append(_normalize(pd.DataFrame(pending)))
+        return _merge(frames).tail(n).reset_index(drop=True)
+
+    def last_timestamp(self, exchange: str, symbol: str, timeframe: str) -> Optional[pd.Timestamp]:
+        """가장 최근 캔들 시각 (없으면 None)"""
+        df = self.tail(exchange, symbol, timeframe, 1)
+        return df['timestamp'].iloc[-1] if len(df) else None
+
+    def _read_files(self, key: str, select: Callable[[List[Path]], List[Path]]) -> List[pd.DataFrame]:
+        """
+        선택한 파티션 + 델타 읽기 (압축과 겹쳐도 누락 없음)
+
+        압축은 파티션을 쓴 뒤 델타를 지우므로 델타 목록을 먼저 잡고 파티션을 읽은 다음,
+        잡아둔 델타가 하나라도 사라졌으면 (그 사이 압축) 목록부터 다시 읽음.
+        계속 겹치면 압축 락을 잡고 읽음 (압축 락 보유 중인 미러 기록은 첫 시도에서 끝남)
+        """
+        for _ in range(3):
+            deltas = self._list_deltas(key)
+            try:
+                frames = [_normalize(pd.read_parquet(p)) for p in select(self._list_partitions(key))]
+                frames += [_normalize(pd.read_parquet(p)) for p in deltas]
+            except FileNotFoundError:
+                continue
+            if all(p.exists() for p in deltas):
+                return frames
+        self._key_lock(key)
+        with self._compact_locks[key]:
+            frames = [_normalize(pd.read_parquet(p)) for p in select(self._list_partitions(key))]
+            return frames + [_normalize(pd.read_parquet(p)) for p in self._list_deltas(key)]
+
+    @property
+    def stats(self) -> Dict:
+        """키별 미압축 델타 수"""
+        with self._lock:
+            return {
+                'pending_deltas': dict(self._delta_counts),
+                'buffered': {k: len(v) for k, v in self._buffers.items() if v},
+                'scheduled': len(self._scheduled),
+                'mirror_pending': len(self._mirror_dirty),
+            }
+
+
+_candle_stores: Dict[str, CandleStore] = {}
+_candle_stores_lock = threading.Lock()
+
+
+def get_candle_store(cache_dir: Union[str, Path] = None) -> CandleStore:
+    """캔들 저장소 싱글톤 (캐시 디렉토리별)"""
+    cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+    key = str(cache_dir.resolve())
+    with _candle_stores_lock:
+        if key not in _candle_stores:
+            _candle_stores[key] = CandleStore(root=cache_dir / 'candles', legacy_dir=cache_dir)
+        return _candle_stores[key]
@@ -0,0 +1,362 @@
+"""
+거래소 마켓 메타데이터 캐시 (JSON 파일 + 메모리)
+- 키: (거래소, 마켓 타입, 테스트넷 여부) → ccxt markets/currencies
+- TTL 이내면 load_markets 대신 set_markets로 즉시 적용 (시작/다운로드/주문 경로 요청 제거)
+- TTL이 지났지만 max_age 이내면 캐시를 먼저 쓰고 백그라운드에서 갱신
+- 싱글톤은 주기 갱신 스레드를 함께 시작 (조회가 없어도 TTL 지난 엔트리 갱신, 종료 시 정지)
+- instrument(): 틱 사이즈 / 최소 수량 / 최대 레버리지 등 정규화 정보 (네트워크 요청 없음)
+"""
+
+import os
+import sys
+import atexit
+import json
+import logging
+import threading
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    from paths import Paths
+    DEFAULT_CACHE_DIR = Path(Paths.CACHE)
+except ImportError:
+    if getattr(sys, 'frozen', False):
+        _BASE_DIR = os.path.dirname(sys.executable)
+    else:
+        _BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    DEFAULT_CACHE_DIR = Path(_BASE_DIR) / 'data' / 'cache'
+
+DEFAULT_TTL = 6 * 3600           # 이 시간 안이면 그대로 사용
+DEFAULT_MAX_AGE = 7 * 86400      # 이 시간 안이면 사용 + 백그라운드 갱신
+
+# ccxt precisionMode
+_DECIMAL_PLACES = 2
+_TICK_SIZE = 4
+
+# 거래소별 기본 마켓 타입
+MARKET_TYPES = {'bithumb': 'spot', 'upbit': 'spot'}
+
+
+def _default_loader(exchange_id: str, market_type: str, sandbox: bool) -> Tuple[Dict, Dict, int]:
+    """공개 ccxt 클라이언트로 마켓 로드 → (markets, currencies, precisionMode)"""
+    import ccxt
+    client = getattr(ccxt, exchange_id)({
+        'enableRateLimit': True,
+        'options': {'defaultType': market_type, 'adjustForTimeDifference': True},
+        'timeout': 30000
+    })
+    if sandbox:
+        client.set_sandbox_mode(True)
+    client.load_markets()
+    return client.markets, client.currencies, client.precisionMode
+
+
+def _decimals(step: Optional[float]) -> Optional[int]:
+    """0.001 → 3 / 0.5 → 1 / 10 → 0"""
+    if not step or step <= 0:
+        return None
+    return max(0, -Decimal(repr(float(step))).normalize().as_tuple().exponent)
+
+
+class MarketMetadataCache:
+    """
+    마켓 메타데이터 캐시
+
+    Usage:
+        cache = get_market_cache()
+        cache.apply_to(client, 'bybit', 'swap')     # load_markets() 대체
+        info = cache.instrument('bybit', 'BTCUSDT')  # {'tick_size': 0.1, 'min_qty': 0.001, ...}
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = None, ttl: float = DEFAULT_TTL,
+                 max_age: float = DEFAULT_MAX_AGE,
+                 loader: Callable[[str, str, bool], Tuple[Dict, Dict, int]] = None,
+                 clock: Callable[[], float] = time.time):
+        self.root = Path(cache_dir or DEFAULT_CACHE_DIR) / 'markets'
+        self.ttl = ttl
+        self.max_age = max_age
+        self._loader = loader or _default_loader
+        self._clock = clock
+        self._entries: Dict[Tuple, Dict] = {}
+        self._id_index: Dict[Tuple, Dict[str, str]] = {}
+        self._refreshing: set = set()
+        self._lock = threading.RLock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._loads = 0
+        self._hits = 0
+
+    # ========== 키 / 파일 ==========
+
+    @staticmethod
+    def _key(exchange_id: str, market_type: str = None, sandbox: bool = False) -> Tuple[str, str, bool]:
+        exchange_id = exchange_id.lower()
+        return exchange_id, market_type or MARKET_TYPES.get(exchange_id, 'swap'), bool(sandbox)
+
+    def _path(self, key: Tuple[str, str, bool]) -> Path:
+        exchange_id, market_type, sandbox = key
+        return self.root / f"{exchange_id}_{market_type}{'_testnet' if sandbox else ''}.json"
+
+    def _read(self, key: Tuple) -> Optional[Dict]:
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            return entry if isinstance(entry.get('markets'), dict) else None
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"[MARKETS] Read failed {key}: {e}")
+            return None
+
+    def _write(self, key: Tuple, entry: Dict):
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            tmp = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, default=str)
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.debug(f"[MARKETS] Save failed {key}: {e}")
+
+    def _store(self, key: Tuple, markets: Dict, currencies: Optional[Dict], precision_mode: Optional[int],
+               persist: bool = True) -> Dict:
+        entry = {
+            'updated_at': self._clock(),
+            'precision_mode': precision_mode,
+            'markets': markets or {},
+            'currencies': currencies or {},
+        }
+        with self._lock:
+            self._entries[key] = entry
+            self._id_index.pop(key, None)
+        if persist:
+            self._write(key, entry)
+        return entry
+
+    # ========== 조회 ==========
+
+    def _cached(self, key: Tuple) -> Optional[Dict]:
+        """메모리 → 디스크 (max_age 초과는 무시)"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            entry = self._read(key)
+            if entry is not None:
+                with self._lock:
+                    entry = self._entries.setdefault(key, entry)
+        if entry is None or self._clock() - entry.get('updated_at', 0) > self.max_age:
+            return None
+        return entry
+
+    def _is_fresh(self, entry: Dict) -> bool:
+        return self._clock() - entry.get('updated_at', 0) <= self.ttl
+
+    def get_markets(self, exchange_id: str, market_type: str = None, sandbox: bool = False,
+                    fetch: bool = True) -> Optional[Dict]:
+        """
+        캐시 엔트리 {'markets', 'currencies', 'precision_mode', 'updated_at'}
+
+        Args:
+            fetch: 캐시가 없을 때 동기 로드 여부 (False면 백그라운드 로드 예약 후 None)
+        """
+        key = self._key(exchange_id, market_type, sandbox)
+        entry = self._cached(key)
+        if entry is not None:
+            with self._lock:
+                self._hits += 1
+            if not self._is_fresh(entry):
+                self.refresh_async(*key)
+            return entry
+        if not fetch:
+            self.refresh_async(*key)
+            return None
+        return self.refresh(*key)
+
+    def apply_to(self, client: Any, exchange_id: str, market_type: str = None, sandbox: bool = False) -> bool:
+        """
+        ccxt 클라이언트에 마켓 적용 (load_markets 대체)
+
+        캐시가 있으면 set_markets (요청 없음), 없으면 client.load_markets() 후 결과를 캐시에 저장
+
+        Returns:
+            True: 캐시 적용 / False: load_markets 실행
+        """
+        key = self._key(exchange_id, market_type, sandbox)
+        entry = self._cached(key)
+        if entry is not None and hasattr(client, 'set_markets'):
+            try:
+                client.set_markets(entry['markets'], entry.get('currencies') or None)
+                with self._lock:
+                    self._hits += 1
+                if not self._is_fresh(entry):
+                    self.refresh_async(*key)
+                return True
+            except Exception as e:
+                logger.debug(f"[MARKETS] set_markets failed {key}: {e}")
+
+        client.load_markets()
+        with self._lock:
+            self._loads += 1
+        self._store(key, getattr(client, 'markets', None) or {}, getattr(client, 'currencies', None),
+                    getattr(client, 'precisionMode', None))
+        return False
+
+    def refresh(self, exchange_id: str, market_type: str = None, sandbox: bool = False) -> Optional[Dict]:
+        """로더로 즉시 갱신 (실패 시 기존 엔트리 유지)"""
+        key = self._key(exchange_id, market_type, sandbox)
+        try:
+            markets, currencies, precision_mode = self._loader(*key)
+        except Exception as e:
+            logger.warning(f"[MARKETS] Refresh failed {key[0]}/{key[1]}: {e}")
+            with self._lock:
+                return self._entries.get(key)
+        entry = self._store(key, markets, currencies, precision_mode)
+        with self._lock:
+            self._loads += 1
+        logger.debug(f"[MARKETS] Refreshed {key[0]}/{key[1]}: {len(markets or {})} markets")
+        return entry
+
+    def refresh_async(self, exchange_id: str, market_type: str = None, sandbox: bool = False):
+        """백그라운드 갱신 (같은 키는 동시에 1개만)"""
+        key = self._key(exchange_id, market_type, sandbox)
+        if self._claim(key):
+            threading.Thread(target=self._refresh_claimed, args=(key,),
+                             name=f"MarketRefresh-{key[0]}", daemon=True).start()
+
+    def _claim(self, key: Tuple) -> bool:
+        """같은 키 갱신은 동시에 1개만 (이미 진행 중이면 False)"""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _refresh_claimed(self, key: Tuple):
+        try:
+            self.refresh(*key)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    # ========== 백그라운드 주기 갱신 ==========
+
+    def start_background_refresh(self, interval: float = None):
+        """알고 있는 엔트리 중 TTL이 지난 것을 주기적으로 갱신"""
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._stop_event.clear()
+            interval = interval or max(60.0, self.ttl / 4)
+
+            def loop():
+                while not self._stop_event.wait(interval):
+                    with self._lock:
+                        stale = [k for k, e in self._entries.items() if not self._is_fresh(e)]
+                    for key in stale:
+                        if self._stop_event.is_set():
+                            break
+                        if self._claim(key):
+                            self._refresh_claimed(key)
+
+            self._refresh_thread = threading.Thread(target=loop, name="MarketRefresh", daemon=True)
+            self._refresh_thread.start()
+
+    def stop_background_refresh(self, timeout: float = 5.0):
+        """주기 갱신 중지 (진행 중인 갱신은 timeout까지 대기)"""
+        self._stop_event.set()
+        thread = self._refresh_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    # ========== 정규화 정보 ==========
+
+    def _find_market(self, key: Tuple, entry: Dict, symbol: str) -> Optional[Dict]:
+        markets = entry['markets']
+        market = markets.get(symbol)
+        if market is not None:
+            return market
+        with self._lock:
+            index = self._id_index.get(key)
+            if index is None:
+                # 같은 ID가 여러 타입에 있으면 (bybit spot/linear 'BTCUSDT') 엔트리 타입 우선
+                index = {}
+                for name, m in markets.items():
+                    if not isinstance(m, dict) or not m.get('id'):
+                        continue
+                    market_id = str(m['id']).upper()
+                    if market_id not in index or m.get('type') == key[1]:
+                        index[market_id] = name
+                self._id_index[key] = index
+        name = index.get(symbol.replace('/', '').replace(':', '').replace('-', '').upper()) \
+            or index.get(symbol.upper())
+        return markets.get(name) if name else None
+
+    def instrument(self, exchange_id: str, symbol: str, market_type: str = None,
+                   sandbox: bool = False, fetch: bool = False) -> Optional[Dict]:
+        """
+        심볼 주문 규격 (ccxt 심볼 또는 거래소 ID: 'BTC/USDT:USDT', 'BTCUSDT')
+
+        Returns:
+            {'symbol', 'id', 'tick_size', 'qty_step', 'price_decimals', 'qty_decimals',
+             'min_qty', 'min_notional', 'max_leverage'} - 캐시에 없으면 None
+        """
+        key = self._key(exchange_id, market_type, sandbox)
+        entry = self.get_markets(*key, fetch=fetch)
+        if entry is None:
+            return None
+        market = self._find_market(key, entry, symbol)
+        if market is None:
+            return None
+
+        precision = market.get('precision') or {}
+        limits = market.get('limits') or {}
+        mode = entry.get('precision_mode')
+
+        def step_and_decimals(value):
+            if value is None:
+                return None, None
+            if mode == _DECIMAL_PLACES:
+                return 10 ** -int(value), int(value)
+            if mode == _TICK_SIZE:
+                return float(value), _decimals(float(value))
+            return None, None
+
+        tick_size, price_decimals = step_and_decimals(precision.get('price'))
+        qty_step, qty_decimals = step_and_decimals(precision.get('amount'))
+        return {
+            'symbol': market.get('symbol'),
+            'id': market.get('id'),
+            'tick_size': tick_size,
+            'qty_step': qty_step,
+            'price_decimals': price_decimals,
+            'qty_decimals': qty_decimals,
+            'min_qty': (limits.get('amount') or {}).get('min'),
+            'min_notional': (limits.get('cost') or {}).get('min'),
+            'max_leverage': (limits.get('leverage') or {}).get('max'),
+        }
+
+    @property
+    def stats(self) -> Dict:
+        """캐시 통계"""
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self._hits, 'loads': self._loads}
+
+
+_market_cache: Optional[MarketMetadataCache] = None
+_market_cache_lock = threading.Lock()
+
+
+def get_market_cache() -> MarketMetadataCache:
+    """마켓 메타데이터 캐시 싱글톤 (주기 갱신 시작, 프로세스 종료 시 정지)"""
+    global _market_cache
+    with _market_cache_lock:
+        if _market_cache is None:
+            _market_cache = MarketMetadataCache()
+            _market_cache.start_background_refresh()
+            atexit.register(_market_cache.stop_background_refresh)
+        return _market_cache
@@ -0,0 +1,334 @@
+"""
+멀티 타임프레임 리샘플 캐시 (피라미드)
+
+- 같은 원본 데이터(데이터 지문)는 상위 TF별로 한 번만 리샘플
+- 큰 원본의 결과는 parquet 캐시 옆({cache}/resampled/)에 저장 → 재실행/다른 프로세스에서 재사용
+- 실시간: ResamplePyramid가 새 원본 캔들이 들어올 때 마지막(및 잘려나간 첫) 구간만 다시 계산
+
+결과는 utils.data_utils.compute_resample과 동일 (같은 pandas 리샘플을 영향받는 구간에만 적용)
+"""
+
+import os
+import re
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from utils.data_utils import compute_resample, data_fingerprint, _add_indicators
+
+logger = logging.getLogger(__name__)
+
+try:
+    from paths import Paths
+    DEFAULT_CACHE_DIR = Path(Paths.CACHE)
+except ImportError:
+    DEFAULT_CACHE_DIR = Path(__file__).parent.parent / 'data' / 'cache'
+
+# 기본 피라미드 TF (pandas 규칙)
+PYRAMID_RULES = ('1h', '4h', '1D')
+
+_FP_COLUMNS = ('datetime', 'timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+
+def _is_sliceable(rule: str) -> bool:
+    """
+    구간 일부만 다시 계산해도 되는 규칙인지
+    - 왼쪽 라벨 + 경계가 데이터 시작점과 무관: 하루를 나누어떨어지는 고정 간격, 1D
+    - 주봉/월봉은 오른쪽 라벨이라 제외 (항상 전체 계산)
+    """
+    try:
+        offset = pd.tseries.frequencies.to_offset(rule)
+    except ValueError:
+        return False
+    if isinstance(offset, pd.offsets.Day):
+        return offset.n == 1
+    try:
+        step = pd.Timedelta(offset)
+    except (ValueError, TypeError):
+        return False
+    day = pd.Timedelta(days=1)
+    return step <= day and day % step == pd.Timedelta(0)
+
+
+class ResampleCache:
+    """
+    데이터 지문 기준 리샘플 결과 캐시
+
+    Usage:
+        cache = get_resample_cache()
+        df_1h = cache.resample(df_15m, '1h')                      # 복사본 반환
+        frames = cache.pyramid(df_15m, ('1h', '4h', '1D'))         # 모든 상위 TF 한 번에
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = None, max_items: int = 64,
+                 persist: bool = True, persist_min_rows: int = 20000, max_files: int = 256):
+        """
+        Args:
+            cache_dir: parquet 캐시 디렉토리 (결과는 {cache_dir}/resampled/ 아래 저장)
+            max_items: 메모리 LRU 최대 항목 수
+            persist: 디스크 저장 여부
+            persist_min_rows: 이 행 수 이상인 원본만 디스크 저장 (실시간 소형 프레임 제외)
+            max_files: 디스크 파일 최대 개수 (오래된 것부터 삭제)
+        """
+        self.root = Path(cache_dir or DEFAULT_CACHE_DIR) / 'resampled'
+        self.max_items = max_items
+        self.persist = persist
+        self.persist_min_rows = persist_min_rows
+        self.max_files = max_files
+        self._frames: 'OrderedDict[Tuple, pd.DataFrame]' = OrderedDict()
+        self._fingerprints: Dict[int, Tuple[weakref.ref, Tuple, str]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _probe(df: pd.DataFrame) -> Tuple:
+        """
+        제자리 변경 감지용 요약 (길이, 컬럼/dtype, 첫/마지막 행 값)
+
+        실시간 경로의 제자리 변경(캔들 추가, 진행 중 캔들 갱신, 잘라내기)은 모두 이 값을 바꿈
+        """
+        cols = [c for c in _FP_COLUMNS if c in df.columns]
+        edges = df[cols].iloc[[0, -1]].to_numpy().ravel().tolist() if len(df) and cols else []
+        return len(df), tuple(df.columns), tuple(str(df[c].dtype) for c in cols), tuple(edges)
+
+    def fingerprint(self, df: pd.DataFrame) -> str:
+        """원본 지문 (같은 객체이고 요약 값이 그대로면 재계산하지 않음)"""
+        key = id(df)
+        probe = self._probe(df)
+        with self._lock:
+            entry = self._fingerprints.get(key)
+            if entry is not None and entry[0]() is df and entry[1] == probe:
+                return entry[2]
+
+        # 숫자(ms)와 datetime timestamp는 값 해시가 같을 수 있어 dtype도 키에 포함
+        ts_dtype = re.sub(r'\W', '', str(df['timestamp'].dtype)) if 'timestamp' in df.columns else 'none'
+        fp = f"{data_fingerprint(df, _FP_COLUMNS)}_{ts_dtype}"
+        with self._lock:
+            try:
+                self._fingerprints[key] = (weakref.ref(df), probe, fp)
+            except TypeError:
+                pass
+            if len(self._fingerprints) > self.max_items * 4:
+                self._fingerprints = {k: v for k, v in self._fingerprints.items() if v[0]() is not None}
+        return fp
+
+    def _path(self, fp: str, rule: str, time_column: Optional[str]) -> Path:
+        return self.root / f"{fp}_{time_column or 'auto'}_{rule}.parquet"
+
+    def _remember(self, key: Tuple, frame: pd.DataFrame):
+        with self._lock:
+            self._frames[key] = frame
+            self._frames.move_to_end(key)
+            while len(self._frames) > self.max_items:
+                self._frames.popitem(last=False)
+
+    def _load(self, path: Path) -> Optional[pd.DataFrame]:
+        try:
+            return pd.read_parquet(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"[RESAMPLE-CACHE] Read failed {path.name}: {e}")
+            return None
+
+    def _save(self, path: Path, frame: pd.DataFrame):
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+            frame.to_parquet(tmp, index=False)
+            os.replace(tmp, path)
+            files = sorted(self.root.glob('*.parquet'), key=lambda p: p.stat().st_mtime)
+            for old in files[:max(0, len(files) - self.max_files)]:
+                old.unlink(missing_ok=True)
+        except Exception as e:
+            logger.debug(f"[RESAMPLE-CACHE] Save failed {path.name}: {e}")
+
+    def _raw(self, df: pd.DataFrame, rule: str, time_column: Optional[str]) -> pd.DataFrame:
+        """캐시된 리샘플 결과 (공유 객체 - 수정 금지)"""
+        fp = self.fingerprint(df)
+        key = (fp, rule, time_column, False)
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is not None:
+                self._frames.move_to_end(key)
+                self._hits += 1
+                return frame
+
+        persist = self.persist and len(df) >= self.persist_min_rows
+        path = self._path(fp, rule, time_column)
+        frame = self._load(path) if persist else None
+        if frame is not None:
+            with self._lock:
+                self._disk_hits += 1
+        else:
+            frame = compute_resample(df, rule, time_column)
+            with self._lock:
+                self._misses += 1
+            if persist:
+                self._save(path, frame)
+        self._remember(key, frame)
+        return frame
+
+    def resample(self, df: pd.DataFrame, rule: str, add_indicators: bool = False,
+                 time_column: str = None) -> pd.DataFrame:
+        """
+        리샘플 결과 (호출자가 수정해도 되는 복사본)
+
+        Args:
+            df: 원본 OHLCV
+            rule: pandas 리샘플 규칙 ('1h', '4h', '1D' 등)
+            add_indicators: resample_data와 같은 지표 추가 여부
+            time_column: 기준 시간 컬럼 (None이면 datetime 우선, 없으면 timestamp)
+        """
+        if not add_indicators:
+            return self._raw(df, rule, time_column).copy()
+
+        key = (self.fingerprint(df), rule, time_column, True)
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is not None:
+                self._frames.move_to_end(key)
+                self._hits += 1
+        if frame is None:
+            frame = _add_indicators(self._raw(df, rule, time_column).copy())
+            self._remember(key, frame)
+        return frame.copy()
+
+    def pyramid(self, df: pd.DataFrame, rules: Iterable[str] = PYRAMID_RULES,
+                time_column: str = None) -> Dict[str, pd.DataFrame]:
+        """여러 상위 TF를 한 번에 (이미 만든 TF는 재사용)"""
+        return {rule: self._raw(df, rule, time_column).copy() for rule in rules}
+
+    def clear(self):
+        """메모리 캐시 비우기 (디스크 파일은 유지)"""
+        with self._lock:
+            self._frames.clear()
+            self._fingerprints.clear()
+            self._hits = self._disk_hits = self._misses = 0
+
+    @property
+    def stats(self) -> Dict:
+        """캐시 통계"""
+        return {
+            'items': len(self._frames),
+            'hits': self._hits,
+            'disk_hits': self._disk_hits,
+            'misses': self._misses,
+        }
+
+
+class ResamplePyramid:
+    """
+    실시간 원본 캔들 → 상위 TF 프레임 (증분 갱신)
+
+    update(df)는 직전 원본과 이어지는지 확인한 뒤
+      - 뒤에 붙은 캔들: 마지막 구간부터만 다시 리샘플
+      - 앞에서 잘린 캔들(최대 N개 유지): 첫 구간만 다시 리샘플
+    이어지지 않으면(과거 캔들 보충/수정) 전체를 다시 계산한다.
+
+    Usage:
+        pyramid = ResamplePyramid(('1h', '4h'), time_column='timestamp')
+        frames = pyramid.update(df_entry_full)     # {rule: DataFrame}
+    """
+
+    def __init__(self, rules: Iterable[str] = PYRAMID_RULES, time_column: str = None):
+        self.rules: List[str] = list(dict.fromkeys(rules))
+        self.time_column = time_column
+        self.frames: Dict[str, pd.DataFrame] = {}
+        self._first_ts = None
+        self._last_ts = None
+        self._prev_times: Optional[pd.DatetimeIndex] = None
+        self._lock = threading.Lock()
+        self.full_rebuilds = 0
+
+    def reset(self):
+        """상태 초기화 (다음 update에서 전체 계산)"""
+        with self._lock:
+            self.frames = {}
+            self._first_ts = self._last_ts = None
+            self._prev_times = None
+
+    def _times(self, df: pd.DataFrame) -> pd.Series:
+        """원본 기준 시간 (compute_resample과 같은 변환)"""
+        source = self.time_column or ('datetime' if 'datetime' in df.columns else 'timestamp')
+        if source == 'datetime':
+            return df['datetime']
+        if pd.api.types.is_numeric_dtype(df[source]):
+            return pd.to_datetime(df[source], unit='ms')
+        return pd.to_datetime(df[source])
+
+    def _aligned(self, times: pd.Series) -> bool:
+        """직전 원본의 마지막 캔들이 남아 있고 앞부분만 잘렸는지 (마지막 캔들 값 변경은 뒤쪽 재계산으로 반영)"""
+        if self._last_ts is None or not times.is_monotonic_increasing:
+            return False
+        if times.iloc[0] < self._first_ts:
+            return False
+        pos = int(times.searchsorted(self._last_ts))
+        if pos >= len(times) or times.iloc[pos] != self._last_ts:
+            return False
+        # 중간 캔들 보충/삭제: 겹치는 구간의 캔들 수가 달라짐
+        skipped = int(self._prev_times.searchsorted(times.iloc[0]))
+        return len(self._prev_times) - skipped == pos + 1
+
+    def _update_frame(self, frame: pd.DataFrame, df: pd.DataFrame, times: pd.Series,
+                      rule: str, head_trimmed: bool) -> pd.DataFrame:
+        labels = frame['datetime']
+        if len(frame) < 3 or not _is_sliceable(rule):
+            return compute_resample(df, rule, self.time_column)
+
+        # 앞쪽: 잘린 구간 제거, 새 첫 캔들이 속한 구간만 다시 계산
+        if head_trimmed:
+            first_time = times.iloc[0]
+            head = int(labels.searchsorted(first_time, side='right')) - 1
+            if head + 1 >= len(frame) - 1:
+                return compute_resample(df, rule, self.time_column)
+            next_label = labels.iloc[head + 1]
+            head_rows = compute_resample(df.iloc[:int(times.searchsorted(next_label))], rule, self.time_column)
+            frame = pd.concat([head_rows, frame.iloc[head + 1:]], ignore_index=True)
+            labels = frame['datetime']
+
+        # 뒤쪽: 마지막 구간(진행 중일 수 있음)부터 다시 계산
+        last_label = labels.iloc[-1]
+        tail_rows = compute_resample(df.iloc[int(times.searchsorted(last_label)):], rule, self.time_column)
+        return pd.concat([frame.iloc[:-1], tail_rows], ignore_index=True)
+
+    def update(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """
+        원본과 동기화 → {rule: 리샘플 프레임} (공유 객체 - 수정 금지)
+        """
+        if df is None or df.empty:
+            return {}
+        with self._lock:
+            times = self._times(df)
+            if not self.frames or not self._aligned(times):
+                self.frames = {rule: compute_resample(df, rule, self.time_column) for rule in self.rules}
+                self.full_rebuilds += 1
+            else:
+                head_trimmed = times.iloc[0] != self._first_ts
+                self.frames = {
+                    rule: self._update_frame(self.frames[rule], df, times, rule, head_trimmed)
+                    for rule in self.rules
+                }
+            self._first_ts, self._last_ts = times.iloc[0], times.iloc[-1]
+            self._prev_times = pd.DatetimeIndex(times)
+            return dict(self.frames)
+
+
+_resample_cache: Optional[ResampleCache] = None
+_resample_cache_lock = threading.Lock()
+
+
+def get_resample_cache() -> ResampleCache:
+    """리샘플 캐시 싱글톤"""
+    global _resample_cache
+    with _resample_cache_lock:
+        if _resample_cache is None:
+            _resample_cache = ResampleCache()
+        return _resample_cache
@@ -0,0 +1,277 @@
+"""
+파라미터 평가 결과 영구 저장소 (SQLite)
+- 키: (네임스페이스, 데이터 지문, 전략/지표 코드 버전, 정규화 파라미터)
+- 같은 심볼/데이터로 재실행 시 이미 평가한 조합은 건너뜀
+- 필터에서 탈락한 조합도 저장 (metrics=None) → 재평가하지 않음
+- 워커 실패(EvaluationFailed)는 저장하지 않음 → 다음 실행에서 재평가
+"""
+
+import os
+import sys
+import json
+import hashlib
+import importlib.util
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    from paths import Paths
+    DEFAULT_DB_PATH = str(Paths.CACHE / 'optimization_results.db')
+except ImportError:
+    if getattr(sys, 'frozen', False):
+        _BASE_DIR = os.path.dirname(sys.executable)
+    else:
+        _BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    DEFAULT_DB_PATH = os.path.join(_BASE_DIR, 'data', 'cache', 'optimization_results.db')
+
+# 미평가와 구분하기 위한 "평가 완료, 결과 없음" 표시
+NO_RESULT = None
+_MISSING = object()
+
+
+class EvaluationFailed:
+    """
+    워커 평가 실패 표시 (필터 탈락 None과 구분, pickle 가능)
+
+    예외(MemoryError, 공유 메모리 attach 실패 등)는 일시적일 수 있으므로 저장소에 기록하지 않는다.
+    bool 값은 False → 결과 없음으로 취급하는 기존 `if result:` 분기는 그대로 동작.
+    """
+    __slots__ = ('error', 'params')
+
+    def __init__(self, error=None, params: Dict = None):
+        self.error = f"{type(error).__name__}: {error}" if isinstance(error, BaseException) else str(error or '')
+        self.params = params
+
+    def __bool__(self):
+        return False
+
+    def __eq__(self, other):
+        return isinstance(other, EvaluationFailed) and (self.error, self.params) == (other.error, other.params)
+
+    def __repr__(self):
+        return f"EvaluationFailed({self.error!r})"
+
+
+def _normalize_value(value):
+    """키 정규화: 5 == 5.0, 리스트/튜플 재귀, numpy 스칼라는 파이썬 값으로"""
+    if hasattr(value, 'item') and not isinstance(value, (list, tuple, dict)):
+        try:
+            value = value.item()
+        except (ValueError, AttributeError):
+            pass
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        f = round(float(value), 10)
+        return int(f) if f.is_integer() else f
+    if isinstance(value, (list, tuple)):
+        return [_normalize_value(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _normalize_value(v) for k, v in value.items()}
+    return str(value)
+
+
+def _json_default(value):
+    """numpy 스칼라 등 JSON 직렬화 보조"""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def normalize_params(params: Dict) -> str:
+    """파라미터 dict → 정규화 JSON 문자열 (키 정렬)"""
+    return json.dumps(_normalize_value(params), sort_keys=True, separators=(',', ':'))
+
+
+# 캐시된 지표가 의존하는 모듈 (전략/커널 + 지표 계산/필터) - 소스가 바뀌면 기존 결과 자동 무효화
+VERSION_SOURCES = (
+    'core.strategy_core',
+    'core.backtest_kernel',
+    'core.optimizer',            # calculate_metrics / _evaluate_trades
+    'core.optimization_logic',   # _run_backtest_task 지표/필터
+    'core.multi_optimizer',      # _evaluate_combo / MIN_TRADES
+    'config.parameters',         # DEFAULT_PARAMS / ACTIVE_PARAMS (그리드에 없는 파라미터 기본값)
+)
+# 위 모듈 밖(유틸 등)의 지표 계산을 바꿀 때 올림
+METRICS_VERSION = 1
+
+_strategy_version_cache: Optional[str] = None
+
+
+def _source_bytes(module_name: str) -> bytes:
+    """모듈 소스 (import 없이 경로만 찾음 → 저장소를 import하는 모듈과 순환 import 없음)"""
+    spec = importlib.util.find_spec(module_name)
+    with open(spec.origin, 'rb') as f:
+        return f.read()
+
+
+def strategy_version() -> str:
+    """전략/지표 코드 버전 (VERSION_SOURCES 소스 해시 + METRICS_VERSION) - 코드 변경 시 자동 무효화"""
+    global _strategy_version_cache
+    if _strategy_version_cache is None:
+        h = hashlib.blake2b(digest_size=8)
+        h.update(f"metrics:{METRICS_VERSION}".encode())
+        for module_name in VERSION_SOURCES:
+            h.update(module_name.encode())
+            try:
+                h.update(_source_bytes(module_name))
+            except Exception as e:
+                logger.debug(f"[RESULT-STORE] Source hash failed ({module_name}): {e}")
+                h.update(b'unknown')
+        _strategy_version_cache = h.hexdigest()
+    return _strategy_version_cache
+
+
+class ResultStore:
+    """
+    파라미터 평가 결과 저장소
+
+    Usage:
+        store = get_result_store()
+        cached = store.get_many('engine', data_fp, [params1, params2])   # {params_key: metrics or None}
+        store.put_many('engine', data_fp, [(params1, metrics1), (params2, None)])
+    """
+
+    def __init__(self, db_path: str = None, version: str = None):
+        self.db_path = db_path or DEFAULT_DB_PATH
+        self.version = version or strategy_version()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._hits = 0
+        self._misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS evaluations (
+                    namespace TEXT NOT NULL,
+                    data_fp TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    params_key TEXT NOT NULL,
+                    metrics TEXT,
+                    created_at TEXT,
+                    PRIMARY KEY (namespace, data_fp, version, params_key)
+                )
+            ''')
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def key(params: Dict) -> str:
+        """저장소 키 (정규화 파라미터)"""
+        return normalize_params(params)
+
+    def get(self, namespace: str, data_fp: str, params: Dict, default=_MISSING):
+        """단일 조회 - 미평가면 default (기본: KeyError)"""
+        found = self.get_many(namespace, data_fp, [params])
+        key = self.key(params)
+        if key in found:
+            return found[key]
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def get_many(self, namespace: str, data_fp: str, params_list: Iterable[Dict]) -> Dict[str, Optional[Dict]]:
+        """
+        일괄 조회
+
+        Returns:
+            {params_key: metrics dict 또는 None(평가됨, 결과 없음)} - 미평가 키는 포함되지 않음
+        """
+        keys = list(dict.fromkeys(self.key(p) for p in params_list))
+        found: Dict[str, Optional[Dict]] = {}
+        if not keys:
+            return found
+        with self._lock:
+            try:
+                conn = self._connect()
+                for start in range(0, len(keys), 500):
+                    batch = keys[start:start + 500]
+                    placeholders = ','.join('?' * len(batch))
+                    rows = conn.execute(
+                        f'SELECT params_key, metrics FROM evaluations '
+                        f'WHERE namespace=? AND data_fp=? AND version=? AND params_key IN ({placeholders})',
+                        [namespace, data_fp, self.version, *batch]
+                    ).fetchall()
+                    for params_key, metrics in rows:
+                        found[params_key] = json.loads(metrics) if metrics is not None else NO_RESULT
+            except sqlite3.Error as e:
+                logger.warning(f"[RESULT-STORE] Lookup failed: {e}")
+            self._hits += len(found)
+            self._misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, namespace: str, data_fp: str, items: Iterable[Tuple[Dict, Optional[Dict]]]):
+        """일괄 저장 (metrics=None은 '평가 완료, 결과 없음')"""
+        now = datetime.now().isoformat()
+        rows = [
+            (namespace, data_fp, self.version, self.key(params),
+             json.dumps(metrics, default=_json_default) if metrics is not None else None, now)
+            for params, metrics in items
+        ]
+        if not rows:
+            return
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.executemany('INSERT OR REPLACE INTO evaluations VALUES (?, ?, ?, ?, ?, ?)', rows)
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"[RESULT-STORE] Save failed: {e}")
+
+    def put(self, namespace: str, data_fp: str, params: Dict, metrics: Optional[Dict]):
+        """단일 저장"""
+        self.put_many(namespace, data_fp, [(params, metrics)])
+
+    def clear(self, namespace: str = None):
+        """저장소 비우기 (namespace 지정 시 해당 네임스페이스만)"""
+        with self._lock:
+            conn = self._connect()
+            if namespace:
+                conn.execute('DELETE FROM evaluations WHERE namespace=?', (namespace,))
+            else:
+                conn.execute('DELETE FROM evaluations')
+            conn.commit()
+            self._hits = 0
+            self._misses = 0
+
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @property
+    def stats(self) -> Dict:
+        """조회 통계"""
+        total = self._hits + self._misses
+        hit_rate = (self._hits / total * 100) if total > 0 else 0
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_rate': f"{hit_rate:.1f}%"
+        }
+
+
+_result_store: Optional[ResultStore] = None
+_result_store_lock = threading.Lock()
+
+
+def get_result_store() -> ResultStore:
+    """결과 저장소 싱글톤"""
+    global _result_store
+    with _result_store_lock:
+        if _result_store is None:
+            _result_store = ResultStore()
+        return _result_store
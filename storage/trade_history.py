@@ -2,15 +2,18 @@
 거래 내역 및 수익 통계 시스템
 - 거래 내역 저장/조회
 - 일별/주별/월별 수익 통계
+- [PERF] WAL + 연결 재사용, (symbol, exit_time) 커버링 인덱스, 트리거 기반 증분 집계 테이블
 """
 
 import os
 import sys
 import json
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 
 @dataclass
@@ -40,85 +43,262 @@ else:
 DB_PATH = os.path.join(BASE_DIR, 'data', 'trades.db')
 
 
+# 스키마 버전 (PRAGMA user_version) - 인덱스/집계 테이블/트리거 추가 시 증가
+SCHEMA_VERSION = 1
+
+_TRADE_COLUMNS = (
+    'symbol', 'exchange', 'side', 'entry_price', 'exit_price',
+    'quantity', 'pnl', 'pnl_percent', 'entry_time', 'exit_time', 'reason'
+)
+_INSERT_SQL = (
+    f"INSERT INTO trades ({', '.join(_TRADE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_TRADE_COLUMNS))})"
+)
+_SELECT_SQL = f"SELECT id, {', '.join(_TRADE_COLUMNS)} FROM trades"
+
+# [PERF] 인덱스 + 증분 집계 (트리거로 INSERT/DELETE 시 같은 트랜잭션에서 갱신)
+_SCHEMA_V1 = [
+    # 심볼별 기간 조회 / 손익 집계 (커버링)
+    'CREATE INDEX IF NOT EXISTS idx_trades_symbol_exit ON trades (symbol, exit_time, pnl)',
+    # 기간 조회 + 최신순 정렬
+    'CREATE INDEX IF NOT EXISTS idx_trades_exit ON trades (exit_time)',
+    '''
+        CREATE TABLE IF NOT EXISTS daily_stats (
+            date TEXT PRIMARY KEY,
+            trades INTEGER NOT NULL DEFAULT 0,
+            wins INTEGER NOT NULL DEFAULT 0,
+            pnl REAL
+        )
+    ''',
+    '''
+        CREATE TABLE IF NOT EXISTS trade_totals (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            trades INTEGER NOT NULL DEFAULT 0,
+            wins INTEGER NOT NULL DEFAULT 0,
+            pnl REAL,
+            best REAL,
+            worst REAL
+        )
+    ''',
+    '''
+        CREATE TRIGGER IF NOT EXISTS trg_trades_insert AFTER INSERT ON trades
+        BEGIN
+            INSERT INTO daily_stats (date, trades, wins, pnl)
+            SELECT DATE(NEW.exit_time), 1, COALESCE(NEW.pnl > 0, 0), NEW.pnl
+            WHERE DATE(NEW.exit_time) IS NOT NULL
+            ON CONFLICT (date) DO UPDATE SET
+                trades = trades + 1,
+                wins = wins + excluded.wins,
+                pnl = CASE WHEN excluded.pnl IS NULL THEN pnl ELSE COALESCE(pnl, 0) + excluded.pnl END;
+            UPDATE trade_totals SET
+                trades = trades + 1,
+                wins = wins + COALESCE(NEW.pnl > 0, 0),
+                pnl = CASE WHEN NEW.pnl IS NULL THEN pnl ELSE COALESCE(pnl, 0) + NEW.pnl END,
+                best = CASE WHEN best IS NULL OR NEW.pnl > best THEN COALESCE(NEW.pnl, best) ELSE best END,
+                worst = CASE WHEN worst IS NULL OR NEW.pnl < worst THEN COALESCE(NEW.pnl, worst) ELSE worst END
+            WHERE id = 1;
+        END
+    ''',
+    '''
+        CREATE TRIGGER IF NOT EXISTS trg_trades_delete AFTER DELETE ON trades
+        BEGIN
+            UPDATE daily_stats SET
+                trades = trades - 1,
+                wins = wins - COALESCE(OLD.pnl > 0, 0),
+                pnl = CASE WHEN OLD.pnl IS NULL THEN pnl ELSE pnl - OLD.pnl END
+            WHERE date = DATE(OLD.exit_time);
+            DELETE FROM daily_stats WHERE date = DATE(OLD.exit_time) AND trades <= 0;
+            UPDATE trade_totals SET
+                trades = trades - 1,
+                wins = wins - COALESCE(OLD.pnl > 0, 0),
+                pnl = CASE WHEN OLD.pnl IS NULL THEN pnl ELSE pnl - OLD.pnl END,
+                best = (SELECT MAX(pnl) FROM trades),
+                worst = (SELECT MIN(pnl) FROM trades)
+            WHERE id = 1;
+        END
+    ''',
+]
+
+
 class TradeHistory:
-    """거래 내역 관리"""
+    """
+    거래 내역 관리
+
+    - [PERF] 연결 재사용: 쓰기 연결 1개(락) + 읽기 연결 풀 (WAL → 쓰기 중에도 읽기 가능)
+      읽기 연결은 유휴 상태로 최대 READER_POOL개만 보관 (짧게 사는 스레드가 많아도 연결 수 고정)
+    - 일별/전체 통계는 트리거로 증분 유지되는 집계 테이블에서 조회 (거래 수와 무관)
+    """
+    
+    READER_POOL = 4  # 보관할 유휴 읽기 연결 수
     
-    def __init__(self):
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or DB_PATH
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pool_lock = threading.Lock()                # 쓰기 락과 분리 (쓰기 중에도 읽기 연결 대여)
+        self._idle_readers: List[sqlite3.Connection] = []
         self._init_db()
     
+    # ========== 연결 ==========
+    
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+    
+    def _writer(self) -> sqlite3.Connection:
+        """쓰기 연결 (self._lock 안에서 사용)"""
+        if self._conn is None:
+            self._conn = self._open()
+        return self._conn
+    
+    @contextmanager
+    def _reader(self):
+        """읽기 연결 대여 (유휴 연결 재사용, 반납 시 풀이 가득 차 있으면 닫음)"""
+        with self._pool_lock:
+            conn = self._idle_readers.pop() if self._idle_readers else None
+        if conn is None:
+            conn = self._open()
+        try:
+            yield conn
+        finally:
+            with self._pool_lock:
+                keep = len(self._idle_readers) < self.READER_POOL
+                if keep:
+                    self._idle_readers.append(conn)
+            if not keep:
+                conn.close()
+    
+    def close(self):
+        """모든 연결 닫기 (대여 중인 읽기 연결은 반납 시 풀로 돌아옴)"""
+        with self._pool_lock:
+            readers, self._idle_readers = self._idle_readers, []
+        with self._lock:
+            for conn in readers + ([self._conn] if self._conn else []):
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._conn = None
+    
+    # ========== 스키마 ==========
+    
     def _init_db(self):
-        """데이터베이스 초기화"""
-        os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-        
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
+        """데이터베이스 초기화 (기존 DB는 인덱스/집계 테이블 추가 후 집계 재구성)"""
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
         
+        with self._lock:
+            conn = self._writer()
+            c = conn.cursor()
+            
+            c.execute('''
+                CREATE TABLE IF NOT EXISTS trades (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    symbol TEXT,
+                    exchange TEXT,
+                    side TEXT,
+                    entry_price REAL,
+                    exit_price REAL,
+                    quantity REAL,
+                    pnl REAL,
+                    pnl_percent REAL,
+                    entry_time TEXT,
+                    exit_time TEXT,
+                    reason TEXT,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            version = c.execute('PRAGMA user_version').fetchone()[0]
+            if version < SCHEMA_VERSION:
+                for statement in _SCHEMA_V1:
+                    c.execute(statement)
+                self._rebuild_aggregates(c)
+                c.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            
+            conn.commit()
+    
+    @staticmethod
+    def _rebuild_aggregates(c: sqlite3.Cursor):
+        """집계 테이블을 trades 전체로부터 다시 계산"""
+        c.execute('DELETE FROM daily_stats')
         c.execute('''
-            CREATE TABLE IF NOT EXISTS trades (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT,
-                exchange TEXT,
-                side TEXT,
-                entry_price REAL,
-                exit_price REAL,
-                quantity REAL,
-                pnl REAL,
-                pnl_percent REAL,
-                entry_time TEXT,
-                exit_time TEXT,
-                reason TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
+            INSERT INTO daily_stats (date, trades, wins, pnl)
+            SELECT DATE(exit_time), COUNT(*), SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END), SUM(pnl)
+            FROM trades
+            WHERE DATE(exit_time) IS NOT NULL
+            GROUP BY DATE(exit_time)
         ''')
-        
-        conn.commit()
-        conn.close()
-    
-    def add_trade(self, trade: TradeRecord) -> int:
-        """거래 추가"""
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        
+        c.execute('DELETE FROM trade_totals')
         c.execute('''
-            INSERT INTO trades (
-                symbol, exchange, side, entry_price, exit_price,
-                quantity, pnl, pnl_percent, entry_time, exit_time, reason
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+            INSERT INTO trade_totals (id, trades, wins, pnl, best, worst)
+            SELECT 1, COUNT(*), COALESCE(SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END), 0),
+                   SUM(pnl), MAX(pnl), MIN(pnl)
+            FROM trades
+        ''')
+    
+    def rebuild_stats(self):
+        """집계 테이블 재구성 (외부 도구로 trades를 직접 수정한 경우)"""
+        with self._lock:
+            conn = self._writer()
+            self._rebuild_aggregates(conn.cursor())
+            conn.commit()
+    
+    # ========== 기록 ==========
+    
+    @staticmethod
+    def _row(trade: TradeRecord) -> tuple:
+        return (
             trade.symbol, trade.exchange, trade.side,
             trade.entry_price, trade.exit_price, trade.quantity,
             trade.pnl, trade.pnl_percent, trade.entry_time, trade.exit_time,
             trade.reason
-        ))
-        
-        trade_id = c.lastrowid
-        conn.commit()
-        conn.close()
+        )
+    
+    def add_trade(self, trade: TradeRecord) -> int:
+        """거래 추가"""
+        with self._lock:
+            conn = self._writer()
+            c = conn.execute(_INSERT_SQL, self._row(trade))
+            trade_id = c.lastrowid
+            conn.commit()
         
         return trade_id
     
-    def get_trades(self, days: int = 30, exchange: str = None) -> List[TradeRecord]:
+    def add_trades(self, trades: Iterable[TradeRecord]) -> int:
+        """[PERF] 일괄 추가 (단일 트랜잭션 + 준비된 INSERT 재사용) → 추가 건수"""
+        rows = [self._row(t) for t in trades]
+        if not rows:
+            return 0
+        with self._lock:
+            conn = self._writer()
+            try:
+                conn.executemany(_INSERT_SQL, rows)
+                conn.commit()
+            except sqlite3.Error:
+                conn.rollback()
+                raise
+        return len(rows)
+    
+    # ========== 조회 ==========
+    
+    def get_trades(self, days: int = 30, exchange: str = None, symbol: str = None) -> List[TradeRecord]:
         """거래 내역 조회"""
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        
         since = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
         
+        query = f"{_SELECT_SQL} WHERE exit_time >= ?"
+        params = [since]
+        if symbol:
+            query += " AND symbol = ?"
+            params.append(symbol)
         if exchange:
-            c.execute('''
-                SELECT * FROM trades
-                WHERE exit_time >= ? AND exchange = ?
-                ORDER BY exit_time DESC
-            ''', (since, exchange))
-        else:
-            c.execute('''
-                SELECT * FROM trades
-                WHERE exit_time >= ?
-                ORDER BY exit_time DESC
-            ''', (since,))
+            query += " AND exchange = ?"
+            params.append(exchange)
+        query += " ORDER BY exit_time DESC"
         
-        rows = c.fetchall()
-        conn.close()
+        with self._reader() as conn:
+            rows = conn.execute(query, params).fetchall()
         
         trades = []
         for row in rows:
@@ -132,26 +312,16 @@ class TradeHistory:
         return trades
     
     def get_daily_stats(self, days: int = 30) -> List[dict]:
-        """일별 통계"""
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        
+        """일별 통계 (daily_stats 집계 테이블)"""
         since = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
         
-        c.execute('''
-            SELECT 
-                DATE(exit_time) as date,
-                COUNT(*) as trades,
-                SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) as wins,
-                SUM(pnl) as total_pnl
-            FROM trades
-            WHERE exit_time >= ?
-            GROUP BY DATE(exit_time)
-            ORDER BY date ASC
-        ''', (since,))
-        
-        rows = c.fetchall()
-        conn.close()
+        with self._reader() as conn:
+            rows = conn.execute('''
+                SELECT date, trades, wins, pnl
+                FROM daily_stats
+                WHERE date >= ? AND trades > 0
+                ORDER BY date ASC
+            ''', (since,)).fetchall()
         
         stats = []
         for row in rows:
@@ -168,22 +338,11 @@ class TradeHistory:
         return stats
     
     def get_summary(self) -> dict:
-        """전체 통계 요약"""
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        
-        c.execute('''
-            SELECT 
-                COUNT(*) as total_trades,
-                SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) as wins,
-                SUM(pnl) as total_pnl,
-                MAX(pnl) as best_trade,
-                MIN(pnl) as worst_trade
-            FROM trades
-        ''')
-        
-        row = c.fetchone()
-        conn.close()
+        """전체 통계 요약 (trade_totals 집계 행)"""
+        with self._reader() as conn:
+            row = conn.execute(
+                'SELECT trades, wins, pnl, best, worst FROM trade_totals WHERE id = 1'
+            ).fetchone() or (0, 0, None, None, None)
         
         total, wins, pnl, best, worst = row
         win_rate = (wins / total * 100) if total and total > 0 else 0
@@ -201,11 +360,13 @@ class TradeHistory:
 
 # 싱글톤
 _history = None
+_history_lock = threading.Lock()
 
 def get_trade_history() -> TradeHistory:
     global _history
-    if _history is None:
-        _history = TradeHistory()
+    with _history_lock:
+        if _history is None:
+            _history = TradeHistory()
     return _history
 
 
@@ -0,0 +1,317 @@
+"""
+추가 전용(append-only) 거래 저널
+- 스냅샷: 기존 JSON 파일 그대로 (history.json / sniper_history.json 형식 유지)
+- 저널: <스냅샷>.wal 에 레코드 1건당 JSON 한 줄 추가 → 거래 기록 비용이 히스토리 크기와 무관
+- fsync 묶음 처리: sync_every 건 또는 sync_interval 초마다 (sync=True면 즉시)
+- 압축: 저널이 compact_every 건을 넘으면 스냅샷을 원자적으로 다시 쓰고 저널 삭제
+- 복구: 시작 시 스냅샷 + 저널 재생, 잘린 마지막 줄은 버림
+  (스냅샷 교체 직후 저널 삭제 전에 중단된 경우 seq로 중복 재생 방지)
+- 다른 프로세스(GUI 등)는 read_records()로 스냅샷 + 저널을 읽기 전용 조회
+"""
+
+import os
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = '.wal'
+
+
+def _append_record(state: list, record: Dict):
+    state.append(record)
+
+
+def _read_journal(journal_path: str) -> Tuple[List[Tuple[int, Dict]], int]:
+    """저널 → ([(seq, record)], 정상 줄까지의 바이트 수) - 잘린/손상된 줄에서 중단"""
+    entries: List[Tuple[int, Dict]] = []
+    good = 0
+    try:
+        f = open(journal_path, 'rb')
+    except FileNotFoundError:
+        return entries, good
+    with f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                entry = json.loads(line)
+                entries.append((int(entry['seq']), entry['record']))
+            except (ValueError, KeyError, TypeError):
+                break
+            good += len(line)
+    return entries, good
+
+
+def read_records(path: str) -> list:
+    """
+    스냅샷(JSON 리스트) + 저널 레코드 읽기 전용 조회
+
+    기록 중인 다른 프로세스의 파일을 수정하지 않음 (꼬리 정리/백업 없음).
+    저널을 먼저 읽고 스냅샷을 읽으므로 그 사이 압축이 끝나도 seq로 중복/누락 없이 합쳐짐.
+    """
+    entries, _ = _read_journal(path + JOURNAL_SUFFIX)
+    records = []
+    if os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"[JOURNAL] Snapshot read failed ({path}): {e}")
+            records = []
+    if not isinstance(records, list):
+        return []
+    base = len(records)
+    records.extend(record for seq, record in entries if seq >= base)
+    return records
+
+
+class TradeJournal:
+    """스냅샷 + 추가 전용 저널 (스레드 안전)"""
+
+    SYNC_EVERY = 5         # 이만큼 쌓이면 fsync
+    SYNC_INTERVAL = 60     # 마지막 fsync 후 이 시간(초) 지나면 fsync
+    COMPACT_EVERY = 500    # 저널 레코드가 이만큼 쌓이면 스냅샷으로 압축
+
+    def __init__(
+        self,
+        path: str,
+        empty: Callable[[], Any] = list,
+        apply: Callable[[Any, Dict], None] = _append_record,
+        size: Callable[[Any], int] = len,
+        restore: Callable[[Any], Any] = None,
+        on_compact: Callable[[Any], None] = None,
+        sync_every: int = None,
+        sync_interval: float = None,
+        compact_every: int = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            path: 스냅샷 JSON 경로 (저널은 path + '.wal')
+            empty: 빈 상태 생성 (기본 list)
+            apply: (상태, 레코드) → 상태에 레코드 반영 (재생/추가 공통)
+            size: 상태에 반영된 레코드 수 (스냅샷 기준 seq)
+            restore: 스냅샷 JSON → 상태 (인덱스 재구성 등, 기본은 그대로 사용)
+            on_compact: 스냅샷 교체 직후 호출 (보조 스냅샷 갱신 등, 실패해도 압축은 유지)
+        """
+        self.path = path
+        self.journal_path = path + JOURNAL_SUFFIX
+        self.sync_every = sync_every or self.SYNC_EVERY
+        self.sync_interval = self.SYNC_INTERVAL if sync_interval is None else sync_interval
+        self.compact_every = compact_every or self.COMPACT_EVERY
+        self._empty = empty
+        self._apply = apply
+        self._size = size
+        self._restore = restore
+        self._on_compact = on_compact
+        self._clock = clock
+
+        self._lock = threading.RLock()
+        self._state = None
+        self._file = None
+        self._seq = 0          # 다음 레코드 번호 (= 스냅샷 + 저널 레코드 수)
+        self._journaled = 0    # 저널에만 있는 레코드 수
+        self._unsynced = 0
+        self._last_sync = clock()
+        self._fsyncs = 0
+        self._compactions = 0
+        self._replayed = 0
+
+    # ========== 로드 / 재생 ==========
+
+    @property
+    def state(self) -> Any:
+        """현재 상태 (스냅샷 + 저널) - 호출 측에서 수정 금지"""
+        with self._lock:
+            self._ensure_loaded()
+            return self._state
+
+    def _ensure_loaded(self):
+        if self._state is None:
+            self._load()
+
+    def _read_snapshot(self) -> Any:
+        if not os.path.exists(self.path):
+            return self._empty()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except Exception as e:
+            # 손상된 파일 → 백업 후 새로 시작 (저널은 그대로 재생)
+            backup_path = self.path + f'.backup_{datetime.now():%Y%m%d_%H%M%S}'
+            logger.error(f"[JOURNAL] Snapshot corrupted, backed up to {backup_path}: {e}")
+            try:
+                os.rename(self.path, backup_path)
+            except OSError:
+                pass
+            return self._empty()
+        return self._restore(snapshot) if self._restore else snapshot
+
+    def _load(self):
+        state = self._read_snapshot()
+        base = self._size(state)
+        seq = base
+        journaled = 0
+
+        entries, good = _read_journal(self.journal_path)
+        for entry_seq, record in entries:
+            if entry_seq < base:
+                # 압축 후 저널 삭제 전 중단 → 이미 스냅샷에 포함
+                continue
+            self._apply(state, record)
+            seq += 1
+            journaled += 1
+
+        # 잘린/손상된 꼬리 제거 (이후 추가가 깨진 줄 뒤에 붙지 않도록)
+        if os.path.exists(self.journal_path) and good < os.path.getsize(self.journal_path):
+            logger.warning(f"[JOURNAL] Dropping torn tail of {self.journal_path}")
+            with open(self.journal_path, 'r+b') as f:
+                f.truncate(good)
+
+        self._state = state
+        self._seq = seq
+        self._journaled = journaled
+        self._replayed = journaled
+
+    # ========== 기록 ==========
+
+    def append(self, record: Dict, sync: bool = False) -> int:
+        """
+        레코드 추가 (저널 한 줄 + 메모리 상태 반영)
+
+        Args:
+            record: JSON 직렬화 가능한 dict
+            sync: True면 즉시 fsync (포지션 청산 시 권장)
+
+        Returns:
+            레코드 번호 (seq)
+        """
+        with self._lock:
+            self._ensure_loaded()
+            # 직렬화 실패 시 아무것도 기록하지 않음
+            line = json.dumps({'seq': self._seq, 'record': record}, ensure_ascii=False) + '\n'
+
+            f = self._open()
+            f.write(line.encode('utf-8'))
+            f.flush()
+
+            self._apply(self._state, record)
+            seq = self._seq
+            self._seq += 1
+            self._journaled += 1
+            self._unsynced += 1
+
+            if sync or self._should_sync():
+                self._sync()
+            if self._journaled >= self.compact_every:
+                self.compact()
+            return seq
+
+    def _open(self):
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.journal_path) or '.', exist_ok=True)
+            self._file = open(self.journal_path, 'ab')
+        return self._file
+
+    def _should_sync(self) -> bool:
+        if self._unsynced >= self.sync_every:
+            return True
+        return self._clock() - self._last_sync >= self.sync_interval
+
+    def _sync(self):
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+            self._fsyncs += 1
+        self._unsynced = 0
+        self._last_sync = self._clock()
+
+    def sync(self):
+        """대기 중인 저널 기록 fsync"""
+        with self._lock:
+            self._sync()
+
+    def compact(self) -> bool:
+        """스냅샷 원자적 재작성 후 저널 삭제 (저널이 비어 있으면 생략)"""
+        with self._lock:
+            self._ensure_loaded()
+            if not self._journaled and not os.path.exists(self.journal_path):
+                return False
+
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            temp_path = self.path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._state, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+
+            if self._on_compact:
+                try:
+                    self._on_compact(self._state)
+                except Exception as e:
+                    logger.warning(f"[JOURNAL] on_compact failed: {e}")
+
+            self._close_file()
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+            self._journaled = 0
+            self._unsynced = 0
+            self._last_sync = self._clock()
+            self._compactions += 1
+            return True
+
+    def reset(self, backup_path: Optional[str] = None):
+        """
+        전체 초기화 (스냅샷 + 저널 삭제)
+
+        Args:
+            backup_path: 지정 시 압축 후 스냅샷을 이 경로로 이동
+        """
+        with self._lock:
+            if backup_path:
+                self._ensure_loaded()
+                self.compact()
+                if os.path.exists(self.path):
+                    os.rename(self.path, backup_path)
+            else:
+                self._close_file()
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+            self._close_file()
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+            self._state = None
+            self._seq = 0
+            self._journaled = 0
+            self._unsynced = 0
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            finally:
+                self._file = None
+
+    def close(self):
+        """fsync 후 저널 파일 닫기"""
+        with self._lock:
+            self._sync()
+            self._close_file()
+
+    @property
+    def stats(self) -> Dict:
+        """저널 통계"""
+        with self._lock:
+            return {
+                'records': self._seq,
+                'journaled': self._journaled,
+                'unsynced': self._unsynced,
+                'replayed': self._replayed,
+                'fsyncs': self._fsyncs,
+                'compactions': self._compactions,
+            }
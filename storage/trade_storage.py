@@ -1,11 +1,16 @@
-import json
 import os
 import sys
+import bisect
 import logging
 import threading
 from datetime import datetime
 from typing import List, Dict, Optional
 
+try:
+    from storage.trade_journal import TradeJournal
+except ImportError:
+    from .trade_journal import TradeJournal
+
 # [FIX] EXE 호환 import
 try:
     from paths import Paths
@@ -50,10 +55,11 @@ except ImportError:
 
 
 class TradeStorage:
-    """스레드 안전한 거래 기록 저장 클래스"""
+    """스레드 안전한 거래 기록 저장 클래스 (history.json 스냅샷 + 추가 전용 저널)"""
     
-    BUFFER_SIZE = 5      # 버퍼에 이만큼 쌓이면 저장
-    FLUSH_INTERVAL = 60  # 초 단위로 이 시간 지나면 저장
+    BUFFER_SIZE = 5      # 이만큼 쌓이면 fsync
+    FLUSH_INTERVAL = 60  # 초 단위로 이 시간 지나면 fsync
+    COMPACT_EVERY = 500  # [PERF] 저널이 이만큼 쌓이면 history.json으로 압축
     
     def __init__(self, exchange: str, symbol: str):
         self.exchange = exchange.lower()
@@ -61,8 +67,21 @@ class TradeStorage:
         self.path = Paths.history(exchange, symbol)
         
         self._lock = threading.Lock()
-        self._buffer: List[Dict] = []
-        self._last_save = datetime.now()
+        
+        # [PERF] 조회 인덱스: (exit_time, -순번) 정렬 목록 + 통계 누적값
+        self._order: List[tuple] = []
+        self._totals = self._empty_totals()
+        
+        # [PERF] 거래 1건 = 저널 한 줄 추가 (전체 파일 재작성 없음)
+        self._journal = TradeJournal(
+            self.path,
+            empty=self._reset_index,
+            apply=self._index_trade,
+            restore=self._restore_index,
+            sync_every=self.BUFFER_SIZE,
+            sync_interval=self.FLUSH_INTERVAL,
+            compact_every=self.COMPACT_EVERY,
+        )
         
         # 폴더 생성
         Paths.ensure_dirs(exchange, symbol)
@@ -80,149 +99,142 @@ class TradeStorage:
                 - exit_price: 청산가
                 - pnl_pct: 수익률 (%)
                 - pnl_usd: 수익금 ($)
-            immediate_flush: True면 버퍼 무시하고 즉시 저장 (포지션 청산 시 권장)
+            immediate_flush: True면 즉시 fsync (포지션 청산 시 권장)
         """
         with self._lock:
             trade['saved_at'] = datetime.now().isoformat()
             trade['exchange'] = self.exchange
             trade['symbol'] = self.symbol
-            self._buffer.append(trade)
-            
-            # 즉시 저장 또는 조건 충족 시 저장
-            if immediate_flush or self._should_flush():
-                self._flush()
-    
-    def _should_flush(self) -> bool:
-        """저장 조건 확인"""
-        # 버퍼가 일정 크기 이상
-        if len(self._buffer) >= self.BUFFER_SIZE:
-            return True
-        # 마지막 저장 후 일정 시간 경과
-        if (datetime.now() - self._last_save).seconds >= self.FLUSH_INTERVAL:
-            return True
-        return False
-    
-    def _flush(self):
-        """버퍼를 디스크에 저장"""
-        if not self._buffer:
-            return
-        
-        # 기존 데이터 로드
-        history = self._load_existing()
-        history.extend(self._buffer)
-        
-        # 임시 파일에 먼저 저장 (손상 방지)
-        temp_path = self.path + '.tmp'
-        with open(temp_path, 'w', encoding='utf-8') as f:
-            json.dump(history, f, ensure_ascii=False, indent=2)
-        
-        # 원자적 교체
-        if os.path.exists(self.path):
-            os.remove(self.path)
-        os.rename(temp_path, self.path)
-        
-        # 버퍼 초기화
-        self._buffer = []
-        self._last_save = datetime.now()
+            self._journal.append(trade, sync=immediate_flush)
     
-    def _load_existing(self) -> List[Dict]:
-        """기존 거래 기록 로드"""
-        if os.path.exists(self.path):
-            try:
-                with open(self.path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, Exception):
-                # 손상된 파일 → 백업 후 새로 시작
-                backup_path = self.path + f'.backup_{datetime.now():%Y%m%d_%H%M%S}'
-                os.rename(self.path, backup_path)
-                return []
+    # ========== 인덱스 ==========
+    
+    @staticmethod
+    def _empty_totals() -> Dict:
+        return {'count': 0, 'wins': 0, 'pnl_pct': 0.0, 'pnl_usd': 0.0, 'max_pct': None, 'min_pct': None}
+    
+    @staticmethod
+    def _time_key(trade: Dict) -> str:
+        value = trade.get('exit_time', '')
+        if isinstance(value, str):
+            return value
+        return '' if value is None else str(value)
+    
+    def _reset_index(self) -> List[Dict]:
+        """저널 로드 시 빈 상태 생성 (인덱스 초기화)"""
+        self._order = []
+        self._totals = self._empty_totals()
         return []
     
+    def _restore_index(self, snapshot: List[Dict]) -> List[Dict]:
+        """history.json 로드 시 인덱스 재구성"""
+        trades = self._reset_index()
+        for trade in snapshot:
+            self._index_trade(trades, trade)
+        return trades
+    
+    def _index_trade(self, trades: List[Dict], trade: Dict):
+        """스냅샷/저널 재생 및 추가 공통: 목록 + 정렬 인덱스 + 통계 반영"""
+        trades.append(trade)
+        bisect.insort(self._order, (self._time_key(trade), -(len(trades) - 1)))
+        
+        pnl = trade.get('pnl_pct', 0) or 0
+        totals = self._totals
+        totals['count'] += 1
+        totals['wins'] += 1 if pnl > 0 else 0
+        totals['pnl_pct'] += pnl
+        totals['pnl_usd'] += trade.get('pnl_usd', 0) or 0
+        totals['max_pct'] = pnl if totals['max_pct'] is None else max(totals['max_pct'], pnl)
+        totals['min_pct'] = pnl if totals['min_pct'] is None else min(totals['min_pct'], pnl)
+    
+    def _ensure_loaded(self) -> List[Dict]:
+        """최초 접근 시 history.json + 저널 재생 (인덱스 구성)"""
+        return self._journal.state
+    
+    def _iter_newest(self, limit: Optional[int] = None):
+        """청산 시간 최신순 (같은 시간은 기록 순서)"""
+        trades = self._ensure_loaded()
+        order = self._order
+        count = len(order) if limit is None else min(limit, len(order))
+        for k in range(1, count + 1):
+            yield dict(trades[-order[-k][1]])
+    
+    # ========== 저장 ==========
+    
     def force_save(self):
-        """강제 저장 (종료 시 호출)"""
+        """강제 저장 (종료 시 호출) - 저널을 history.json으로 압축"""
         with self._lock:
-            self._flush()
+            self._journal.sync()
+            self._journal.compact()
     
-    def get_all_trades(self) -> List[Dict]:
-        """모든 거래 기록 반환 (버퍼 포함)"""
+    def close(self):
+        """저널 fsync 후 파일 닫기"""
         with self._lock:
-            existing = self._load_existing()
-            # 최신순 정렬 (버퍼가 더 최신일 수 있음, 하지만 보통 append임)
-            # 버퍼 + 기존 데이터 합치기
-            all_trades = existing + self._buffer
-            return sorted(all_trades, key=lambda x: x.get('exit_time', ''), reverse=True)
-
-    def get_recent_trades(self, limit: int = 50) -> List[Dict]:
-        """최근 거래 기록 반환"""
+            self._journal.close()
+    
+    # ========== 조회 ==========
+    
+    def get_all_trades(self) -> List[Dict]:
+        """모든 거래 기록 반환 (청산 시간 최신순)"""
         with self._lock:
-            # 효율성을 위해 전체 로드 후 슬라이싱 (파일이 아주 크지 않다면 OK)
-            # 개선점: 파일 끝부분만 읽는 방식이 좋으나 JSON 구조상 전체 파싱 필요
-            all_trades = self.get_all_trades()
-            return all_trades[:limit]
-            
-    def get_stats(self) -> Dict:
-            all_trades = existing + self._buffer.copy()
-            # 날짜순 정렬 (내림차순)
-            try:
-                all_trades.sort(key=lambda x: x.get('time', ''), reverse=True)
-            except:
-                pass
-            return all_trades
-
+            return list(self._iter_newest())
+    
     def get_recent_trades(self, limit: int = 5) -> List[Dict]:
         """최근 거래 기록 반환"""
-        trades = self.get_all_trades()
-        return trades[:limit]
+        with self._lock:
+            return list(self._iter_newest(max(0, limit)))
+    
+    def get_trades(self, limit: int = 50) -> List[Dict]:
+        """최근 limit건 (기록 순서, 레거시 history[-limit:]와 동일)"""
+        with self._lock:
+            trades = self._ensure_loaded()
+            return [dict(t) for t in trades[-limit:]] if limit > 0 else []
     
     def get_stats(self) -> Dict:
-        """거래 통계 계산"""
-        trades = self.get_all_trades()
-        
-        if not trades:
+        """거래 통계 (누적값 기반, 전체 조회 없음)"""
+        with self._lock:
+            self._ensure_loaded()
+            totals = self._totals
+            count = totals['count']
+            
+            if not count:
+                return {
+                    'total_trades': 0,
+                    'win_rate': 0.0,
+                    'total_pnl_pct': 0.0,
+                    'total_pnl_usd': 0.0,
+                    'avg_pnl_pct': 0.0,
+                    'max_win_pct': 0.0,
+                    'max_loss_pct': 0.0,
+                }
+            
             return {
-                'total_trades': 0,
-                'win_rate': 0.0,
-                'total_pnl_pct': 0.0,
-                'total_pnl_usd': 0.0,
-                'avg_pnl_pct': 0.0,
-                'max_win_pct': 0.0,
-                'max_loss_pct': 0.0,
+                'total_trades': count,
+                'win_rate': totals['wins'] / count * 100,
+                'total_pnl_pct': totals['pnl_pct'],
+                'total_pnl_usd': totals['pnl_usd'],
+                'avg_pnl_pct': totals['pnl_pct'] / count,
+                'max_win_pct': totals['max_pct'],
+                'max_loss_pct': totals['min_pct'],
             }
-        
-        pnl_list = [t.get('pnl_pct', 0) for t in trades]
-        pnl_usd_list = [t.get('pnl_usd', 0) for t in trades]
-        wins = [p for p in pnl_list if p > 0]
-        
-        return {
-            'total_trades': len(trades),
-            'win_rate': len(wins) / len(trades) * 100 if trades else 0,
-            'total_pnl_pct': sum(pnl_list),
-            'total_pnl_usd': sum(pnl_usd_list),
-            'avg_pnl_pct': sum(pnl_list) / len(pnl_list) if pnl_list else 0,
-            'max_win_pct': max(pnl_list) if pnl_list else 0,
-            'max_loss_pct': min(pnl_list) if pnl_list else 0,
-        }
 
     def reset_history(self):
         """거래 내역 초기화 (백업 후 삭제)"""
         with self._lock:
-            # 1. 기존 데이터 백업
-            if os.path.exists(self.path):
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                backup_path = f"{self.path}.bak_{timestamp}"
-                try:
-                    os.rename(self.path, backup_path)
+            # 1. 저널 압축 후 기존 데이터 백업
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            backup_path = f"{self.path}.bak_{timestamp}"
+            try:
+                self._journal.reset(backup_path=backup_path)
+                if os.path.exists(backup_path):
                     logging.info(f"💾 Trade History backed up to: {backup_path}")
-                except Exception as e:
-                    logging.error(f"❌ Failed to backup trade history: {e}")
+            except Exception as e:
+                logging.error(f"❌ Failed to backup trade history: {e}")
             
-            # 2. 버퍼 및 파일 초기화
-            self._buffer = []
-            self._last_save = datetime.now()
-            # 파일이 삭제되었거나 이름이 바뀌었으므로 새로 생성할 준비됨
+            # 2. 인덱스 초기화
+            self._reset_index()
             logging.info(f"🧹 Trade History reset for {self.exchange}/{self.symbol}")
 
-
 # 전역 인스턴스 캐시
 _storage_instances: Dict[str, TradeStorage] = {}
 
@@ -0,0 +1,4 @@
+"""
+핫패스 성능 벤치마크
+사용법: python -m tests.benchmarks.run_benchmarks --help
+"""
@@ -0,0 +1,290 @@
+"""
+핫패스 성능 벤치마크 실행기
+사용법: python -m tests.benchmarks.run_benchmarks [옵션]
+
+옵션:
+  --candles N          합성 15m 캔들 수 (기본 20000, 시드 고정 → 매 실행 동일 데이터)
+  --repeat N           케이스별 반복 횟수 (기본 3, 중앙값 사용)
+  --cases a,b          실행할 케이스만 지정
+  --output FILE        결과 JSON 경로 (기본 tests/benchmarks/benchmark_result.json)
+  --baseline FILE      이전 결과 JSON - 케이스 시간이 허용 비율 이상 느려지면 실패
+  --max-slowdown R     baseline 대비 허용 느려짐 비율 (기본 0.25 = 25%)
+  --thresholds FILE    케이스별 절대 한도 JSON {"case": {"max_seconds": 1.0, "min_throughput": 1e5}}
+
+종료 코드: 0 = 통과, 1 = 회귀 감지
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import logging
+import argparse
+import platform
+import statistics
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utils.indicators import add_all_indicators
+from utils.data_utils import resample_data
+from core.strategy_core import AlphaX7Core
+from core.optimizer import BacktestOptimizer
+
+DEFAULT_OUTPUT = Path(__file__).parent / 'benchmark_result.json'
+
+# 소규모 엔드투엔드 그리드 (16 조합)
+E2E_GRID = {
+    'trend_interval': ['1h'], 'filter_tf': ['4h'], 'entry_tf': ['15m'],
+    'leverage': [1, 3], 'direction': ['Both', 'Long'], 'max_mdd': [100.0],
+    'atr_mult': [1.0, 2.0], 'pattern_tolerance': [0.03, 0.05],
+}
+
+
+def make_ohlcv(n: int, seed: int = 42) -> pd.DataFrame:
+    """결정적 합성 15m OHLCV (같은 n/seed → 항상 같은 데이터)"""
+    rng = np.random.default_rng(seed)
+    # 완만한 추세 전환이 섞인 로그 랜덤워크 → W/M 패턴이 적당히 발생
+    drift = 0.0004 * np.sin(np.arange(n) / 500)
+    close = 100 * np.exp(np.cumsum(drift + rng.normal(0, 0.004, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=n, freq='15min'),
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + rng.uniform(0, 0.003, n)),
+        'low': np.minimum(open_, close) * (1 - rng.uniform(0, 0.003, n)),
+        'close': close,
+        'volume': rng.uniform(1, 10, n),
+    })
+
+
+class BenchCase:
+    """벤치마크 케이스: setup()으로 입력 준비, run(state)만 측정"""
+
+    def __init__(self, name: str, setup: Callable[[], Dict], run: Callable[[Dict], object],
+                 units: Callable[[Dict], int], unit: str = 'candles'):
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.units = units
+        self.unit = unit
+
+
+def build_cases(df: pd.DataFrame) -> List[BenchCase]:
+    """핫패스 케이스 목록 (입력 준비는 측정 대상에서 제외)"""
+    n = len(df)
+    strategy = AlphaX7Core()
+
+    def frames() -> Dict:
+        return {
+            'df_pattern': resample_data(df, '1h', add_indicators=True, use_cache=False),
+            'df_entry': resample_data(df, '15m', add_indicators=True, use_cache=False),
+        }
+
+    def signals_state() -> Dict:
+        state = frames()
+        state['signals'] = strategy._extract_all_signals(state['df_pattern'], 0.05, 6)
+        return state
+
+    def trades_state() -> Dict:
+        state = signals_state()
+        trades = strategy.run_backtest(state['df_pattern'], state['df_entry'], slippage=0.001,
+                                       pattern_tolerance=0.05, entry_validity_hours=6,
+                                       use_kernel=True, signals=state['signals'])
+        # 메트릭 계산은 거래 수에 비례 → 최소 1000건이 되도록 복제
+        trades = trades or [{'pnl': 0.5}, {'pnl': -0.3}]
+        state['trades'] = (trades * (1000 // len(trades) + 1))[:max(1000, len(trades))]
+        return state
+
+    def run_grid(_state):
+        optimizer = BacktestOptimizer(AlphaX7Core)
+        return optimizer.run_optimization(df, E2E_GRID, max_workers=2, use_result_store=False)
+
+    combos = int(np.prod([len(v) for v in E2E_GRID.values()]))
+
+    return [
+        BenchCase('add_all_indicators', lambda: {'df': df.copy()},
+                  lambda s: add_all_indicators(s['df'].copy()), lambda s: n),
+        BenchCase('resample_data_1h', lambda: {},
+                  lambda s: resample_data(df, '1h', add_indicators=True, use_cache=False), lambda s: n),
+        BenchCase('resample_data_4h_raw', lambda: {},
+                  lambda s: resample_data(df, '4h', add_indicators=False, use_cache=False), lambda s: n),
+        BenchCase('extract_all_signals', frames,
+                  lambda s: strategy._extract_all_signals(s['df_pattern'], 0.05, 6),
+                  lambda s: len(s['df_pattern'])),
+        BenchCase('run_backtest', signals_state,
+                  lambda s: strategy.run_backtest(s['df_pattern'], s['df_entry'], slippage=0.001,
+                                                  pattern_tolerance=0.05, entry_validity_hours=6,
+                                                  use_kernel=True, signals=s['signals']),
+                  lambda s: len(s['df_entry'])),
+        BenchCase('calculate_metrics', trades_state,
+                  lambda s: BacktestOptimizer.calculate_metrics(s['trades']),
+                  lambda s: len(s['trades']), unit='trades'),
+        BenchCase('e2e_grid', lambda: {}, run_grid, lambda s: combos, unit='combos'),
+    ]
+
+
+def measure(case: BenchCase, repeat: int) -> Dict:
+    """케이스 측정: 시간은 tracemalloc 없이, 피크 메모리는 별도 1회 실행으로"""
+    state = case.setup()
+    units = case.units(state)
+
+    case.run(state)  # 워밍업 (임포트/캐시/JIT 효과 제외)
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        case.run(state)
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        case.run(state)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(times)
+    return {
+        'units': units,
+        'unit': case.unit,
+        'repeat': repeat,
+        'median_seconds': round(median, 6),
+        'min_seconds': round(min(times), 6),
+        'max_seconds': round(max(times), 6),
+        'throughput_per_sec': round(units / median, 2) if median > 0 else None,
+        'peak_memory_mb': round(peak / 1024 / 1024, 3),
+    }
+
+
+def check_regressions(results: Dict[str, Dict], baseline: Optional[Dict] = None,
+                      max_slowdown: float = 0.25, thresholds: Optional[Dict] = None) -> List[str]:
+    """
+    회귀 검사
+
+    Args:
+        results: {case: measure() 결과}
+        baseline: 이전 실행 결과 JSON ('cases' 키 포함) - 같은 candles 수일 때만 비교
+        max_slowdown: baseline 대비 허용 느려짐 비율
+        thresholds: {case: {'max_seconds': x, 'min_throughput': y, 'max_peak_memory_mb': z}}
+
+    Returns:
+        실패 메시지 목록 (비어 있으면 통과)
+    """
+    failures = []
+    base_cases = (baseline or {}).get('cases', {})
+    for name, result in results.items():
+        base = base_cases.get(name)
+        if base and base.get('units') == result['units'] and base.get('median_seconds'):
+            limit = base['median_seconds'] * (1 + max_slowdown)
+            if result['median_seconds'] > limit:
+                failures.append(
+                    f"{name}: {result['median_seconds']:.4f}s > baseline "
+                    f"{base['median_seconds']:.4f}s × {1 + max_slowdown:.2f}"
+                )
+        limits = (thresholds or {}).get(name, {})
+        if 'max_seconds' in limits and result['median_seconds'] > limits['max_seconds']:
+            failures.append(f"{name}: {result['median_seconds']:.4f}s > max {limits['max_seconds']}s")
+        if 'min_throughput' in limits and (result['throughput_per_sec'] or 0) < limits['min_throughput']:
+            failures.append(
+                f"{name}: {result['throughput_per_sec']} {result['unit']}/s < min {limits['min_throughput']}"
+            )
+        if 'max_peak_memory_mb' in limits and result['peak_memory_mb'] > limits['max_peak_memory_mb']:
+            failures.append(
+                f"{name}: peak {result['peak_memory_mb']}MB > max {limits['max_peak_memory_mb']}MB"
+            )
+    return failures
+
+
+def run_benchmarks(candles: int = 20000, repeat: int = 3, cases: Optional[List[str]] = None,
+                   seed: int = 42, verbose: bool = True) -> Dict:
+    """벤치마크 실행 → 결과 dict (JSON 저장 형식)"""
+    df = make_ohlcv(candles, seed)
+    selected = [c for c in build_cases(df) if not cases or c.name in cases]
+    unknown = set(cases or []) - {c.name for c in selected}
+    if unknown:
+        raise ValueError(f"Unknown benchmark cases: {sorted(unknown)}")
+
+    results = {}
+    for case in selected:
+        results[case.name] = measure(case, repeat)
+        if verbose:
+            r = results[case.name]
+            print(f"  {case.name:<24} {r['median_seconds'] * 1000:>10.2f}ms  "
+                  f"{r['throughput_per_sec'] or 0:>14,.0f} {r['unit']}/s  "
+                  f"peak {r['peak_memory_mb']:>8.2f}MB")
+
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'candles': candles,
+        'seed': seed,
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'cases': results,
+    }
+
+
+def _load_json(path: Optional[str]) -> Optional[Dict]:
+    if not path:
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='핫패스 성능 벤치마크')
+    parser.add_argument('--candles', type=int, default=20000, help='합성 15m 캔들 수')
+    parser.add_argument('--repeat', type=int, default=3, help='케이스별 반복 횟수')
+    parser.add_argument('--seed', type=int, default=42, help='합성 데이터 시드')
+    parser.add_argument('--cases', default=None, help='쉼표 구분 케이스 이름')
+    parser.add_argument('--output', default=str(DEFAULT_OUTPUT), help='결과 JSON 경로')
+    parser.add_argument('--baseline', default=None, help='비교할 이전 결과 JSON')
+    parser.add_argument('--max-slowdown', type=float, default=0.25, help='baseline 대비 허용 느려짐 비율')
+    parser.add_argument('--thresholds', default=None, help='케이스별 절대 한도 JSON')
+    parser.add_argument('-q', '--quiet', action='store_true')
+    args = parser.parse_args(argv)
+
+    cases = [c.strip() for c in args.cases.split(',')] if args.cases else None
+    if not args.quiet:
+        print(f"▶ Benchmark: {args.candles:,} candles × {args.repeat} repeats")
+
+    # 벤치마크 출력에 최적화 로그가 섞이지 않도록
+    previous_disable = logging.root.manager.disable
+    logging.disable(logging.INFO)
+    try:
+        report = run_benchmarks(args.candles, args.repeat, cases, args.seed, verbose=not args.quiet)
+    finally:
+        logging.disable(previous_disable)
+
+    failures = check_regressions(report['cases'], _load_json(args.baseline),
+                                 args.max_slowdown, _load_json(args.thresholds))
+    report['regressions'] = failures
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if not args.quiet:
+        print(f"📄 결과 저장: {output}")
+    for failure in failures:
+        print(f"❌ 회귀: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+Unit Tests: AsyncScanner Pipeline
+동시 요청 수 제한, 429/거래소 rate limit 코드 재시도, NumPy 파싱 (최신순 → 오름차순),
+워커 풀 점수 == 현재 프로세스 점수, 결과 순서 검증
+"""
+import unittest
+import sys
+import os
+import asyncio
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.async_scanner import AsyncScanner, parse_klines, score_candles
+
+STEP_MS = 15 * 60 * 1000
+
+
+def bybit_payload(symbol, n=60):
+    """Bybit v5 kline 응답 (문자열 값, 최신순)"""
+    seed = sum(map(ord, symbol))
+    rows = []
+    for i in range(n):
+        close = 100 + seed % 11 + np.sin(i / 4.0 + seed)
+        rows.append([str(1_700_000_000_000 + i * STEP_MS), f"{close - 0.2:.4f}", f"{close + 0.5:.4f}",
+                     f"{close - 0.5:.4f}", f"{close:.4f}", f"{10 + (i * seed) % 7:.1f}", "0"])
+    return {'retCode': 0, 'retMsg': 'OK', 'result': {'symbol': symbol, 'list': rows[::-1]}}
+
+
+class FakeResponse:
+    def __init__(self, status, payload, headers=None):
+        self.status = status
+        self._payload = payload
+        self.headers = headers or {}
+
+    async def json(self):
+        return self._payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """심볼별 응답 스크립트 (소진 후에는 정상 응답), 동시 요청 수 기록"""
+
+    def __init__(self, script=None, delay=0.01):
+        self.script = {k: list(v) for k, v in (script or {}).items()}
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+
+    def get(self, url, params=None, timeout=None):
+        session = self
+        symbol = params['symbol']
+
+        class Request:
+            async def __aenter__(self):
+                session.calls.append(symbol)
+                session.active += 1
+                session.max_active = max(session.max_active, session.active)
+                await asyncio.sleep(session.delay)
+                session.active -= 1
+                queued = session.script.get(symbol)
+                if queued:
+                    status, payload = queued.pop(0)
+                    return FakeResponse(status, payload, {'Retry-After': '0'} if status == 429 else None)
+                return FakeResponse(200, bybit_payload(symbol))
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return Request()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class TestAsyncScanner(unittest.TestCase):
+    """수집 → 파싱 → 점수 파이프라인"""
+
+    def make(self, session, **kwargs):
+        kwargs.setdefault('rate', 1000)
+        kwargs.setdefault('retry_delay', 0.001)
+        return AsyncScanner('bybit', session_factory=lambda: session, **kwargs)
+
+    def test_parse_klines(self):
+        payload = bybit_payload('BTCUSDT', n=5)
+        candles = parse_klines('bybit', payload)
+        rows = payload['result']['list'][::-1]
+        self.assertEqual(candles['timestamp'].dtype, np.int64)
+        np.testing.assert_array_equal(candles['timestamp'], [int(r[0]) for r in rows])
+        np.testing.assert_array_equal(candles['close'], [float(r[4]) for r in rows])
+
+        binance = [[int(r[0]), r[1], r[2], r[3], r[4], r[5], int(r[0]) + STEP_MS - 1] for r in rows]
+        for name, values in parse_klines('binance', binance).items():
+            np.testing.assert_array_equal(values, candles[name])
+
+        self.assertIsNone(parse_klines('bybit', {'retCode': 10001, 'result': {}}))
+        self.assertIsNone(parse_klines('bybit', {'result': 'ok'}))
+        self.assertIsNone(parse_klines('binance', []))
+
+    def test_bounded_concurrency_and_retries(self):
+        symbols = ['S%02dUSDT' % i for i in range(20)]
+        session = FakeSession(script={
+            'S01USDT': [(429, {}), (503, {})],
+            'S02USDT': [(200, {'retCode': 10006, 'retMsg': 'Too many visits!'})],
+            'S03USDT': [(429, {})] * 3,
+            'S04USDT': [(400, {})],
+        })
+        scanner = self.make(session, max_concurrency=4, scorer=None)
+        results = asyncio.run(scanner.scan_symbols(symbols, '15m'))
+
+        self.assertLessEqual(session.max_active, 4)
+        self.assertEqual([r['symbol'] for r in results], [s for s in symbols if s not in ('S03USDT', 'S04USDT')])
+        self.assertEqual(session.calls.count('S01USDT'), 3)
+        self.assertEqual(session.calls.count('S03USDT'), 3)
+        self.assertEqual(session.calls.count('S04USDT'), 1)
+        self.assertEqual(scanner.stats['failed'], 2)
+        self.assertEqual(scanner.stats['retries'], 5)
+        for r in results:
+            np.testing.assert_array_equal(r['candles']['close'], parse_klines('bybit', bybit_payload(r['symbol']))['close'])
+            self.assertIsNone(r['score'])
+
+    def test_pool_scores_match_inline(self):
+        symbols = ['BTCUSDT', 'ETHUSDT', 'SOLUSDT', 'XRPUSDT', 'ADAUSDT']
+        inline = self.make(FakeSession(), workers=1).run_sync_scan(symbols, '15m')
+
+        pooled_scanner = self.make(FakeSession(), workers=2)
+        try:
+            pooled = pooled_scanner.run_sync_scan(symbols, '15m')
+        finally:
+            pooled_scanner.close()
+
+        self.assertEqual([r['symbol'] for r in pooled], symbols)
+        for a, b in zip(inline, pooled):
+            self.assertEqual(a['score'], b['score'])
+            self.assertEqual(b['score'], score_candles(b['symbol'], b['candles']))
+        self.assertTrue(all(0 <= r['score']['rsi'] <= 100 for r in pooled))
+
+
+if __name__ == '__main__':
+    unittest.main()
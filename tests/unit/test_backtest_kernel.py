@@ -0,0 +1,126 @@
+"""
+Unit Tests: Backtest Kernel
+AlphaX7Core.run_backtest 루프 방식과 배열 커널(use_kernel=True) 결과 일치 검증
+"""
+import unittest
+import sys
+import os
+import itertools
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.strategy_core import AlphaX7Core
+from core.backtest_kernel import TradeBuffer, DIR_LONG, DIR_SHORT, _next_true_index
+
+
+def make_candles(n: int = 4000, seed: int = 0) -> pd.DataFrame:
+    """결정적 15m 랜덤워크 캔들"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.003, n))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.003, n))
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=n, freq='15min'),
+        'open': open_, 'high': high, 'low': low, 'close': close,
+        'volume': rng.uniform(1, 10, n),
+    })
+
+
+def to_pattern(df: pd.DataFrame) -> pd.DataFrame:
+    return df.set_index('timestamp', drop=False).resample('1h').agg({
+        'timestamp': 'first', 'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'
+    }).dropna().reset_index(drop=True)
+
+
+def same(a, b) -> bool:
+    """값과 타입까지 동일한지 재귀 비교"""
+    if type(a) != type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(same(a[k], b[k]) for k in a)
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+class TestBacktestKernelParity(unittest.TestCase):
+    """루프 방식과 커널 방식의 거래 목록 일치"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.df_entry = make_candles(4000, seed=3)
+        cls.df_pattern = to_pattern(cls.df_entry)
+
+    def _run(self, **kwargs):
+        base = dict(
+            slippage=0.0006, atr_mult=1.25, trail_start_r=0.8, trail_dist_r=0.1,
+            pattern_tolerance=0.05, entry_validity_hours=24, pullback_rsi_long=40,
+            pullback_rsi_short=60, max_adds=1, rsi_period=14, atr_period=14,
+        )
+        base.update(kwargs)
+        loop = AlphaX7Core().run_backtest(self.df_pattern, self.df_entry, **base)
+        kernel = AlphaX7Core().run_backtest(self.df_pattern, self.df_entry, use_kernel=True, **base)
+        return loop, kernel
+
+    def test_trades_match_exactly(self):
+        """파라미터 조합별 거래 목록 완전 일치"""
+        for pullback, direction, filter_tf, max_adds in itertools.product(
+            [False, True], [None, 'Long', 'Short'], [None, '4h'], [1, 2]
+        ):
+            with self.subTest(pullback=pullback, direction=direction, filter_tf=filter_tf, max_adds=max_adds):
+                loop, kernel = self._run(
+                    enable_pullback=pullback, allowed_direction=direction,
+                    filter_tf=filter_tf, max_adds=max_adds,
+                )
+                self.assertGreater(len(loop), 0)
+                self.assertTrue(same(loop, kernel))
+
+    def test_final_state_matches(self):
+        """return_state=True 최종 상태 일치"""
+        loop, kernel = self._run(enable_pullback=True, filter_tf='4h', return_state=True)
+        self.assertTrue(same(loop[0], kernel[0]))
+        self.assertTrue(same(loop[1], kernel[1]))
+
+    def test_audit_uses_loop(self):
+        """collect_audit=True는 루프 방식으로 감사 로그 반환"""
+        trades, audit = AlphaX7Core().run_backtest(
+            self.df_pattern, self.df_entry, use_kernel=True, collect_audit=True
+        )
+        self.assertIsInstance(audit, list)
+
+    def test_nan_candles_fall_back(self):
+        """NaN 캔들이 있으면 루프 방식과 동일 결과"""
+        df = self.df_entry.copy()
+        df.loc[100, 'high'] = np.nan
+        loop = AlphaX7Core().run_backtest(self.df_pattern, df)
+        kernel = AlphaX7Core().run_backtest(self.df_pattern, df, use_kernel=True)
+        self.assertTrue(same(loop, kernel))
+
+
+class TestTradeBuffer(unittest.TestCase):
+    """거래 버퍼 기록/확장"""
+
+    def test_grows_beyond_capacity(self):
+        buf = TradeBuffer(capacity=2)
+        for i in range(5):
+            buf.close_positions([i, i + 1], [100.0, 101.0], i + 2, DIR_LONG, 102.0, 0.1)
+        self.assertEqual(len(buf.view()), 10)
+        self.assertFalse(buf.view()['is_addon'][0])
+        self.assertTrue(buf.view()['is_addon'][1])
+
+    def test_short_pnl(self):
+        buf = TradeBuffer()
+        buf.close_positions([0], [100.0], 3, DIR_SHORT, 90.0, 0.0)
+        self.assertAlmostEqual(buf.view()['pnl'][0], 10.0)
+
+    def test_next_true_index(self):
+        nxt = _next_true_index(np.array([False, True, False, False, True]))
+        self.assertEqual(nxt.tolist(), [1, 1, 4, 4, 4, 5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Unit Tests: Benchmark Suite
+합성 데이터 결정성, 결과 JSON 형식 및 회귀 한도 실패 처리 검증
+"""
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from tests.benchmarks.run_benchmarks import make_ohlcv, check_regressions, main
+
+
+class TestSyntheticData(unittest.TestCase):
+    """합성 OHLCV 생성"""
+
+    def test_deterministic_and_valid(self):
+        a = make_ohlcv(500, seed=3)
+        self.assertTrue(a.equals(make_ohlcv(500, seed=3)))
+        self.assertFalse(a.equals(make_ohlcv(500, seed=4)))
+        self.assertEqual(len(a), 500)
+        self.assertTrue((a['high'] >= a[['open', 'close']].max(axis=1)).all())
+        self.assertTrue((a['low'] <= a[['open', 'close']].min(axis=1)).all())
+
+
+class TestRegressionCheck(unittest.TestCase):
+    """baseline / 절대 한도 비교"""
+
+    def setUp(self):
+        self.results = {'case': {'units': 100, 'unit': 'candles', 'median_seconds': 0.2,
+                                 'throughput_per_sec': 500.0, 'peak_memory_mb': 10.0}}
+
+    def test_baseline_slowdown(self):
+        baseline = {'cases': {'case': {'units': 100, 'median_seconds': 0.1}}}
+        self.assertEqual(len(check_regressions(self.results, baseline, max_slowdown=0.5)), 1)
+        self.assertEqual(check_regressions(self.results, baseline, max_slowdown=1.5), [])
+        # 데이터 크기가 다르면 비교하지 않음
+        baseline['cases']['case']['units'] = 200
+        self.assertEqual(check_regressions(self.results, baseline, max_slowdown=0.5), [])
+
+    def test_thresholds(self):
+        self.assertEqual(check_regressions(self.results, thresholds={'case': {'max_seconds': 1}}), [])
+        failures = check_regressions(self.results, thresholds={
+            'case': {'max_seconds': 0.1, 'min_throughput': 1000, 'max_peak_memory_mb': 5}})
+        self.assertEqual(len(failures), 3)
+
+
+class TestRunner(unittest.TestCase):
+    """실행기: 결과 파일 기록 및 종료 코드"""
+
+    def test_output_and_exit_code(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, 'bench.json')
+            args = ['--candles', '3000', '--repeat', '1', '--output', output, '-q',
+                    '--cases', 'add_all_indicators,extract_all_signals,run_backtest,calculate_metrics']
+            self.assertEqual(main(args), 0)
+            with open(output, encoding='utf-8') as f:
+                report = json.load(f)
+            self.assertEqual(report['candles'], 3000)
+            self.assertEqual(set(report['cases']),
+                             {'add_all_indicators', 'extract_all_signals', 'run_backtest', 'calculate_metrics'})
+            for result in report['cases'].values():
+                self.assertGreater(result['throughput_per_sec'], 0)
+                self.assertGreaterEqual(result['peak_memory_mb'], 0)
+            self.assertEqual(report['regressions'], [])
+
+            thresholds = os.path.join(tmp, 'thresholds.json')
+            with open(thresholds, 'w', encoding='utf-8') as f:
+                json.dump({'add_all_indicators': {'max_seconds': 0}}, f)
+            self.assertEqual(main(['--candles', '3000', '--repeat', '1', '--output', output, '-q',
+                                   '--cases', 'add_all_indicators', '--thresholds', thresholds]), 1)
+            self.assertEqual(main(['--candles', '3000', '--repeat', '1', '--output', output, '-q',
+                                   '--cases', 'add_all_indicators', '--baseline', output,
+                                   '--max-slowdown', '10']), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
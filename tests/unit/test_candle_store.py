@@ -0,0 +1,218 @@
+"""
+Unit Tests: Append-only Candle Store
+델타 추가, 진행 중 캔들 버퍼, 월별 파티션 압축, 기존 단일 파일 가져오기/미러,
+외부 변경 재가져오기, 미러 기록 간격 제한, 조회 중 압축 검증
+"""
+import unittest
+import sys
+import os
+import tempfile
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from storage.candle_store import CandleStore
+
+
+def make_candles(start: str, n: int, close: float = 1.5) -> pd.DataFrame:
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start, periods=n, freq='15min'),
+        'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': close, 'volume': 3.0,
+    })
+
+
+def to_ms(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    df['timestamp'] = (df['timestamp'] - pd.Timestamp('1970-01-01')) // pd.Timedelta(milliseconds=1)
+    return df
+
+
+def ws_kline(ts: pd.Timestamp, close: float) -> dict:
+    return {'start': int(ts.timestamp() * 1000), 'open': '1', 'high': '2', 'low': '0.5',
+            'close': str(close), 'volume': '1'}
+
+
+class TestCandleStore(unittest.TestCase):
+    """CandleStore 단위 테스트"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+        self.store = CandleStore(root=os.path.join(self.dir, 'candles'), legacy_dir=self.dir,
+                                 compact_threshold=4, background=False)
+
+    def tearDown(self):
+        self.store.flush()
+        self.tmp.cleanup()
+
+    def test_append_does_not_rewrite_history(self):
+        self.store.append('bybit', 'BTCUSDT', '15m', make_candles('2024-01-31 12:00', 8))
+        self.store.compact('bybit', 'BTCUSDT', '15m')
+        partition = os.path.join(self.dir, 'candles', 'bybit_btcusdt_15m', '2024-01.parquet')
+        mtime = os.stat(partition).st_mtime_ns
+
+        last = pd.Timestamp('2024-01-31 13:45')
+        for i in range(1, 3):
+            self.store.append('bybit', 'BTCUSDT', '15m', ws_kline(last + pd.Timedelta(minutes=15 * i), 9.0))
+
+        self.assertEqual(os.stat(partition).st_mtime_ns, mtime)
+        df = self.store.read('bybit', 'BTCUSDT', '15m')
+        self.assertEqual(len(df), 10)
+        self.assertEqual(df['close'].iloc[-1], 9.0)
+        self.assertTrue(df['timestamp'].is_monotonic_increasing)
+
+    def test_compaction_partitions_by_month(self):
+        self.store.append('bybit', 'BTCUSDT', '15m', make_candles('2024-01-31 23:00', 4))
+        self.store.append('bybit', 'BTCUSDT', '15m', make_candles('2024-02-01 00:00', 4, close=7.0))
+        before = self.store.read('bybit', 'BTCUSDT', '15m')
+        self.assertEqual(self.store.compact('bybit', 'BTCUSDT', '15m'), 2)
+
+        key_dir = os.path.join(self.dir, 'candles', 'bybit_btcusdt_15m')
+        self.assertEqual(sorted(f for f in os.listdir(key_dir) if f.endswith('.parquet')),
+                         ['2024-01.parquet', '2024-02.parquet'])
+        self.assertEqual(os.listdir(os.path.join(key_dir, 'delta')), [])
+        pd.testing.assert_frame_equal(self.store.read('bybit', 'BTCUSDT', '15m'), before)
+        self.assertEqual(len(self.store.read('bybit', 'BTCUSDT', '15m', start='2024-02-01')), 4)
+        self.assertEqual(len(self.store.tail('bybit', 'BTCUSDT', '15m', 3)), 3)
+        self.assertEqual(self.store.last_timestamp('bybit', 'BTCUSDT', '15m'), pd.Timestamp('2024-02-01 00:45'))
+
+    def test_buffered_ticks_keep_latest(self):
+        ts = pd.Timestamp('2024-03-01 00:00')
+        self.store.append('bybit', 'ETHUSDT', '1h', ws_kline(ts, 1.0), buffer=True)
+        self.store.append('bybit', 'ETHUSDT', '1h', ws_kline(ts, 2.0), buffer=True)
+        self.assertEqual(self.store.stats['pending_deltas'].get('bybit_ethusdt_1h', 0), 0)
+        self.assertEqual(self.store.read('bybit', 'ETHUSDT', '1h')['close'].tolist(), [2.0])
+
+        # 다음 캔들 틱 → 이전 캔들만 델타로 기록
+        self.store.append('bybit', 'ETHUSDT', '1h', ws_kline(ts + pd.Timedelta(hours=1), 3.0), buffer=True)
+        self.assertEqual(self.store.stats['pending_deltas']['bybit_ethusdt_1h'], 1)
+        self.assertEqual(self.store.read('bybit', 'ETHUSDT', '1h', include_buffer=False)['close'].tolist(), [2.0])
+        self.assertEqual(self.store.read('bybit', 'ETHUSDT', '1h')['close'].tolist(), [2.0, 3.0])
+
+    def test_legacy_import_and_mirror(self):
+        legacy = os.path.join(self.dir, 'bybit_btcusdt_15m.parquet')
+        df = to_ms(make_candles('2024-01-01', 10))
+        df.to_parquet(legacy, index=False)
+
+        self.assertEqual(len(self.store.read('bybit', 'BTCUSDT', '15m')), 10)
+        for i in range(4):
+            self.store.append('bybit', 'BTCUSDT', '15m', ws_kline(pd.Timestamp('2024-01-01 02:30') + pd.Timedelta(minutes=15 * i), 8.0))
+
+        # 임계치 도달 → 압축 + 미러 갱신
+        mirror = pd.read_parquet(legacy)
+        self.assertEqual(len(mirror), 14)
+        self.assertEqual(mirror['close'].iloc[-1], 8.0)
+        # 미러는 기존 형식 그대로 ms 정수 timestamp
+        self.assertEqual(mirror['timestamp'].dtype, 'int64')
+        self.assertEqual(mirror['timestamp'].iloc[0], df['timestamp'].iloc[0])
+        self.assertEqual(mirror['timestamp'].iloc[-1], int(pd.Timestamp('2024-01-01 03:15').timestamp() * 1000))
+
+    def test_external_rewrite_is_reimported(self):
+        legacy = os.path.join(self.dir, 'bybit_btcusdt_15m.parquet')
+        to_ms(make_candles('2024-01-01', 10)).to_parquet(legacy, index=False)
+        self.assertEqual(len(self.store.read('bybit', 'BTCUSDT', '15m')), 10)
+        self.store.append('bybit', 'BTCUSDT', '15m', ws_kline(pd.Timestamp('2024-01-01 02:30'), 8.0))
+
+        # GUI 다운로더가 더 긴 히스토리로 단일 파일을 다시 씀 (압축 없이 다음 조회에 반영)
+        external = make_candles('2023-12-31 18:00', 60, close=4.0)
+        to_ms(external).to_parquet(legacy, index=False)
+        tail = self.store.tail('bybit', 'BTCUSDT', '15m', 100)
+        self.assertEqual(len(tail), 60)
+        self.assertEqual(tail['timestamp'].iloc[0], external['timestamp'].iloc[0])
+        # 우선순위: 외부 < 기존 파티션 < 델타
+        closes = tail.set_index('timestamp')['close']
+        self.assertEqual(closes[pd.Timestamp('2024-01-01 00:00')], 1.5)
+        self.assertEqual(closes[pd.Timestamp('2024-01-01 02:30')], 8.0)
+        self.assertEqual(closes[pd.Timestamp('2024-01-01 05:00')], 4.0)
+        pd.testing.assert_frame_equal(self.store.read('bybit', 'BTCUSDT', '15m'), tail)
+
+        # 변경이 없으면 다시 읽지 않음
+        partition = os.path.join(self.dir, 'candles', 'bybit_btcusdt_15m', '2024-01.parquet')
+        mtime = os.stat(partition).st_mtime_ns
+        self.store.read('bybit', 'BTCUSDT', '15m')
+        self.assertEqual(os.stat(partition).st_mtime_ns, mtime)
+
+    def test_mirror_is_throttled(self):
+        store = CandleStore(root=os.path.join(self.dir, 'candles'), legacy_dir=self.dir,
+                            compact_threshold=4, background=False, mirror_interval=3600)
+        legacy = os.path.join(self.dir, 'bybit_ethusdt_15m.parquet')
+        base = pd.Timestamp('2024-01-01')
+
+        def append(start, n):
+            for i in range(n):
+                store.append('bybit', 'ETHUSDT', '15m', ws_kline(base + pd.Timedelta(minutes=15 * (start + i)), 2.0))
+
+        append(0, 4)
+        self.assertEqual(len(pd.read_parquet(legacy)), 4)
+
+        # 간격 안의 압축은 미러를 다시 쓰지 않음 (파티션은 갱신)
+        append(4, 8)
+        self.assertEqual(len(pd.read_parquet(legacy)), 4)
+        self.assertEqual(store.stats['mirror_pending'], 1)
+        self.assertEqual(len(store.read('bybit', 'ETHUSDT', '15m')), 12)
+
+        # 강제 기록 (save_parquet) / 종료 시 flush
+        store.compact('bybit', 'ETHUSDT', '15m', force_mirror=True)
+        self.assertEqual(len(pd.read_parquet(legacy)), 12)
+        append(12, 4)
+        self.assertEqual(len(pd.read_parquet(legacy)), 12)
+        store.flush()
+        mirror = pd.read_parquet(legacy)
+        self.assertEqual(len(mirror), 16)
+        self.assertEqual(mirror['timestamp'].dtype, 'int64')
+        self.assertEqual(store.stats['mirror_pending'], 0)
+
+        # 자기 미러는 외부 변경으로 보지 않음
+        self.assertEqual(len(store.read('bybit', 'ETHUSDT', '15m')), 16)
+
+    def test_read_during_compaction_keeps_candles(self):
+        store = CandleStore(root=os.path.join(self.dir, 'candles'), legacy_dir=self.dir,
+                            compact_threshold=100, background=False)
+        base = pd.Timestamp('2024-01-01')
+        real_list = store._list_partitions
+
+        def interleave(n):
+            for i in range(n):
+                store.append('bybit', 'SOLUSDT', '15m', ws_kline(base + pd.Timedelta(minutes=15 * i), 3.0))
+            calls = []
+
+            def list_then_compact(key):
+                # 파티션 목록을 잡은 직후 압축 (파티션 기록 + 델타 삭제)
+                partitions = real_list(key)
+                if not calls:
+                    calls.append(key)
+                    store.compact('bybit', 'SOLUSDT', '15m')
+                return partitions
+
+            store._list_partitions = list_then_compact
+            return calls
+
+        calls = interleave(5)
+        self.assertEqual(len(store.read('bybit', 'SOLUSDT', '15m')), 5)
+        self.assertTrue(calls)
+        self.assertEqual(store.stats['pending_deltas']['bybit_solusdt_15m'], 0)
+
+        calls = interleave(8)
+        self.assertEqual(len(store.tail('bybit', 'SOLUSDT', '15m', 100)), 8)
+        self.assertTrue(calls)
+
+
+class TestDataManagerLoad(unittest.TestCase):
+    """BotDataManager.load_historical: 저장소 전체가 아닌 최근 1000개 (기존 entry 파일 구간)"""
+
+    def test_load_historical_window(self):
+        from core.data_manager import BotDataManager
+        with tempfile.TemporaryDirectory() as tmp:
+            df = make_candles('2024-01-01', 1500)
+            to_ms(df).to_parquet(os.path.join(tmp, 'bybit_btcusdt_15m.parquet'), index=False)
+            manager = BotDataManager('bybit', 'BTCUSDT', cache_dir=tmp)
+            self.assertTrue(manager.load_historical())
+            self.assertEqual(len(manager.df_entry_full), 1000)
+            self.assertEqual(manager.df_entry_full['timestamp'].iloc[0], df['timestamp'].iloc[500])
+            self.assertEqual(manager.df_entry_full['timestamp'].iloc[-1], df['timestamp'].iloc[-1])
+            manager.candle_store.flush()
+
+
+if __name__ == '__main__':
+    unittest.main()
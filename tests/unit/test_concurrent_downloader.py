@@ -0,0 +1,175 @@
+"""
+Unit Tests: Concurrent Downloader
+로컬 가짜 거래소로 구간 분할/동시 수집 결과가 순차 페이지네이션과 같은지,
+거래소별 토큰 버킷, 클라이언트 재사용, DataManager 캐시 저장 검증
+"""
+import unittest
+import sys
+import os
+import tempfile
+import threading
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utils.api_utils import TokenBucket
+from utils.concurrent_downloader import (
+    ConcurrentDownloader, DownloadJob, ExchangeClientPool, split_windows, timeframe_to_ms,
+)
+
+HOUR = 3_600_000
+START = int(pd.Timestamp('2024-01-01').timestamp() * 1000)
+
+
+class FakeExchange:
+    """ccxt fetch_ohlcv 흉내: since 이후 최대 limit개 (지연/실패 주입 가능)"""
+
+    def __init__(self, listings=None, end=START + 5000 * HOUR, page_limit=1000,
+                 latency=0.0, fail_every=0, rate_limit=None):
+        self.listings = listings or {'BTC/USDT:USDT': START, 'ETH/USDT:USDT': START + 700 * HOUR}
+        self.end = end
+        self.page_limit = page_limit
+        self.latency = latency
+        self.fail_every = fail_every
+        if rate_limit is not None:
+            self.rateLimit = rate_limit
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def candle(ts):
+        base = ts / HOUR
+        return [ts, base, base + 2, base - 2, base + 1, 10.0]
+
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        tf = timeframe_to_ms(timeframe)
+        with self._lock:
+            self.calls.append((symbol, since, limit))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            fail = self.fail_every and len(self.calls) % self.fail_every == 0
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            if fail:
+                raise ConnectionError('fake network error')
+            first = max(self.listings[symbol], -(-since // tf) * tf)
+            count = min(limit or self.page_limit, self.page_limit)
+            return [self.candle(ts) for ts in range(first, self.end, tf)][:count]
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def expected(self, symbol, since, until, tf='1h'):
+        first = max(self.listings[symbol], since)
+        return [self.candle(ts) for ts in range(first, min(until, self.end), timeframe_to_ms(tf))]
+
+
+def make_downloader(exchange, **kwargs):
+    kwargs.setdefault('rate_limits', {'bybit': 10000})
+    return ConcurrentDownloader(client_pool=ExchangeClientPool(lambda _: exchange), retry_delay=0, **kwargs)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """토큰 버킷: 버스트 후 rate로 제한"""
+
+    def test_rate_and_burst(self):
+        now = [0.0]
+        bucket = TokenBucket(rate=5, capacity=2, clock=lambda: now[0],
+                             sleep=lambda s: now.__setitem__(0, now[0] + s))
+        for _ in range(12):
+            bucket.acquire()
+        # 버스트 2개 + 나머지 10개는 초당 5개
+        self.assertAlmostEqual(now[0], 2.0)
+        self.assertFalse(bucket.acquire(timeout=0.1))
+        with self.assertRaises(ValueError):
+            TokenBucket(0)
+
+
+class TestConcurrentDownloader(unittest.TestCase):
+    """구간 분할 동시 수집 == 전체 기간 캔들"""
+
+    def test_split_windows(self):
+        windows = split_windows(START, START + 2500 * HOUR, '1h', 1000)
+        self.assertEqual(windows, [(START, START + 1000 * HOUR), (START + 1000 * HOUR, START + 2000 * HOUR),
+                                   (START + 2000 * HOUR, START + 2500 * HOUR)])
+
+    def test_multi_symbol_matches_expected(self):
+        exchange = FakeExchange(latency=0.01)
+        downloader = make_downloader(exchange, max_workers=8)
+        since, until = START - 100 * HOUR, START + 4800 * HOUR
+        arrived = []
+        jobs = [DownloadJob('bybit', s, '1h', since, until) for s in exchange.listings]
+        results = downloader.download(jobs, on_result=lambda job, rows: arrived.append(job.key))
+        for symbol in exchange.listings:
+            self.assertEqual(results[symbol], exchange.expected(symbol, since, until))
+        self.assertEqual(sorted(arrived), sorted(exchange.listings))
+        self.assertGreater(exchange.max_in_flight, 1)
+
+    def test_short_pages_and_retries(self):
+        exchange = FakeExchange(page_limit=300, fail_every=4)
+        downloader = make_downloader(exchange, max_workers=4)
+        rows = downloader.fetch_range('bybit', 'BTC/USDT:USDT', '1h', START, START + 3000 * HOUR)
+        self.assertEqual(rows, exchange.expected('BTC/USDT:USDT', START, START + 3000 * HOUR))
+
+    def test_failure_reported(self):
+        exchange = FakeExchange(fail_every=1)
+        downloader = make_downloader(exchange, max_retries=2)
+        errors = []
+        results = downloader.download([DownloadJob('bybit', 'BTC/USDT:USDT', '1h', START, START + 10 * HOUR)],
+                                      on_error=lambda job, e: errors.append(job.key))
+        self.assertEqual(results, {})
+        self.assertEqual(errors, ['BTC/USDT:USDT'])
+
+    def test_shared_rate_limit(self):
+        exchange = FakeExchange(rate_limit=20)  # ccxt rateLimit (ms) → 50 req/s
+        downloader = ConcurrentDownloader(client_pool=ExchangeClientPool(lambda _: exchange), max_workers=8)
+        self.assertAlmostEqual(downloader.bucket('bybit').rate, 50.0)
+        started = time.monotonic()
+        downloader.fetch_range('bybit', 'BTC/USDT:USDT', '1h', START, START + 5000 * HOUR)
+        # 요청 6개 (probe + 구간 5개), 버스트 이후 초당 50개 이하
+        self.assertEqual(len(exchange.calls), 6)
+        self.assertLess(time.monotonic() - started, 1.0)
+
+    def test_client_created_once(self):
+        created = []
+        pool = ExchangeClientPool(lambda ex: created.append(ex) or FakeExchange())
+        threads = [threading.Thread(target=pool.get, args=('bybit',)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertIs(pool.get('BYBIT'), pool.get('bybit'))
+        self.assertEqual(created, ['bybit'])
+
+
+class TestDataManagerDownloadMany(unittest.TestCase):
+    """DataManager.download_many: 심볼별 캐시 저장 + 이어받기"""
+
+    def test_download_and_resume(self):
+        from GUI.data_manager import DataManager
+        exchange = FakeExchange(end=START + 3000 * HOUR)
+        with tempfile.TemporaryDirectory() as tmp:
+            dm = DataManager(cache_dir=tmp)
+            dm._downloader = make_downloader(exchange)
+            saved = []
+            counts = dm.download_many(['BTCUSDT', 'ETHUSDT'], '1h', start_date='2024-01-01',
+                                      on_symbol_done=lambda s, df: saved.append(s))
+            self.assertEqual(counts, {'BTCUSDT': 3000, 'ETHUSDT': 2300})
+            self.assertEqual(sorted(saved), ['BTCUSDT', 'ETHUSDT'])
+            df = dm._load_cache(dm._get_cache_path('bybit', 'BTCUSDT', '1h'))
+            self.assertEqual(df['timestamp'].tolist(), list(range(START, START + 3000 * HOUR, HOUR)))
+
+            # 새 캔들만 이어받기
+            exchange.end += 10 * HOUR
+            exchange.calls.clear()
+            self.assertEqual(dm.download_many(['BTCUSDT'], '1h'), {'BTCUSDT': 3010})
+            self.assertEqual(exchange.calls[0][1], START + 2999 * HOUR + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Unit Tests: Incremental Pattern Detection
+증분 W/M 감지기가 전체 재계산(_extract_all_signals)과 같은 시그널을 내는지,
+실시간 경로가 새로 마감된 봉만 검사하는지 검증
+"""
+import unittest
+import sys
+import os
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.strategy_core import AlphaX7Core
+from core.signal_processor import SignalProcessor
+from core.incremental_patterns import IncrementalPatternDetector
+
+
+def make_hourly(n: int = 1500, seed: int = 2) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.008, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2023-01-01', periods=n, freq='1h'),
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + rng.uniform(0, 0.004, n)),
+        'low': np.minimum(open_, close) * (1 - rng.uniform(0, 0.004, n)),
+        'close': close,
+        'volume': rng.uniform(1, 10, n),
+    })
+
+
+class TestIncrementalPatternDetector(unittest.TestCase):
+    """IncrementalPatternDetector == _extract_all_signals"""
+
+    def setUp(self):
+        self.core = AlphaX7Core()
+        self.df = make_hourly()
+
+    def test_matches_batch_when_fed_incrementally(self):
+        for tolerance in (0.02, 0.05):
+            expected = self.core._extract_all_signals(self.df, tolerance, 12)
+            self.assertGreater(len(expected), 5)
+            detector = IncrementalPatternDetector(tolerance)
+            got = detector.update(self.df.iloc[:200])
+            for end in range(201, len(self.df) + 1):
+                got += detector.update(self.df.iloc[:end])
+            self.assertEqual(got, expected)
+            self.assertEqual(detector.signals, expected)
+
+    def test_numeric_timestamps(self):
+        df = self.df.copy()
+        df['timestamp'] = df['timestamp'].astype('int64') // 1000
+        self.assertEqual(IncrementalPatternDetector(0.05).update(df),
+                         self.core._extract_all_signals(df, 0.05, 12))
+
+    def test_only_new_bars_examined(self):
+        detector = IncrementalPatternDetector(0.05)
+        detector.update(self.df.iloc[:-1])
+        with mock.patch.object(detector, '_step', wraps=detector._step) as step:
+            detector.update(self.df)
+            detector.update(self.df)
+        self.assertEqual(step.call_count, 1)
+
+    def test_revised_history_reseeds(self):
+        detector = IncrementalPatternDetector(0.05)
+        detector.update(self.df)
+        revised = self.df.copy()
+        revised.loc[len(revised) - 1, 'close'] *= 1.01
+        self.assertEqual(detector.update(revised), self.core._extract_all_signals(revised, 0.05, 12))
+
+
+class TestLiveSignalPaths(unittest.TestCase):
+    """실시간 경로: _extract_new_signals / SignalProcessor.add_patterns_from_df"""
+
+    def setUp(self):
+        self.df = make_hourly()
+
+    def test_extract_new_signals(self):
+        core = AlphaX7Core()
+        all_signals = core._extract_all_signals(self.df, 0.05, 12)
+        since = pd.Timestamp(all_signals[len(all_signals) // 2]['time'])
+        expected = [s for s in all_signals if pd.Timestamp(s['time']) > since]
+        self.assertEqual(core._extract_new_signals(self.df.iloc[:1000], None, 0.05, 12, 12, 26, 9),
+                         core._extract_all_signals(self.df.iloc[:1000], 0.05, 12))
+        self.assertEqual(core._extract_new_signals(self.df, since, 0.05, 12, 12, 26, 9), expected)
+
+    def test_add_patterns_from_df(self):
+        processor = SignalProcessor(strategy_params={'entry_validity_hours': 1e6, 'pattern_tolerance': 0.05},
+                                    maxlen=1000)
+        for end in range(1000, len(self.df) + 1, 25):
+            processor.add_patterns_from_df(self.df.iloc[:end])
+        expected = AlphaX7Core()._extract_all_signals(self.df, 0.05, 12)
+        self.assertEqual([(s['time'], s['type']) for s in processor.pending_signals],
+                         [(s['time'], s['type']) for s in expected])
+        self.assertEqual(processor.add_patterns_from_df(self.df), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+Unit Tests: KlinePoller / MultiTrader Signal Scan
+증분 폴링 결과가 전체 요청과 같은지, 구간 끊김 시 재요청, 결과 순서 및 동시 요청 수 제한,
+MultiTrader 스캔 연동 검증
+"""
+import unittest
+import sys
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utils.kline_poller import KlinePoller
+from core.multi_trader import MultiTrader
+
+STEP = 15 * 60  # 15m (초)
+START = pd.Timestamp('2024-01-01').timestamp()
+
+
+class FakeExchange:
+    """현재 시각까지의 15m 캔들 (마지막 캔들은 진행 중 → 시각마다 종가 변경)"""
+
+    def __init__(self, delay=0.0):
+        self.now = START + 500 * STEP + 60
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def candles(self, symbol, limit):
+        seed = sum(map(ord, symbol))
+        n = int((self.now - START) // STEP) + 1
+        idx = np.arange(n - limit, n)
+        close = 100 + seed % 7 + np.sin(idx / 5.0 + seed)
+        close[-1] += (self.now % STEP) / STEP  # 진행 중 캔들
+        return pd.DataFrame({
+            'timestamp': pd.to_datetime(START + idx * STEP, unit='s'),
+            'open': close - 0.1,
+            'high': close + 0.5,
+            'low': close - 0.5,
+            'close': close,
+            'volume': np.full(limit, 10.0) + idx % 3,
+        })
+
+    def fetch(self, symbol, interval, limit):
+        with self._lock:
+            self.calls.append((symbol, limit))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            return self.candles(symbol, limit)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestKlinePoller(unittest.TestCase):
+    """증분 폴링 == 전체 요청"""
+
+    def make(self, exchange, **kwargs):
+        kwargs.setdefault('rate', 1000)
+        return KlinePoller(exchange.fetch, interval='15m', limit=100, clock=lambda: exchange.now, **kwargs)
+
+    def test_incremental_matches_full(self):
+        exchange = FakeExchange()
+        poller = self.make(exchange)
+        first = poller.fetch_symbol('BTCUSDT')
+        pd.testing.assert_frame_equal(first, exchange.candles('BTCUSDT', 100))
+
+        for advance in (30, STEP, 3 * STEP + 100, 0):
+            exchange.now += advance
+            exchange.calls.clear()
+            df = poller.fetch_symbol('BTCUSDT')
+            self.assertLess(exchange.calls[0][1], 100)
+            pd.testing.assert_frame_equal(df, exchange.candles('BTCUSDT', 100))
+        self.assertEqual(poller.stats['full'], 1)
+        self.assertEqual(poller.stats['incremental'], 4)
+
+    def test_gap_refetches_full(self):
+        exchange = FakeExchange()
+        poller = self.make(exchange)
+        poller.fetch_symbol('ETHUSDT')
+
+        # 오래 멈춘 뒤 → 전체 재요청
+        exchange.now += 200 * STEP
+        exchange.calls.clear()
+        df = poller.fetch_symbol('ETHUSDT')
+        self.assertEqual(exchange.calls, [('ETHUSDT', 100)])
+        pd.testing.assert_frame_equal(df, exchange.candles('ETHUSDT', 100))
+
+        # 증분 응답이 캐시 마지막 (진행 중이던) 캔들을 덮지 못하면 전체 재요청
+        exchange.now += STEP
+        real = exchange.candles
+        exchange.candles = lambda s, n: real(s, n).iloc[2:].reset_index(drop=True) if n < 100 else real(s, n)
+        exchange.calls.clear()
+        df = poller.fetch_symbol('ETHUSDT')
+        self.assertEqual([n for _, n in exchange.calls][-1], 100)
+        pd.testing.assert_frame_equal(df, real('ETHUSDT', 100))
+
+    def test_scan_order_and_concurrency(self):
+        exchange = FakeExchange(delay=0.03)
+        poller = self.make(exchange, max_workers=3)
+        symbols = ['S%02dUSDT' % i for i in range(10)]
+
+        def evaluate(symbol, df):
+            if symbol == 'S03USDT':
+                raise ValueError('bad frame')
+            df['extra'] = 1  # 캐시에는 영향 없음
+            return None if symbol == 'S05USDT' else (symbol, float(df['close'].iloc[-1]))
+
+        results = poller.scan(symbols, evaluate)
+        expected = [s for s in symbols if s not in ('S03USDT', 'S05USDT')]
+        self.assertEqual([s for s, _ in results], expected)
+        for symbol, close in results:
+            self.assertEqual(close, float(exchange.candles(symbol, 100)['close'].iloc[-1]))
+        self.assertLessEqual(exchange.max_active, 3)
+        self.assertGreater(exchange.max_active, 1)
+
+        # 감시 목록에서 빠진 심볼 캐시 정리
+        poller.scan(symbols[:2], lambda s, df: 'extra' in df)
+        self.assertEqual(poller.stats['symbols'], 2)
+        self.assertEqual(poller.scan(symbols[:2], lambda s, df: s, should_stop=lambda: True), [])
+
+
+class TestMultiTraderScan(unittest.TestCase):
+    """MultiTrader._scan_signals 연동"""
+
+    def test_scan_signals(self):
+        exchange = FakeExchange()
+
+        class FakeAdapter:
+            def get_klines(self, symbol, interval, limit):
+                return exchange.fetch(symbol, interval, limit)
+
+        class FakeCore:
+            def detect_pattern(self, df):
+                last = float(df['close'].iloc[-1])
+                return {'detected': last > 103, 'direction': 'Long', 'strength': round(last, 3)}
+
+        trader = MultiTrader.__new__(MultiTrader)
+        trader.exchange_name = 'bybit'
+        trader.adapter = FakeAdapter()
+        trader.core = FakeCore()
+        trader.poller = None
+        trader.running = True
+        trader.pending_signals = []
+        trader.stats = {'watching': 0, 'pending': [], 'active': None}
+        trader.watching_symbols = ['BTCUSDT', 'ETHUSDT', 'SOLUSDT', 'XRPUSDT', 'DOGEUSDT']
+
+        trader._scan_signals()
+        trader.poller._clock = lambda: exchange.now
+        expected = []
+        for symbol in trader.watching_symbols:
+            last = float(exchange.candles(symbol, 100)['close'].iloc[-1])
+            if last > 103:
+                expected.append({'symbol': symbol, 'direction': 'Long', 'strength': round(last, 3), 'price': last})
+        self.assertEqual(trader.pending_signals, expected)
+        self.assertEqual(trader.stats['watching'], 5)
+
+        exchange.now += STEP
+        trader._scan_signals()
+        self.assertEqual(trader.poller.stats['incremental'], 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
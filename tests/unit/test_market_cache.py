@@ -0,0 +1,215 @@
+"""
+Unit Tests: Market Metadata Cache
+TTL 이내 캐시 적용 (load_markets 호출 없음), TTL 초과 시 백그라운드 갱신,
+디스크 영속화, 주기 갱신 (싱글톤 시작/종료), instrument() 정규화 (TICK_SIZE / DECIMAL_PLACES) 검증
+"""
+import unittest
+import sys
+import os
+import tempfile
+import threading
+import time
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import storage.market_cache as market_cache
+from storage.market_cache import MarketMetadataCache
+
+
+def make_market(symbol, market_id, market_type, price, amount, min_qty=None, max_leverage=None):
+    base, quote = symbol.split(':')[0].split('/')
+    return {
+        'id': market_id, 'symbol': symbol, 'base': base, 'quote': quote,
+        'settle': quote if market_type == 'swap' else None,
+        'type': market_type, 'spot': market_type == 'spot', 'swap': market_type == 'swap',
+        'contract': market_type == 'swap', 'linear': market_type == 'swap' or None, 'active': True,
+        'precision': {'price': price, 'amount': amount},
+        'limits': {'amount': {'min': min_qty}, 'cost': {'min': 5}, 'leverage': {'max': max_leverage}},
+    }
+
+
+MARKETS = {
+    'BTC/USDT': make_market('BTC/USDT', 'BTCUSDT', 'spot', 0.01, 0.000001, 0.000048),
+    'BTC/USDT:USDT': make_market('BTC/USDT:USDT', 'BTCUSDT', 'swap', 0.1, 0.001, 0.001, 100),
+    'ETH/USDT:USDT': make_market('ETH/USDT:USDT', 'ETHUSDT', 'swap', 0.01, 0.01, 0.01, 50),
+}
+
+
+class FakeClient:
+    """ccxt 클라이언트 흉내 (load_markets 호출 횟수 기록)"""
+
+    precisionMode = 4
+
+    def __init__(self, markets=None):
+        self._remote = markets or MARKETS
+        self.markets = None
+        self.currencies = {}
+        self.load_calls = 0
+
+    def load_markets(self):
+        self.load_calls += 1
+        self.markets = dict(self._remote)
+        return self.markets
+
+    def set_markets(self, markets, currencies=None):
+        self.markets = markets
+        self.currencies = currencies or {}
+
+
+class TestMarketMetadataCache(unittest.TestCase):
+    """apply_to / TTL / 백그라운드 갱신 / 영속화"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.now = [1_000_000.0]
+        self.loads = []
+        self.loaded = threading.Event()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def loader(self, exchange_id, market_type, sandbox):
+        self.loads.append((exchange_id, market_type, sandbox))
+        self.loaded.set()
+        return MARKETS, {'BTC': {'code': 'BTC'}}, 4
+
+    def make_cache(self, **kwargs):
+        return MarketMetadataCache(cache_dir=self.tmp.name, loader=self.loader,
+                                   clock=lambda: self.now[0], **kwargs)
+
+    def test_apply_uses_cache_after_first_load(self):
+        cache = self.make_cache()
+        first = FakeClient()
+        self.assertFalse(cache.apply_to(first, 'bybit', 'swap'))
+        self.assertEqual(first.load_calls, 1)
+
+        # 새 인스턴스 (재시작)도 디스크 캐시 사용 → load_markets 없음
+        restarted = self.make_cache()
+        client = FakeClient()
+        self.assertTrue(restarted.apply_to(client, 'bybit', 'swap'))
+        self.assertEqual(client.load_calls, 0)
+        self.assertEqual(set(client.markets), set(MARKETS))
+        self.assertEqual(self.loads, [])
+        self.assertEqual(restarted.stats['hits'], 1)
+
+        # 키 분리: 테스트넷 / 다른 마켓 타입은 별도 엔트리
+        other = FakeClient()
+        self.assertFalse(restarted.apply_to(other, 'bybit', 'swap', sandbox=True))
+        self.assertEqual(other.load_calls, 1)
+
+    def test_stale_served_and_refreshed_in_background(self):
+        cache = self.make_cache(ttl=60, max_age=3600)
+        cache.apply_to(FakeClient(), 'okx', 'swap')
+
+        self.now[0] += 120  # TTL 초과, max_age 이내
+        client = FakeClient()
+        self.assertTrue(cache.apply_to(client, 'okx', 'swap'))
+        self.assertEqual(client.load_calls, 0)
+        self.assertTrue(self.loaded.wait(5))
+        for _ in range(100):
+            if cache.stats['loads'] == 2:
+                break
+            time.sleep(0.01)
+        self.assertEqual(cache.get_markets('okx', 'swap')['updated_at'], self.now[0])
+        self.assertEqual(self.loads, [('okx', 'swap', False)])
+
+        self.now[0] += 7200  # max_age 초과 → 캐시 무시
+        expired = FakeClient()
+        self.assertFalse(cache.apply_to(expired, 'okx', 'swap'))
+        self.assertEqual(expired.load_calls, 1)
+
+    def test_periodic_refresh_without_reads(self):
+        cache = self.make_cache(ttl=60, max_age=3600)
+        cache.apply_to(FakeClient(), 'bitget', 'swap')
+        self.now[0] += 120
+        cache.start_background_refresh(interval=0.01)
+        try:
+            # 조회 없이 주기 스레드가 TTL 지난 엔트리 갱신
+            self.assertTrue(self.loaded.wait(5))
+        finally:
+            cache.stop_background_refresh()
+        self.assertFalse(cache._refresh_thread.is_alive())
+        self.assertEqual(self.loads[0], ('bitget', 'swap', False))
+        self.assertEqual(cache._entries[('bitget', 'swap', False)]['updated_at'], self.now[0])
+
+    def test_singleton_starts_and_stops_refresh(self):
+        with mock.patch.object(market_cache, '_market_cache', None), \
+                mock.patch.object(market_cache, 'DEFAULT_CACHE_DIR', self.tmp.name), \
+                mock.patch.object(market_cache.atexit, 'register') as register:
+            cache = market_cache.get_market_cache()
+            self.assertIs(market_cache.get_market_cache(), cache)
+        self.assertTrue(cache._refresh_thread.is_alive())
+        register.assert_called_once_with(cache.stop_background_refresh)
+        cache.stop_background_refresh()
+        self.assertFalse(cache._refresh_thread.is_alive())
+
+    def test_failed_refresh_keeps_entry(self):
+        cache = self.make_cache(ttl=60)
+        cache.apply_to(FakeClient(), 'bybit', 'swap')
+        cache._loader = lambda *key: (_ for _ in ()).throw(ConnectionError('offline'))
+        self.now[0] += 120
+        entry = cache.refresh('bybit', 'swap')
+        self.assertEqual(set(entry['markets']), set(MARKETS))
+
+    def test_real_ccxt_client(self):
+        try:
+            import ccxt
+        except ImportError:
+            self.skipTest('ccxt not installed')
+        cache = self.make_cache()
+        cache.refresh('bybit', 'swap')
+        client = ccxt.bybit({'options': {'defaultType': 'swap'}})
+        self.assertTrue(cache.apply_to(client, 'bybit', 'swap'))
+        self.assertEqual(client.market('BTC/USDT:USDT')['id'], 'BTCUSDT')
+        self.assertEqual(client.amount_to_precision('BTC/USDT:USDT', 0.12345), '0.123')
+
+
+class TestInstrument(unittest.TestCase):
+    """instrument(): 거래소 ID/ccxt 심볼 조회 + precisionMode 정규화"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_tick_size_mode(self):
+        cache = MarketMetadataCache(cache_dir=self.tmp.name, loader=lambda *k: (MARKETS, {}, 4))
+        cache.refresh('bybit', 'swap')
+        # 'BTCUSDT'는 spot/swap 둘 다 있지만 엔트리 타입(swap) 우선
+        info = cache.instrument('bybit', 'BTCUSDT')
+        self.assertEqual(info['symbol'], 'BTC/USDT:USDT')
+        self.assertEqual((info['tick_size'], info['price_decimals']), (0.1, 1))
+        self.assertEqual((info['qty_step'], info['qty_decimals']), (0.001, 3))
+        self.assertEqual((info['min_qty'], info['min_notional'], info['max_leverage']), (0.001, 5, 100))
+        self.assertEqual(cache.instrument('bybit', 'ETH/USDT:USDT')['qty_decimals'], 2)
+        self.assertIsNone(cache.instrument('bybit', 'DOGEUSDT'))
+
+    def test_decimal_places_mode(self):
+        markets = {'BTC/USDT:USDT': make_market('BTC/USDT:USDT', 'BTC-USDT-SWAP', 'swap', 1, 3, 0.01)}
+        cache = MarketMetadataCache(cache_dir=self.tmp.name, loader=lambda *k: (markets, {}, 2))
+        cache.refresh('okx', 'swap')
+        info = cache.instrument('okx', 'BTC-USDT-SWAP')
+        self.assertEqual((info['price_decimals'], info['qty_decimals']), (1, 3))
+        self.assertAlmostEqual(info['tick_size'], 0.1)
+
+    def test_miss_schedules_background_load(self):
+        loaded = threading.Event()
+
+        def loader(*key):
+            loaded.set()
+            return MARKETS, {}, 4
+
+        cache = MarketMetadataCache(cache_dir=self.tmp.name, loader=loader)
+        self.assertIsNone(cache.instrument('bybit', 'BTCUSDT'))  # 요청 대기 없이 즉시 반환
+        self.assertTrue(loaded.wait(5))
+        for _ in range(100):
+            if cache.instrument('bybit', 'BTCUSDT'):
+                break
+            time.sleep(0.01)
+        self.assertEqual(cache.instrument('bybit', 'BTCUSDT')['min_qty'], 0.001)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Unit Tests: Parallel Signal Collection
+프로세스 풀 수집 결과가 순차 수집과 같은 순서/값인지, 메모리 예산에 따른 동시 실행 제한,
+워커 비정상 종료 시 순차 재실행, 컬럼 배열 변환 / 시간순 병합 검증
+"""
+import unittest
+import sys
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.parallel_signals import merge_by_time, pack_rows, run_parallel, unpack_rows
+
+
+def _timed_task(i, seconds):
+    start = time.monotonic()
+    time.sleep(seconds)
+    return i, start, time.monotonic()
+
+
+def _failing_task(i):
+    if i == 2:
+        raise ValueError('bad task')
+    return i * 10
+
+
+_PARENT_PID = os.getpid()
+
+
+def _crashing_task(i):
+    # 워커 프로세스에서만 비정상 종료 (순차 재실행은 정상)
+    if i == 1 and os.getpid() != _PARENT_PID:
+        os._exit(1)
+    time.sleep(0.05)
+    return i * 10
+
+
+class TestRunParallel(unittest.TestCase):
+    """run_parallel: 순서 / 예산 / 오류"""
+
+    def test_results_in_task_order(self):
+        tasks = [(i, 0.05 * (4 - i)) for i in range(4)]
+        done = []
+        results = run_parallel(_timed_task, tasks, max_workers=4, on_done=lambda i, r: done.append(i))
+        self.assertEqual([r[0] for r in results], [0, 1, 2, 3])
+        self.assertEqual(sorted(done), [0, 1, 2, 3])
+        # 동시 실행
+        self.assertLess(max(r[1] for r in results), min(r[2] for r in results))
+
+    def test_memory_budget_limits_in_flight(self):
+        tasks = [(i, 0.05) for i in range(3)]
+        results = run_parallel(_timed_task, tasks, costs=[600, 600, 600], memory_budget=1000, max_workers=3)
+        spans = sorted((r[1], r[2]) for r in results)
+        for (_, end), (start, _) in zip(spans, spans[1:]):
+            self.assertGreaterEqual(start, end - 1e-3)
+
+    def test_errors(self):
+        tasks = [(i,) for i in range(4)]
+        errors = []
+        results = run_parallel(_failing_task, tasks, max_workers=2, on_error=lambda i, e: errors.append(i))
+        self.assertEqual(results, [0, 10, None, 30])
+        self.assertEqual(errors, [2])
+        with self.assertRaises(ValueError):
+            run_parallel(_failing_task, tasks, max_workers=1)
+
+    def test_broken_pool_reruns_unfinished(self):
+        tasks = [(i,) for i in range(6)]
+        errors, done = [], []
+        results = run_parallel(_crashing_task, tasks, max_workers=3,
+                               on_done=lambda i, r: done.append(i), on_error=lambda i, e: errors.append(i))
+        self.assertEqual(results, [i * 10 for i in range(6)])
+        self.assertEqual(sorted(done), list(range(6)))
+        self.assertEqual(errors, [])
+
+
+class TestColumns(unittest.TestCase):
+    """컬럼 배열 변환 / 병합"""
+
+    def test_pack_unpack_and_merge(self):
+        t = pd.date_range('2024-01-01', periods=4, freq='h').to_numpy()
+        a = [{'entry_time': t[i], 'pnl': np.float64(i), 'is_addon': i == 1, 'type': 'Long', 'symbol': 'A'}
+             for i in (0, 2)]
+        b = [{'entry_time': t[i], 'pnl': np.float64(-i), 'is_addon': False, 'type': 'Short', 'symbol': 'B'}
+             for i in (0, 1, 3)]
+        self.assertEqual(unpack_rows(pack_rows(a)), a)
+        merged = unpack_rows(merge_by_time([pack_rows(a), pack_rows(b), {}], 'entry_time'))
+        expected = sorted(a + b, key=lambda x: x['entry_time'])
+        self.assertEqual(merged, expected)
+        self.assertIsInstance(merged[0]['is_addon'], bool)
+
+
+def make_15m(n, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    times = pd.date_range('2024-01-01', periods=n, freq='15min')
+    return pd.DataFrame({
+        'timestamp': times.as_unit('ms').asi8,
+        'open': np.r_[close[0], close[:-1]],
+        'high': close * (1 + rng.random(n) * 0.004),
+        'low': close * (1 - rng.random(n) * 0.004),
+        'close': close,
+        'volume': rng.random(n) * 1000,
+    })
+
+
+class TestMultiBacktesterParallel(unittest.TestCase):
+    """MultiBacktester: 병렬 수집 == 순차 수집"""
+
+    def test_parallel_matches_sequential(self):
+        from core.multi_backtest import MultiBacktester
+        with tempfile.TemporaryDirectory() as tmp:
+            presets = []
+            for k, symbol in enumerate(['BTCUSDT', 'ETHUSDT', 'SOLUSDT']):
+                make_15m(4000, seed=k).to_parquet(os.path.join(tmp, f"bybit_{symbol.lower()}_15m.parquet"))
+                presets.append({'_meta': {'symbol': symbol, 'timeframe': '1h'},
+                                'params': {'atr_mult': 1.5, 'pattern_tolerance': 0.05}})
+            presets.append({'_meta': {'symbol': 'MISSINGUSDT', 'timeframe': '1h'}, 'params': {}})
+
+            bt = MultiBacktester(exchange='bybit')
+            bt.cache_dir = bt.cache_dir.__class__(tmp)
+            sequential = bt.collect_all_signals(presets, max_workers=1)
+            parallel = bt.collect_all_signals(presets, max_workers=3)
+            self.assertGreater(len(sequential), 0)
+            self.assertEqual(len(parallel), len(sequential))
+            for p, s in zip(parallel, sequential):
+                self.assertEqual(p.keys(), s.keys())
+                for key in s:
+                    self.assertEqual(p[key], s[key], key)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Unit Tests: H/L Pivot Extraction
+extract_hl_points (배열 연산)와 기존 while 루프 결과 일치 검증
+"""
+import unittest
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.strategy_core import AlphaX7Core, extract_hl_points
+
+
+def reference_points(df_1h: pd.DataFrame, hist: pd.Series) -> list:
+    """기존 _extract_all_signals while 루프 구현"""
+    points = []
+    n = len(hist)
+    i = 0
+    while i < n:
+        if hist.iloc[i] > 0:
+            start = i
+            while i < n and hist.iloc[i] > 0: i += 1
+            if i < n:
+                seg = df_1h.iloc[start:i]
+                if len(seg) > 0:
+                    max_idx = seg['high'].idxmax()
+                    points.append({'type': 'H', 'price': df_1h.loc[max_idx, 'high'], 'time': df_1h.loc[max_idx, 'timestamp'], 'confirmed_time': df_1h.iloc[i-1]['timestamp']})
+        elif hist.iloc[i] < 0:
+            start = i
+            while i < n and hist.iloc[i] < 0: i += 1
+            if i < n:
+                seg = df_1h.iloc[start:i]
+                if len(seg) > 0:
+                    min_idx = seg['low'].idxmin()
+                    points.append({'type': 'L', 'price': df_1h.loc[min_idx, 'low'], 'time': df_1h.loc[min_idx, 'timestamp'], 'confirmed_time': df_1h.iloc[i-1]['timestamp']})
+        else: i += 1
+    return points
+
+
+def make_hourly(n: int = 1500, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    # 동률 극값 검증용으로 소수 둘째 자리 반올림
+    high = np.round(np.maximum(open_, close) * (1 + rng.uniform(0, 0.005, n)), 2)
+    low = np.round(np.minimum(open_, close) * (1 - rng.uniform(0, 0.005, n)), 2)
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=n, freq='1h'),
+        'open': open_, 'high': high, 'low': low, 'close': close,
+    })
+
+
+def macd_hist(df: pd.DataFrame, fast=12, slow=26, signal=9) -> pd.Series:
+    macd = df['close'].ewm(span=fast, adjust=False).mean() - df['close'].ewm(span=slow, adjust=False).mean()
+    return macd - macd.ewm(span=signal, adjust=False).mean()
+
+
+def same(a, b) -> bool:
+    if type(a) != type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(same(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+class TestExtractHLPoints(unittest.TestCase):
+    """배열 구현과 루프 구현 결과 일치"""
+
+    def test_matches_reference(self):
+        for seed in range(3):
+            df = make_hourly(seed=seed)
+            hist = macd_hist(df)
+            self.assertTrue(same(extract_hl_points(df, hist), reference_points(df, hist)))
+
+    def test_zero_and_nan_break_segments(self):
+        df = make_hourly(200, seed=5)
+        hist = macd_hist(df)
+        hist.iloc[[10, 11, 50, 120]] = 0.0
+        hist.iloc[[30, 90]] = np.nan
+        self.assertTrue(same(extract_hl_points(df, hist), reference_points(df, hist)))
+
+    def test_integer_timestamps(self):
+        """정수(ms) timestamp 컬럼도 동일한 타입으로 반환"""
+        df = make_hourly(400, seed=7)
+        df['timestamp'] = df['timestamp'].astype('int64') // 10**6
+        hist = macd_hist(df)
+        self.assertTrue(same(extract_hl_points(df, hist), reference_points(df, hist)))
+
+    def test_non_range_index(self):
+        df = make_hourly(300, seed=8)
+        df.index = df.index * 3 + 7
+        hist = macd_hist(df)
+        self.assertTrue(same(extract_hl_points(df, hist), reference_points(df, hist)))
+
+    def test_empty_and_open_segment(self):
+        df = make_hourly(10)
+        self.assertEqual(extract_hl_points(df.iloc[:0], pd.Series([], dtype=float)), [])
+        # 전 구간 양수 → 마지막 구간 미확정
+        self.assertEqual(extract_hl_points(df, pd.Series(np.ones(10))), [])
+
+
+class TestSignalExtraction(unittest.TestCase):
+    """시그널 목록 회귀 확인"""
+
+    def test_signals_sorted_and_typed(self):
+        df = make_hourly(2000, seed=1)
+        signals = AlphaX7Core()._extract_all_signals(df, 0.05, 24)
+        self.assertGreater(len(signals), 0)
+        times = [s['time'] for s in signals]
+        self.assertEqual(times, sorted(times))
+        self.assertTrue(all(s['type'] in ('Long', 'Short') for s in signals))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Unit Tests: Post-hoc Leverage/Direction Expansion
+백테스트 1회 결과에서 파생한 레버리지/방향 결과 = 조합별 개별 실행 결과 검증
+"""
+import unittest
+import sys
+import os
+import itertools
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import core.optimizer as optimizer
+from core.optimizer import expand_posthoc_grid, _worker_run_single, _worker_run_expanded
+from core.strategy_core import AlphaX7Core
+
+
+def make_candles(n: int = 6000, seed: int = 3) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=n, freq='15min'),
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + rng.uniform(0, 0.003, n)),
+        'low': np.minimum(open_, close) * (1 - rng.uniform(0, 0.003, n)),
+        'close': close,
+        'volume': rng.uniform(1, 10, n),
+    })
+
+
+class TestExpandPosthocGrid(unittest.TestCase):
+    """expand_posthoc_grid 단위 테스트"""
+
+    def test_split_sizes_and_key_order(self):
+        grid = {
+            'trend_interval': ['1h'],
+            'leverage': [1, 3, 5],
+            'direction': ['Both', 'Long', 'Short'],
+            'atr_mult': [1.0, 1.5],
+        }
+        base_combos, variants = expand_posthoc_grid(grid)
+        self.assertEqual(len(base_combos), 2)
+        self.assertEqual(len(variants), 9)
+        self.assertEqual(list(base_combos[0].keys()), list(grid.keys()))
+
+        # base × variant = 전체 조합 (키 순서 포함)
+        expanded = [str({**b, **v}) for b in base_combos for v in variants]
+        full = [str(dict(zip(grid.keys(), c))) for c in itertools.product(*grid.values())]
+        self.assertEqual(sorted(expanded), sorted(full))
+
+    def test_grid_without_posthoc_axes(self):
+        grid = {'trend_interval': ['1h'], 'atr_mult': [1.0, 1.5]}
+        base_combos, variants = expand_posthoc_grid(grid)
+        self.assertEqual(variants, [{}])
+        self.assertEqual(base_combos, [{'trend_interval': '1h', 'atr_mult': 1.0},
+                                       {'trend_interval': '1h', 'atr_mult': 1.5}])
+
+
+class TestWorkerRunExpanded(unittest.TestCase):
+    """사후 확장 워커 = 개별 워커"""
+
+    @classmethod
+    def setUpClass(cls):
+        df = make_candles()
+        cls.df_entry = df
+        cls.df_pattern = df.set_index('timestamp').resample('1h').agg({
+            'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'
+        }).dropna().reset_index()
+
+    def test_matches_individual_runs(self):
+        grid = {
+            'trend_interval': ['1h'],
+            'filter_tf': ['4h'],
+            'leverage': [1, 3, 10],
+            'direction': ['Both', 'Long', 'Short'],
+            'max_mdd': [100.0],
+            'atr_mult': [1.5],
+            'pattern_tolerance': [0.05],
+        }
+        base_combos, variants = expand_posthoc_grid(grid)
+        params = base_combos[0]
+
+        with patch.object(optimizer, '_worker_backtest', wraps=optimizer._worker_backtest) as spy:
+            expanded = _worker_run_expanded(AlphaX7Core, params, variants, self.df_pattern, self.df_entry, 0.0006, 0.00055)
+        self.assertEqual(spy.call_count, 1)
+        self.assertGreater(len(expanded), 0)
+
+        individual = []
+        for variant in variants:
+            result = _worker_run_single(AlphaX7Core, {**params, **variant}, self.df_pattern, self.df_entry, 0.0006, 0.00055)
+            if result:
+                individual.append(result)
+        self.assertEqual(expanded, individual)
+
+    def test_mdd_filter_per_leverage(self):
+        """MDD 한도는 레버리지 적용 후 조합별로 판정"""
+        params = {'trend_interval': '1h', 'filter_tf': '4h', 'leverage': 1, 'direction': 'Both',
+                  'max_mdd': 5.0, 'pattern_tolerance': 0.05}
+        variants = [{'leverage': 1}, {'leverage': 50}]
+        expanded = _worker_run_expanded(AlphaX7Core, params, variants, self.df_pattern, self.df_entry, 0.0006, 0.00055)
+        self.assertTrue(all(r.params['leverage'] != 50 for r in expanded))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Unit Tests: Price Index
+searchsorted 시점 조회가 기존 불리언 마스크 조회와 같은지,
+구간 최고가/최저가 / 첫 터치 캔들, MultiSymbolBacktest 연동 (경로 청산 == 캔들별 청산) 검증
+"""
+import unittest
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utils.price_index import PriceIndex
+
+
+def make_candles(n: int = 2000, seed: int = 3) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=n, freq='4h'),
+        'open': close + rng.normal(0, 0.5, n),
+        'high': close + 2 + rng.random(n),
+        'low': close - 2 - rng.random(n),
+        'close': close,
+    })
+
+
+def mask_lookup(df: pd.DataFrame, target) -> dict:
+    """기존 경로: df[df['timestamp'] >= target].iloc[0]"""
+    rows = df[df['timestamp'] >= target]
+    if len(rows) == 0:
+        return None
+    row = rows.iloc[0]
+    return {k: float(row[k]) for k in ('open', 'high', 'low', 'close')}
+
+
+class TestPriceIndex(unittest.TestCase):
+    """시점/구간 조회"""
+
+    def setUp(self):
+        self.df = make_candles()
+        rng = np.random.default_rng(7)
+        times = self.df['timestamp']
+        span = (times.iloc[-1] - times.iloc[0]).value
+        self.targets = [times.iloc[0] + pd.Timedelta(int(x), 'ns')
+                        for x in rng.integers(-span // 10, span + span // 10, 500)]
+        self.targets += [times.iloc[0], times.iloc[-1], times.iloc[100]]
+
+    def test_at_matches_mask(self):
+        index = PriceIndex.from_frame(self.df)
+        for target in self.targets:
+            self.assertEqual(index.at(target), mask_lookup(self.df, target), target)
+
+    def test_time_formats(self):
+        expected = [mask_lookup(self.df, t) for t in self.targets]
+        ms = self.df.assign(timestamp=self.df['timestamp'].dt.as_unit('ms').astype('int64'))
+        utc = self.df.assign(timestamp=self.df['timestamp'].dt.tz_localize('UTC'))
+        shuffled = self.df.sample(frac=1, random_state=1)
+        for frame in (ms, utc, self.df.set_index('timestamp'), shuffled):
+            index = PriceIndex.from_frame(frame)
+            self.assertEqual([index.at(t) for t in self.targets], expected)
+        # 숫자 target = ms
+        index = PriceIndex.from_frame(self.df)
+        target = self.targets[0]
+        self.assertEqual(index.at(target.value // 10**6), index.at(target))
+
+    def test_extrema_and_first_hit(self):
+        index = PriceIndex.from_frame(self.df)
+        start, end = self.df['timestamp'].iloc[50], self.df['timestamp'].iloc[300]
+        window = self.df.iloc[50:300]
+        self.assertEqual(index.extrema(start, end), (window['high'].max(), window['low'].min()))
+        self.assertIsNone(index.extrema(end, start))
+
+        level = window['low'].iloc[120]
+        hit = index.first_hit(start, end, level, 'below')
+        self.assertEqual(hit, 50 + int((window['low'] <= level).to_numpy().argmax()))
+        self.assertEqual(index.time_at(hit), self.df['timestamp'].iloc[hit])
+        self.assertIsNone(index.first_hit(start, end, window['high'].max() + 1, 'above'))
+        with self.assertRaises(ValueError):
+            index.first_hit(start, end, level, 'sideways')
+
+
+class TestMultiSymbolBacktestLookup(unittest.TestCase):
+    """MultiSymbolBacktest 가격 조회가 인덱스를 사용"""
+
+    def test_lookup_and_rebuild(self):
+        from core.multi_symbol_backtest import MultiSymbolBacktest
+        bt = MultiSymbolBacktest()
+        df = make_candles()
+        bt.all_candles['BTCUSDT_4h'] = df
+        target = df['timestamp'].iloc[10] - pd.Timedelta('1h')
+        self.assertEqual(bt.get_price_at_time('BTCUSDT', '4h', target), mask_lookup(df, target))
+        self.assertEqual(bt.get_price_at_time('ETHUSDT', '4h', target)['close'], 0)
+        self.assertEqual(bt.get_price_at_time('BTCUSDT', '4h', df['timestamp'].iloc[-1] + pd.Timedelta('1h'))['close'], 0)
+
+        window = df.iloc[10:20]
+        self.assertEqual(bt.get_price_range('BTCUSDT', '4h', df['timestamp'].iloc[10], df['timestamp'].iloc[20]),
+                         {'high': window['high'].max(), 'low': window['low'].min()})
+
+        # 캔들 df 교체 시 인덱스 재생성
+        replaced = make_candles(seed=9)
+        bt.all_candles['BTCUSDT_4h'] = replaced
+        self.assertEqual(bt.get_price_at_time('BTCUSDT', '4h', target), mask_lookup(replaced, target))
+
+    def test_path_exits_match_per_candle(self):
+        from core.multi_symbol_backtest import MultiSymbolBacktest, Signal
+        df = make_candles(n=600, seed=5)
+        times = df['timestamp']
+
+        def simulate(path_exits, step):
+            bt = MultiSymbolBacktest(path_exits=path_exits)
+            bt.all_candles['BTCUSDT_4h'] = df
+            exits = []
+            for k in range(0, 560, 40):
+                entry = df.iloc[k]
+                direction = 'Long' if (k // 40) % 2 == 0 else 'Short'
+                sl = entry['close'] - 6 if direction == 'Long' else entry['close'] + 6
+                bt.enter_position(Signal('BTCUSDT', times.iloc[k], direction, float(entry['close']), float(sl),
+                                         0, 0, 0, '4h'))
+                for j in [*range(k + step, k + 39, step), k + 39]:
+                    if bt.check_exit_conditions(times.iloc[j]):
+                        break
+                if bt.position:
+                    exits.append(('OPEN', bt.position.highest_price, bt.position.lowest_price))
+                    bt.position = None
+            return exits + [(t.exit_time, t.exit_reason, t.exit_price) for t in bt.trades]
+
+        # 캔들마다 확인 == 드문 시그널 시각에 경로 전체 확인
+        reference = simulate(False, 1)
+        self.assertEqual(simulate(True, 1), reference)
+        self.assertEqual(simulate(True, 7), reference)
+        self.assertEqual({r[1] for r in reference if r[0] != 'OPEN'}, {'SL', 'TRAILING'})
+        # 기존 방식은 시그널 시각 캔들만 확인 → 사이 캔들 SL 누락
+        self.assertNotEqual(simulate(False, 7), reference)
+
+
+if __name__ == '__main__':
+    unittest.main()
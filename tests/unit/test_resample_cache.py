@@ -0,0 +1,150 @@
+"""
+Unit Tests: Resample Cache
+리샘플 캐시/피라미드 결과가 직접 리샘플과 같은지, 제자리 변경 후 지문 갱신, 디스크 재사용 및 증분 갱신 검증
+"""
+import unittest
+import sys
+import os
+import tempfile
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utils.data_utils import resample_data, compute_resample
+from storage.resample_cache import ResampleCache, ResamplePyramid
+
+
+def make_15m(n: int = 3000, seed: int = 4, start: str = '2024-01-01 00:45') -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.005, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start, periods=n, freq='15min'),
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + rng.uniform(0, 0.003, n)),
+        'low': np.minimum(open_, close) * (1 - rng.uniform(0, 0.003, n)),
+        'close': close,
+        'volume': rng.uniform(1, 10, n),
+    })
+
+
+class TestResampleCache(unittest.TestCase):
+    """캐시 결과 == 직접 계산, 지문 분리, 제자리 변경 감지, 디스크 재사용"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ResampleCache(self.tmp.name, persist_min_rows=1000)
+        self.df = make_15m()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_matches_uncached(self):
+        with mock.patch('storage.resample_cache.get_resample_cache', return_value=self.cache):
+            for tf in ('1h', '4h', '1d'):
+                for add in (False, True):
+                    expected = resample_data(self.df, tf, add_indicators=add, use_cache=False)
+                    pd.testing.assert_frame_equal(resample_data(self.df, tf, add_indicators=add), expected)
+                    pd.testing.assert_frame_equal(resample_data(self.df, tf, add_indicators=add), expected)
+        self.assertGreater(self.cache.stats['hits'], 0)
+
+    def test_returns_copies(self):
+        first = self.cache.resample(self.df, '1h')
+        first['close'] = 0.0
+        self.assertFalse((self.cache.resample(self.df, '1h')['close'] == 0).any())
+
+    def test_numeric_and_datetime_timestamps_separated(self):
+        numeric = self.df.copy()
+        numeric['timestamp'] = numeric['timestamp'].astype('int64') // 1000
+        self.assertNotEqual(self.cache.fingerprint(numeric), self.cache.fingerprint(self.df))
+        pd.testing.assert_frame_equal(self.cache.resample(numeric, '4h'), compute_resample(numeric, '4h'))
+
+    def test_in_place_mutation_not_stale(self):
+        df = self.df.iloc[:800].copy()
+        self.cache.resample(df, '1h')
+        fp = self.cache.fingerprint(df)
+        self.assertEqual(self.cache.fingerprint(df), fp)
+
+        # 진행 중 캔들 갱신 (마지막 행 제자리 수정)
+        df.loc[df.index[-1], 'close'] = df['close'].iloc[-1] + 5
+        df.loc[df.index[-1], 'high'] = df['high'].iloc[-1] + 5
+        self.assertNotEqual(self.cache.fingerprint(df), fp)
+        pd.testing.assert_frame_equal(self.cache.resample(df, '1h'), compute_resample(df, '1h'))
+
+        # 캔들 추가 (제자리 append)
+        df.loc[len(df)] = self.df.iloc[800]
+        pd.testing.assert_frame_equal(self.cache.resample(df, '1h'), compute_resample(df, '1h'))
+
+    def test_disk_persistence(self):
+        expected = self.cache.resample(self.df, '4h')
+        fresh = ResampleCache(self.tmp.name, persist_min_rows=1000)
+        with mock.patch('storage.resample_cache.compute_resample') as compute:
+            pd.testing.assert_frame_equal(fresh.resample(self.df.copy(), '4h'), expected)
+        compute.assert_not_called()
+        self.assertEqual(fresh.stats['disk_hits'], 1)
+
+    def test_small_frames_not_persisted(self):
+        self.cache.resample(self.df.iloc[:500], '1h')
+        self.assertFalse(list(self.cache.root.glob('*.parquet')))
+
+
+class TestResamplePyramid(unittest.TestCase):
+    """증분 갱신 == 전체 리샘플 (캔들 추가, 앞부분 잘림, 마지막 캔들 수정, 중간 보충)"""
+
+    RULES = ('30min', '1h', '4h', '1D', '1W')
+
+    def setUp(self):
+        self.df = make_15m(n=2500)
+
+    def assert_frames(self, frames, df):
+        for rule in self.RULES:
+            pd.testing.assert_frame_equal(frames[rule], compute_resample(df, rule), check_exact=True)
+
+    def test_rolling_window(self):
+        pyramid = ResamplePyramid(self.RULES)
+        pyramid.update(self.df.iloc[:1000])
+        for end in range(1001, 1200):
+            window = self.df.iloc[end - 1000:end]
+            self.assert_frames(pyramid.update(window), window)
+        self.assertEqual(pyramid.full_rebuilds, 1)
+
+    def test_last_candle_revision(self):
+        pyramid = ResamplePyramid(self.RULES)
+        pyramid.update(self.df)
+        revised = self.df.copy()
+        revised.loc[len(revised) - 1, ['high', 'close']] += 5.0
+        self.assert_frames(pyramid.update(revised), revised)
+
+    def test_backfilled_gap_rebuilds(self):
+        pyramid = ResamplePyramid(self.RULES)
+        pyramid.update(self.df.drop(index=range(700, 720)))
+        self.assert_frames(pyramid.update(self.df), self.df)
+        self.assertEqual(pyramid.full_rebuilds, 2)
+
+
+class TestDataManagerResample(unittest.TestCase):
+    """BotDataManager: 상위 TF Entry/Pattern 프레임 == 기존 리샘플 결과"""
+
+    def test_process_data_matches_direct_resample(self):
+        from core.data_manager import BotDataManager
+        from utils.indicators import add_all_indicators
+        df = make_15m(n=1200)
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = BotDataManager('bybit', 'BTCUSDT', {'entry_tf': '4h', 'pattern_tf': '1h'}, cache_dir=tmp)
+            for end in (1100, 1101, 1150, 1200):
+                manager.df_entry_full = df.iloc[end - 1100:end].reset_index(drop=True)
+                manager.process_data()
+
+            window = df.iloc[100:1200].set_index('timestamp')
+            agg = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}
+            for tf, got in (('4h', manager.df_entry_resampled), ('1h', manager.df_pattern_full)):
+                expected = add_all_indicators(window.resample(tf).agg(agg).dropna().reset_index())
+                pd.testing.assert_frame_equal(got, expected)
+            self.assertEqual(manager._tf_pyramid.full_rebuilds, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Unit Tests: Integer-Bucket Resample Kernel
+정수 버킷 커널이 pandas resample().agg()와 비트 단위로 같은지 (라벨/구간/빈 구간/정수 컬럼),
+스트리밍 집계기가 배열 커널과 같은 봉을 만드는지 검증
+"""
+import unittest
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utils.resample_kernel import resample_frame, resample_arrays, bucket_labels, StreamingResampler
+
+RULES = ('15min', '1h', '4h', '7h', '1D', '1W', 'W-MON')
+AGG = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum', 'timestamp': 'first'}
+
+
+def make_candles(n: int = 3000, start: str = '2024-01-03 05:45', freq: str = '15min',
+                 gaps: bool = False, seed: int = 1) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    times = pd.date_range(start, periods=n, freq=freq)
+    if gaps:
+        times = times.delete(rng.choice(n, n // 5, replace=False))
+    m = len(times)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, m)))
+    return pd.DataFrame({
+        'timestamp': times,
+        'open': np.r_[close[0], close[:-1]],
+        'high': close * 1.01,
+        'low': close * 0.99,
+        'close': close,
+        'volume': rng.uniform(0, 1e6, m) * rng.uniform(0, 1, m),
+    })
+
+
+def pandas_resample(df: pd.DataFrame, rule: str) -> pd.DataFrame:
+    """기존 경로: DatetimeIndex + resample().agg()"""
+    times = df['timestamp']
+    if pd.api.types.is_numeric_dtype(times):
+        times = pd.to_datetime(times, unit='ms')
+    work = df[list(AGG)].set_axis(pd.DatetimeIndex(times, name='datetime'), axis=0)
+    return work.resample(rule).agg(AGG).dropna().reset_index()
+
+
+class TestResampleFrame(unittest.TestCase):
+    """resample_frame == pandas resample (exact)"""
+
+    def assert_same(self, df):
+        for rule in RULES:
+            got = resample_frame(df, rule)
+            self.assertIsNotNone(got, rule)
+            pd.testing.assert_frame_equal(got, pandas_resample(df, rule), check_exact=True)
+
+    def test_datetime_timestamps(self):
+        self.assert_same(make_candles())
+        self.assert_same(make_candles(start='2023-12-31 23:00', freq='1h', seed=2))
+
+    def test_millisecond_timestamps(self):
+        df = make_candles()
+        df['timestamp'] = df['timestamp'].astype('int64') // 1000
+        self.assert_same(df)
+
+    def test_gaps_and_integer_columns(self):
+        df = make_candles(gaps=True)
+        self.assert_same(df)
+        for col in ('open', 'high', 'low', 'close', 'volume'):
+            df[col] = (df[col] * 100).astype('int64')
+        self.assert_same(df)
+
+    def test_long_buckets(self):
+        self.assert_same(make_candles(n=20000, freq='1min'))
+
+    def test_unsupported_falls_back(self):
+        df = make_candles(n=200)
+        self.assertIsNone(resample_frame(df, '1ME'))
+        self.assertIsNone(resample_frame(df.iloc[::-1], '1h'))
+        broken = df.copy()
+        broken.loc[5, 'close'] = np.nan
+        self.assertIsNone(resample_frame(broken, '1h'))
+
+
+class TestStreamingResampler(unittest.TestCase):
+    """StreamingResampler == resample_arrays"""
+
+    def test_matches_arrays(self):
+        df = make_candles(gaps=True)
+        ts = df['timestamp'].astype('int64').to_numpy() // 1000
+        for rule in ('1h', '4h', '1D', '1W'):
+            expected = resample_arrays(ts, df['open'], df['high'], df['low'], df['close'], df['volume'], rule)
+            stream = StreamingResampler(rule)
+            bars = [stream.update(t, o, h, l, c, v) for t, o, h, l, c, v in
+                    zip(ts, df['open'], df['high'], df['low'], df['close'], df['volume'])]
+            bars = [b for b in bars if b is not None] + [stream.flush()]
+            for key in ('label', 'open', 'high', 'low', 'close', 'volume'):
+                np.testing.assert_array_equal([b[key] for b in bars], expected[key])
+
+    def test_labels_and_validation(self):
+        day = 86_400_000
+        sunday = pd.Timestamp('2024-01-07').value // 1_000_000
+        labels = bucket_labels(np.array([sunday - day, sunday + 10 * 3600_000, sunday + day]), '1W')
+        self.assertEqual(labels.tolist(), [sunday, sunday, sunday + 7 * day])
+        with self.assertRaises(ValueError):
+            StreamingResampler('1ME')
+        stream = StreamingResampler('1h')
+        stream.update(sunday, 1, 1, 1, 1, 1)
+        with self.assertRaises(ValueError):
+            stream.update(sunday - 1, 1, 1, 1, 1, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,232 @@
+"""
+Unit Tests: Persistent Result Store
+키 정규화, 미평가/결과 없음 구분, 버전 격리 및 재실행 시 재평가 생략,
+워커 예외/청크 실패는 저장하지 않고 실패 조합 수 집계, 지표 모듈 변경 시 버전 변경 검증
+"""
+import unittest
+import sys
+import os
+import json
+import tempfile
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import core.optimizer as optimizer
+import storage.result_store as result_store
+from storage.result_store import EvaluationFailed, ResultStore, normalize_params
+import core.optimization_logic as optimizer_logic
+from core.optimization_logic import OptimizationEngine
+from utils.data_utils import data_fingerprint
+from core.strategy_core import AlphaX7Core
+
+
+def make_candles(n: int = 4000, seed: int = 11) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=n, freq='15min'),
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + rng.uniform(0, 0.003, n)),
+        'low': np.minimum(open_, close) * (1 - rng.uniform(0, 0.003, n)),
+        'close': close,
+        'volume': rng.uniform(1, 10, n),
+    })
+
+
+def _failing_chunk(fn, tasks, *shared_args):
+    """atr_mult=2.0 조합이 든 청크는 통째로 실패 (워커 프로세스에서 실행)"""
+    if any(task[0].get('atr_mult') == 2.0 for task in tasks):
+        raise MemoryError('chunk lost')
+    return optimizer_run_timed_chunk(fn, tasks, *shared_args)
+
+
+optimizer_run_timed_chunk = optimizer.run_timed_chunk
+
+
+class TestResultStore(unittest.TestCase):
+    """ResultStore 단위 테스트"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'results.db')
+        self.store = ResultStore(self.path, version='v1')
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_key_normalization(self):
+        self.assertEqual(normalize_params({'a': 5, 'b': 'x'}), normalize_params({'b': 'x', 'a': 5.0}))
+        self.assertEqual(normalize_params({'a': np.float64(0.1)}), normalize_params({'a': 0.1}))
+        self.assertNotEqual(normalize_params({'a': 5}), normalize_params({'a': 5.5}))
+
+    def test_missing_vs_no_result(self):
+        self.store.put_many('ns', 'fp', [({'a': 1}, {'trades': 12}), ({'a': 2}, None)])
+        found = self.store.get_many('ns', 'fp', [{'a': 1.0}, {'a': 2}, {'a': 3}])
+        self.assertEqual(found[self.store.key({'a': 1})], {'trades': 12})
+        self.assertIsNone(found[self.store.key({'a': 2})])
+        self.assertNotIn(self.store.key({'a': 3}), found)
+        with self.assertRaises(KeyError):
+            self.store.get('ns', 'fp', {'a': 3})
+
+    def test_isolation(self):
+        self.store.put('ns', 'fp', {'a': 1}, {'trades': 1})
+        other_version = ResultStore(self.path, version='v2')
+        try:
+            self.assertEqual(other_version.get_many('ns', 'fp', [{'a': 1}]), {})
+        finally:
+            other_version.close()
+        self.assertEqual(self.store.get_many('other', 'fp', [{'a': 1}]), {})
+        self.assertEqual(self.store.get_many('ns', 'fp2', [{'a': 1}]), {})
+
+    def test_version_tracks_metric_modules(self):
+        real = result_store._source_bytes
+
+        def version(edited=None, metrics_version=result_store.METRICS_VERSION):
+            def source(name):
+                return real(name) + (b'# edited' if name == edited else b'')
+            with mock.patch.object(result_store, '_strategy_version_cache', None), \
+                    mock.patch.object(result_store, '_source_bytes', source), \
+                    mock.patch.object(result_store, 'METRICS_VERSION', metrics_version):
+                return result_store.strategy_version()
+
+        base = version()
+        self.assertEqual(version(), base)
+        for name in ('core.optimizer', 'core.optimization_logic', 'core.multi_optimizer', 'core.strategy_core',
+                     'config.parameters'):
+            self.assertNotEqual(version(edited=name), base, name)
+        self.assertNotEqual(version(metrics_version=result_store.METRICS_VERSION + 1), base)
+
+
+class TestOptimizerReuse(unittest.TestCase):
+    """재실행 시 저장소 결과 재사용 (결과 동일, 재평가 없음)"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ResultStore(os.path.join(self.tmp.name, 'results.db'))
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_engine_rerun_skips_evaluated(self):
+        df = make_candles()
+        grid = [{'atr_mult': a, 'pattern_tolerance': 0.05, 'filter_tf': '4h'} for a in (1.0, 1.5, 2.0)]
+        engine = OptimizationEngine()
+        engine.result_store = self.store
+
+        def key(r):
+            return str(r.params)
+
+        first = sorted(engine.run_optimization(df, grid, max_workers=2, use_shared_memory=False), key=key)
+        with mock.patch('core.optimization_logic.ProcessPoolExecutor') as pool:
+            second = sorted(engine.run_optimization(df, grid, max_workers=2, use_shared_memory=False), key=key)
+        pool.assert_not_called()
+        self.assertEqual(second, first)
+
+    def test_backtest_optimizer_rerun_skips_evaluated(self):
+        df = make_candles()
+        grid = {
+            'trend_interval': ['1h'], 'filter_tf': ['4h'], 'entry_tf': ['15m'],
+            'leverage': [1, 3], 'direction': ['Both', 'Long'], 'max_mdd': [100.0],
+            'atr_mult': [1.0, 2.0], 'pattern_tolerance': [0.05],
+        }
+
+        def run(**kw):
+            opt = optimizer.BacktestOptimizer(AlphaX7Core)
+            opt.result_store = self.store
+            results = opt.run_optimization(df, grid, max_workers=2, use_shared_memory=False, **kw)
+            return sorted((str(r.params), r.trades, r.win_rate, r.compound_return) for r in results)
+
+        first = run()
+        submitted = []
+        run_chunked = optimizer.run_chunked
+
+        def spy(submit_chunk, items, *args, **kwargs):
+            items = list(items)
+            submitted.extend(items)
+            return run_chunked(submit_chunk, items, *args, **kwargs)
+
+        with mock.patch.object(optimizer, 'run_chunked', side_effect=spy):
+            second = run()
+        self.assertEqual(second, first)
+        # 모든 조합이 저장소에서 적중 → 제출된 태스크 없음
+        self.assertEqual(submitted, [])
+        self.assertEqual(run(use_result_store=False), first)
+
+
+    def test_worker_failures_not_stored(self):
+        df = make_candles()
+        grid = [{'atr_mult': a, 'pattern_tolerance': 0.05, 'filter_tf': '4h'} for a in (1.0, 1.5, 2.0)]
+        engine = OptimizationEngine()
+        engine.result_store = self.store
+        resolve = optimizer_logic._resolve_signal_params
+
+        def flaky(params):
+            if params.get('atr_mult') == 1.5:
+                raise MemoryError('transient')
+            return resolve(params)
+
+        # 워커는 fork 시점의 패치된 모듈을 사용
+        with mock.patch.object(optimizer_logic, '_resolve_signal_params', side_effect=flaky):
+            engine.run_optimization(df, grid, max_workers=2, use_shared_memory=False)
+        found = self.store.get_many(optimizer_logic.RESULT_NAMESPACE, data_fingerprint(df), grid)
+        self.assertEqual(set(found), {self.store.key(grid[0]), self.store.key(grid[2])})
+
+        # 재실행 시 실패했던 조합 재평가 → 저장
+        engine.run_optimization(df, grid, max_workers=2, use_shared_memory=False)
+        self.assertEqual(len(self.store.get_many(optimizer_logic.RESULT_NAMESPACE, data_fingerprint(df), grid)), 3)
+
+    def test_backtest_optimizer_failures_not_stored(self):
+        df = make_candles()
+        grid = {
+            'trend_interval': ['1h'], 'filter_tf': ['4h'], 'entry_tf': ['15m'],
+            'leverage': [1, 3], 'direction': ['Both'], 'max_mdd': [100.0],
+            'atr_mult': [1.0, 2.0], 'pattern_tolerance': [0.05],
+        }
+        backtest = optimizer._worker_backtest
+
+        def flaky(strategy_class, params, *args):
+            if params.get('atr_mult') == 2.0:
+                raise MemoryError('transient')
+            return backtest(strategy_class, params, *args)
+
+        self.assertIsInstance(optimizer._worker_run_expanded(
+            AlphaX7Core, {'atr_mult': 2.0}, [{}], None, None, 0.0, 0.0), EvaluationFailed)
+
+        with mock.patch.object(optimizer, '_worker_backtest', side_effect=flaky):
+            opt = optimizer.BacktestOptimizer(AlphaX7Core)
+            opt.result_store = self.store
+            opt.run_optimization(df, grid, max_workers=2, use_shared_memory=False)
+
+        rows = self.store._connect().execute('SELECT params_key FROM evaluations').fetchall()
+        stored = sorted(json.loads(k)['atr_mult'] for (k,) in rows)
+        self.assertEqual(stored, [1, 1])
+        # 백테스트 1회 실패 → 파생 조합(레버리지 2개) 모두 실패로 집계
+        self.assertEqual(opt.failed_count, 2)
+
+    def test_backtest_optimizer_counts_failed_chunks(self):
+        df = make_candles()
+        grid = {
+            'trend_interval': ['1h'], 'filter_tf': ['4h'], 'entry_tf': ['15m'],
+            'leverage': [1, 3], 'direction': ['Both'], 'max_mdd': [100.0],
+            'atr_mult': [1.0, 2.0], 'pattern_tolerance': [0.05],
+        }
+        opt = optimizer.BacktestOptimizer(AlphaX7Core)
+        opt.result_store = self.store
+        with mock.patch.object(optimizer, 'run_timed_chunk', _failing_chunk), \
+                self.assertLogs(optimizer.logger.name, level='WARNING') as logs:
+            opt.run_optimization(df, grid, max_workers=2, use_shared_memory=False)
+        self.assertEqual(opt.failed_count, 2)
+        self.assertTrue(any('2개 조합' in line for line in logs.output))
+        rows = self.store._connect().execute('SELECT params_key FROM evaluations').fetchall()
+        self.assertEqual(sorted(json.loads(k)['atr_mult'] for (k,) in rows), [1, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Unit Tests: Shared-memory Frame Distribution
+공유 메모리 DF 배포/복원 및 공유 모드 최적화 결과 = pickle 모드 결과 검증
+"""
+import unittest
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import core.optimizer as optimizer
+from core.shared_frames import SharedFrames, attach_frames
+from core.optimization_logic import OptimizationEngine
+from core.strategy_core import AlphaX7Core
+
+
+def make_candles(n: int = 4000, seed: int = 5) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=n, freq='15min'),
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + rng.uniform(0, 0.003, n)),
+        'low': np.minimum(open_, close) * (1 - rng.uniform(0, 0.003, n)),
+        'close': close,
+        'volume': rng.uniform(1, 10, n),
+    })
+
+
+class TestSharedFrames(unittest.TestCase):
+    """SharedFrames / attach_frames 단위 테스트"""
+
+    def test_roundtrip(self):
+        df = make_candles(100)
+        df['flag'] = df['close'] > df['open']
+        indexed = df.set_index('timestamp')
+        with SharedFrames({'plain': df, 'indexed': indexed, 'empty': df.iloc[:0], 'none': None}) as shared:
+            frames = attach_frames(shared.handle)
+            pd.testing.assert_frame_equal(frames['plain'], df)
+            pd.testing.assert_frame_equal(frames['indexed'], indexed)
+            self.assertEqual(len(frames['empty']), 0)
+            self.assertNotIn('none', frames)
+
+            views = attach_frames(shared.handle, copy=False)
+            pd.testing.assert_frame_equal(views['plain'], df)
+            self.assertFalse(views['plain']['close'].to_numpy().flags.writeable)
+
+    def test_rejects_object_columns(self):
+        df = pd.DataFrame({'symbol': ['BTCUSDT', 'ETHUSDT'], 'close': [1.0, 2.0]})
+        with self.assertRaises(ValueError):
+            SharedFrames({'x': df})
+
+
+class TestSharedWorkers(unittest.TestCase):
+    """공유 메모리 워커 결과 = 기존 워커 결과"""
+
+    def test_optimizer_shared_worker(self):
+        df = make_candles()
+        df_pattern = df.set_index('timestamp').resample('1h').agg({
+            'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'
+        }).dropna().reset_index()
+        params = {'trend_interval': '1h', 'filter_tf': '4h', 'leverage': 3, 'direction': 'Both',
+                  'pattern_tolerance': 0.05}
+        variants = [{'leverage': 1}, {'leverage': 3}]
+
+        with SharedFrames({'p_1h': df_pattern, 'e_15m': df}) as shared:
+            optimizer._init_shared_worker(AlphaX7Core, shared.handle)
+            try:
+                single = optimizer._worker_run_task(params, 'p_1h', 'e_15m', None, None, 0.0006, 0.00055)
+                expanded = optimizer._worker_run_task(params, 'p_1h', 'e_15m', None, variants, 0.0006, 0.00055)
+            finally:
+                optimizer._WORKER_CONTEXT.clear()
+
+        self.assertEqual(single, optimizer._worker_run_single(AlphaX7Core, params, df_pattern, df, 0.0006, 0.00055))
+        self.assertEqual(expanded, optimizer._worker_run_expanded(AlphaX7Core, params, variants, df_pattern, df, 0.0006, 0.00055))
+
+    def test_engine_shared_matches_pickled(self):
+        df = make_candles()
+        grid = [{'atr_mult': a, 'pattern_tolerance': 0.05, 'filter_tf': '4h'} for a in (1.0, 1.5, 2.0)]
+        engine = OptimizationEngine()
+
+        def key(r):
+            return str(r.params)
+
+        def run(**kw):
+            return sorted(engine.run_optimization(df, grid, max_workers=2, use_result_store=False, **kw), key=key)
+
+        shared = run(use_shared_memory=True)
+        pickled = run(use_shared_memory=False)
+        self.assertEqual(shared, pickled)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Unit Tests: Signal Cache
+시그널 세트 캐시 키/LRU 동작 및 캐시된 시그널로 동일한 백테스트 결과 검증
+"""
+import unittest
+import sys
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.signal_cache import SignalCache
+from core.strategy_core import AlphaX7Core
+from utils.data_utils import data_fingerprint
+
+
+def make_candles(n: int = 3000, seed: int = 1, freq: str = '15min') -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=n, freq=freq),
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + rng.uniform(0, 0.003, n)),
+        'low': np.minimum(open_, close) * (1 - rng.uniform(0, 0.003, n)),
+        'close': close,
+        'volume': rng.uniform(1, 10, n),
+    })
+
+
+def to_hourly(df: pd.DataFrame) -> pd.DataFrame:
+    return df.set_index('timestamp').resample('1h').agg({
+        'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'
+    }).dropna().reset_index()
+
+
+SIGNAL_KW = dict(tolerance=0.05, validity_hours=12, macd_fast=12, macd_slow=26, macd_signal=9)
+
+
+class TestSignalCache(unittest.TestCase):
+    """SignalCache 단위 테스트"""
+
+    def setUp(self):
+        self.cache = SignalCache(max_items=2)
+        self.core = AlphaX7Core(use_mtf=False)
+        self.df_pattern = to_hourly(make_candles())
+
+    def test_hit_reuses_signal_list(self):
+        """같은 키는 추출 1회"""
+        with patch.object(self.core, '_extract_all_signals', wraps=self.core._extract_all_signals) as spy:
+            first = self.cache.get_signals(self.core, self.df_pattern, pattern_tf='1h', **SIGNAL_KW)
+            second = self.cache.get_signals(self.core, self.df_pattern, pattern_tf='1h', **SIGNAL_KW)
+        self.assertIs(first, second)
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(self.cache.stats['hits'], 1)
+        self.assertEqual(self.cache.stats['misses'], 1)
+
+    def test_key_normalization(self):
+        """int/float 표기 차이는 같은 키"""
+        a = SignalCache.make_key('fp', '1h', 12, 26, 9, 0.05, 12)
+        b = SignalCache.make_key('fp', '1h', 12.0, 26.0, 9.0, 0.05, 12.0)
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, SignalCache.make_key('fp', '4h', 12, 26, 9, 0.05, 12))
+        self.assertNotEqual(a, SignalCache.make_key('fp', '1h', 12, 26, 9, 0.04, 12))
+
+    def test_lru_eviction(self):
+        """max_items 초과 시 가장 오래 안 쓴 키 제거"""
+        for tol in (0.03, 0.04, 0.05):
+            self.cache.get_signals(self.core, self.df_pattern, pattern_tf='1h', **{**SIGNAL_KW, 'tolerance': tol})
+        self.assertEqual(self.cache.stats['size'], 2)
+        self.cache.get_signals(self.core, self.df_pattern, pattern_tf='1h', **{**SIGNAL_KW, 'tolerance': 0.03})
+        self.assertEqual(self.cache.stats['misses'], 4)
+
+    def test_fingerprint_tracks_data(self):
+        """데이터가 바뀌면 지문도 변경"""
+        other = self.df_pattern.copy()
+        self.assertEqual(data_fingerprint(other), data_fingerprint(self.df_pattern))
+        other.loc[other.index[-1], 'close'] += 1.0
+        self.assertNotEqual(data_fingerprint(other), data_fingerprint(self.df_pattern))
+        self.assertEqual(data_fingerprint(None), 'empty')
+
+    def test_cached_signals_same_trades(self):
+        """캐시된 시그널로 돌린 백테스트 = 직접 추출한 백테스트"""
+        df_entry = make_candles()
+        kw = dict(slippage=0.001, pattern_tolerance=0.05, entry_validity_hours=12,
+                  macd_fast=12, macd_slow=26, macd_signal=9)
+        expected = self.core.run_backtest(self.df_pattern, df_entry, **kw)
+        signals = self.cache.get_signals(self.core, self.df_pattern, pattern_tf='1h', **SIGNAL_KW)
+        for atr_mult in (1.0, 2.0):
+            direct = self.core.run_backtest(self.df_pattern, df_entry, atr_mult=atr_mult, **kw)
+            cached = self.core.run_backtest(self.df_pattern, df_entry, atr_mult=atr_mult, signals=signals, **kw)
+            self.assertEqual(direct, cached)
+        self.assertEqual(expected, self.core.run_backtest(self.df_pattern, df_entry, signals=signals, **kw))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Unit Tests: MultiCoinSniper Parallel Initialization
+병렬 초기화 결과(승률/순서)가 순차 초기화와 같은지, 동시 데이터 수집 수 제한,
+코인별 완료 콜백, 승률이 백테스트 거래 목록에서 계산되는지 검증
+"""
+import unittest
+import sys
+import os
+import logging
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.multi_sniper import MultiCoinSniper, _backtest_winrate
+
+
+def make_15m(n, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=n, freq='15min'),
+        'open': np.r_[close[0], close[:-1]],
+        'high': close * (1 + rng.random(n) * 0.004),
+        'low': close * (1 - rng.random(n) * 0.004),
+        'close': close,
+        'volume': rng.random(n) * 1000,
+    })
+
+
+class FakeCandleStore:
+    def __init__(self, frames):
+        self.frames = frames
+
+    def read(self, exchange, symbol, timeframe):
+        if timeframe != '15m' or symbol not in self.frames:
+            return pd.DataFrame()
+        return self.frames[symbol].copy()
+
+
+class TestSniperInit(unittest.TestCase):
+    """병렬 초기화 == 순차 초기화"""
+
+    def make_sniper(self, frames):
+        sniper = MultiCoinSniper.__new__(MultiCoinSniper)
+        sniper.coins = {}
+        sniper._lock = threading.Lock()
+        sniper.logger = logging.getLogger('test')
+        sniper.candle_store = FakeCandleStore(frames)
+        sniper.INIT_FETCH_WORKERS = 2
+
+        self.active = 0
+        self.max_active = 0
+        counter_lock = threading.Lock()
+
+        def fetch(exchange, symbol):
+            with counter_lock:
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            time.sleep(0.05)
+            with counter_lock:
+                self.active -= 1
+            return True
+
+        sniper._fetch_latest_data = fetch
+        sniper._load_params = lambda exchange, symbol: {'atr_mult': 1.5}
+        return sniper
+
+    def test_parallel_matches_sequential(self):
+        symbols = ['BTCUSDT', 'ETHUSDT', 'SOLUSDT', 'XRPUSDT', 'NODATAUSDT']
+        frames = {s: make_15m(3000, seed=k) for k, s in enumerate(symbols[:4])}
+
+        sequential = self.make_sniper(frames)
+        sequential._init_coins('bybit', symbols, max_workers=1)
+
+        parallel = self.make_sniper(frames)
+        ready = []
+        parallel._init_coins('bybit', symbols, max_workers=3,
+                             on_coin_ready=lambda s, state, done, total: ready.append((s, done, total)))
+
+        self.assertEqual(list(parallel.coins), symbols)
+        for symbol in symbols:
+            self.assertEqual(parallel.coins[symbol].backtest_winrate, sequential.coins[symbol].backtest_winrate)
+        self.assertEqual(parallel.coins['NODATAUSDT'].backtest_winrate, 75.0)
+        self.assertEqual(sorted(s for s, _, _ in ready), sorted(symbols))
+        self.assertEqual([d for _, d, _ in ready], [1, 2, 3, 4, 5])
+        self.assertTrue(all(t == 5 for _, _, t in ready))
+        self.assertLessEqual(self.max_active, 2)
+        # 거래가 있으면 대체값(75.0)이 아닌 실제 승률
+        self.assertTrue(all(sequential.coins[s].backtest_winrate != 75.0 for s in symbols[:4]))
+
+    def test_winrate_from_trades(self):
+        from core.strategy_core import AlphaX7Core
+        df = make_15m(3000, seed=1)
+        original = df.copy()
+        winrate = _backtest_winrate('BTCUSDT', df, {'atr_mult': 1.5, 'leverage': 10})
+        pd.testing.assert_frame_equal(df, original)
+
+        resampled = df.set_index('timestamp').resample(MultiCoinSniper._select_optimal_tf(len(df))).agg({
+            'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}).dropna().reset_index()
+        trades = AlphaX7Core().run_backtest(df_pattern=resampled, df_entry=resampled, atr_mult=1.5)
+        self.assertTrue(trades)
+        self.assertAlmostEqual(winrate, sum(t['pnl'] > 0 for t in trades) / len(trades) * 100)
+        self.assertEqual(_backtest_winrate('BTCUSDT', df.head(120), {}), 75.0)
+
+    def test_errors_propagate(self):
+        sniper = self.make_sniper({})
+
+        def bad_params(exchange, symbol):
+            if symbol == 'ETHUSDT':
+                raise ValueError('bad preset')
+            return {}
+
+        sniper._load_params = bad_params
+        with self.assertRaises(ValueError):
+            sniper._init_coins('bybit', ['BTCUSDT', 'ETHUSDT', 'SOLUSDT'], max_workers=2)
+        self.assertEqual(set(sniper.coins), {'BTCUSDT', 'SOLUSDT'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Unit Tests: BotStateManager State WAL
+변경 키만 WAL에 기록 / 재시작 시 재생 / 체크포인트 후 기존 JSON 스냅샷과 동일,
+체크포인트 중단 후 재생 결과 동일 검증
+"""
+import unittest
+import sys
+import os
+import json
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.bot_state import BotStateManager
+
+
+def read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+class TestStateWal(unittest.TestCase):
+    """WAL 모드 저장 / 복구 / 체크포인트"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make(self, **kwargs):
+        return BotStateManager('bybit', 'BTCUSDT', storage_dir=self.dir, use_wal=True, **kwargs)
+
+    def save_sequence(self, manager):
+        states = []
+        for i in range(30):
+            state = {
+                'position': {'side': 'Long', 'entry_price': 95000, 'size': 0.1} if i < 20 else None,
+                'capital': 1000 + i // 5,
+                'current_sl': 94000 + i * 10,
+                'opened_at': datetime(2024, 1, 1, 0, i),
+            }
+            if i % 7 == 0:
+                state['extra'] = i
+            manager.save_state(state)
+            states.append(state)
+        return states
+
+    def test_replay_matches_full_snapshot(self):
+        manager = self.make()
+        states = self.save_sequence(manager)
+        self.assertFalse(os.path.exists(manager.state_file))
+
+        # 변경 키만 기록
+        with open(str(manager.state_file) + '.wal', encoding='utf-8') as f:
+            deltas = [json.loads(line)['record'] for line in f]
+        self.assertNotIn('position', deltas[1]['set'])
+        self.assertEqual(deltas[1].get('del'), ['extra'])
+
+        expected = json.loads(json.dumps(states[-1], default=str))
+        self.assertEqual(manager.load_state(), expected)
+
+        # 재시작 (크래시) → WAL 재생
+        reopened = self.make()
+        self.assertEqual(reopened.load_state(), expected)
+
+        # 체크포인트 → 기존 두 스냅샷 형식
+        self.assertTrue(reopened.checkpoint())
+        self.assertEqual(read_json(reopened.state_file), expected)
+        self.assertEqual(read_json(reopened.default_state_file), expected)
+        self.assertFalse(os.path.exists(str(reopened.state_file) + '.wal'))
+
+        # 체크포인트 후 저장도 이어서 재생
+        reopened.save_state({'capital': 5})
+        self.assertEqual(self.make().load_state()['capital'], 5)
+        self.assertNotIn('position', self.make().load_state())
+
+    def test_interrupted_checkpoint_replays_idempotently(self):
+        manager = self.make()
+        states = self.save_sequence(manager)
+        wal_path = str(manager.state_file) + '.wal'
+        with open(wal_path, 'rb') as f:
+            wal = f.read()
+        manager.checkpoint()
+        # 스냅샷 교체 후 WAL 삭제 전 중단
+        with open(wal_path, 'wb') as f:
+            f.write(wal)
+        expected = json.loads(json.dumps(states[-1], default=str))
+        self.assertEqual(self.make().load_state(), expected)
+
+    def test_managed_positions_and_new_storage(self):
+        saved = []
+
+        class FakeStateStorage:
+            def save(self, state):
+                saved.append(state)
+
+            def load(self):
+                return saved[-1] if saved else None
+
+        manager = self.make(use_new_storage=True, state_storage=FakeStateStorage())
+        manager.add_managed_position('BTCUSDT', '1', 'c1', 95000, 'Long', 0.1)
+        self.assertEqual(saved, [])
+        manager.close()
+        self.assertEqual(saved[-1]['managed_positions']['BTCUSDT']['order_id'], '1')
+        self.assertTrue(self.make().is_managed_position('BTCUSDT'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Unit Tests: Streaming Indicators
+스트리밍 지표가 배치 함수와 비트 단위로 같은지, 실시간 경로(포지션/데이터 관리자) 증분 갱신 검증
+"""
+import unittest
+import sys
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utils.indicators import (
+    calculate_rsi, calculate_atr, calculate_macd, calculate_ema, add_all_indicators,
+    StreamingRSI, StreamingATR, StreamingEMA, StreamingMACD, IndicatorStreams,
+)
+
+
+def make_candles(n: int = 600, seed: int = 5, flat: bool = False) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.01, n))), 2)
+    if flat:
+        close[50:90] = close[50]
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=n, freq='15min'),
+        'open': np.r_[close[0], close[:-1]],
+        'high': close * (1 + rng.uniform(0, 0.01, n)),
+        'low': close * (1 - rng.uniform(0, 0.01, n)),
+        'close': close,
+        'volume': rng.uniform(1, 10, n),
+    })
+
+
+class TestStreamingMatchesBatch(unittest.TestCase):
+    """seed/update 값 == 같은 구간 배치 계산 마지막 값 (정확히 일치)"""
+
+    def test_rsi_atr_prefixes(self):
+        df = make_candles(flat=True)
+        for period in (5, 14):
+            rsi, atr = StreamingRSI(period), StreamingATR(period)
+            for k, row in enumerate(df.itertuples(), start=1):
+                r = rsi.update(row.close)
+                a = atr.update(row.high, row.low, row.close)
+                if k in (1, period, period + 1, period + 2, 100, 333, len(df)):
+                    self.assertEqual(r, calculate_rsi(df['close'].iloc[:k], period, return_series=True).iloc[-1])
+                    self.assertEqual(a, calculate_atr(df.iloc[:k], period, return_series=True).iloc[-1])
+
+    def test_full_series_after_warmup(self):
+        df = make_candles(seed=8)
+        period = 14
+        rsi = np.array([v for v in map(StreamingRSI(period).update, df['close'])])
+        stream = StreamingATR(period)
+        atr = np.array([stream.update(h, l, c) for h, l, c in zip(df['high'], df['low'], df['close'])])
+        np.testing.assert_array_equal(rsi[period:], calculate_rsi(df['close'], period, True).to_numpy()[period:])
+        np.testing.assert_array_equal(atr[period:], calculate_atr(df, period, True).to_numpy()[period:])
+
+    def test_ema_macd(self):
+        closes = make_candles(seed=3, flat=True)['close'].to_numpy()
+        ema = StreamingEMA(20)
+        np.testing.assert_array_equal([ema.update(c) for c in closes], calculate_ema(closes, 20, True).to_numpy())
+        macd = StreamingMACD().seed(closes[:-1])
+        self.assertEqual(macd.update(closes[-1]), calculate_macd(closes))
+
+    def test_short_history_defaults(self):
+        self.assertEqual(StreamingRSI(14).seed([1.0, 2.0, 3.0]).value, 50.0)
+        self.assertEqual(StreamingATR(14).value, 0.0)
+
+
+class TestIndicatorStreams(unittest.TestCase):
+    """DataFrame 동기화: 새 행만 반영, 이력이 어긋나면 재시드"""
+
+    def test_sync_extends_and_reseeds(self):
+        df = make_candles()
+        full = add_all_indicators(df)
+        streams = IndicatorStreams()
+        self.assertEqual(len(streams.sync(df.iloc[:500])), 500)
+        added = streams.sync(df)
+        self.assertEqual(len(added), 100)
+        for col in IndicatorStreams.COLUMNS:
+            self.assertEqual([v[col] for v in added], full[col].iloc[500:].tolist())
+        self.assertEqual(streams.sync(df), [])
+
+        # 마지막 캔들 수정 → 전체 재시드
+        revised = df.copy()
+        revised.loc[len(df) - 1, 'close'] += 1
+        self.assertEqual(len(streams.sync(revised)), len(df))
+
+    def test_position_manager_rsi(self):
+        from core.position_manager import PositionManager
+        df = add_all_indicators(make_candles())
+        pm = PositionManager(exchange=None, strategy_params={'rsi_period': 14}, dry_run=True)
+        self.assertEqual(pm._calculate_rsi(df.iloc[:-1]), df['rsi'].iloc[-2])
+        self.assertEqual(pm._calculate_rsi(df), df['rsi'].iloc[-1])
+        self.assertEqual(pm._rsi_stream.rsi.count, len(df))
+
+
+class TestDataManagerIncremental(unittest.TestCase):
+    """캔들 마감 경로: 증분 지표 == 전체 재계산"""
+
+    def test_append_candle_matches_full_recompute(self):
+        from core.data_manager import BotDataManager
+        df = make_candles(n=400)
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = BotDataManager('bybit', 'BTCUSDT', cache_dir=tmp)
+            manager.df_entry_full = df.iloc[:390].copy()
+            manager.process_data()
+            for i in range(390, 400):
+                manager.append_candle(df.iloc[i].to_dict(), save=False)
+                manager.process_data()
+            self.assertEqual(manager._entry_streams.last_timestamp, df['timestamp'].iloc[-1])
+            expected = add_all_indicators(df)
+            for col in IndicatorStreams.COLUMNS:
+                np.testing.assert_array_equal(manager.df_entry_resampled[col].to_numpy(), expected[col].to_numpy())
+            self.assertEqual(len(manager.df_entry_resampled), 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Unit Tests: Chunked Task Batching
+청크 크기 조정, 진행 중 청크 수 제한, 지연 소비 및 최적화 결과 동일성 검증
+"""
+import unittest
+import sys
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.task_batching import AdaptiveChunker, run_chunked, run_timed_chunk
+from core.optimizer import BacktestOptimizer
+from core.strategy_core import AlphaX7Core
+
+
+def _square(x, offset=0):
+    return x * x + offset
+
+
+class TestAdaptiveChunker(unittest.TestCase):
+    """AdaptiveChunker 단위 테스트"""
+
+    def test_size_follows_measured_time(self):
+        chunker = AdaptiveChunker(target_seconds=0.5, max_size=100, smoothing=1.0)
+        self.assertEqual(chunker.next_size(), 1)
+        chunker.record(10, 0.1)      # 0.01s/task → 50
+        self.assertEqual(chunker.next_size(), 50)
+        chunker.record(1, 10.0)      # 느린 태스크 → 최소 1
+        self.assertEqual(chunker.next_size(), 1)
+        chunker.record(1000, 0.0)    # 측정 불가할 만큼 빠름 → 최대
+        self.assertEqual(chunker.next_size(), 100)
+
+    def test_ignores_invalid_samples(self):
+        chunker = AdaptiveChunker(initial_size=4)
+        chunker.record(0, 1.0)
+        chunker.record(3, None)
+        self.assertEqual(chunker.next_size(), 4)
+        self.assertIsNone(chunker.per_task_seconds)
+
+
+class TestRunChunked(unittest.TestCase):
+    """run_chunked 단위 테스트"""
+
+    def test_all_items_once_with_bounded_in_flight(self):
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+        consumed = []
+
+        def items():
+            for i in range(200):
+                consumed.append(i)
+                yield (i,)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            def submit(chunk):
+                nonlocal in_flight, peak
+                with lock:
+                    in_flight += 1
+                    peak = max(peak, in_flight)
+                future = executor.submit(run_timed_chunk, _square, chunk, 1)
+
+                def done(_):
+                    nonlocal in_flight
+                    with lock:
+                        in_flight -= 1
+                future.add_done_callback(done)
+                return future
+
+            seen = {}
+            gen = run_chunked(submit, items(), max_in_flight=3,
+                              chunker=AdaptiveChunker(initial_size=5, max_size=5))
+            first_chunk, first_results = next(gen)
+            # 지연 소비: 첫 결과 시점에 전체가 생성되지 않음
+            self.assertLess(len(consumed), 200)
+            for chunk, results in [(first_chunk, first_results)] + list(gen):
+                for (i,), r in zip(chunk, results):
+                    seen[i] = r
+
+        self.assertEqual(seen, {i: i * i + 1 for i in range(200)})
+        self.assertLessEqual(peak, 3)
+
+    def test_failed_chunk_yields_none(self):
+        def boom(x):
+            raise RuntimeError("fail")
+
+        with ThreadPoolExecutor(max_workers=1) as executor, \
+                self.assertLogs('core.task_batching', level='WARNING'):
+            out = list(run_chunked(lambda c: executor.submit(run_timed_chunk, boom, c),
+                                   [(1,), (2,)], max_in_flight=1,
+                                   chunker=AdaptiveChunker(initial_size=2)))
+        self.assertEqual(out, [([(1,), (2,)], None)])
+
+    def test_should_stop(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            out = list(run_chunked(lambda c: executor.submit(run_timed_chunk, _square, c),
+                                   [(i,) for i in range(100)], max_in_flight=1,
+                                   should_stop=lambda: True))
+        self.assertEqual(out, [])
+
+
+class TestOptimizerModes(unittest.TestCase):
+    """청크 스케줄러 경유 최적화: 모든 모드 결과 동일"""
+
+    def test_modes_match(self):
+        rng = np.random.default_rng(9)
+        n = 6000
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+        open_ = np.r_[close[0], close[:-1]]
+        df = pd.DataFrame({
+            'timestamp': pd.date_range('2024-01-01', periods=n, freq='15min'),
+            'open': open_,
+            'high': np.maximum(open_, close) * (1 + rng.uniform(0, 0.003, n)),
+            'low': np.minimum(open_, close) * (1 - rng.uniform(0, 0.003, n)),
+            'close': close,
+            'volume': rng.uniform(1, 10, n),
+        })
+        grid = {
+            'trend_interval': ['1h'], 'filter_tf': ['4h'], 'entry_tf': ['15m'],
+            'leverage': [1, 3], 'direction': ['Both', 'Long'], 'max_mdd': [100.0],
+            'atr_mult': [1.0, 2.0], 'pattern_tolerance': [0.05],
+        }
+
+        def run(**kw):
+            results = BacktestOptimizer(AlphaX7Core).run_optimization(df, grid, max_workers=2,
+                                                                       use_result_store=False, **kw)
+            return sorted(str((r.params, r.trades, r.win_rate, r.compound_return)) for r in results)
+
+        baseline = run(expand_posthoc=False, use_shared_memory=False)
+        self.assertEqual(run(expand_posthoc=True, use_shared_memory=True), baseline)
+        self.assertEqual(run(expand_posthoc=True, use_shared_memory=False), baseline)
+
+
+if __name__ == '__main__':
+    unittest.main()
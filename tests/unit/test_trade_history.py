@@ -0,0 +1,166 @@
+"""
+Unit Tests: Trade History (SQLite)
+집계 테이블 통계가 기존 GROUP BY / 전체 집계 쿼리와 같은지 (추가/일괄 추가/삭제),
+기존 스키마 DB 마이그레이션, 인덱스 사용, 읽기 연결 수 제한 검증
+"""
+import unittest
+import sys
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from storage.trade_history import TradeHistory, TradeRecord
+
+
+def legacy_daily(db_path, days=30):
+    since = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute('''
+        SELECT DATE(exit_time), COUNT(*), SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END), SUM(pnl)
+        FROM trades WHERE exit_time >= ? GROUP BY DATE(exit_time) ORDER BY 1 ASC
+    ''', (since,)).fetchall()
+    conn.close()
+    return [(d, n, w, p or 0) for d, n, w, p in rows]
+
+
+def legacy_summary(db_path):
+    conn = sqlite3.connect(db_path)
+    row = conn.execute('''
+        SELECT COUNT(*), SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END), SUM(pnl), MAX(pnl), MIN(pnl) FROM trades
+    ''').fetchone()
+    conn.close()
+    total, wins, pnl, best, worst = row
+    return (total or 0, wins or 0, pnl or 0, best or 0, worst or 0)
+
+
+def random_trades(n, seed):
+    rng = random.Random(seed)
+    now = datetime.now()
+    trades = []
+    for _ in range(n):
+        exit_time = now - timedelta(days=rng.uniform(0, 40), minutes=rng.randint(0, 1440))
+        trades.append(TradeRecord(
+            symbol=rng.choice(['BTCUSDT', 'ETHUSDT']), exchange=rng.choice(['bybit', 'okx']),
+            side=rng.choice(['LONG', 'SHORT']), pnl=None if rng.random() < 0.05 else rng.uniform(-50, 50),
+            exit_time=exit_time.strftime('%Y-%m-%d %H:%M:%S'),
+        ))
+    return trades
+
+
+class TestTradeHistory(unittest.TestCase):
+    """집계 테이블 == 기존 집계 쿼리"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, 'trades.db')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def assertStatsMatchLegacy(self, history):
+        daily = [(d['date'], d['trades'], d['wins'], d['pnl']) for d in history.get_daily_stats()]
+        expected = legacy_daily(self.db_path)
+        self.assertEqual([row[:3] for row in daily], [row[:3] for row in expected])
+        for (_, _, _, pnl), (_, _, _, ref) in zip(daily, expected):
+            self.assertAlmostEqual(pnl, ref, places=6)
+
+        s = history.get_summary()
+        total, wins, pnl, best, worst = legacy_summary(self.db_path)
+        self.assertEqual((s['total_trades'], s['wins'], s['losses']), (total, wins, total - wins))
+        self.assertAlmostEqual(s['total_pnl'], pnl, places=6)
+        self.assertEqual((s['best_trade'], s['worst_trade']), (best, worst))
+
+    def test_incremental_aggregates(self):
+        history = TradeHistory(self.db_path)
+        self.assertEqual(history.get_summary()['total_trades'], 0)
+        trades = random_trades(300, seed=1)
+        for trade in trades[:20]:
+            history.add_trade(trade)
+        self.assertEqual(history.add_trades(trades[20:]), 280)
+        self.assertStatsMatchLegacy(history)
+
+        recent = history.get_trades(days=7, symbol='BTCUSDT')
+        since = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+        expected = sorted((t.exit_time for t in trades if t.symbol == 'BTCUSDT' and t.exit_time >= since), reverse=True)
+        self.assertEqual([t.exit_time for t in recent], expected)
+
+        # 삭제도 집계에 반영
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('DELETE FROM trades WHERE id % 3 = 0')
+        conn.commit()
+        conn.close()
+        self.assertStatsMatchLegacy(history)
+        history.close()
+
+    def test_migrates_existing_db(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('''
+            CREATE TABLE trades (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, symbol TEXT, exchange TEXT, side TEXT,
+                entry_price REAL, exit_price REAL, quantity REAL, pnl REAL, pnl_percent REAL,
+                entry_time TEXT, exit_time TEXT, reason TEXT, created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.executemany('INSERT INTO trades (symbol, pnl, exit_time) VALUES (?, ?, ?)',
+                         [(t.symbol, t.pnl, t.exit_time) for t in random_trades(100, seed=2)])
+        conn.commit()
+        conn.close()
+
+        history = TradeHistory(self.db_path)
+        self.assertStatsMatchLegacy(history)
+        with history._reader() as reader:
+            plan = ' '.join(str(r) for r in reader.execute(
+                'EXPLAIN QUERY PLAN SELECT exit_time, pnl FROM trades WHERE symbol = ? AND exit_time >= ?',
+                ('BTCUSDT', '2024-01-01')).fetchall())
+        self.assertIn('COVERING INDEX idx_trades_symbol_exit', plan)
+        history.close()
+
+    def test_short_lived_threads_do_not_leak_readers(self):
+        history = TradeHistory(self.db_path)
+        history.add_trades(random_trades(20, seed=3))
+        opened = []
+        real_open = history._open
+
+        def tracking_open():
+            conn = real_open()
+            opened.append(conn)
+            return conn
+
+        history._open = tracking_open
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            for _ in range(5):
+                history.get_summary()
+                history.get_trades(days=60)
+
+        for _ in range(5):
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        def is_open(conn):
+            try:
+                conn.execute('SELECT 1')
+                return True
+            except sqlite3.ProgrammingError:
+                return False
+
+        # 스레드 40개 → 열린 읽기 연결은 풀 크기 이하
+        self.assertLessEqual(sum(map(is_open, opened)), TradeHistory.READER_POOL)
+        self.assertLessEqual(len(history._idle_readers), TradeHistory.READER_POOL)
+        self.assertEqual(history.get_summary()['total_trades'], 20)
+        history.close()
+        self.assertFalse(any(map(is_open, opened)))
+
+
+if __name__ == '__main__':
+    unittest.main()
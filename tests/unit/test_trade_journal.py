@@ -0,0 +1,183 @@
+"""
+Unit Tests: Trade Journal
+저널 추가/재생(잘린 줄, 압축 중단), 압축 후 중복 없음, 다른 프로세스용 읽기 전용 조회,
+TradeStorage 조회/통계가 기존 전체 정렬 방식과 같은지, 스나이퍼 히스토리 누적 검증
+"""
+import unittest
+import sys
+import os
+import json
+import random
+import tempfile
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from storage.trade_journal import TradeJournal, JOURNAL_SUFFIX, read_records
+
+
+class TestTradeJournal(unittest.TestCase):
+    """스냅샷 + 저널 재생 / 압축"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'history.json')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_append_replay_and_torn_tail(self):
+        journal = TradeJournal(self.path, sync_every=2)
+        for i in range(5):
+            journal.append({'i': i})
+        self.assertEqual(journal.stats['fsyncs'], 2)
+        self.assertFalse(os.path.exists(self.path))
+
+        # 크래시: 마지막 줄이 잘린 채로 남음
+        with open(self.path + JOURNAL_SUFFIX, 'ab') as f:
+            f.write(b'{"seq": 5, "rec')
+        reopened = TradeJournal(self.path)
+        self.assertEqual(reopened.state, [{'i': i} for i in range(5)])
+        reopened.append({'i': 5}, sync=True)
+        self.assertEqual(TradeJournal(self.path).state, [{'i': i} for i in range(6)])
+
+    def test_compaction_without_duplicates(self):
+        journal = TradeJournal(self.path, compact_every=4)
+        for i in range(10):
+            journal.append({'i': i})
+        self.assertEqual(journal.stats['compactions'], 2)
+        with open(self.path, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), [{'i': i} for i in range(8)])
+
+        # 스냅샷 교체 후 저널 삭제 전 중단 → 이미 반영된 줄은 건너뜀
+        with open(self.path + JOURNAL_SUFFIX, 'rb') as f:
+            tail = f.read()
+        journal.compact()
+        with open(self.path + JOURNAL_SUFFIX, 'wb') as f:
+            f.write(tail)
+        self.assertEqual(TradeJournal(self.path).state, [{'i': i} for i in range(10)])
+
+    def test_read_records_sees_live_journal(self):
+        journal = TradeJournal(self.path, compact_every=4)
+        self.assertEqual(read_records(self.path), [])
+        for i in range(6):
+            journal.append({'i': i})
+        # 압축 전 거래도 바로 보임 (스냅샷 4건 + 저널 2건)
+        self.assertEqual(read_records(self.path), [{'i': i} for i in range(6)])
+
+        # 압축 직후 저널 삭제 전 상태 → 중복 없음
+        with open(self.path + JOURNAL_SUFFIX, 'rb') as f:
+            tail = f.read()
+        journal.compact()
+        with open(self.path + JOURNAL_SUFFIX, 'wb') as f:
+            f.write(tail + b'{"seq": 6, "rec')
+        size = os.path.getsize(self.path + JOURNAL_SUFFIX)
+        self.assertEqual(read_records(self.path), [{'i': i} for i in range(6)])
+        # 읽기 전용: 잘린 꼬리를 정리하지 않음
+        self.assertEqual(os.path.getsize(self.path + JOURNAL_SUFFIX), size)
+
+    def test_reset_with_backup(self):
+        journal = TradeJournal(self.path)
+        journal.append({'i': 0})
+        backup = self.path + '.bak'
+        journal.reset(backup_path=backup)
+        with open(backup, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), [{'i': 0}])
+        self.assertEqual(journal.state, [])
+        self.assertFalse(os.path.exists(self.path + JOURNAL_SUFFIX))
+
+
+def legacy_sorted(trades):
+    """기존 방식: 전체 로드 후 exit_time 내림차순 정렬"""
+    return sorted(trades, key=lambda x: x.get('exit_time', ''), reverse=True)
+
+
+class TestTradeStorage(unittest.TestCase):
+    """TradeStorage: 저널 기반 조회 == 기존 정렬/통계"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmp.name, 'bybit', 'BTCUSDT', 'history.json')
+        os.makedirs(os.path.dirname(path))
+        from storage import trade_storage
+        self.patches = [
+            patch.object(trade_storage.Paths, 'history', lambda exchange, symbol: path),
+            patch.object(trade_storage.Paths, 'ensure_dirs', lambda *a, **k: None),
+        ]
+        for p in self.patches:
+            p.start()
+        self.TradeStorage = trade_storage.TradeStorage
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        self.tmp.cleanup()
+
+    def test_queries_match_legacy(self):
+        rng = random.Random(3)
+        storage = self.TradeStorage('bybit', 'BTCUSDT')
+        added = []
+        for i in range(40):
+            trade = {'id': i, 'exit_time': f"2024-01-{rng.randint(1, 9):02d}T00:00:00",
+                     'pnl_pct': rng.uniform(-3, 3), 'pnl_usd': rng.uniform(-30, 30)}
+            storage.add_trade(trade, immediate_flush=(i % 7 == 0))
+            added.append(dict(trade))
+            if i == 20:
+                storage.force_save()
+
+        expected = legacy_sorted(added)
+        self.assertEqual(storage.get_all_trades(), expected)
+        self.assertEqual(storage.get_recent_trades(5), expected[:5])
+        self.assertEqual(storage.get_trades(limit=3), added[-3:])
+
+        stats = storage.get_stats()
+        pnl = [t['pnl_pct'] for t in expected]
+        self.assertEqual(stats['total_trades'], 40)
+        self.assertAlmostEqual(stats['total_pnl_pct'], sum(pnl))
+        self.assertAlmostEqual(stats['total_pnl_usd'], sum(t['pnl_usd'] for t in expected))
+        self.assertEqual(stats['win_rate'], len([p for p in pnl if p > 0]) / 40 * 100)
+        self.assertEqual((stats['max_win_pct'], stats['max_loss_pct']), (max(pnl), min(pnl)))
+
+        # 재시작 후 같은 결과 (스냅샷 + 저널 재생)
+        reopened = self.TradeStorage('bybit', 'BTCUSDT')
+        self.assertEqual(reopened.get_all_trades(), expected)
+        self.assertEqual(reopened.get_stats(), stats)
+
+        reopened.reset_history()
+        self.assertEqual(reopened.get_all_trades(), [])
+        self.assertEqual(reopened.get_stats()['total_trades'], 0)
+
+
+class TestSniperHistory(unittest.TestCase):
+    """MultiCoinSniper: 저널 기반 히스토리 누적"""
+
+    def test_history_accumulates(self):
+        from core.multi_sniper import MultiCoinSniper
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'sniper_history.json')
+            with patch.object(MultiCoinSniper, '_get_history_path', lambda self: path):
+                sniper = MultiCoinSniper.__new__(MultiCoinSniper)
+                sniper.coins = {}
+                sniper._history_journal = None
+                sniper.logger = __import__('logging').getLogger('test')
+                pnls = [5.0, -2.0, 3.5]
+                for pnl in pnls:
+                    sniper._save_trade_history('BTCUSDT', {'closedPnl': pnl})
+                sniper._save_trade_history('ETHUSDT', {'closedPnl': 1.0})
+
+                summary = sniper.get_trade_summary()
+                self.assertEqual((summary['coins'], summary['total_trades'], summary['total_wins']), (2, 4, 3))
+                self.assertEqual(summary['total_pnl'], sum(pnls) + 1.0)
+
+                sniper.compact_history()
+                reopened = MultiCoinSniper.__new__(MultiCoinSniper)
+                reopened.coins = {}
+                reopened._history_journal = None
+                reopened.logger = sniper.logger
+                btc = reopened.get_trade_summary('BTCUSDT')
+                self.assertEqual([t['closed_pnl'] for t in btc['trades']], pnls)
+                self.assertEqual((btc['trade_count'], btc['win_count']), (3, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
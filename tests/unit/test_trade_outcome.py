@@ -0,0 +1,106 @@
+"""
+Unit Tests: Trade Outcome Resolver
+배열 first-hit 판정이 캔들별 루프와 같은지 (SL 우선, TP 0 무시, 윈도우 확장),
+UnifiedBacktest 일괄 판정 == 단일 판정 검증
+"""
+import unittest
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.trade_outcome import resolve_exits, resolve_exit, DIR_LONG, DIR_SHORT, EXIT_NONE, EXIT_SL, EXIT_TP
+
+
+def loop_exit(highs, lows, start, direction, sl, tp):
+    """기존 방식: 캔들별 순회"""
+    for i in range(start, len(highs)):
+        if direction == DIR_LONG:
+            if lows[i] <= sl:
+                return i, EXIT_SL
+            if highs[i] >= tp and tp:
+                return i, EXIT_TP
+        else:
+            if highs[i] >= sl:
+                return i, EXIT_SL
+            if lows[i] <= tp and tp:
+                return i, EXIT_TP
+    return -1, EXIT_NONE
+
+
+def make_prices(n, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, n))
+    return close + rng.random(n) * 2, close - rng.random(n) * 2, close
+
+
+class TestResolveExits(unittest.TestCase):
+    """resolve_exits == 캔들별 루프"""
+
+    def test_matches_loop(self):
+        rng = np.random.default_rng(1)
+        for n in (1, 5, 70, 3000):
+            highs, lows, close = make_prices(n, seed=n)
+            m = 400
+            starts = rng.integers(0, n + 2, m)
+            dirs = np.where(rng.random(m) < 0.5, DIR_LONG, DIR_SHORT)
+            ref = close[np.minimum(starts, n - 1)]
+            # 넓은 SL/TP도 섞어서 윈도우 확장 / 미청산 경로 포함
+            dist = rng.random(m) * np.where(rng.random(m) < 0.2, 100, 5)
+            sl = np.where(dirs == DIR_LONG, ref - dist, ref + dist)
+            tp = np.where(dirs == DIR_LONG, ref + dist * 1.5, ref - dist * 1.5)
+            tp[rng.random(m) < 0.05] = 0
+            exit_idx, reasons = resolve_exits(highs, lows, starts, dirs, sl, tp, window=4, max_cells=256)
+            expected = [loop_exit(highs, lows, s, d, a, b) for s, d, a, b in zip(starts, dirs, sl, tp)]
+            self.assertEqual(list(zip(exit_idx.tolist(), reasons.tolist())), expected)
+
+    def test_sl_wins_same_candle(self):
+        highs = np.array([10.0, 10.0, 12.0])
+        lows = np.array([10.0, 10.0, 8.0])
+        self.assertEqual(resolve_exit(highs, lows, 1, DIR_LONG, 9.0, 11.0), (2, EXIT_SL))
+        self.assertEqual(resolve_exit(highs, lows, 1, DIR_SHORT, 11.0, 9.0), (2, EXIT_SL))
+        self.assertEqual(resolve_exit(highs, lows, 3, DIR_LONG, 9.0, 11.0), (-1, EXIT_NONE))
+
+
+class _Signal:
+    def __init__(self, signal_type, stop_loss):
+        self.signal_type = signal_type
+        self.stop_loss = stop_loss
+
+
+class TestUnifiedBacktestOutcomes(unittest.TestCase):
+    """UnifiedBacktest: 일괄 판정 == 단일 판정"""
+
+    def test_batch_matches_single(self):
+        from core.unified_backtest import UnifiedBacktest
+        bt = UnifiedBacktest.__new__(UnifiedBacktest)
+        highs, lows, close = make_prices(500, seed=4)
+        idx = pd.date_range('2024-01-01', periods=500, freq='15min')
+        df = pd.DataFrame({'open': close, 'high': highs, 'low': lows, 'close': close}, index=idx)
+
+        entries = []
+        for i in range(0, 520, 7):
+            direction = 'buy' if i % 2 else 'sell'
+            ref = close[min(i, 499)]
+            entries.append((idx[0] + pd.Timedelta(minutes=15 * i - 5), _Signal(direction, ref - 2 if i % 2 else ref + 2), {}))
+        entries.append((idx[10], _Signal('buy', 0), {}))
+
+        batch = bt._resolve_trade_outcomes(df, entries, 'BTCUSDT')
+        single = [bt._calculate_trade_outcome(df, t, s, p, 'BTCUSDT') for t, s, p in entries]
+        self.assertEqual(batch, single)
+        self.assertIsNone(batch[-1])
+        self.assertEqual({o['exit_reason'] for o in batch if o}, {'SL', 'TP', 'Force'})
+
+        # 정렬 안 된 인덱스도 같은 결과 (마스크 행 기준)
+        shuffled = df.sample(frac=1, random_state=2)
+        for (t, s, p), outcome in zip(entries[:10], bt._resolve_trade_outcomes(shuffled, entries[:10], 'BTCUSDT')):
+            rows = shuffled[shuffled.index >= t]
+            if outcome is not None:
+                self.assertIn(outcome['exit_time'], rows.index[1:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+"""
+Unit Tests: Multiplexed WebSocket Stream Manager
+배치 구독 메시지, 연결당 토픽 수 제한, 심볼별 콜백 분배 검증 (로컬 웹소켓 서버)
+"""
+import unittest
+import sys
+import os
+import json
+import asyncio
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from exchanges.ws_stream_manager import StreamManager, PROTOCOLS
+
+try:
+    from websockets.asyncio.server import serve
+    from websockets.exceptions import ConnectionClosed
+except ImportError:
+    serve = None
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class FakeBybitServer:
+    """구독 메시지를 기록하고 구독된 토픽에 kline 메시지를 보내는 로컬 서버"""
+
+    def __init__(self):
+        self.connections = []    # [(websocket, topics set)]
+        self.messages = []
+        self.loop = asyncio.new_event_loop()
+        self.ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        self.ready.wait(5)
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+
+        async def handler(ws):
+            topics = set()
+            self.connections.append((ws, topics))
+            try:
+                async for message in ws:
+                    msg = json.loads(message)
+                    self.messages.append(msg)
+                    if msg['op'] == 'subscribe':
+                        topics.update(msg['args'])
+                    else:
+                        topics.difference_update(msg['args'])
+            except ConnectionClosed:
+                pass
+
+        async def main():
+            self.server = await serve(handler, '127.0.0.1', 0)
+            self.port = self.server.sockets[0].getsockname()[1]
+            self.ready.set()
+            await self.server.serve_forever()
+
+        try:
+            self.loop.run_until_complete(main())
+        except Exception:
+            pass
+
+    @property
+    def url(self):
+        return f"ws://127.0.0.1:{self.port}"
+
+    def push(self, topic, close, confirm):
+        payload = json.dumps({'topic': topic, 'data': [{
+            'start': 1700000000000, 'open': '1', 'high': '2', 'low': '0.5',
+            'close': str(close), 'volume': '10', 'confirm': confirm}]})
+
+        async def send():
+            for ws, topics in self.connections:
+                if topic in topics:
+                    await ws.send(payload)
+        asyncio.run_coroutine_threadsafe(send(), self.loop).result(5)
+
+    def subscribed(self):
+        return set().union(*(t for _, t in self.connections)) if self.connections else set()
+
+    def close(self):
+        async def shutdown():
+            self.server.close()
+            await self.server.wait_closed()
+        asyncio.run_coroutine_threadsafe(shutdown(), self.loop).result(5)
+        self.thread.join(5)
+
+
+class TestProtocols(unittest.TestCase):
+    """거래소별 구독 메시지/파싱"""
+
+    def test_batched_subscribe_messages(self):
+        bybit = PROTOCOLS['bybit']()
+        topics = [bybit.topic(f"C{i}USDT", '15m') for i in range(25)]
+        messages = bybit.subscribe_messages(topics)
+        self.assertEqual([len(m['args']) for m in messages], [10, 10, 5])
+        self.assertEqual(topics[0], 'kline.15.C0USDT')
+
+        binance = PROTOCOLS['binance']()
+        msg = binance.subscribe_messages([binance.topic('BTCUSDT', '1h'), binance.topic('ETHUSDT', '1h')])
+        self.assertEqual(msg[0]['params'], ['btcusdt@kline_1h', 'ethusdt@kline_1h'])
+
+    def test_parse_routes_by_topic(self):
+        binance = PROTOCOLS['binance']()
+        events = binance.parse({'e': 'kline', 's': 'BTCUSDT',
+                                'k': {'i': '15m', 't': 1, 'o': '1', 'h': '2', 'l': '0', 'c': '1.5', 'v': '3', 'x': True}})
+        self.assertEqual(events[0][0], binance.topic('BTCUSDT', '15m'))
+        self.assertTrue(events[0][1]['confirm'])
+
+        okx = PROTOCOLS['okx']()
+        topic = okx.topic('BTCUSDT', '1h')
+        events = okx.parse({'arg': {'channel': 'candle1H', 'instId': 'BTC-USDT-SWAP'},
+                            'data': [['1', '1', '2', '0', '1.5', '3', '0', '0', '1']]})
+        self.assertEqual(events[0][0], topic)
+        self.assertEqual(events[0][1]['close'], 1.5)
+
+
+@unittest.skipIf(serve is None, "websockets server not available")
+class TestStreamManager(unittest.TestCase):
+    """로컬 서버로 연결 공유 및 콜백 분배 검증"""
+
+    def setUp(self):
+        self.server = FakeBybitServer()
+        self.manager = StreamManager(endpoints={'bybit': self.server.url}, max_topics={'bybit': 10})
+
+    def tearDown(self):
+        self.manager.stop()
+        self.server.close()
+
+    def test_many_symbols_few_connections(self):
+        prices = {}
+        closes = []
+        subs = []
+        for i in range(25):
+            symbol = f"C{i}USDT"
+            subs.append(self.manager.subscribe(
+                'bybit', symbol, '15m',
+                on_price_update=lambda p, s=symbol: prices.__setitem__(s, p),
+                on_candle_close=lambda c, s=symbol: closes.append((s, c['close']))))
+
+        self.assertTrue(wait_until(lambda: len(self.server.subscribed()) == 25))
+        self.assertEqual(len(self.server.connections), 3)
+        self.assertTrue(all(len(m['args']) <= 10 for m in self.server.messages))
+        self.assertEqual(self.manager.stats['bybit']['connections'], 3)
+
+        self.server.push('kline.15.C7USDT', 42.0, False)
+        self.server.push('kline.15.C21USDT', 7.0, True)
+        self.assertTrue(wait_until(lambda: len(prices) == 2 and closes))
+        self.assertEqual(prices, {'C7USDT': 42.0, 'C21USDT': 7.0})
+        self.assertEqual(closes, [('C21USDT', 7.0)])
+
+        # 같은 토픽 두 번째 구독자는 연결/구독 추가 없이 콜백만 추가
+        extra = []
+        self.manager.subscribe('bybit', 'C7USDT', '15m', on_price_update=extra.append)
+        self.server.push('kline.15.C7USDT', 43.0, False)
+        self.assertTrue(wait_until(lambda: extra == [43.0] and prices['C7USDT'] == 43.0))
+        self.assertEqual(len(self.server.connections), 3)
+
+        # 마지막 구독자 해제 → 거래소 구독 해제
+        subs[21].disconnect()
+        self.assertTrue(wait_until(lambda: 'kline.15.C21USDT' not in self.server.subscribed()))
+        self.assertEqual(self.manager.stats['bybit']['topics'], 24)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,7 @@ API 호출 유틸리티
 
 import time
 import logging
+import threading
 from typing import Callable, Any
 from functools import wraps
 
@@ -148,6 +149,64 @@ class RateLimiter:
         pass
 
 
+class TokenBucket:
+    """
+    토큰 버킷 Rate Limit (스레드 안전)
+
+    - 초당 rate개 토큰 충전, 최대 capacity개까지 누적 (버스트 허용)
+    - 여러 스레드가 같은 버킷을 공유하면 합산 호출률이 rate를 넘지 않음
+
+    Usage:
+        bucket = TokenBucket(rate=10, capacity=10)
+        bucket.acquire()  # 토큰이 생길 때까지 대기 후 1개 소비
+    """
+
+    def __init__(self, rate: float, capacity: float = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], Any] = time.sleep):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive: {rate}")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """토큰 소비 시도 → 0이면 성공, 아니면 필요한 대기 시간(초)"""
+        with self._lock:
+            self._refill(self._clock())
+            # 부동소수점 누적 오차로 토큰이 1e-9 모자라 무한 대기하지 않도록 허용 오차 적용
+            if self._tokens >= tokens - 1e-9:
+                self._tokens = max(0.0, self._tokens - tokens)
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0, timeout: float = None) -> bool:
+        """토큰이 생길 때까지 대기 후 소비 (timeout 초과 시 False)"""
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return True
+            if deadline is not None and self._clock() + wait > deadline:
+                return False
+            self._sleep(wait)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
 # ========== 테스트 ==========
 if __name__ == "__main__":
     import random
@@ -0,0 +1,329 @@
+"""
+utils/concurrent_downloader.py
+동시 페이지 분할 과거 캔들 다운로더
+
+- 기간을 배치 크기 단위의 독립 시간 구간(window)으로 분할 → 구간/심볼을 동시에 요청
+- 거래소별 토큰 버킷으로 합산 요청률 제한 (스레드 수와 무관하게 rate 이하)
+- 거래소당 클라이언트 1개 재사용 (load_markets 1회)
+- 심볼별 모든 구간이 끝나는 즉시 on_result 콜백 (도착 순서대로 저장 가능)
+
+Usage:
+    downloader = ConcurrentDownloader(max_workers=8)
+    jobs = [DownloadJob('bybit', 'BTC/USDT:USDT', '15m', since_ms) for ...]
+    downloader.download(jobs, on_result=lambda job, rows: save(job, rows))
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.api_utils import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+# 타임프레임 → ms
+TIMEFRAME_MS = {
+    '1m': 60_000, '3m': 180_000, '5m': 300_000, '15m': 900_000, '30m': 1_800_000,
+    '1h': 3_600_000, '2h': 7_200_000, '4h': 14_400_000, '6h': 21_600_000,
+    '12h': 43_200_000, '1d': 86_400_000, '3d': 259_200_000, '1w': 604_800_000,
+}
+
+# 거래소별 페이지당 캔들 수 (GUI.data_manager.DataManager.EXCHANGE_LIMITS와 동일)
+EXCHANGE_BATCH_SIZES = {
+    'bithumb': 200,
+    'upbit': 1000,
+    'binance': 1000,
+    'bybit': 1000,
+    'okx': 100,
+    'bitget': 1000,
+    'bingx': 1000,
+}
+
+# 거래소별 초당 요청 수 (클라이언트 rateLimit 정보가 없을 때)
+DEFAULT_RATE_LIMITS = {
+    'bybit': 10.0,
+    'binance': 10.0,
+    'okx': 8.0,
+    'bitget': 8.0,
+    'bingx': 5.0,
+    'bithumb': 5.0,
+    'upbit': 8.0,
+}
+
+
+def timeframe_to_ms(timeframe: str) -> int:
+    """'15m' / '1h' / '1d' → ms"""
+    if timeframe in TIMEFRAME_MS:
+        return TIMEFRAME_MS[timeframe]
+    units = {'m': 60_000, 'h': 3_600_000, 'd': 86_400_000, 'w': 604_800_000}
+    try:
+        return int(timeframe[:-1]) * units[timeframe[-1].lower()]
+    except (KeyError, ValueError):
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+
+
+def split_windows(since: int, until: int, timeframe: str, batch_size: int) -> List[Tuple[int, int]]:
+    """[since, until) 구간을 batch_size 캔들 단위 [start, end) 구간으로 분할"""
+    span = timeframe_to_ms(timeframe) * max(1, int(batch_size))
+    return [(start, min(start + span, until)) for start in range(int(since), int(until), span)]
+
+
+def _default_client_factory(exchange_id: str):
+    """ccxt 클라이언트 생성 (GUI.data_manager와 같은 옵션) + 마켓 로드 (로컬 캐시 우선)"""
+    import ccxt
+    from storage.market_cache import get_market_cache
+    market_type = 'spot' if exchange_id in ('bithumb', 'upbit') else 'swap'
+    client = getattr(ccxt, exchange_id)({
+        'enableRateLimit': False,  # 요청률은 TokenBucket이 관리
+        'options': {'defaultType': market_type, 'adjustForTimeDifference': True},
+        'timeout': 30000
+    })
+    get_market_cache().apply_to(client, exchange_id, market_type)
+    return client
+
+
+class ExchangeClientPool:
+    """거래소당 클라이언트 1개 (생성/마켓 로드는 최초 1회, 스레드 안전)"""
+
+    def __init__(self, factory: Callable[[str], Any] = None):
+        self._factory = factory or _default_client_factory
+        self._clients: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, exchange_id: str):
+        exchange_id = exchange_id.lower()
+        client = self._clients.get(exchange_id)
+        if client is not None:
+            return client
+        with self._lock:
+            lock = self._locks.setdefault(exchange_id, threading.Lock())
+        with lock:
+            client = self._clients.get(exchange_id)
+            if client is None:
+                client = self._factory(exchange_id)
+                self._clients[exchange_id] = client
+            return client
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+
+
+@dataclass
+class DownloadJob:
+    """심볼 1개 다운로드 요청 (until=None이면 현재까지)"""
+    exchange: str
+    symbol: str
+    timeframe: str
+    since: int
+    until: Optional[int] = None
+    key: Any = None  # 콜백 식별자 (기본: symbol)
+
+    def __post_init__(self):
+        self.exchange = self.exchange.lower()
+        if self.key is None:
+            self.key = self.symbol
+
+
+@dataclass
+class _JobState:
+    job: DownloadJob
+    until: int
+    parts: List[List] = field(default_factory=list)
+    remaining: int = 0
+    fetched: int = 0
+    error: Optional[Exception] = None
+
+
+class ConcurrentDownloader:
+    """
+    구간/심볼 동시 다운로더
+
+    심볼마다 since에서 첫 페이지를 먼저 요청(probe)해 실제 데이터 시작점을 찾고,
+    나머지 기간을 구간으로 나눠 동시에 요청한다 (상장 전 빈 구간 요청 방지).
+    """
+
+    def __init__(self, client_pool: ExchangeClientPool = None, max_workers: int = 8,
+                 rate_limits: Dict[str, float] = None, batch_sizes: Dict[str, int] = None,
+                 max_retries: int = 3, retry_delay: float = 1.0,
+                 clock: Callable[[], float] = time.time):
+        self.client_pool = client_pool or get_client_pool()
+        self.max_workers = max_workers
+        self.rate_limits = dict(rate_limits or {})
+        self.batch_sizes = {**EXCHANGE_BATCH_SIZES, **(batch_sizes or {})}
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._clock = clock
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    # ========== Rate Limit ==========
+
+    def bucket(self, exchange_id: str) -> TokenBucket:
+        """거래소별 토큰 버킷 (설정값 > 클라이언트 rateLimit(ms) > 기본값)"""
+        with self._lock:
+            bucket = self._buckets.get(exchange_id)
+            if bucket is None:
+                rate = self.rate_limits.get(exchange_id)
+                if rate is None:
+                    rate_limit_ms = getattr(self.client_pool.get(exchange_id), 'rateLimit', None)
+                    if isinstance(rate_limit_ms, (int, float)) and rate_limit_ms > 0:
+                        rate = 1000.0 / rate_limit_ms
+                    else:
+                        rate = DEFAULT_RATE_LIMITS.get(exchange_id, 5.0)
+                bucket = TokenBucket(rate, capacity=max(1.0, rate))
+                self._buckets[exchange_id] = bucket
+            return bucket
+
+    # ========== 요청 ==========
+
+    def _request(self, job: DownloadJob, since: int, limit: int) -> List:
+        """토큰 1개 소비 후 fetch_ohlcv (실패 시 지수 백오프 재시도)"""
+        client = self.client_pool.get(job.exchange)
+        bucket = self.bucket(job.exchange)
+        for attempt in range(self.max_retries):
+            bucket.acquire()
+            try:
+                return client.fetch_ohlcv(job.symbol, job.timeframe, since=since, limit=limit) or []
+            except Exception as e:
+                if attempt + 1 >= self.max_retries:
+                    raise
+                logger.info(f"[DOWNLOAD] {job.symbol} retry {attempt + 1}/{self.max_retries}: {e}")
+                time.sleep(self.retry_delay * (2 ** attempt))
+        return []
+
+    def _fetch_window(self, job: DownloadJob, start: int, end: int) -> List:
+        """[start, end) 구간 캔들 (짧은 응답이면 구간 안에서 이어서 요청)"""
+        tf_ms = timeframe_to_ms(job.timeframe)
+        batch = self.batch_sizes.get(job.exchange, 1000)
+        rows: List = []
+        cursor = start
+        while cursor < end:
+            limit = min(batch, max(1, -(-(end - cursor) // tf_ms)))
+            data = self._request(job, cursor, limit)
+            page = [row for row in data if cursor <= row[0] < end]
+            if not page:
+                break
+            rows.extend(page)
+            cursor = page[-1][0] + 1
+            if data[-1][0] >= end - tf_ms:
+                break
+        return rows
+
+    def _probe(self, job: DownloadJob, until: int) -> List:
+        """since부터 첫 페이지 (거래소가 실제 데이터 시작점부터 돌려줌)"""
+        batch = self.batch_sizes.get(job.exchange, 1000)
+        return [row for row in self._request(job, job.since, batch) if job.since <= row[0] < until]
+
+    # ========== 실행 ==========
+
+    def download(self, jobs: List[DownloadJob],
+                 on_result: Callable[[DownloadJob, List], Any] = None,
+                 on_progress: Callable[[DownloadJob, int], Any] = None,
+                 on_error: Callable[[DownloadJob, Exception], Any] = None,
+                 should_stop: Callable[[], bool] = None) -> Dict[Any, List]:
+        """
+        여러 심볼 동시 다운로드
+
+        Args:
+            jobs: 다운로드 요청 목록
+            on_result: 심볼 완료 시 (job, rows) - 호출 스레드에서 도착 순서대로 호출
+            on_progress: 구간 완료 시 (job, 누적 캔들 수)
+            on_error: 심볼 실패 시 (job, 예외)
+            should_stop: True 반환 시 새 요청 중단
+
+        Returns:
+            {job.key: [[ts, o, h, l, c, v], ...]} (ts 오름차순, 중복 제거) - 실패한 심볼 제외
+        """
+        results: Dict[Any, List] = {}
+        if not jobs:
+            return results
+        now = int(self._clock() * 1000)
+        states = [_JobState(job, job.until if job.until is not None else now) for job in jobs]
+        pending: Dict[Any, Tuple[_JobState, str]] = {}
+
+        def finish(state: _JobState):
+            if state.error is not None:
+                logger.info(f"[DOWNLOAD] ❌ {state.job.symbol}: {state.error}")
+                if on_error:
+                    on_error(state.job, state.error)
+                return
+            rows = self._merge(state.parts)
+            results[state.job.key] = rows
+            if on_result:
+                on_result(state.job, rows)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for state in states:
+                if state.job.since >= state.until:
+                    finish(state)
+                    continue
+                pending[executor.submit(self._probe, state.job, state.until)] = (state, 'probe')
+
+            while pending:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    state, kind = pending.pop(future)
+                    try:
+                        rows = future.result()
+                    except Exception as e:
+                        state.error = state.error or e
+                        rows = []
+                    state.parts.append(rows)
+                    state.fetched += len(rows)
+                    if kind == 'window':
+                        state.remaining -= 1
+                    if rows and on_progress:
+                        on_progress(state.job, state.fetched)
+
+                    if kind == 'probe' and rows and state.error is None:
+                        windows = split_windows(rows[-1][0] + 1, state.until, state.job.timeframe,
+                                                self.batch_sizes.get(state.job.exchange, 1000))
+                        for start, end in windows:
+                            pending[executor.submit(self._fetch_window, state.job, start, end)] = (state, 'window')
+                        state.remaining = len(windows)
+                    if state.remaining == 0:
+                        finish(state)
+
+                # 중단 요청: 대기 중 요청 취소 (구간이 빠진 심볼은 결과 보고 안 함)
+                if should_stop is not None and should_stop():
+                    for future in list(pending):
+                        if future.cancel():
+                            pending.pop(future)
+        return results
+
+    def fetch_range(self, exchange: str, symbol: str, timeframe: str, since: int,
+                    until: int = None, on_progress: Callable[[DownloadJob, int], Any] = None) -> List:
+        """심볼 1개 [since, until) 구간 (실패 시 예외)"""
+        errors: List[Exception] = []
+        job = DownloadJob(exchange, symbol, timeframe, since, until)
+        result = self.download([job], on_progress=on_progress, on_error=lambda _, e: errors.append(e))
+        if errors:
+            raise errors[0]
+        return result.get(job.key, [])
+
+    @staticmethod
+    def _merge(parts: List[List]) -> List:
+        """구간 결과 병합 (ts 오름차순, 같은 ts는 마지막 값)"""
+        merged: Dict[int, List] = {}
+        for part in parts:
+            for row in part:
+                merged[row[0]] = list(row)
+        return [merged[ts] for ts in sorted(merged)]
+
+
+_client_pool: Optional[ExchangeClientPool] = None
+_client_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> ExchangeClientPool:
+    """거래소 클라이언트 풀 싱글톤"""
+    global _client_pool
+    with _client_pool_lock:
+        if _client_pool is None:
+            _client_pool = ExchangeClientPool()
+        return _client_pool
@@ -137,11 +137,19 @@ def download_all(exchange_name: str, timeframe: str):
     logging.info(f"🚀 [START] '{exchange_name}' {total}개 심볼 수집 시작 (TF: {timeframe})")
     
     success = 0
-    for i, symbol in enumerate(symbols):
-        logging.info(f"[{i+1}/{total}] Processing {symbol}...")
-        count = download_symbol(exchange_name, symbol, timeframe)
-        if count > 0:
-            success += 1
+    if exchange_name.lower() == 'bithumb':
+        for i, symbol in enumerate(symbols):
+            logging.info(f"[{i+1}/{total}] Processing {symbol}...")
+            count = download_symbol(exchange_name, symbol, timeframe)
+            if count > 0:
+                success += 1
+    else:
+        # [PERF] 심볼/기간 구간 동시 수집 (거래소 Rate Limit 내), 완료 순서대로 저장
+        counts = DataManager().download_many(
+            symbols, timeframe, exchange=exchange_name.lower(), limit=500000,
+            on_symbol_done=lambda symbol, df: logging.info(f"✅ {symbol}: {len(df) if df is not None else 0}개")
+        )
+        success = sum(1 for count in counts.values() if count > 0)
             
     logging.info(f"🏁 [FINISHED] {exchange_name} 수집 완료: {success}/{total} 성공")
 
@@ -4,8 +4,13 @@
 루트 utils로 통합
 """
 
+import hashlib
+from typing import Iterable
+
 import pandas as pd
 
+from utils.resample_kernel import resample_frame
+
 # Logging
 import logging
 logger = logging.getLogger(__name__)
@@ -25,7 +30,18 @@ except ImportError:
     }
 
 
-def resample_data(df: pd.DataFrame, target_tf: str, add_indicators: bool = True) -> pd.DataFrame:
+# OHLCV 리샘플링 집계 규칙
+_OHLCV_AGG = {
+    'open': 'first',
+    'high': 'max',
+    'low': 'min',
+    'close': 'last',
+    'volume': 'sum'
+}
+
+
+def resample_data(df: pd.DataFrame, target_tf: str, add_indicators: bool = True,
+                  use_cache: bool = True) -> pd.DataFrame:
     """
     OHLCV 데이터를 목표 타임프레임으로 리샘플링
     
@@ -33,6 +49,7 @@ def resample_data(df: pd.DataFrame, target_tf: str, add_indicators: bool = True)
         df: 원본 DataFrame (timestamp, open, high, low, close, volume)
         target_tf: 목표 타임프레임 ('30m', '1h', '4h' 등)
         add_indicators: 지표 추가 여부
+        use_cache: True면 데이터 지문 기준 리샘플 캐시 사용 (같은 데이터는 TF당 1회 계산)
     
     Returns:
         리샘플링된 DataFrame
@@ -49,30 +66,12 @@ def resample_data(df: pd.DataFrame, target_tf: str, add_indicators: bool = True)
             result = _add_indicators(result)
         return result
     
-    df = df.copy()
-    
-    # datetime 컬럼 생성
-    if 'datetime' not in df.columns:
-        if pd.api.types.is_numeric_dtype(df['timestamp']):
-            df['datetime'] = pd.to_datetime(df['timestamp'], unit='ms')
-        else:
-            df['datetime'] = pd.to_datetime(df['timestamp'])
+    # [PERF] 같은 원본 데이터는 TF당 한 번만 리샘플 (메모리 + 디스크 캐시)
+    if use_cache:
+        from storage.resample_cache import get_resample_cache
+        return get_resample_cache().resample(df, rule, add_indicators=add_indicators)
     
-    df = df.set_index('datetime')
-    
-    # 리샘플링
-    agg_dict = {
-        'open': 'first',
-        'high': 'max',
-        'low': 'min',
-        'close': 'last',
-        'volume': 'sum'
-    }
-    
-    if 'timestamp' in df.columns:
-        agg_dict['timestamp'] = 'first'
-    
-    resampled = df.resample(rule).agg(agg_dict).dropna().reset_index()
+    resampled = compute_resample(df, rule)
     
     # 지표 추가
     if add_indicators:
@@ -81,6 +80,39 @@ def resample_data(df: pd.DataFrame, target_tf: str, add_indicators: bool = True)
     return resampled
 
 
+def compute_resample(df: pd.DataFrame, rule: str, time_column: str = None) -> pd.DataFrame:
+    """
+    OHLCV 리샘플링 직접 계산 (캐시 미사용)
+    
+    Args:
+        df: 원본 DataFrame
+        rule: pandas 리샘플 규칙 ('1h', '4h', '1D' 등)
+        time_column: 기준 시간 컬럼 (None이면 datetime 컬럼 우선, 없으면 timestamp)
+    
+    Returns:
+        [datetime, open, high, low, close, volume, timestamp] - 빈 구간 제외
+    """
+    # [PERF] 정수 버킷 커널 (처리할 수 없는 규칙/데이터면 pandas resample)
+    fast = resample_frame(df, rule, time_column)
+    if fast is not None:
+        return fast
+    
+    source = time_column or ('datetime' if 'datetime' in df.columns else 'timestamp')
+    if source == 'datetime':
+        times = df['datetime']
+    elif pd.api.types.is_numeric_dtype(df[source]):
+        times = pd.to_datetime(df[source], unit='ms')
+    else:
+        times = pd.to_datetime(df[source])
+    
+    agg_dict = {col: how for col, how in _OHLCV_AGG.items() if col in df.columns}
+    if 'timestamp' in df.columns:
+        agg_dict['timestamp'] = 'first'
+    
+    work = df[list(agg_dict)].set_axis(pd.DatetimeIndex(times, name='datetime'), axis=0)
+    return work.resample(rule).agg(agg_dict).dropna().reset_index()
+
+
 def _add_indicators(df: pd.DataFrame) -> pd.DataFrame:
     """지표 추가 (IndicatorGenerator 사용)"""
     try:
@@ -114,6 +146,29 @@ def resample_ohlcv(df: pd.DataFrame, target_tf: str) -> pd.DataFrame:
     return resample_data(df, target_tf, add_indicators=False)
 
 
+def data_fingerprint(df: pd.DataFrame, columns: Iterable[str] = ('timestamp', 'open', 'high', 'low', 'close', 'volume')) -> str:
+    """
+    OHLCV 데이터 지문 (캐시 키용)
+    
+    같은 캔들 데이터면 항상 같은 값, 값/길이/구간이 바뀌면 다른 값
+    
+    Args:
+        df: OHLCV DataFrame
+        columns: 지문에 포함할 컬럼 (없는 컬럼은 무시)
+    
+    Returns:
+        16자리 hex 문자열
+    """
+    if df is None or df.empty:
+        return 'empty'
+    cols = [c for c in columns if c in df.columns]
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(f"{len(df)}|{','.join(cols)}".encode())
+    if cols:
+        digest.update(pd.util.hash_pandas_object(df[cols], index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
 def calculate_pnl_metrics(pnls: list) -> dict:
     """
     PNL 리스트(%)를 기반으로 표준 메트릭 계산 (엔진/UI 통합 로직)
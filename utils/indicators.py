@@ -5,9 +5,13 @@ utils/indicators.py
 - 백테스트와 실시간 매매에서 동일한 로직 사용 보장
 """
 
+import math
+import threading
+from collections import deque
+
 import numpy as np
 import pandas as pd
-from typing import Union, Tuple
+from typing import Dict, List, Optional, Union, Tuple
 
 # Logging
 import logging
@@ -328,6 +332,315 @@ def add_all_indicators(
     return df
 
 
+# ========== 스트리밍 지표 (캔들 1개당 O(1) 갱신) ==========
+#
+# [PERF] 실시간 봇은 캔들 마감마다 전체 이력을 다시 계산하지 않고 상태만 갱신.
+# 배치 함수(return_series=True)와 비트 단위로 같은 값을 내도록 pandas의
+# rolling().mean() / ewm(adjust=False).mean() 누적 방식을 그대로 따른다.
+# (같은 시작점부터 seed/update 했을 때 calculate_xxx(...).iloc[-1]과 동일)
+
+
+class _RollingMean:
+    """pandas rolling(window).mean()과 동일한 누적 상태 (Kahan 보정 포함)"""
+
+    __slots__ = ('window', '_values', '_nobs', '_sum', '_comp_add', '_comp_remove',
+                 '_neg_ct', '_same_ct', '_prev')
+
+    def __init__(self, window: int):
+        self.window = window
+        self._values = deque()
+        self._nobs = 0
+        self._sum = 0.0
+        self._comp_add = 0.0
+        self._comp_remove = 0.0
+        self._neg_ct = 0
+        self._same_ct = 0
+        self._prev = None
+
+    def update(self, value: float) -> float:
+        """값 1개 추가 → 현재 창 평균 (창이 덜 찼으면 NaN)"""
+        if self._prev is None:
+            self._prev = value
+        if len(self._values) == self.window:
+            old = self._values.popleft()
+            if old == old:
+                self._nobs -= 1
+                y = -old - self._comp_remove
+                t = self._sum + y
+                self._comp_remove = t - self._sum - y
+                self._sum = t
+                if math.copysign(1.0, old) < 0:
+                    self._neg_ct -= 1
+        self._values.append(value)
+        if value == value:
+            self._nobs += 1
+            y = value - self._comp_add
+            t = self._sum + y
+            self._comp_add = t - self._sum - y
+            self._sum = t
+            if math.copysign(1.0, value) < 0:
+                self._neg_ct += 1
+            if value == self._prev:
+                self._same_ct += 1
+            else:
+                self._same_ct = 1
+            self._prev = value
+
+        if self._nobs < self.window or self._nobs == 0:
+            return float('nan')
+        result = self._sum / self._nobs
+        if self._same_ct >= self._nobs:
+            result = self._prev
+        elif self._neg_ct == 0 and result < 0:
+            result = 0.0
+        elif self._neg_ct == self._nobs and result > 0:
+            result = 0.0
+        return result
+
+
+class StreamingEMA:
+    """
+    EMA 스트리밍 상태 (calculate_ema와 동일 값)
+
+    Usage:
+        ema = StreamingEMA(20).seed(closes)
+        value = ema.update(new_close)
+    """
+
+    __slots__ = ('period', '_old_wt', '_new_wt', 'value', 'count')
+
+    def __init__(self, period: int = 20):
+        self.period = period
+        alpha = 1. / (1. + (period - 1) / 2)
+        self._old_wt = 1. - alpha
+        self._new_wt = alpha
+        self.value = float('nan')
+        self.count = 0
+
+    def update(self, value: float) -> float:
+        """값 1개 반영 후 현재 EMA 반환"""
+        value = float(value)
+        self.count += 1
+        weighted = self.value
+        if self.count == 1:
+            weighted = value
+        elif weighted == weighted:
+            if value == value and weighted != value:
+                weighted = (self._old_wt * weighted + self._new_wt * value) / (self._old_wt + self._new_wt)
+        elif value == value:
+            weighted = value
+        self.value = weighted
+        return weighted
+
+    def seed(self, data: Union[np.ndarray, pd.Series]) -> 'StreamingEMA':
+        """과거 데이터로 상태 초기화 (1회 O(n))"""
+        for value in np.asarray(data, dtype=np.float64):
+            self.update(value)
+        return self
+
+
+class StreamingRSI:
+    """
+    RSI 스트리밍 상태 (calculate_rsi(return_series=True)와 동일 SMA 방식)
+
+    데이터가 period+1개 미만이면 배치 함수와 같이 50.0
+    """
+
+    __slots__ = ('period', '_gain', '_loss', '_last_close', '_raw', 'count')
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._gain = _RollingMean(period)
+        self._loss = _RollingMean(period)
+        self._last_close = None
+        self._raw = 50.0
+        self.count = 0
+
+    @property
+    def value(self) -> float:
+        return self._raw if self.count >= self.period + 1 else 50.0
+
+    def update(self, close: float) -> float:
+        """종가 1개 반영 후 현재 RSI 반환"""
+        close = float(close)
+        delta = close - self._last_close if self._last_close is not None else float('nan')
+        self._last_close = close
+        self.count += 1
+
+        # delta.where(delta > 0, 0) / -delta.where(delta < 0, 0) 과 동일 (손실 쪽 -0.0 포함)
+        avg_gain = self._gain.update(delta if delta > 0 else 0.0)
+        avg_loss = self._loss.update(-(delta if delta < 0 else 0.0))
+
+        rs = avg_gain / avg_loss if avg_loss == avg_loss and avg_loss != 0 else float('nan')
+        if rs != rs:
+            rs = 100.0
+        rsi = 100 - (100 / (1 + rs))
+        self._raw = rsi if rsi == rsi else 50.0
+        return self.value
+
+    def seed(self, data: Union[np.ndarray, pd.Series]) -> 'StreamingRSI':
+        """과거 종가로 상태 초기화 (1회 O(n))"""
+        for close in np.asarray(data, dtype=np.float64):
+            self.update(close)
+        return self
+
+
+class StreamingATR:
+    """
+    ATR 스트리밍 상태 (calculate_atr(return_series=True)와 동일 SMA 방식)
+
+    데이터가 period+1개 미만이면 배치 함수와 같이 0.0
+    """
+
+    __slots__ = ('period', '_tr', '_last_close', '_raw', 'count')
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._tr = _RollingMean(period)
+        self._last_close = None
+        self._raw = 0.0
+        self.count = 0
+
+    @property
+    def value(self) -> float:
+        return self._raw if self.count >= self.period + 1 else 0.0
+
+    def update(self, high: float, low: float, close: float) -> float:
+        """캔들 1개 반영 후 현재 ATR 반환"""
+        high, low, close = float(high), float(low), float(close)
+        high_low = high - low
+        if self._last_close is None:
+            true_range = high_low
+        else:
+            true_range = max(high_low, abs(high - self._last_close), abs(low - self._last_close))
+        self._last_close = close
+        self.count += 1
+
+        atr = self._tr.update(true_range)
+        self._raw = atr if atr == atr else 0.0
+        return self.value
+
+    def seed(self, df: pd.DataFrame) -> 'StreamingATR':
+        """과거 OHLC로 상태 초기화 (1회 O(n))"""
+        for high, low, close in zip(df['high'].to_numpy(np.float64), df['low'].to_numpy(np.float64),
+                                    df['close'].to_numpy(np.float64)):
+            self.update(high, low, close)
+        return self
+
+
+class StreamingMACD:
+    """MACD 스트리밍 상태 (calculate_macd와 동일 값) - update()는 (MACD, Signal, Histogram)"""
+
+    __slots__ = ('_fast', '_slow', '_signal', 'value', 'count')
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        self._fast = StreamingEMA(fast_period)
+        self._slow = StreamingEMA(slow_period)
+        self._signal = StreamingEMA(signal_period)
+        self.value: Tuple[float, float, float] = (float('nan'),) * 3
+        self.count = 0
+
+    def update(self, close: float) -> Tuple[float, float, float]:
+        """종가 1개 반영 후 (MACD, Signal, Histogram) 반환"""
+        macd = self._fast.update(close) - self._slow.update(close)
+        signal = self._signal.update(macd)
+        self.count += 1
+        self.value = (macd, signal, macd - signal)
+        return self.value
+
+    def seed(self, data: Union[np.ndarray, pd.Series]) -> 'StreamingMACD':
+        """과거 종가로 상태 초기화 (1회 O(n))"""
+        for close in np.asarray(data, dtype=np.float64):
+            self.update(close)
+        return self
+
+
+class IndicatorStreams:
+    """
+    add_all_indicators 컬럼(rsi, atr, macd, macd_signal, macd_hist)의 스트리밍 묶음
+
+    sync(df)는 마지막으로 반영한 캔들 이후의 새 행만 반영하고,
+    이력이 어긋나면(과거 캔들 보충/수정) 전체 재시드.
+
+    Usage:
+        streams = IndicatorStreams()
+        streams.sync(df_entry)          # 캔들 마감마다 호출 - 새 캔들 1개면 O(1)
+        rsi = streams.rsi.value
+    """
+
+    COLUMNS = ('rsi', 'atr', 'macd', 'macd_signal', 'macd_hist')
+
+    def __init__(self, rsi_period: int = 14, atr_period: int = 14,
+                 macd_fast: int = 12, macd_slow: int = 26, macd_signal: int = 9):
+        self._periods = (rsi_period, atr_period, macd_fast, macd_slow, macd_signal)
+        self._lock = threading.RLock()
+        self.reset()
+
+    def reset(self):
+        """상태 초기화 (다음 sync에서 재시드)"""
+        rsi_period, atr_period, macd_fast, macd_slow, macd_signal = self._periods
+        self.rsi = StreamingRSI(rsi_period)
+        self.atr = StreamingATR(atr_period)
+        self.macd = StreamingMACD(macd_fast, macd_slow, macd_signal)
+        self.last_timestamp = None
+        self._last_close = None
+
+    @property
+    def ready(self) -> bool:
+        """RSI/ATR 창이 모두 찼는지 (이후 값은 전체 시리즈 배치 계산과도 동일)"""
+        return self.rsi.count > self.rsi.period and self.atr.count > self.atr.period
+
+    def update(self, candle: Dict) -> Dict[str, float]:
+        """마감 캔들 1개 반영 → 해당 캔들의 지표 값"""
+        close = candle['close']
+        rsi = self.rsi.update(close)
+        atr = self.atr.update(candle['high'], candle['low'], close)
+        macd, signal, hist = self.macd.update(close)
+        self.last_timestamp = candle.get('timestamp')
+        self._last_close = float(close)
+        return {'rsi': rsi, 'atr': atr, 'macd': macd, 'macd_signal': signal, 'macd_hist': hist}
+
+    def new_rows_start(self, df: pd.DataFrame) -> Optional[int]:
+        """df에서 아직 반영하지 않은 첫 행 위치 (이력이 어긋나면 None)"""
+        if self.last_timestamp is None or 'timestamp' not in df.columns:
+            return None
+        timestamps = df['timestamp']
+        if not timestamps.is_monotonic_increasing:
+            return None
+        pos = int(timestamps.searchsorted(self.last_timestamp))
+        if pos >= len(df) or timestamps.iloc[pos] != self.last_timestamp:
+            return None
+        # 마지막 반영 캔들이 수정됐으면 (미마감 캔들 등) 재시드
+        if float(df['close'].iloc[pos]) != self._last_close:
+            return None
+        return pos + 1
+
+    def sync(self, df: pd.DataFrame) -> List[Dict[str, float]]:
+        """
+        DataFrame과 상태 동기화
+
+        Returns:
+            새로 반영한 행들의 지표 값 목록 (재시드한 경우 전체 행)
+        """
+        if df is None or df.empty:
+            return []
+        with self._lock:
+            start = self.new_rows_start(df)
+            if start is None:
+                self.reset()
+                start = 0
+            rows = df.iloc[start:]
+            if rows.empty:
+                return []
+            timestamps = rows['timestamp'].tolist() if 'timestamp' in rows.columns else [None] * len(rows)
+            return [
+                self.update({'high': high, 'low': low, 'close': close, 'timestamp': ts})
+                for high, low, close, ts in zip(rows['high'].to_numpy(np.float64),
+                                                rows['low'].to_numpy(np.float64),
+                                                rows['close'].to_numpy(np.float64), timestamps)
+            ]
+
+
 # 하위 호환성을 위한 클래스 래퍼
 class IndicatorCalculator:
     """
@@ -0,0 +1,193 @@
+"""
+utils/kline_poller.py
+감시 심볼 일괄 캔들 폴러 (MultiTrader 시그널 스캔용)
+
+- 심볼별 요청을 스레드 풀에서 동시에 실행, 거래소 토큰 버킷으로 합산 요청률 제한
+- 직전 폴링 결과를 캐시 → 다음 폴링은 마지막 캔들 이후 + 여유분(overlap)만 요청해서 병합
+  (진행 중이던 마지막 캔들은 새 응답으로 교체, 구간이 끊기면 전체 재요청)
+- 캔들 수신 즉시 같은 작업에서 평가 함수 실행 → 결과는 심볼 순서대로 반환
+
+Usage:
+    poller = KlinePoller(lambda s, i, n: adapter.get_klines(symbol=s, interval=i, limit=n), exchange='bybit')
+    signals = poller.scan(symbols, lambda symbol, df: evaluate(symbol, df))
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from utils.api_utils import TokenBucket
+from utils.concurrent_downloader import DEFAULT_RATE_LIMITS, timeframe_to_ms
+from utils.price_index import to_ns
+
+logger = logging.getLogger(__name__)
+
+_NS_PER_MS = 1_000_000
+
+
+class KlinePoller:
+    """심볼별 최근 캔들 증분 폴링 + 동시 평가"""
+
+    def __init__(
+        self,
+        fetch: Callable[[str, str, int], Optional[pd.DataFrame]],
+        interval: str = '15m',
+        limit: int = 100,
+        exchange: str = None,
+        rate: float = None,
+        max_workers: int = 8,
+        overlap: int = 2,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            fetch: (심볼, interval, limit) → timestamp 오름차순 캔들 DataFrame (실패 시 None)
+            limit: 심볼별 유지할 캔들 수
+            exchange: 기본 요청률 조회용 거래소 이름
+            rate: 초당 요청 수 (None이면 거래소 기본값)
+            overlap: 증분 요청 시 마지막 캔들 이전으로 겹쳐 받을 캔들 수
+        """
+        self._fetch = fetch
+        self.interval = interval
+        self.limit = int(limit)
+        self.max_workers = max(1, int(max_workers))
+        self.overlap = max(1, int(overlap))
+        self._step_ms = timeframe_to_ms(interval)
+        self._clock = clock
+        rate = rate if rate is not None else DEFAULT_RATE_LIMITS.get((exchange or '').lower(), 5.0)
+        self.bucket = TokenBucket(rate, capacity=max(1.0, rate))
+
+        self._cache: Dict[str, pd.DataFrame] = {}
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._full = 0
+        self._incremental = 0
+
+    # ========== 요청 ==========
+
+    def _request(self, symbol: str, limit: int) -> Optional[pd.DataFrame]:
+        self.bucket.acquire()
+        with self._lock:
+            self._requests += 1
+        df = self._fetch(symbol, self.interval, limit)
+        if df is None or len(df) == 0:
+            return None
+        return df
+
+    def _missing(self, cached: pd.DataFrame) -> int:
+        """캐시 마지막 캔들 이후 새 캔들 수 + overlap (전체 재요청이 필요하면 limit)"""
+        last_ms = to_ns(cached['timestamp'].iloc[-1]) // _NS_PER_MS
+        elapsed = int(self._clock() * 1000) - last_ms
+        if elapsed < 0:
+            return self.overlap
+        return min(self.limit, elapsed // self._step_ms + self.overlap)
+
+    def _merge(self, cached: pd.DataFrame, fresh: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """캐시 + 새 캔들 (겹치는 구간은 새 값) - 캐시 마지막 캔들을 덮지 못하면 None"""
+        first_ms = to_ns(fresh['timestamp'].iloc[0]) // _NS_PER_MS
+        last_ms = to_ns(cached['timestamp'].iloc[-1]) // _NS_PER_MS
+        if first_ms > last_ms:
+            # 캐시 마지막 캔들은 진행 중이던 값일 수 있음 → 새 값 없이 이어붙이지 않음
+            return None
+        head = cached[cached['timestamp'] < fresh['timestamp'].iloc[0]]
+        merged = pd.concat([head, fresh], ignore_index=True) if len(head) else fresh
+        return merged.tail(self.limit).reset_index(drop=True)
+
+    def fetch_symbol(self, symbol: str) -> Optional[pd.DataFrame]:
+        """심볼 최근 limit개 캔들 (캐시가 있으면 증분 요청)"""
+        with self._lock:
+            cached = self._cache.get(symbol)
+
+        df = None
+        if cached is not None and len(cached) and 'timestamp' in cached:
+            need = self._missing(cached)
+            if need < self.limit:
+                fresh = self._request(symbol, need)
+                if fresh is None:
+                    return None
+                try:
+                    df = self._merge(cached, fresh)
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.debug(f"[POLL] {symbol} merge failed, refetching: {e}")
+                    df = None
+                if df is not None:
+                    with self._lock:
+                        self._incremental += 1
+
+        if df is None:
+            df = self._request(symbol, self.limit)
+            if df is None:
+                return None
+            with self._lock:
+                self._full += 1
+
+        with self._lock:
+            self._cache[symbol] = df
+        return df
+
+    # ========== 스캔 ==========
+
+    def scan(
+        self,
+        symbols: Sequence[str],
+        evaluate: Callable[[str, pd.DataFrame], Any],
+        should_stop: Callable[[], bool] = None,
+    ) -> List[Any]:
+        """
+        전체 심볼 동시 폴링 + 평가
+
+        Args:
+            evaluate: (심볼, 캔들) → 결과 (None이면 제외)
+            should_stop: True 반환 시 남은 심볼 건너뜀
+
+        Returns:
+            심볼 순서의 평가 결과 (None/실패 제외)
+        """
+        symbols = list(symbols)
+        watched = set(symbols)
+        with self._lock:
+            # 감시 목록에서 빠진 심볼 캐시 정리
+            for symbol in [s for s in self._cache if s not in watched]:
+                del self._cache[symbol]
+        if not symbols:
+            return []
+
+        def task(symbol):
+            if should_stop and should_stop():
+                return None
+            try:
+                df = self.fetch_symbol(symbol)
+                if df is None:
+                    return None
+                # 평가 함수가 컬럼을 추가해도 캐시는 그대로
+                return evaluate(symbol, df.copy())
+            except Exception as e:
+                logger.debug(f"[POLL] {symbol} skipped: {e}")
+                return None
+
+        workers = min(self.max_workers, len(symbols))
+        if workers <= 1:
+            results = [task(s) for s in symbols]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='kline-poll') as pool:
+                results = list(pool.map(task, symbols))
+        return [r for r in results if r is not None]
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._cache.clear()
+
+    @property
+    def stats(self) -> Dict:
+        """폴링 통계"""
+        with self._lock:
+            return {
+                'symbols': len(self._cache),
+                'requests': self._requests,
+                'full': self._full,
+                'incremental': self._incremental,
+            }
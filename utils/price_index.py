@@ -0,0 +1,125 @@
+"""
+utils/price_index.py
+정렬된 타임스탬프 인덱스 기반 캔들 가격 조회
+
+- 타임스탬프는 int64 ns 배열로 한 번만 정규화 (datetime64 / tz-aware / ms 정수 모두 지원)
+- 시점 조회: searchsorted로 target 이후 첫 캔들 → O(log n) (불리언 마스크 전체 스캔 없음)
+- 구간 조회: [start, end) 인덱스 범위, 구간 최고가/최저가, SL/TP 첫 터치 캔들
+"""
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+TimeLike = Union[pd.Timestamp, np.datetime64, str, int, float]
+
+_MS_TO_NS = 1_000_000
+
+
+def to_ns(value: TimeLike) -> int:
+    """시각 → int64 ns (숫자는 ms, tz-aware는 UTC 기준)"""
+    if isinstance(value, (int, np.integer, float, np.floating)) and not isinstance(value, bool):
+        return int(value) * _MS_TO_NS
+    ts = pd.Timestamp(value)
+    if ts.tz is not None:
+        ts = ts.tz_convert('UTC').tz_localize(None)
+    return int(ts.as_unit('ns').value)
+
+
+def _column_ns(values) -> np.ndarray:
+    """타임스탬프 컬럼/인덱스 → int64 ns 배열"""
+    if pd.api.types.is_numeric_dtype(values):
+        return np.asarray(values, dtype='int64') * _MS_TO_NS
+    times = pd.DatetimeIndex(values)
+    if times.tz is not None:
+        times = times.tz_convert('UTC').tz_localize(None)
+    return times.as_unit('ns').asi8
+
+
+class PriceIndex:
+    """
+    단일 심볼/타임프레임 캔들 가격 인덱스 (읽기 전용)
+
+    Usage:
+        index = PriceIndex.from_frame(df)
+        index.at('2024-01-01 04:00')             # target 이후 첫 캔들 OHLC
+        index.extrema(entry_time, signal_time)   # 구간 (최고가, 최저가)
+        index.first_hit(entry_time, None, sl, 'below')
+    """
+
+    __slots__ = ('times', 'open', 'high', 'low', 'close')
+
+    def __init__(self, times: np.ndarray, open_: np.ndarray, high: np.ndarray,
+                 low: np.ndarray, close: np.ndarray):
+        self.times = times
+        self.open = open_
+        self.high = high
+        self.low = low
+        self.close = close
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, time_column: str = 'timestamp') -> 'PriceIndex':
+        """캔들 DataFrame → 인덱스 (time_column이 없으면 DataFrame 인덱스 사용)"""
+        times = _column_ns(df[time_column] if time_column in df.columns else df.index)
+        columns = [np.asarray(df[c], dtype='float64') for c in ('open', 'high', 'low', 'close')]
+        if len(times) > 1 and not (np.diff(times) >= 0).all():
+            # 같은 시각은 원래 순서 유지 (기존 마스크 조회의 첫 행과 동일)
+            order = np.argsort(times, kind='stable')
+            times = times[order]
+            columns = [c[order] for c in columns]
+        return cls(times, *columns)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    # ========== 시점 / 구간 ==========
+
+    def locate(self, target: TimeLike) -> int:
+        """target 이후(포함) 첫 캔들 위치 (없으면 len)"""
+        return int(np.searchsorted(self.times, to_ns(target), side='left'))
+
+    def at(self, target: TimeLike) -> Optional[Dict[str, float]]:
+        """target 이후(포함) 첫 캔들 OHLC (없으면 None)"""
+        i = self.locate(target)
+        if i >= len(self.times):
+            return None
+        return {'open': float(self.open[i]), 'high': float(self.high[i]),
+                'low': float(self.low[i]), 'close': float(self.close[i])}
+
+    def span(self, start: Optional[TimeLike] = None, end: Optional[TimeLike] = None) -> Tuple[int, int]:
+        """[start, end) 구간 캔들 위치 범위 (None = 처음/끝까지)"""
+        lo = 0 if start is None else self.locate(start)
+        hi = len(self.times) if end is None else self.locate(end)
+        return lo, max(lo, hi)
+
+    def extrema(self, start: Optional[TimeLike] = None,
+                end: Optional[TimeLike] = None) -> Optional[Tuple[float, float]]:
+        """[start, end) 구간 (최고가, 최저가) - 빈 구간이면 None"""
+        lo, hi = self.span(start, end)
+        if lo >= hi:
+            return None
+        return float(self.high[lo:hi].max()), float(self.low[lo:hi].min())
+
+    def first_hit(self, start: Optional[TimeLike], end: Optional[TimeLike],
+                  level: float, side: str) -> Optional[int]:
+        """
+        [start, end) 구간에서 가격이 level에 처음 닿는 캔들 위치
+
+        Args:
+            side: 'below' (low <= level, 롱 SL / 숏 TP) 또는 'above' (high >= level)
+        """
+        lo, hi = self.span(start, end)
+        if lo >= hi:
+            return None
+        if side == 'below':
+            hits = self.low[lo:hi] <= level
+        elif side == 'above':
+            hits = self.high[lo:hi] >= level
+        else:
+            raise ValueError(f"side must be 'below' or 'above': {side}")
+        k = int(hits.argmax())
+        return lo + k if hits[k] else None
+
+    def time_at(self, i: int) -> pd.Timestamp:
+        """캔들 위치 → 시각"""
+        return pd.Timestamp(int(self.times[i]))
@@ -0,0 +1,303 @@
+"""
+utils/resample_kernel.py
+정수 버킷 OHLCV 리샘플링 커널
+
+- 타임스탬프는 int64 (기본 ms)로만 처리 (DatetimeIndex / resample() 미사용)
+- 버킷 번호 = 정수 나눗셈, open/close = 구간 첫/끝 값, high/low = np.maximum/minimum.reduceat
+- volume 합계는 pandas groupby sum과 같은 Kahan 보정 합 → 결과가 비트 단위로 동일
+- 라벨/구간 규칙은 pandas resample 기본값과 동일
+  · 고정 간격(min/h/s): 왼쪽 닫힘/왼쪽 라벨, 기준점 = 첫 캔들 날짜 00:00 (origin='start_day')
+  · 1D: 자정 기준 / 1W(W-SUN 등): 해당 요일로 끝나는 주, 라벨 = 주 마지막 날
+- 지원하지 않는 규칙/데이터(NaN, 역순, tz 포함 등)는 None → 호출자가 pandas 경로 사용
+"""
+import logging
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+_NS_PER_DAY = 86_400_000_000_000
+_UNIT_NS = {'s': 1_000_000_000, 'ms': 1_000_000, 'us': 1_000, 'ns': 1}
+
+# 1970-01-01 (epoch 0일) = 목요일
+_EPOCH_WEEKDAY = 3
+
+# 규칙 종류
+KIND_TICK = 'tick'
+KIND_DAY = 'day'
+KIND_WEEK = 'week'
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+# Kahan 합을 구간 내 위치 단위로 돌리는 최대 구간 길이 (넘으면 groupby sum)
+_MAX_LOCKSTEP = 1024
+
+
+def rule_spec(rule: str) -> Optional[Tuple[str, int, int]]:
+    """
+    pandas 리샘플 규칙 → (종류, 간격 ns, 주봉 마감 요일)
+
+    지원하지 않는 규칙이면 None
+    """
+    try:
+        offset = pd.tseries.frequencies.to_offset(rule)
+    except (ValueError, TypeError):
+        return None
+    if isinstance(offset, pd.offsets.Tick):
+        step = int(pd.Timedelta(offset).value)
+        return (KIND_TICK, step, -1) if step > 0 else None
+    if isinstance(offset, pd.offsets.Day) and offset.n == 1:
+        return KIND_DAY, _NS_PER_DAY, -1
+    if isinstance(offset, pd.offsets.Week) and offset.n == 1 and offset.weekday is not None:
+        return KIND_WEEK, 7 * _NS_PER_DAY, int(offset.weekday)
+    return None
+
+
+def _unit_spec(spec: Tuple[str, int, int], unit: str) -> Optional[Tuple[str, int, int, int]]:
+    """규칙 간격을 타임스탬프 단위로 변환 → (종류, 간격, 하루, 주봉 요일)"""
+    factor = _UNIT_NS.get(unit)
+    if factor is None or spec[1] % factor:
+        return None
+    return spec[0], spec[1] // factor, _NS_PER_DAY // factor, spec[2]
+
+
+def bucket_labels(ts: np.ndarray, rule: str, unit: str = 'ms', origin: Optional[int] = None) -> Optional[np.ndarray]:
+    """
+    타임스탬프별 구간 라벨 (같은 단위의 int64)
+
+    Args:
+        ts: int64 타임스탬프 배열
+        rule: pandas 리샘플 규칙 ('15min', '1h', '4h', '1D', '1W' 등)
+        unit: 타임스탬프 단위 ('ms' 기본)
+        origin: 고정 간격 기준점 (None이면 첫 캔들 날짜 00:00 - pandas 기본값)
+
+    Returns:
+        라벨 배열 (지원하지 않는 규칙이면 None)
+    """
+    spec = rule_spec(rule)
+    spec = _unit_spec(spec, unit) if spec else None
+    if spec is None:
+        return None
+    kind, step, day, weekday = spec
+    ts = np.asarray(ts, dtype=np.int64)
+    if kind == KIND_TICK:
+        if origin is None:
+            origin = (int(ts[0]) // day) * day if len(ts) else 0
+        return (ts - origin) // step * step + origin
+    days = ts // day
+    if kind == KIND_DAY:
+        return days * day
+    # 주봉: 해당 요일(포함)까지 남은 일수만큼 이동
+    return (days + (weekday - (days + _EPOCH_WEEKDAY)) % 7) * day
+
+
+def _kahan_group_sum(values: np.ndarray, starts: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    """구간별 Kahan 보정 합 (pandas group_sum과 같은 순서/보정) - 구간 내 위치 단위로 일괄 처리"""
+    if len(sizes) and sizes.max() > _MAX_LOCKSTEP:
+        # 구간이 매우 길면 (1분봉 → 1D 등) 같은 Kahan 합을 쓰는 groupby sum
+        ids = np.repeat(np.arange(len(starts)), sizes)
+        return pd.Series(values).groupby(ids, sort=False).sum().to_numpy(np.float64)
+    total = np.zeros(len(starts), dtype=np.float64)
+    comp = np.zeros(len(starts), dtype=np.float64)
+    active = np.arange(len(starts))
+    for j in range(int(sizes.max()) if len(sizes) else 0):
+        active = active[sizes[active] > j]
+        val = values[starts[active] + j]
+        y = val - comp[active]
+        t = total[active] + y
+        c = t - total[active] - y
+        comp[active] = np.where(c != c, 0.0, c)
+        total[active] = t
+    return total
+
+
+def resample_arrays(ts: np.ndarray, open_: np.ndarray, high: np.ndarray, low: np.ndarray,
+                    close: np.ndarray, volume: Optional[np.ndarray], rule: str,
+                    unit: str = 'ms') -> Optional[Dict[str, np.ndarray]]:
+    """
+    배열 OHLCV 리샘플링 (빈 구간 제외)
+
+    Args:
+        ts: 오름차순 int64 타임스탬프
+        open_, high, low, close, volume: 같은 길이의 값 배열 (NaN 없음)
+        rule: pandas 리샘플 규칙
+        unit: 타임스탬프 단위
+
+    Returns:
+        {'label', 'first_idx', 'open', 'high', 'low', 'close', 'volume'} (지원 불가면 None)
+    """
+    ts = np.asarray(ts, dtype=np.int64)
+    if len(ts) == 0:
+        return None
+    labels = bucket_labels(ts, rule, unit)
+    if labels is None:
+        return None
+
+    starts = np.flatnonzero(np.r_[True, labels[1:] != labels[:-1]])
+    ends = np.r_[starts[1:], len(ts)]
+    result = {
+        'label': labels[starts],
+        'first_idx': starts,
+        'open': np.asarray(open_)[starts],
+        'high': np.maximum.reduceat(np.asarray(high), starts),
+        'low': np.minimum.reduceat(np.asarray(low), starts),
+        'close': np.asarray(close)[ends - 1],
+    }
+    if volume is not None:
+        volume = np.asarray(volume)
+        if volume.dtype.kind == 'f':
+            result['volume'] = _kahan_group_sum(volume.astype(np.float64, copy=False), starts, ends - starts)
+        else:
+            result['volume'] = np.add.reduceat(volume, starts)
+    return result
+
+
+def _has_gaps(labels: np.ndarray, rule: str, unit: str) -> bool:
+    """첫~마지막 구간 사이에 빈 구간이 있는지 (pandas는 빈 구간 때문에 정수 컬럼을 float로 변환)"""
+    if len(labels) < 2:
+        return False
+    step = _unit_spec(rule_spec(rule), unit)[1]
+    return bool((np.diff(labels) != step).any())
+
+
+def resample_frame(df: pd.DataFrame, rule: str, time_column: str = None) -> Optional[pd.DataFrame]:
+    """
+    compute_resample과 같은 결과를 정수 버킷 커널로 계산
+
+    Returns:
+        [datetime, open, high, low, close, volume, timestamp] (커널로 처리할 수 없으면 None)
+    """
+    if df is None or df.empty:
+        return None
+    source = time_column or ('datetime' if 'datetime' in df.columns else 'timestamp')
+    times = df[source]
+    if source != 'datetime':
+        if pd.api.types.is_numeric_dtype(times):
+            times = pd.to_datetime(times, unit='ms')
+        elif not pd.api.types.is_datetime64_any_dtype(times):
+            return None
+    if not isinstance(times.dtype, np.dtype) or times.dtype.kind != 'M' or times.isna().any():
+        return None  # tz 포함 / NaT
+    if not times.is_monotonic_increasing:
+        return None
+
+    columns = [c for c in OHLCV_COLUMNS if c in df.columns]
+    if columns != list(OHLCV_COLUMNS[:len(columns)]) or len(columns) < 4:
+        return None
+    values = {}
+    for col in columns:
+        arr = df[col].to_numpy()
+        if arr.dtype.kind not in 'iuf' or (arr.dtype.kind == 'f' and np.isnan(arr).any()):
+            return None
+        values[col] = arr
+    ts_values = df['timestamp'] if 'timestamp' in df.columns else None
+    if ts_values is not None and (ts_values.dtype.kind not in 'iufMO' or ts_values.isna().any()):
+        return None
+
+    unit = np.datetime_data(times.dtype)[0]
+    agg = resample_arrays(times.to_numpy().view(np.int64), values['open'], values['high'], values['low'],
+                          values['close'], values.get('volume'), rule, unit)
+    if agg is None:
+        return None
+
+    gaps = _has_gaps(agg['label'], rule, unit)
+    data = {'datetime': agg['label'].view(times.dtype)}
+    for col in columns:
+        arr = agg[col]
+        if gaps and col != 'volume' and arr.dtype.kind in 'iu':
+            arr = arr.astype(np.float64)
+        data[col] = arr
+    frame = pd.DataFrame(data)
+    if ts_values is not None:
+        first = ts_values.iloc[agg['first_idx']].reset_index(drop=True)
+        if gaps and first.dtype.kind in 'iu':
+            first = first.astype(np.float64)
+        frame['timestamp'] = first
+    return frame
+
+
+class StreamingResampler:
+    """
+    캔들 단위 스트리밍 OHLCV 집계기 (resample_arrays와 같은 라벨/집계 규칙)
+
+    Usage:
+        agg = StreamingResampler('1h')
+        for candle in stream:
+            bar = agg.update(candle['timestamp'], o, h, l, c, v)   # 구간이 바뀌면 마감 봉 반환
+        agg.current                                              # 진행 중 봉
+
+    고정 간격 규칙의 기준점은 첫 캔들 날짜 00:00 (pandas 기본값과 동일)
+    """
+
+    def __init__(self, rule: str, unit: str = 'ms'):
+        spec = rule_spec(rule)
+        spec = _unit_spec(spec, unit) if spec else None
+        if spec is None:
+            raise ValueError(f"Unsupported resample rule: {rule}")
+        self.rule = rule
+        self.unit = unit
+        self._day = spec[2]
+        self.reset()
+
+    def reset(self):
+        """상태 초기화"""
+        self._origin: Optional[int] = None
+        self._label: Optional[int] = None
+        self._bar: Optional[Dict] = None
+        self._comp = 0.0
+        self.last_timestamp: Optional[int] = None
+
+    def _label_of(self, ts: int) -> int:
+        if self._origin is None:
+            self._origin = (ts // self._day) * self._day
+        return int(bucket_labels(np.array([ts], dtype=np.int64), self.rule, self.unit, self._origin)[0])
+
+    @property
+    def current(self) -> Optional[Dict]:
+        """진행 중 봉 (label, open, high, low, close, volume, count)"""
+        return dict(self._bar) if self._bar else None
+
+    def update(self, ts: int, open_: float, high: float, low: float, close: float,
+               volume: float = 0.0) -> Optional[Dict]:
+        """
+        캔들 1개 반영
+
+        Returns:
+            새 구간이 시작되어 마감된 직전 봉 (없으면 None)
+        """
+        ts = int(ts)
+        if self.last_timestamp is not None and ts < self.last_timestamp:
+            raise ValueError(f"Out-of-order candle: {ts} < {self.last_timestamp}")
+        self.last_timestamp = ts
+        label = self._label_of(ts)
+
+        closed = None
+        if self._bar is not None and label != self._label:
+            closed = self._bar
+            self._bar = None
+        if self._bar is None:
+            self._label = label
+            self._comp = 0.0
+            self._bar = {'label': label, 'open': open_, 'high': high, 'low': low,
+                         'close': close, 'volume': 0.0, 'count': 0}
+        bar = self._bar
+        bar['high'] = max(bar['high'], high)
+        bar['low'] = min(bar['low'], low)
+        bar['close'] = close
+        bar['count'] += 1
+        # pandas group_sum과 같은 Kahan 보정 합
+        y = volume - self._comp
+        t = bar['volume'] + y
+        c = t - bar['volume'] - y
+        self._comp = 0.0 if c != c else c
+        bar['volume'] = t
+        return closed
+
+    def flush(self) -> Optional[Dict]:
+        """진행 중 봉을 마감 봉으로 반환하고 비움"""
+        bar, self._bar = self._bar, None
+        self._label = None
+        return bar